@@ -0,0 +1,231 @@
+"""
+Compare the two-pass and single-pass `Memory.add` modes on latency, LLM usage and decision quality.
+
+Every scenario seeds a few memories, then adds follow-up turns that should create, refine or contradict
+them. Both modes run the same scenarios against their own collection, and the final memories are
+checked against the facts each scenario expects to survive and the stale ones it expects to be gone.
+
+Token usage is read from the raw responses of LLM providers that accept a `response_callback`
+(OpenAI and OpenRouter); other providers report the number of LLM calls only.
+
+Usage:
+    python benchmark_add_modes.py [--config mem0_config.json] [--runs 3] [--output results/add_modes.json]
+"""
+
+import argparse
+import copy
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+from dotenv import load_dotenv
+
+from mem0 import Memory
+
+load_dotenv()
+
+ADD_MODES = ["two_pass", "single_pass"]
+
+SCENARIOS = [
+    {
+        "name": "relocation",
+        "seed": [[{"role": "user", "content": "I live in Paris and work as a nurse."}]],
+        "turns": [
+            [
+                {"role": "user", "content": "Big news, I just moved to Berlin for a new job."},
+                {"role": "assistant", "content": "Congratulations! How are you finding Berlin?"},
+                {"role": "user", "content": "Love it. I'm still a nurse, now at Charité hospital."},
+            ]
+        ],
+        "expected": ["berlin", "nurse"],
+        "stale": ["paris"],
+    },
+    {
+        "name": "diet_change",
+        "seed": [[{"role": "user", "content": "I love cheese pizza and I eat meat most days."}]],
+        "turns": [
+            [{"role": "user", "content": "I became vegetarian last month, so no more meat for me."}],
+            [{"role": "user", "content": "Cheese pizza is still my favourite though."}],
+        ],
+        "expected": ["vegetarian", "pizza"],
+        "stale": ["eat meat"],
+    },
+    {
+        "name": "new_facts_only",
+        "seed": [[{"role": "user", "content": "My name is Priya."}]],
+        "turns": [
+            [
+                {"role": "user", "content": "I'm training for a marathon in October."},
+                {"role": "assistant", "content": "Great goal! Do you have a training plan?"},
+                {"role": "user", "content": "Yes, and my dog Bruno runs with me every morning."},
+            ]
+        ],
+        "expected": ["priya", "marathon", "bruno"],
+        "stale": [],
+    },
+    {
+        "name": "small_talk",
+        "seed": [[{"role": "user", "content": "I work remotely from Lisbon."}]],
+        "turns": [
+            [
+                {"role": "user", "content": "Hi, how are you?"},
+                {"role": "assistant", "content": "I'm doing well, thanks for asking!"},
+            ]
+        ],
+        "expected": ["lisbon"],
+        "stale": [],
+    },
+]
+
+
+def default_config(base_dir):
+    return {
+        "vector_store": {
+            "provider": "qdrant",
+            "config": {"path": os.path.join(base_dir, "qdrant")},
+        },
+        "llm": {"provider": "openai", "config": {"model": os.getenv("MODEL", "gpt-4.1-nano-2025-04-14")}},
+        "embedder": {
+            "provider": "openai",
+            "config": {"model": os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")},
+        },
+    }
+
+
+class UsageTracker:
+    """Counts LLM calls and the tokens reported by the provider."""
+
+    def __init__(self, memory):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.tokens_reported = hasattr(memory.llm.config, "response_callback")
+
+        generate_response = memory.llm.generate_response
+
+        def counting_generate_response(*args, **kwargs):
+            self.calls += 1
+            return generate_response(*args, **kwargs)
+
+        memory.llm.generate_response = counting_generate_response
+        if self.tokens_reported:
+            memory.llm.config.response_callback = self.on_response
+
+    def on_response(self, llm, response, params):
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens or 0
+            self.completion_tokens += usage.completion_tokens or 0
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_mode(base_config, add_mode, runs, base_dir):
+    config = copy.deepcopy(base_config)
+    config["add_mode"] = add_mode
+    config["history_db_path"] = os.path.join(base_dir, f"history_{add_mode}.db")
+    vector_store_config = config["vector_store"].setdefault("config", {})
+    vector_store_config["collection_name"] = f"add_mode_benchmark_{add_mode}"
+    if vector_store_config.get("path"):
+        # Local stores lock their directory, so each mode gets its own
+        vector_store_config["path"] = os.path.join(vector_store_config["path"], add_mode)
+    memory = Memory.from_config(config)
+    tracker = UsageTracker(memory)
+
+    latencies = []
+    events = Counter()
+    scenario_results = []
+    try:
+        for run in range(runs):
+            for scenario in SCENARIOS:
+                user_id = f"{scenario['name']}-{add_mode}-{run}"
+                for messages in scenario["seed"]:
+                    memory.add(messages, user_id=user_id, infer=False)
+
+                for messages in scenario["turns"]:
+                    start = time.perf_counter()
+                    result = memory.add(messages, user_id=user_id)
+                    latencies.append(time.perf_counter() - start)
+                    events.update(item["event"] for item in result["results"])
+
+                final_memories = [item["memory"].lower() for item in memory.get_all(user_id=user_id)["results"]]
+                text = "\n".join(final_memories)
+                found = [fact for fact in scenario["expected"] if fact in text]
+                stale = [fact for fact in scenario["stale"] if fact in text]
+                scenario_results.append(
+                    {
+                        "scenario": scenario["name"],
+                        "run": run,
+                        "memories": final_memories,
+                        "expected_found": len(found) / len(scenario["expected"]) if scenario["expected"] else 1.0,
+                        "stale_removed": 1 - len(stale) / len(scenario["stale"]) if scenario["stale"] else 1.0,
+                    }
+                )
+    finally:
+        memory.close()
+
+    add_calls = len(latencies)
+    return {
+        "add_mode": add_mode,
+        "add_calls": add_calls,
+        "latency_p50_s": statistics.median(latencies),
+        "latency_p95_s": percentile(latencies, 95),
+        "latency_mean_s": statistics.mean(latencies),
+        "llm_calls_per_add": tracker.calls / add_calls,
+        "prompt_tokens_per_add": tracker.prompt_tokens / add_calls if tracker.tokens_reported else None,
+        "completion_tokens_per_add": tracker.completion_tokens / add_calls if tracker.tokens_reported else None,
+        "expected_found": statistics.mean(item["expected_found"] for item in scenario_results),
+        "stale_removed": statistics.mean(item["stale_removed"] for item in scenario_results),
+        "events": dict(events),
+        "scenarios": scenario_results,
+    }
+
+
+def print_summary(results):
+    columns = [
+        ("add_mode", "{}"),
+        ("latency_p50_s", "{:.2f}"),
+        ("latency_p95_s", "{:.2f}"),
+        ("llm_calls_per_add", "{:.2f}"),
+        ("prompt_tokens_per_add", "{:.0f}"),
+        ("completion_tokens_per_add", "{:.0f}"),
+        ("expected_found", "{:.2%}"),
+        ("stale_removed", "{:.2%}"),
+    ]
+    print(" | ".join(name for name, _ in columns))
+    for result in results:
+        print(" | ".join("n/a" if result[name] is None else fmt.format(result[name]) for name, fmt in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the two-pass and single-pass add modes")
+    parser.add_argument("--config", type=str, default=None, help="JSON file with a Memory config to benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Number of times each scenario is replayed")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the detailed results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        if args.config:
+            with open(args.config) as f:
+                base_config = json.load(f)
+        else:
+            base_config = default_config(base_dir)
+
+        results = [run_mode(base_config, add_mode, args.runs, base_dir) for add_mode in ADD_MODES]
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Measure how long wiping one user's memories takes, the way `Memory.delete_all` used to do it and the way it does now.
+
+For each vector store, the collection holds `--num-memories` memories of the user being wiped and as many of
+other users, and the wipe runs in two modes over a fresh copy:
+- `per_memory`: the memories are listed, then each one is fetched, deleted and gets its own history
+  transaction, as `delete_all` used to do through `_delete_memory`,
+- `delete_by_filter`: the memories are streamed with `iter_list` for their history rows, deleted with one
+  `delete_by_filter` call and recorded in one `batch_add_history` transaction.
+
+The benchmark checks that the other users' memories survive. FAISS and Qdrant run locally. Pass
+`--pgvector-connection-string` to include pgvector, e.g. with
+`docker run -e POSTGRES_PASSWORD=postgres -p 5432:5432 -d pgvector/pgvector:pg17`.
+
+Usage:
+    python benchmark_delete_all.py [--num-memories 50000] [--pgvector-connection-string postgresql://...]
+        [--output results/delete_all.json]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from mem0.memory.storage import SQLiteManager
+
+DIMS = 32
+INSERT_BATCH_SIZE = 5000
+USER_ID = "wiped-user"
+
+
+def open_store(provider, base_dir, connection_string=None):
+    collection_name = f"delete_benchmark_{uuid.uuid4().hex[:8]}"
+    if provider == "faiss":
+        from mem0.vector_stores.faiss import FAISS
+
+        return FAISS(
+            collection_name=collection_name,
+            path=os.path.join(base_dir, collection_name),
+            embedding_model_dims=DIMS,
+            flush_interval=None,
+        )
+    if provider == "qdrant":
+        from mem0.vector_stores.qdrant import Qdrant
+
+        return Qdrant(
+            collection_name=collection_name,
+            embedding_model_dims=DIMS,
+            path=os.path.join(base_dir, collection_name),
+            on_disk=False,
+        )
+
+    from mem0.vector_stores.pgvector import PGVector
+
+    return PGVector(
+        dbname=None,
+        collection_name=collection_name,
+        embedding_model_dims=DIMS,
+        user=None,
+        password=None,
+        host=None,
+        port=None,
+        diskann=False,
+        hnsw=True,
+        connection_string=connection_string,
+    )
+
+
+def load(store, num_memories):
+    rng = np.random.default_rng(0)
+    total = 2 * num_memories
+    for offset in range(0, total, INSERT_BATCH_SIZE):
+        count = min(INSERT_BATCH_SIZE, total - offset)
+        store.insert(
+            vectors=rng.random((count, DIMS), dtype=np.float32).tolist(),
+            payloads=[
+                {
+                    "data": f"Memory number {i}",
+                    "user_id": USER_ID if i % 2 else f"user-{i % 100}",
+                    "created_at": "2025-01-01T00:00:00.000000-08:00",
+                }
+                for i in range(offset, offset + count)
+            ],
+            ids=[str(uuid.uuid4()) for _ in range(count)],
+        )
+
+
+def wipe_per_memory(store, db, filters):
+    memory_ids = [memory.id for memory in store.iter_list(filters=filters)]
+    for memory_id in memory_ids:
+        memory = store.get(memory_id)
+        store.delete(memory_id)
+        db.add_history(memory_id, memory.payload.get("data", ""), None, "DELETE", is_deleted=1)
+    return len(memory_ids)
+
+
+def wipe_by_filter(store, db, filters):
+    memories = list(store.iter_list(filters=filters))
+    store.delete_by_filter(filters)
+    db.batch_add_history(
+        [
+            {"memory_id": m.id, "old_memory": m.payload.get("data", ""), "event": "DELETE", "is_deleted": 1}
+            for m in memories
+        ]
+    )
+    return len(memories)
+
+
+MODES = {"per_memory": wipe_per_memory, "delete_by_filter": wipe_by_filter}
+
+
+def run_mode(provider, mode, num_memories, base_dir, connection_string):
+    store = open_store(provider, base_dir, connection_string)
+    db = SQLiteManager(os.path.join(base_dir, f"history_{uuid.uuid4().hex[:8]}.db"))
+    try:
+        load(store, num_memories)
+        start = time.perf_counter()
+        deleted = MODES[mode](store, db, {"user_id": USER_ID})
+        seconds = time.perf_counter() - start
+        remaining = sum(1 for _ in store.iter_list(page_size=1000))
+        leftover = sum(1 for _ in store.iter_list(filters={"user_id": USER_ID}))
+    finally:
+        store.delete_col()
+        db.close()
+
+    if leftover or remaining != num_memories:
+        raise RuntimeError(f"{provider}/{mode} left {leftover} memories of the user and {remaining} in total")
+    return {
+        "provider": provider,
+        "mode": mode,
+        "deleted": deleted,
+        "seconds": seconds,
+        "memories_per_s": deleted / seconds,
+    }
+
+
+def print_summary(results):
+    print(f"{'provider':<9} | {'mode':<16} | deleted | seconds  | memories/s")
+    for result in results:
+        print(
+            f"{result['provider']:<9} | {result['mode']:<16} | {result['deleted']:<7} | "
+            f"{result['seconds']:<8.2f} | {result['memories_per_s']:.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark wiping one user's memories per memory and by filter")
+    parser.add_argument("--num-memories", type=int, default=50000, help="Number of memories of the wiped user")
+    parser.add_argument("--providers", nargs="+", default=["faiss", "qdrant"], help="Local stores to benchmark")
+    parser.add_argument("--pgvector-connection-string", type=str, default=None, help="Also benchmark pgvector")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    providers = list(args.providers)
+    if args.pgvector_connection_string:
+        providers.append("pgvector")
+
+    results = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        for provider in providers:
+            for mode in MODES:
+                results.append(
+                    run_mode(provider, mode, args.num_memories, base_dir, args.pgvector_connection_string)
+                )
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Compare the pickle and SQLite docstores of the FAISS vector store on memory, cold start and lookup latency.
+
+For each backend, a collection of synthetic memories is written once. A fresh Python process then opens it
+and reports:
+- the resident memory that opening added to the process,
+- the time to open the collection,
+- the latency of `get` by id,
+- the latency of listing one user's memories.
+
+Vectors are tiny so that the numbers reflect the payloads.
+
+Usage:
+    python benchmark_faiss_docstore.py [--num-memories 1000000] [--lookups 2000] [--output results/faiss_docstore.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BACKENDS = ["pickle", "sqlite"]
+DIMS = 8
+NUM_USERS = 1000
+INSERT_BATCH_SIZE = 10000
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        # Outside Linux, fall back to the peak RSS, in bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def open_store(path, backend):
+    from mem0.vector_stores.faiss import FAISS
+
+    return FAISS(
+        collection_name="docstore_benchmark",
+        path=path,
+        embedding_model_dims=DIMS,
+        docstore=backend,
+        flush_interval=None,
+        flush_every_n=10**9,
+    )
+
+
+def build(path, backend, num_memories):
+    store = open_store(path, backend)
+    rng = np.random.default_rng(0)
+    for offset in range(0, num_memories, INSERT_BATCH_SIZE):
+        count = min(INSERT_BATCH_SIZE, num_memories - offset)
+        store.insert(
+            vectors=rng.random((count, DIMS), dtype=np.float32),
+            payloads=[
+                {
+                    "data": f"Memory number {i} about the user's preferences, plans and past conversations",
+                    "hash": f"{i:032x}",
+                    "user_id": f"user-{i % NUM_USERS}",
+                    "created_at": "2025-01-01T00:00:00.000000-08:00",
+                    "metadata": {"category": "benchmark", "source": "synthetic"},
+                }
+                for i in range(offset, offset + count)
+            ],
+            ids=[str(i) for i in range(offset, offset + count)],
+        )
+    store.close()
+
+
+def measure(path, backend, num_memories, lookups):
+    # Import everything before the baseline so that only the collection counts towards the RSS
+    import mem0.vector_stores.faiss  # noqa: F401
+
+    baseline_rss = rss_mb()
+    start = time.perf_counter()
+    store = open_store(path, backend)
+    open_seconds = time.perf_counter() - start
+    open_rss_mb = rss_mb() - baseline_rss
+
+    ids = [str(random.randrange(num_memories)) for _ in range(lookups)]
+    get_latencies = []
+    for vector_id in ids:
+        start = time.perf_counter()
+        store.get(vector_id)
+        get_latencies.append(time.perf_counter() - start)
+
+    list_latencies = []
+    for user in range(min(lookups, NUM_USERS) // 10):
+        start = time.perf_counter()
+        store.list(filters={"user_id": f"user-{user}"}, limit=100)
+        list_latencies.append(time.perf_counter() - start)
+
+    return {
+        "docstore": backend,
+        "num_memories": num_memories,
+        "open_seconds": open_seconds,
+        "open_rss_mb": open_rss_mb,
+        "get_p50_us": statistics.median(get_latencies) * 1e6,
+        "get_p95_us": percentile(get_latencies, 95) * 1e6,
+        "list_user_p50_ms": statistics.median(list_latencies) * 1000,
+    }
+
+
+def run_backend(backend, num_memories, lookups, base_dir):
+    path = os.path.join(base_dir, backend)
+    build(path, backend, num_memories)
+    # A fresh process, so that neither the build nor the other backend is in the measured RSS
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--measure",
+            path,
+            "--backend",
+            backend,
+            "--num-memories",
+            str(num_memories),
+            "--lookups",
+            str(lookups),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["disk_mb"] = sum(entry.stat().st_size for entry in os.scandir(path)) / (1024 * 1024)
+    return result
+
+
+def print_summary(results):
+    columns = [
+        ("docstore", "{}"),
+        ("open_seconds", "{:.2f}"),
+        ("open_rss_mb", "{:.0f}"),
+        ("disk_mb", "{:.0f}"),
+        ("get_p50_us", "{:.1f}"),
+        ("get_p95_us", "{:.1f}"),
+        ("list_user_p50_ms", "{:.2f}"),
+    ]
+    print(" | ".join(name for name, _ in columns))
+    for result in results:
+        print(" | ".join(fmt.format(result[name]) for name, fmt in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pickle and SQLite docstores of the FAISS store")
+    parser.add_argument("--num-memories", type=int, default=1000000, help="Number of memories in the collection")
+    parser.add_argument("--lookups", type=int, default=2000, help="Number of `get` calls to time")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    parser.add_argument("--measure", type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--backend", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.backend, args.num_memories, args.lookups)))
+        return
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        results = [run_backend(backend, args.num_memories, args.lookups, base_dir) for backend in BACKENDS]
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
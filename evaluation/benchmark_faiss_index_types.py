@@ -0,0 +1,159 @@
+"""
+Measure the recall and latency of the FAISS vector store index types.
+
+Every index type is built from the same vectors through `mem0.vector_stores.faiss.FAISS` and queried
+with the same vectors. Recall@k is measured against an exact flat search, once per value of the
+per-search knob (`ef_search` for HNSW, `nprobe` for IVF), to show the recall/speed trade-off.
+
+By default the vectors are synthetic: Gaussian clusters, which are closer to real embeddings than
+uniform noise. Pass `--vectors` with a `.npy` file of shape (n, d) to benchmark your own embeddings.
+
+Usage:
+    python benchmark_faiss_index_types.py [--num-vectors 100000] [--dims 384] [--queries 500]
+        [--k 10] [--vectors embeddings.npy] [--output results/faiss_index_types.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import faiss
+import numpy as np
+
+from mem0.vector_stores.faiss import FAISS
+
+INDEX_CONFIGS = [
+    {"index_type": "flat", "sweep": [None]},
+    {"index_type": "hnsw", "params": {"hnsw_m": 32, "ef_construction": 40}, "sweep": [16, 32, 64, 128, 256]},
+    {"index_type": "ivf_flat", "sweep": [1, 4, 16, 64]},
+    {"index_type": "ivf_pq", "sweep": [1, 4, 16, 64]},
+]
+
+INSERT_BATCH_SIZE = 10000
+
+
+def synthetic_vectors(num_vectors, dims, seed=0):
+    rng = np.random.default_rng(seed)
+    num_clusters = max(1, num_vectors // 1000)
+    centers = rng.normal(size=(num_clusters, dims)).astype(np.float32)
+    assignments = rng.integers(num_clusters, size=num_vectors)
+    vectors = centers[assignments] + 0.3 * rng.normal(size=(num_vectors, dims)).astype(np.float32)
+    return vectors.astype(np.float32)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def ivf_params(num_vectors, dims):
+    # Rule of thumb: about sqrt(n) clusters, and PQ codes of 8 bits over sub-vectors of 4 to 8 dimensions
+    nlist = max(1, int(4 * np.sqrt(num_vectors)))
+    nlist = min(nlist, num_vectors // 39)
+    pq_m = next(m for m in (dims // 4, dims // 8, 16, 8, 4, 2, 1) if m and dims % m == 0)
+    return {"nlist": nlist, "pq_m": pq_m, "train_min_vectors": min(num_vectors, 256 * nlist)}
+
+
+def build_store(config, vectors, base_dir):
+    params = dict(config.get("params", {}))
+    if config["index_type"].startswith("ivf"):
+        params = {**ivf_params(len(vectors), vectors.shape[1]), **params}
+    store = FAISS(
+        collection_name=f"benchmark_{config['index_type']}",
+        path=os.path.join(base_dir, config["index_type"]),
+        embedding_model_dims=vectors.shape[1],
+        index_type=config["index_type"],
+        # Keep snapshots out of the measurements
+        flush_every_n=len(vectors) + 1,
+        flush_interval=None,
+        **params,
+    )
+    start = time.perf_counter()
+    for offset in range(0, len(vectors), INSERT_BATCH_SIZE):
+        batch = vectors[offset : offset + INSERT_BATCH_SIZE]
+        store.insert(
+            vectors=batch,
+            payloads=[{} for _ in range(len(batch))],
+            ids=[str(i) for i in range(offset, offset + len(batch))],
+        )
+    build_seconds = time.perf_counter() - start
+    return store, params, build_seconds
+
+
+def run_config(config, vectors, queries, ground_truth, k, base_dir):
+    store, params, build_seconds = build_store(config, vectors, base_dir)
+    knob = "ef_search" if config["index_type"] == "hnsw" else "nprobe"
+    results = []
+    for value in config["sweep"]:
+        latencies = []
+        hits = 0
+        for query, expected in zip(queries, ground_truth):
+            start = time.perf_counter()
+            found = store.search(query="", vectors=query, limit=k, **({knob: value} if value else {}))
+            latencies.append(time.perf_counter() - start)
+            hits += len({int(item.id) for item in found} & set(expected.tolist()))
+        results.append(
+            {
+                "index_type": store.col_info()["index_type"],
+                "params": params,
+                knob: value,
+                "build_seconds": build_seconds,
+                f"recall_at_{k}": hits / (k * len(queries)),
+                "latency_p50_ms": statistics.median(latencies) * 1000,
+                "latency_p95_ms": percentile(latencies, 95) * 1000,
+            }
+        )
+    store.delete_col()
+    return results
+
+
+def print_summary(results, k):
+    print(f"{'index_type':<10} | {'knob':<14} | recall@{k:<3} | p50 ms | p95 ms | build s")
+    for result in results:
+        knob = next((f"{name}={result[name]}" for name in ("ef_search", "nprobe") if result.get(name)), "-")
+        print(
+            f"{result['index_type']:<10} | {knob:<14} | {result[f'recall_at_{k}']:<9.3f} | "
+            f"{result['latency_p50_ms']:<6.2f} | {result['latency_p95_ms']:<6.2f} | {result['build_seconds']:.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recall and latency of the FAISS index types")
+    parser.add_argument("--num-vectors", type=int, default=100000, help="Number of synthetic vectors to index")
+    parser.add_argument("--dims", type=int, default=384, help="Dimension of the synthetic vectors")
+    parser.add_argument("--queries", type=int, default=500, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Number of neighbors retrieved per query")
+    parser.add_argument("--vectors", type=str, default=None, help=".npy file of vectors to use instead")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the detailed results as JSON")
+    args = parser.parse_args()
+
+    if args.vectors:
+        vectors = np.load(args.vectors).astype(np.float32)
+    else:
+        vectors = synthetic_vectors(args.num_vectors, args.dims)
+    rng = np.random.default_rng(1)
+    queries = vectors[rng.choice(len(vectors), size=args.queries, replace=False)]
+    queries = queries + 0.05 * rng.normal(size=queries.shape).astype(np.float32)
+
+    exact = faiss.IndexFlatL2(vectors.shape[1])
+    exact.add(vectors)
+    _, ground_truth = exact.search(queries, args.k)
+
+    results = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        for config in INDEX_CONFIGS:
+            results.extend(run_config(config, vectors, queries, ground_truth, args.k, base_dir))
+
+    print_summary(results, args.k)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Compare the separate and combined `graph_store.extraction_mode` of the graph `add` on LLM calls and latency.
+
+The separate mode asks the LLM for the entities, then for the relations among them, then which existing
+relations to delete. The combined mode gets the entities and relations with one call, and only asks for
+deletions when the entities already have relations in the graph.
+
+The Neo4j `MemoryGraph` is built the way the unit tests build it, with a mocked driver, and runs against a
+stub LLM that answers every tool call from the scenarios below after `--llm-latency` seconds, and an
+in-memory relation store. The numbers therefore show the LLM round trips each mode saves, not the quality
+of the extraction. `Memory.add` runs the graph `add` alongside the vector path, so the graph `add` stops
+being the slower of the two once it needs fewer sequential LLM calls than the vector path.
+
+Usage:
+    python benchmark_graph_extraction.py [--runs 20] [--llm-latency 0.2] [--output results/graph_extraction.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+from mem0.memory.graph_memory import MemoryGraph
+
+EXTRACTION_MODES = ["separate", "combined"]
+
+# Each turn lists what the stub LLM extracts from it and which existing relations it deletes.
+SCENARIOS = [
+    {
+        "name": "relocation",
+        "turns": [
+            {
+                "text": "I live in Paris and work as a nurse.",
+                "entities": {"USER": "person", "Paris": "city", "nurse": "occupation"},
+                "relations": [("USER", "lives_in", "Paris"), ("USER", "works_as", "nurse")],
+            },
+            {
+                "text": "I just moved to Berlin.",
+                "entities": {"USER": "person", "Berlin": "city"},
+                "relations": [("USER", "lives_in", "Berlin")],
+                "deletions": [("USER", "lives_in", "paris")],
+            },
+        ],
+    },
+    {
+        "name": "new_facts_only",
+        "turns": [
+            {
+                "text": "My dog Bruno runs with me every morning.",
+                "entities": {"USER": "person", "Bruno": "dog"},
+                "relations": [("USER", "owns", "Bruno"), ("Bruno", "runs_with", "USER")],
+            },
+            {
+                "text": "Maria is training for a marathon in October.",
+                "entities": {"Maria": "person", "marathon": "event"},
+                "relations": [("Maria", "training_for", "marathon")],
+            },
+        ],
+    },
+    {
+        "name": "preferences",
+        "turns": [
+            {
+                "text": "I love cheese pizza.",
+                "entities": {"USER": "person", "cheese pizza": "food"},
+                "relations": [("USER", "loves", "cheese pizza")],
+            },
+            {
+                "text": "I also love sushi.",
+                "entities": {"USER": "person", "sushi": "food"},
+                "relations": [("USER", "loves", "sushi")],
+            },
+        ],
+    },
+]
+
+
+def _relation(source, relationship, destination, user_id):
+    return {
+        "source": user_id if source == "USER" else source,
+        "relationship": relationship,
+        "destination": user_id if destination == "USER" else destination,
+    }
+
+
+class StubLLM:
+    """Answers the graph tool calls of the current turn after a fixed latency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self.turn = None
+        self.user_id = None
+
+    def generate_response(self, messages, tools=None, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+
+        entities = [
+            {"entity": self.user_id if name == "USER" else name, "entity_type": entity_type}
+            for name, entity_type in self.turn["entities"].items()
+        ]
+        relations = [_relation(*relation, self.user_id) for relation in self.turn["relations"]]
+        name = tools[0]["function"]["name"]
+        if name == "extract_entities":
+            return {"tool_calls": [{"name": name, "arguments": {"entities": entities}}]}
+        if name in ("establish_relationships", "establish_relations"):
+            return {"tool_calls": [{"name": name, "arguments": {"entities": relations}}]}
+        if name == "extract_graph":
+            return {"tool_calls": [{"name": name, "arguments": {"entities": entities, "relations": relations}}]}
+        return {
+            "tool_calls": [
+                {"name": "delete_graph_memory", "arguments": _relation(*relation, self.user_id)}
+                for relation in self.turn.get("deletions", [])
+            ]
+        }
+
+
+class InMemoryRelations:
+    """Stands in for the graph database: relations per user, matched to entities by name."""
+
+    def __init__(self):
+        self.relations = {}
+
+    def search(self, node_list, filters, limit=100):
+        names = set(node_list)
+        return [
+            relation
+            for relation in self.relations.get(filters["user_id"], [])
+            if relation["source"] in names or relation["destination"] in names
+        ][:limit]
+
+    def delete(self, to_be_deleted, filters):
+        relations = self.relations.get(filters["user_id"], [])
+        deleted = [relation for relation in relations if relation in to_be_deleted]
+        self.relations[filters["user_id"]] = [relation for relation in relations if relation not in to_be_deleted]
+        return deleted
+
+    def add(self, to_be_added, filters, entity_type_map):
+        relations = self.relations.setdefault(filters["user_id"], [])
+        relations.extend(relation for relation in to_be_added if relation not in relations)
+        return to_be_added
+
+
+def build_graph(extraction_mode, llm):
+    config = Mock()
+    config.graph_store.config.base_label = True
+    config.graph_store.config.vector_index = True
+    config.graph_store.threshold = 0.7
+    config.graph_store.llm = None
+    config.graph_store.custom_prompt = None
+    config.graph_store.extraction_mode = extraction_mode
+    config.llm.provider = "openai"
+
+    embedding_model = Mock()
+    embedding_model.config.embedding_dims = 4
+    with patch("mem0.memory.graph_memory.Neo4jGraph", return_value=MagicMock()), patch(
+        "mem0.memory.graph_memory.EmbedderFactory.create", return_value=embedding_model
+    ), patch("mem0.memory.graph_memory.LlmFactory.create", return_value=llm):
+        graph = MemoryGraph(config)
+
+    store = InMemoryRelations()
+    graph._search_graph_db = store.search
+    graph._delete_entities = store.delete
+    graph._add_entities = store.add
+    return graph, store
+
+
+def run_mode(extraction_mode, runs, llm_latency):
+    llm = StubLLM(llm_latency)
+    graph, store = build_graph(extraction_mode, llm)
+
+    latencies = []
+    for run in range(runs):
+        for scenario in SCENARIOS:
+            llm.user_id = f"{scenario['name']}-{run}"
+            for turn in scenario["turns"]:
+                llm.turn = turn
+                start = time.perf_counter()
+                graph.add(turn["text"], {"user_id": llm.user_id})
+                latencies.append(time.perf_counter() - start)
+
+    adds = len(latencies)
+    return {
+        "extraction_mode": extraction_mode,
+        "adds": adds,
+        "llm_latency_s": llm_latency,
+        "llm_calls_per_add": llm.calls / adds,
+        "latency_p50_s": statistics.median(latencies),
+        "latency_mean_s": statistics.mean(latencies),
+        "relations": sum(len(relations) for relations in store.relations.values()),
+    }
+
+
+def print_summary(results):
+    columns = [
+        ("extraction_mode", "{}"),
+        ("llm_calls_per_add", "{:.2f}"),
+        ("latency_p50_s", "{:.3f}"),
+        ("latency_mean_s", "{:.3f}"),
+        ("relations", "{}"),
+    ]
+    print(" | ".join(name for name, _ in columns))
+    for result in results:
+        print(" | ".join(fmt.format(result[name]) for name, fmt in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the separate and combined graph extraction modes")
+    parser.add_argument("--runs", type=int, default=20, help="Number of times each scenario is replayed")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds the stub LLM takes per call")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    results = [run_mode(mode, args.runs, args.llm_latency) for mode in EXTRACTION_MODES]
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
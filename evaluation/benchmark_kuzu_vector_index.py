@@ -0,0 +1,152 @@
+"""
+Measure entity lookups and writes of the Kuzu graph backend with and without its HNSW vector index.
+
+A Kuzu database is filled with `--num-entities` entities spread over `--num-users` users, then the same
+operations run in two modes over it:
+- `scan`: `graph_store.config.vector_index=False`, every lookup computes the cosine similarity of all the
+  user's nodes, as the backend used to,
+- `vector_index`: lookups query the native HNSW index and keep the candidates of the filters' scope.
+
+Each mode reports the latency of `_search_graph_db` for one entity name, the latency of `_add_entities` for one
+new relation (which resolves both of its entities first), and the time it took to build the index. Entity
+embeddings are random vectors derived from the names, so no embedding model or API key is needed and the
+benchmark runs anywhere Kuzu installs.
+
+Usage:
+    python benchmark_kuzu_vector_index.py [--num-entities 20000] [--num-users 10] [--dims 384] [--lookups 200]
+        [--output results/kuzu_vector_index.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import zlib
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from mem0.memory.kuzu_memory import MemoryGraph
+
+LOAD_BATCH_SIZE = 5000
+
+
+def embed(name, dims):
+    return np.random.default_rng(zlib.crc32(name.encode())).standard_normal(dims, dtype=np.float32).tolist()
+
+
+def open_graph(db_path, dims, vector_index):
+    config = Mock()
+    config.graph_store.config.db = db_path
+    config.graph_store.config.vector_index = vector_index
+    config.graph_store.threshold = 0.9
+
+    embedding_model = Mock()
+    embedding_model.config.embedding_dims = dims
+    embedding_model.embed_batch.side_effect = lambda names: [embed(name, dims) for name in names]
+    with patch("mem0.memory.kuzu_memory.EmbedderFactory.create", return_value=embedding_model), patch(
+        "mem0.memory.kuzu_memory.LlmFactory.create", return_value=Mock()
+    ):
+        return MemoryGraph(config)
+
+
+def load(graph, num_entities, num_users, dims):
+    for offset in range(0, num_entities, LOAD_BATCH_SIZE):
+        rows = [
+            {"user_id": f"user-{i % num_users}", "name": f"entity_{i}", "embedding": embed(f"entity_{i}", dims)}
+            for i in range(offset, min(offset + LOAD_BATCH_SIZE, num_entities))
+        ]
+        graph.kuzu_execute(
+            """
+            UNWIND $rows AS row
+            CREATE (:Entity {user_id: row.user_id, name: row.name, mentions: 1, embedding: row.embedding})
+            """,
+            parameters={"rows": rows},
+        )
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def timed(operation):
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def run_mode(db_path, mode, num_entities, num_users, dims, lookups):
+    start = time.perf_counter()
+    graph = open_graph(db_path, dims, vector_index=mode == "vector_index")
+    open_s = time.perf_counter() - start
+    if mode == "vector_index" and graph.vector_index is None:
+        raise RuntimeError("Kuzu could not create the vector index")
+
+    rng = np.random.default_rng(0)
+    entities = rng.integers(0, num_entities, size=lookups)
+    search_latencies = [
+        timed(lambda i=i: graph._search_graph_db([f"entity_{i}"], {"user_id": f"user-{i % num_users}"}))
+        for i in entities
+    ]
+    add_latencies = [
+        timed(
+            lambda n=n, i=i: graph._add_entities(
+                [{"source": f"entity_{i}", "relationship": "related_to", "destination": f"new_{mode}_{n}"}],
+                {"user_id": f"user-{i % num_users}"},
+                {},
+            )
+        )
+        for n, i in enumerate(entities)
+    ]
+    return {
+        "mode": mode,
+        "num_entities": num_entities,
+        "num_users": num_users,
+        "open_s": open_s,
+        "search_p50_ms": statistics.median(search_latencies) * 1000,
+        "search_p95_ms": percentile(search_latencies, 95) * 1000,
+        "add_p50_ms": statistics.median(add_latencies) * 1000,
+        "add_p95_ms": percentile(add_latencies, 95) * 1000,
+    }
+
+
+def print_summary(results):
+    columns = ["mode", "open_s", "search_p50_ms", "search_p95_ms", "add_p50_ms", "add_p95_ms"]
+    print(" | ".join(columns))
+    for result in results:
+        print(" | ".join(f"{result[c]:.2f}" if isinstance(result[c], float) else str(result[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Kuzu entity lookups with and without the vector index")
+    parser.add_argument("--num-entities", type=int, default=20000, help="Number of entities in the graph")
+    parser.add_argument("--num-users", type=int, default=10, help="Number of users the entities are spread over")
+    parser.add_argument("--dims", type=int, default=384, help="Dimensions of the entity embeddings")
+    parser.add_argument("--lookups", type=int, default=200, help="Number of searches and writes per mode")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        db_path = os.path.join(base_dir, "graph.kuzu")
+        # Load without the index, so that the vector_index mode's open time is the time to build it
+        graph = open_graph(db_path, args.dims, vector_index=False)
+        load(graph, args.num_entities, args.num_users, args.dims)
+        graph.graph.close()
+        graph.db.close()
+
+        for mode in ("scan", "vector_index"):
+            results.append(run_mode(db_path, mode, args.num_entities, args.num_users, args.dims, args.lookups))
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
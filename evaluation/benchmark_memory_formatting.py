@@ -0,0 +1,134 @@
+"""
+Measure how long formatting vector store records into the dicts returned by `get_all` and `search` takes, the way
+`Memory` used to do it and the way it does now.
+
+The same synthetic records are formatted in two modes:
+- `model_dump`: a `MemoryItem` pydantic model is built and dumped per record, then the promoted payload keys and
+  the leftover metadata are added, as `Memory` used to,
+- `lean`: `_format_memory_item` builds the same dict directly.
+
+Each mode reports the best of `--repeats` runs for every record count. The benchmark checks that both modes
+return the same dicts. It needs no API key or server.
+
+Usage:
+    python benchmark_memory_formatting.py [--counts 100 1000 10000 100000] [--repeats 5]
+        [--output results/memory_formatting.json]
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from mem0.configs.base import MemoryItem
+from mem0.memory.main import _format_memory_item
+
+
+class OutputData(BaseModel):
+    id: Optional[str]
+    score: Optional[float]
+    payload: Optional[Dict]
+
+
+PROMOTED_PAYLOAD_KEYS = ["user_id", "agent_id", "run_id", "actor_id", "role"]
+CORE_AND_PROMOTED_KEYS = {"data", "hash", "created_at", "updated_at", "id", *PROMOTED_PAYLOAD_KEYS}
+
+
+def format_with_model_dump(mem):
+    item = MemoryItem(
+        id=mem.id,
+        memory=mem.payload.get("data", ""),
+        hash=mem.payload.get("hash"),
+        created_at=mem.payload.get("created_at"),
+        updated_at=mem.payload.get("updated_at"),
+        score=mem.score,
+    ).model_dump()
+
+    for key in PROMOTED_PAYLOAD_KEYS:
+        if key in mem.payload:
+            item[key] = mem.payload[key]
+
+    additional_metadata = {k: v for k, v in mem.payload.items() if k not in CORE_AND_PROMOTED_KEYS}
+    if additional_metadata:
+        item["metadata"] = additional_metadata
+    return item
+
+
+def format_lean(mem):
+    return _format_memory_item(mem, mem.score)
+
+
+MODES = {"model_dump": format_with_model_dump, "lean": format_lean}
+
+
+def make_records(count):
+    records = []
+    for index in range(count):
+        payload = {
+            "data": f"Memory number {index}",
+            "hash": f"hash-{index}",
+            "created_at": "2025-01-01T00:00:00-08:00",
+            "user_id": f"user-{index % 10}",
+        }
+        if index % 2:
+            payload.update(agent_id="agent", role="user", updated_at="2025-01-02T00:00:00-08:00")
+        if index % 3:
+            payload.update(category="food", tags=["a", "b"])
+        records.append(OutputData(id=f"id-{index}", score=1 / (index + 1), payload=payload))
+    return records
+
+
+def best_of(format_record, records, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        formatted = [format_record(mem) for mem in records]
+        timings.append(time.perf_counter() - start)
+    return min(timings), formatted
+
+
+def run_count(count, repeats):
+    records = make_records(count)
+    results = []
+    outputs = {}
+    for mode, format_record in MODES.items():
+        seconds, outputs[mode] = best_of(format_record, records, repeats)
+        results.append({"mode": mode, "records": count, "ms": seconds * 1000, "records_per_s": count / seconds})
+    if outputs["lean"] != outputs["model_dump"]:
+        raise RuntimeError(f"The formatting modes disagree on {count} records")
+    return results
+
+
+def print_summary(results):
+    print(f"{'records':<8} | {'mode':<10} | {'ms':<9} | records/s")
+    for result in results:
+        print(
+            f"{result['records']:<8} | {result['mode']:<10} | {result['ms']:<9.2f} | {result['records_per_s']:.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark formatting memories with and without pydantic models")
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1000, 10000, 100000], help="Numbers of records to format"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per mode, the fastest one is reported")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.counts:
+        results.extend(run_count(count, args.repeats))
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
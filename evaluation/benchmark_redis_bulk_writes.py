@@ -0,0 +1,141 @@
+"""
+Measure the throughput of one-at-a-time and pipelined writes and reads of the Valkey and Redis vector stores.
+
+Every operation runs twice over the same memories:
+- `single`: one call per memory (`insert` of one vector, `get`, `update`, `delete`), one round trip each,
+- `pipelined`: one bulk call (`insert`, `get_many`, `update_many`, `delete_many`) sending `batch_size`
+  commands per round trip.
+
+The gap grows with the network round-trip time, so run it against a server on another host, or add
+latency locally (e.g. `tc qdisc add dev lo root netem delay 1ms`).
+
+Needs a server with the search module, e.g. `docker run -p 6379:6379 -d valkey/valkey-bundle` for Valkey
+or `docker run -p 6380:6379 -d redis/redis-stack-server` for Redis.
+
+Usage:
+    python benchmark_redis_bulk_writes.py [--valkey-url valkey://localhost:6379] [--redis-url redis://localhost:6380]
+        [--num-memories 10000] [--batch-size 500] [--output results/redis_bulk_writes.json]
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+
+import numpy as np
+
+DIMS = 384
+
+
+def open_store(provider, url, batch_size):
+    collection_name = f"bulk_benchmark_{uuid.uuid4().hex[:8]}"
+    if provider == "valkey":
+        from mem0.vector_stores.valkey import ValkeyDB
+
+        return ValkeyDB(
+            valkey_url=url, collection_name=collection_name, embedding_model_dims=DIMS, batch_size=batch_size
+        )
+
+    from mem0.vector_stores.redis import RedisDB
+
+    return RedisDB(redis_url=url, collection_name=collection_name, embedding_model_dims=DIMS, batch_size=batch_size)
+
+
+def memories(num_memories):
+    rng = np.random.default_rng(0)
+    vectors = rng.random((num_memories, DIMS), dtype=np.float32).tolist()
+    payloads = [
+        {
+            "hash": f"{i:032x}",
+            "data": f"Memory number {i}",
+            "user_id": f"user-{i % 100}",
+            "created_at": "2025-01-01T00:00:00.000000-08:00",
+            "updated_at": "2025-01-02T00:00:00.000000-08:00",
+        }
+        for i in range(num_memories)
+    ]
+    ids = [str(uuid.uuid4()) for _ in range(num_memories)]
+    return vectors, payloads, ids
+
+
+def timed(operation):
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def run_single(store, vectors, payloads, ids):
+    updates = list(zip(ids, vectors, payloads))
+    return {
+        "insert": timed(lambda: [store.insert([v], [dict(p)], [i]) for v, p, i in zip(vectors, payloads, ids)]),
+        "get": timed(lambda: [store.get(i) for i in ids]),
+        "update": timed(lambda: [store.update(i, v, dict(p)) for i, v, p in updates]),
+        "delete": timed(lambda: [store.delete(i) for i in ids]),
+    }
+
+
+def run_pipelined(store, vectors, payloads, ids):
+    updates = [(i, v, dict(p)) for i, v, p in zip(ids, vectors, payloads)]
+    return {
+        "insert": timed(lambda: store.insert(vectors, [dict(p) for p in payloads], ids)),
+        "get": timed(lambda: store.get_many(ids)),
+        "update": timed(lambda: store.update_many(updates)),
+        "delete": timed(lambda: store.delete_many(ids)),
+    }
+
+
+def run_provider(provider, url, num_memories, batch_size):
+    vectors, payloads, ids = memories(num_memories)
+    results = []
+    for mode, run in (("single", run_single), ("pipelined", run_pipelined)):
+        store = open_store(provider, url, batch_size)
+        try:
+            seconds = run(store, vectors, payloads, ids)
+        finally:
+            store.delete_col()
+        results.append(
+            {
+                "provider": provider,
+                "mode": mode,
+                "num_memories": num_memories,
+                "batch_size": batch_size,
+                **{f"{operation}_per_s": num_memories / elapsed for operation, elapsed in seconds.items()},
+            }
+        )
+    return results
+
+
+def print_summary(results):
+    columns = ["provider", "mode", "insert_per_s", "get_per_s", "update_per_s", "delete_per_s"]
+    print(" | ".join(columns))
+    for result in results:
+        print(" | ".join(f"{result[c]:.0f}" if isinstance(result[c], float) else str(result[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipelined bulk operations of the Valkey and Redis stores")
+    parser.add_argument("--valkey-url", type=str, default=None, help="Valkey server with valkey-search")
+    parser.add_argument("--redis-url", type=str, default=None, help="Redis server with RediSearch")
+    parser.add_argument("--num-memories", type=int, default=10000, help="Number of memories per operation")
+    parser.add_argument("--batch-size", type=int, default=500, help="Commands per pipeline round trip")
+    parser.add_argument("--output", type=str, default=None, help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    targets = [(provider, url) for provider, url in (("valkey", args.valkey_url), ("redis", args.redis_url)) if url]
+    if not targets:
+        parser.error("Pass --valkey-url and/or --redis-url")
+
+    results = []
+    for provider, url in targets:
+        results.extend(run_provider(provider, url, args.num_memories, args.batch_size))
+
+    print_summary(results)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
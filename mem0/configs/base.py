@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +27,30 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class AddQueueConfig(BaseModel):
+    path: Optional[str] = Field(
+        description="Path to the SQLite database holding queued add calls, defaults to add_queue_<hash>.db next to "
+        "the history database, where the hash identifies the vector store collection",
+        default=None,
+    )
+    max_workers: int = Field(description="Number of background workers draining the queue", default=2, ge=1)
+    max_attempts: int = Field(description="Number of times a failing add call is tried", default=3, ge=1)
+    retry_backoff: float = Field(
+        description="Delay in seconds before the first retry, doubled for every further retry",
+        default=1.0,
+        ge=0,
+    )
+
+
+class SearchCacheConfig(BaseModel):
+    max_size: int = Field(description="Maximum number of cached searches", default=1000, ge=1)
+    ttl: Optional[float] = Field(
+        description="Seconds a cached search stays valid, None to keep it until a write invalidates it",
+        default=60.0,
+        gt=0,
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -64,6 +88,25 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    add_mode: Literal["two_pass", "single_pass"] = Field(
+        description="How `add` infers memories: 'two_pass' extracts facts and then decides the memory actions "
+        "with a second LLM call, 'single_pass' does both with one LLM call",
+        default="two_pass",
+    )
+    add_queue: AddQueueConfig = Field(
+        description="Configuration for the durable queue behind `enqueue_add`",
+        default_factory=AddQueueConfig,
+    )
+    search_cache: Optional[SearchCacheConfig] = Field(
+        description="Cache of search results invalidated by writes to the searched scope, disabled when None",
+        default=None,
+    )
+    executor_max_workers: Optional[int] = Field(
+        description="Size of the worker pool that runs vector store and graph operations in parallel, "
+        "defaults to the ThreadPoolExecutor default",
+        default=None,
+        ge=1,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -322,6 +322,20 @@ Please note to return the IDs in the output from the input IDs only and do not g
         }
 """
 
+SINGLE_PASS_MEMORY_PROMPT = """You are a smart memory manager which controls the memory of a system.
+In a single step you extract new facts from a conversation and reconcile them with the existing memory.
+
+1. **Extract facts**: Pick out the preferences, personal details, plans, activities, health and wellness information, professional details and other miscellaneous details shared in the conversation. Each fact must be short and self-contained. Ignore greetings, small talk and general knowledge. Record the facts in the same language as the conversation.
+
+2. **Reconcile with the existing memory**: For each extracted fact decide whether to:
+- ADD: Add it to the memory as a new element with a new ID
+- UPDATE: Update an existing memory element whose information it refines or changes, keeping the same ID and returning the previous text as "old_memory". If the fact and the memory convey the same thing, keep the one with the most information
+- DELETE: Delete an existing memory element that it contradicts
+- NONE: Make no change if the fact is already present or irrelevant
+Every existing memory element must appear in the output, with the event "NONE" if it does not change.
+"""
+
+
 PROCEDURAL_MEMORY_SYSTEM_PROMPT = """
 You are a memory summarization system that records and preserves the complete interaction history between a human and an AI agent. You are provided with the agent’s execution history over the past N steps. Your task is to produce a comprehensive summary of the agent's output history that contains every detail necessary for the agent to continue the task without ambiguity. **Every output produced by the agent must be recorded verbatim as part of the summary.**
 
@@ -457,3 +471,62 @@ def get_update_memory_messages(retrieved_old_memory_dict, response_content, cust
 
     Do not return anything except the JSON format.
     """
+
+
+def get_single_pass_memory_messages(
+    parsed_messages,
+    retrieved_old_memory_dict,
+    is_agent_memory=False,
+    custom_fact_extraction_prompt=None,
+    custom_update_memory_prompt=None,
+):
+    """Build the prompts that extract facts and decide the memory actions with a single LLM call.
+
+    Args:
+        parsed_messages (str): The conversation, as formatted by `parse_messages`.
+        retrieved_old_memory_dict (list): Existing memories similar to the conversation, with integer IDs.
+        is_agent_memory (bool): If True, extract facts about the assistant instead of the user.
+        custom_fact_extraction_prompt (str, optional): Replaces the default fact extraction guidance.
+        custom_update_memory_prompt (str, optional): Replaces the default reconciliation guidance.
+
+    Returns:
+        tuple: (system_prompt, user_prompt)
+    """
+    subject = "assistant" if is_agent_memory else "user"
+    guidance = SINGLE_PASS_MEMORY_PROMPT
+    if custom_fact_extraction_prompt or custom_update_memory_prompt:
+        guidance = "\n\n".join(
+            prompt for prompt in (custom_fact_extraction_prompt, custom_update_memory_prompt) if prompt
+        )
+
+    system_prompt = f"""{guidance.strip()}
+
+Extract facts about the {subject} solely from the {subject}'s messages. Do not pick anything from the system messages.
+Today's date is {datetime.now().strftime("%Y-%m-%d")}.
+
+You must return your response in the following JSON structure only:
+
+{{
+    "facts" : ["<Fact extracted from the conversation>", ...],
+    "memory" : [
+        {{
+            "id" : "<ID of the memory>",                # Use existing ID for updates/deletes, or new ID for additions
+            "text" : "<Content of the memory>",         # Content of the memory
+            "event" : "<Operation to be performed>",    # Must be "ADD", "UPDATE", "DELETE", or "NONE"
+            "old_memory" : "<Old memory content>"       # Required only if the event is "UPDATE"
+        }},
+        ...
+    ]
+}}
+
+If nothing worth remembering is found, return empty "facts" and "memory" lists.
+Do not return anything except the JSON format.
+"""
+
+    if retrieved_old_memory_dict:
+        current_memory_part = f"Existing memory:\n```\n{retrieved_old_memory_dict}\n```"
+    else:
+        current_memory_part = "Existing memory is empty."
+
+    user_prompt = f"{current_memory_part}\n\nConversation:\n{parsed_messages}"
+    return system_prompt, user_prompt
@@ -25,6 +25,12 @@ class CassandraConfig(BaseModel):
         None,
         description="Custom load balancing policy object"
     )
+    use_sai: Optional[bool] = Field(
+        None,
+        description="Search through an SAI vector index with ANN queries. None uses it when the cluster "
+        "supports it, False always scans the table"
+    )
+    fetch_size: int = Field(1000, description="Rows per page when search falls back to scanning the table")
 
     @model_validator(mode="before")
     @classmethod
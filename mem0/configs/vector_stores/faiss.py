@@ -13,6 +13,40 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    flush_every_n: int = Field(
+        1000, description="Number of logged mutations after which the index and docstore are snapshotted to disk"
+    )
+    flush_interval: Optional[float] = Field(
+        60.0,
+        description="Seconds after which a mutation triggers a snapshot to disk (None to snapshot by count only)",
+    )
+    compaction_threshold: int = Field(
+        1000, description="Number of deleted vectors after which they are removed from the index in the background"
+    )
+    index_type: str = Field(
+        "flat", description="Index type to build. Options: 'flat' (exact search), 'hnsw', 'ivf_flat', 'ivf_pq'"
+    )
+    hnsw_m: int = Field(32, description="Number of neighbors per node of the HNSW graph")
+    ef_construction: int = Field(40, description="HNSW search depth when adding vectors")
+    ef_search: int = Field(64, description="Default HNSW search depth; higher trades speed for recall")
+    nlist: int = Field(1024, description="Number of IVF clusters")
+    nprobe: int = Field(
+        16, description="Default number of IVF clusters visited per search; higher trades speed for recall"
+    )
+    pq_m: int = Field(
+        16, description="Number of product-quantizer sub-vectors for 'ivf_pq' (must divide the dimension)"
+    )
+    pq_nbits: int = Field(8, description="Bits per product-quantizer code for 'ivf_pq'")
+    train_min_vectors: Optional[int] = Field(
+        None,
+        description="Number of vectors after which IVF indexes are trained, searching a flat index until then "
+        "(defaults to 39 per IVF cluster)",
+    )
+    docstore: str = Field(
+        "pickle",
+        description="Where payloads are kept. Options: 'pickle' (in memory, pickled with every snapshot), "
+        "'sqlite' (on disk, read on demand)",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -22,6 +56,22 @@ class FAISSConfig(BaseModel):
             raise ValueError("Invalid distance_strategy. Must be one of: 'euclidean', 'inner_product', 'cosine'")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_index_type(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        index_type = values.get("index_type")
+        if index_type and index_type not in ["flat", "hnsw", "ivf_flat", "ivf_pq"]:
+            raise ValueError("Invalid index_type. Must be one of: 'flat', 'hnsw', 'ivf_flat', 'ivf_pq'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_docstore(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        docstore = values.get("docstore")
+        if docstore and docstore not in ["pickle", "sqlite"]:
+            raise ValueError("Invalid docstore. Must be one of: 'pickle', 'sqlite'")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
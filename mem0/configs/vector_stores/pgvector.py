@@ -19,6 +19,18 @@ class PGVectorConfig(BaseModel):
     sslmode: Optional[str] = Field(None, description="SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')")
     connection_string: Optional[str] = Field(None, description="PostgreSQL connection string (overrides individual connection parameters)")
     connection_pool: Optional[Any] = Field(None, description="psycopg connection pool object (overrides connection string and individual parameters)")
+    hnsw_iterative_scan: Optional[str] = Field(
+        "relaxed_order",
+        description="Iterative HNSW index scan mode for filtered searches on pgvector 0.8+: 'relaxed_order', "
+        "'strict_order', or None to disable",
+    )
+
+    migrate_scope_columns: bool = Field(
+        False,
+        description="Add the indexed user_id/agent_id/run_id columns to a collection created by an earlier version "
+        "on startup. This rewrites the table under an ACCESS EXCLUSIVE lock; call PGVector.migrate() to run it "
+        "at a time of your choosing instead",
+    )
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -39,6 +51,14 @@ class PGVectorConfig(BaseModel):
             raise ValueError("Both 'host' and 'port' must be provided when not using connection_string.")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def check_hnsw_iterative_scan(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        mode = values.get("hnsw_iterative_scan")
+        if mode is not None and mode not in ("relaxed_order", "strict_order"):
+            raise ValueError("hnsw_iterative_scan must be 'relaxed_order', 'strict_order' or None")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
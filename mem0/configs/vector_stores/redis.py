@@ -8,6 +8,7 @@ class RedisDBConfig(BaseModel):
     redis_url: str = Field(..., description="Redis URL")
     collection_name: str = Field("mem0", description="Collection name")
     embedding_model_dims: int = Field(1536, description="Embedding model dimensions")
+    batch_size: int = Field(500, description="Commands sent per pipeline round trip by bulk writes and get_many")
 
     @model_validator(mode="before")
     @classmethod
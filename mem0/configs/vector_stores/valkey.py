@@ -13,3 +13,4 @@ class ValkeyConfig(BaseModel):
     hnsw_m: int = 16  # Number of connections per layer (default from Valkey docs)
     hnsw_ef_construction: int = 200  # Search width during construction
     hnsw_ef_runtime: int = 10  # Search width during queries
+    batch_size: int = 500  # Commands sent per pipeline round trip by bulk writes and get_many
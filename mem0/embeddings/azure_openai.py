@@ -6,6 +6,7 @@ from openai import AzureOpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.openai import MAX_BATCH_SIZE
 
 SCOPE = "https://cognitiveservices.azure.com/.default"
 
@@ -53,3 +54,22 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Azure OpenAI, sending up to 2048 texts per request.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), MAX_BATCH_SIZE):
+            response = self.client.embeddings.create(
+                input=texts[start : start + MAX_BATCH_SIZE], model=self.config.model
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Literal, Optional
 
@@ -29,3 +30,47 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        The default implementation embeds the texts one at a time. Providers whose API accepts several
+        inputs per request override it to embed the whole list in as few requests as possible.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return [self.embed(text, memory_action) for text in texts]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text.
+
+        The default implementation runs `embed` in a worker thread. Providers with an async client override
+        it to await the request directly.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return await asyncio.to_thread(self.embed, text, memory_action)
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embeddings for a list of texts.
+
+        The default implementation runs `embed_batch` in a worker thread.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return await asyncio.to_thread(self.embed_batch, texts, memory_action)
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.configs import EmbeddingCacheConfig
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingDiskCache:
+    """SQLite-backed store of embeddings keyed by their cache key."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+            self.connection.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, list]:
+        found = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+            for key, blob in rows:
+                found[key] = array("d", blob).tolist()
+        return found
+
+    def set_many(self, items: Dict[str, list]) -> None:
+        if not items:
+            return
+        rows = [(key, array("d", vector).tobytes()) for key, vector in items.items()]
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to write embeddings to the disk cache: {e}")
+                raise
+
+    def close(self) -> None:
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+
+class CachedEmbedding(EmbeddingBase):
+    """
+    Wraps an embedder with a content-addressed cache.
+
+    Embeddings are keyed by provider, model, dimensions, memory action and the text itself, and kept in
+    a bounded in-process LRU tier backed by an optional SQLite tier on disk. Only texts missing from both
+    tiers reach the wrapped embedder. Cached vectors are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, provider: str, cache_config: Optional[EmbeddingCacheConfig] = None):
+        super().__init__(embedder.config)
+        self.embedder = embedder
+        self.provider = provider
+        self.cache_config = cache_config or EmbeddingCacheConfig()
+
+        dims = getattr(self.config, "embedding_dims", None) or getattr(self.config, "output_dimensionality", None)
+        self._key_prefix = f"{provider}\x00{getattr(self.config, 'model', None)}\x00{dims}\x00"
+
+        self._memory_tier = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.disk_cache = None
+        if self.cache_config.persist:
+            path = self.cache_config.path
+            if path is None:
+                from mem0.memory.setup import mem0_dir
+
+                path = os.path.join(mem0_dir, "embedding_cache.db")
+            self.disk_cache = EmbeddingDiskCache(path)
+
+    def __getattr__(self, name):
+        # Expose provider-specific attributes (client, model, ...) of the wrapped embedder
+        if name == "embedder":
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    def _key(self, text: str, memory_action: Optional[str]) -> str:
+        return hashlib.sha256(f"{self._key_prefix}{memory_action}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, items: Dict[str, list]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._memory_tier[key] = vector
+                self._memory_tier.move_to_end(key)
+            while len(self._memory_tier) > self.cache_config.max_size:
+                self._memory_tier.popitem(last=False)
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, computing it only on a cache miss.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts, sending only the cache misses to the wrapped embedder.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        keys = [self._key(text, memory_action) for text in texts]
+        found, missing = self._lookup(keys, texts)
+        if missing and self.disk_cache is not None:
+            self._load_from_disk(found, missing, self.disk_cache.get_many(list(missing)))
+
+        if missing:
+            computed = dict(zip(missing, self.embedder.embed_batch(list(missing.values()), memory_action)))
+            self._remember(computed)
+            if self.disk_cache is not None:
+                self._save_to_disk(computed)
+            found.update(computed)
+
+        return self._finish(keys, found, missing)
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text, computing it only on a cache miss.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return (await self.aembed_batch([text], memory_action))[0]
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embeddings for a list of texts, awaiting the wrapped embedder only for misses.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        keys = [self._key(text, memory_action) for text in texts]
+        found, missing = self._lookup(keys, texts)
+        if missing and self.disk_cache is not None:
+            from_disk = await asyncio.to_thread(self.disk_cache.get_many, list(missing))
+            self._load_from_disk(found, missing, from_disk)
+
+        if missing:
+            vectors = await self.embedder.aembed_batch(list(missing.values()), memory_action)
+            computed = dict(zip(missing, vectors))
+            self._remember(computed)
+            if self.disk_cache is not None:
+                await asyncio.to_thread(self._save_to_disk, computed)
+            found.update(computed)
+
+        return self._finish(keys, found, missing)
+
+    def _lookup(self, keys: List[str], texts: List[str]):
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory_tier:
+                    self._memory_tier.move_to_end(key)
+                    found[key] = self._memory_tier[key]
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        return found, missing
+
+    def _load_from_disk(self, found: Dict[str, list], missing: Dict[str, str], from_disk: Dict[str, list]) -> None:
+        self._remember(from_disk)
+        found.update(from_disk)
+        for key in from_disk:
+            del missing[key]
+
+    def _save_to_disk(self, computed: Dict[str, list]) -> None:
+        try:
+            self.disk_cache.set_many(computed)
+        except Exception:
+            # The vectors are still valid, so a failing disk tier only costs future hits
+            pass
+
+    def _finish(self, keys: List[str], found: Dict[str, list], missing: Dict[str, str]) -> List[list]:
+        with self._lock:
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+        return [found[key] for key in keys]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters and the number of embeddings held in memory."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._memory_tier)}
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset the counters. The on-disk tier is left untouched."""
+        with self._lock:
+            self._memory_tier.clear()
+            self.hits = 0
+            self.misses = 0
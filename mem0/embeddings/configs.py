@@ -3,12 +3,32 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+class EmbeddingCacheConfig(BaseModel):
+    max_size: int = Field(
+        description="Maximum number of embeddings kept in the in-memory LRU tier",
+        default=10000,
+        ge=1,
+    )
+    persist: bool = Field(
+        description="Whether to also keep embeddings in an on-disk SQLite tier that survives restarts",
+        default=False,
+    )
+    path: Optional[str] = Field(
+        description="Path to the on-disk tier, defaults to embedding_cache.db inside the mem0 directory",
+        default=None,
+    )
+
+
 class EmbedderConfig(BaseModel):
     provider: str = Field(
         description="Provider of the embedding model (e.g., 'ollama', 'openai')",
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache: Optional[EmbeddingCacheConfig] = Field(
+        description="Configuration for the embedding cache, disabled when not set",
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -29,6 +29,8 @@ class OllamaEmbedding(EmbeddingBase):
         self.config.embedding_dims = self.config.embedding_dims or 512
 
         self.client = Client(host=self.config.ollama_base_url)
+        if self.config.ollama_use_embed_api and not hasattr(self.client, "embed"):
+            raise ValueError("ollama_use_embed_api requires an ollama client with the `embed` API (ollama>=0.3)")
         self._ensure_model_exists()
 
     def _ensure_model_exists(self):
@@ -49,5 +51,28 @@ class OllamaEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        if self.config.ollama_use_embed_api:
+            return self.embed_batch([text], memory_action)[0]
         response = self.client.embeddings(model=self.config.model, prompt=text)
         return response["embedding"]
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        With `ollama_use_embed_api`, the whole list is embedded with a single `embed` request. Otherwise every
+        text goes through the legacy `embeddings` request, like `embed`: the `embed` endpoint L2-normalizes its
+        vectors, so mixing both would compare queries and stored memories from different distributions.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        if not self.config.ollama_use_embed_api:
+            return [self.embed(text, memory_action) for text in texts]
+        response = self.client.embed(model=self.config.model, input=list(texts))
+        return list(response["embeddings"])
@@ -1,12 +1,16 @@
+import asyncio
 import os
 import warnings
 from typing import Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
 
+# Maximum number of inputs accepted by a single embeddings request
+MAX_BATCH_SIZE = 2048
+
 
 class OpenAIEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -29,7 +33,16 @@ class OpenAIEmbedding(EmbeddingBase):
                 DeprecationWarning,
             )
 
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._client_kwargs = {"api_key": api_key, "base_url": base_url}
+        self.client = OpenAI(**self._client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async client used by `aembed` and `aembed_batch`, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -47,3 +60,59 @@ class OpenAIEmbedding(EmbeddingBase):
             .data[0]
             .embedding
         )
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using OpenAI, sending up to 2048 texts per request.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), MAX_BATCH_SIZE):
+            response = self.client.embeddings.create(
+                input=texts[start : start + MAX_BATCH_SIZE],
+                model=self.config.model,
+                dimensions=self.config.embedding_dims,
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text using the async OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return (await self.aembed_batch([text], memory_action))[0]
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embeddings for a list of texts, sending the 2048-text chunks concurrently.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        responses = await asyncio.gather(
+            *(
+                self.async_client.embeddings.create(
+                    input=texts[start : start + MAX_BATCH_SIZE],
+                    model=self.config.model,
+                    dimensions=self.config.embedding_dims,
+                )
+                for start in range(0, len(texts), MAX_BATCH_SIZE)
+            )
+        )
+        return [item.embedding for response in responses for item in response.data]
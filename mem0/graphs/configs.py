@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -11,6 +11,11 @@ class Neo4jConfig(BaseModel):
     password: Optional[str] = Field(None, description="Password for the graph database")
     database: Optional[str] = Field(None, description="Database for the graph database")
     base_label: Optional[bool] = Field(None, description="Whether to use base node label __Entity__ for all entities")
+    vector_index: bool = Field(
+        True,
+        description="Resolve entities through a vector index on __Entity__ embeddings, which needs base_label and "
+        "Neo4j 5.11+. Without it, every lookup scans the user's nodes.",
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -75,6 +80,12 @@ class NeptuneConfig(BaseModel):
 
 class KuzuConfig(BaseModel):
     db: Optional[str] = Field(":memory:", description="Path to a Kuzu database file")
+    vector_index: bool = Field(
+        False,
+        description="Resolve entities through a native HNSW index on the Entity embeddings, which needs Kuzu 0.9+. "
+        "It only pays off on graphs with around 100k entities per user and takes minutes to build on large ones. "
+        "Without it, every lookup scans the user's nodes.",
+    )
 
 
 class GraphStoreConfig(BaseModel):
@@ -98,6 +109,18 @@ class GraphStoreConfig(BaseModel):
         ge=0.0,
         le=1.0,
     )
+    extraction_mode: Literal["separate", "combined"] = Field(
+        description="How `add` extracts the graph: 'separate' asks the LLM for the entities and then for the "
+        "relations among them, 'combined' gets both with one LLM call and only asks which relations to delete "
+        "when the entities already have relations in the graph",
+        default="separate",
+    )
+    entity_matcher: Literal["local", "llm"] = Field(
+        description="How `search` finds the entities a query mentions: 'local' matches the query against the "
+        "names of the graph's entities, falling back to the nodes closest to the query embedding, "
+        "'llm' extracts them with an LLM call (Neo4j, Memgraph and Kuzu)",
+        default="local",
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -0,0 +1,136 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+_TOKEN = re.compile(r"[^\W_]+")
+# Words a user refers to themselves with, matched to the node named after the user_id.
+_SELF_REFERENCES = frozenset({"i", "me", "my", "mine", "myself"})
+
+
+def _tokenize(text: str) -> tuple:
+    return tuple(_TOKEN.findall(text.lower()))
+
+
+class EntityNameIndex:
+    """
+    In-process dictionary of the entity names stored in the graph, used to find the entities a search query
+    mentions without an LLM call.
+
+    Each scope (`user_id`, `agent_id`, `run_id` of the search filters) holds the names of its nodes, loaded
+    from the graph on first use and keyed by their first token. A query matches the longest names whose
+    tokens appear in a row in its text. Writes add their entity names to every cached scope they fall in,
+    `delete_all` drops the scopes of the user. Scopes also expire after `ttl` seconds, which bounds how long
+    writes made by other processes go unseen, and the least recently used ones are evicted beyond `max_scopes`.
+
+    Write counters are stamps from one increasing sequence. Once more than `max_scopes` users have one, they
+    are all forgotten and every user reads the latest stamp, which still differs from what any load that a
+    write overlapped read before it.
+    """
+
+    def __init__(self, max_scopes: int = 1000, ttl: Optional[float] = 300.0):
+        self.max_scopes = max_scopes
+        self.ttl = ttl
+        self._scopes = OrderedDict()
+        # Bumped by every write of a user, so that names loaded while a write lands are not cached.
+        self._generations: Dict[Any, int] = {}
+        self._stamp = 0
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scope(filters: Dict[str, Any]) -> tuple:
+        return tuple(filters.get(key) for key in _SCOPE_KEYS)
+
+    @staticmethod
+    def _insert(names_by_token: Dict[str, Dict[tuple, str]], names: Iterable[str]):
+        for name in names:
+            tokens = _tokenize(name or "")
+            if tokens:
+                names_by_token.setdefault(tokens[0], {})[tokens] = name
+
+    def match(self, query: str, filters: Dict[str, Any], load: Callable[[], Iterable[str]]) -> List[str]:
+        """
+        Find the names of the scope's entities that the query mentions.
+
+        Args:
+            query (str): Text of the search.
+            filters (dict): Filters of the search, their `user_id`, `agent_id` and `run_id` select the scope.
+            load (callable): Returns the names of the scope's nodes, called when the scope is not cached.
+
+        Returns:
+            list: Matched entity names, in the order they appear in the query.
+        """
+        scope = self._scope(filters)
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                entry = None
+            if entry is not None:
+                self._scopes.move_to_end(scope)
+            generation = self._generations.get(scope[0], self._floor)
+
+        if entry is None:
+            names_by_token = {}
+            self._insert(names_by_token, load())
+            entry = (time.monotonic(), names_by_token)
+            with self._lock:
+                # Names loaded while a write of the user landed may miss it, so they are matched but not cached.
+                if self._generations.get(scope[0], self._floor) == generation:
+                    self._scopes[scope] = entry
+                    self._scopes.move_to_end(scope)
+                    while len(self._scopes) > self.max_scopes:
+                        self._scopes.popitem(last=False)
+
+        tokens = _tokenize(query)
+        user_name = filters["user_id"].lower().replace(" ", "_")
+        matched = []
+        with self._lock:
+            names_by_token = entry[1]
+            i = 0
+            while i < len(tokens):
+                candidates = sorted(names_by_token.get(tokens[i], {}).items(), key=lambda item: -len(item[0]))
+                for name_tokens, name in candidates:
+                    if tokens[i : i + len(name_tokens)] == name_tokens:
+                        if name not in matched:
+                            matched.append(name)
+                        i += len(name_tokens)
+                        break
+                else:
+                    if tokens[i] in _SELF_REFERENCES and user_name not in matched:
+                        matched.append(user_name)
+                    i += 1
+        return matched
+
+    def add(self, filters: Dict[str, Any], names: Iterable[str]):
+        """Add the names of entities written with the given filters to the cached scopes that can see them."""
+        written = self._scope(filters)
+        names = list(names)
+        with self._lock:
+            self._bump(written[0])
+            for scope, (_, names_by_token) in self._scopes.items():
+                if scope[0] == written[0] and all(s is None or s == w for s, w in zip(scope[1:], written[1:])):
+                    self._insert(names_by_token, names)
+
+    def invalidate(self, filters: Optional[Dict[str, Any]] = None):
+        """Drop the cached scopes of the filters' user, or every scope when no filters are given."""
+        with self._lock:
+            if filters is None:
+                self._scopes.clear()
+                self._stamp += 1
+                self._floor = self._stamp
+                self._generations.clear()
+                return
+            self._bump(filters.get("user_id"))
+            for scope in [scope for scope in self._scopes if scope[0] == filters.get("user_id")]:
+                del self._scopes[scope]
+
+    def _bump(self, user_id):
+        """Give the user a new write counter. Called with the lock held."""
+        self._stamp += 1
+        if len(self._generations) >= self.max_scopes:
+            self._floor = self._stamp
+            self._generations.clear()
+        self._generations[user_id] = self._stamp
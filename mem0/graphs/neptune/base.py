@@ -13,10 +13,12 @@ from mem0.graphs.tools import (
     DELETE_MEMORY_TOOL_GRAPH,
     EXTRACT_ENTITIES_STRUCT_TOOL,
     EXTRACT_ENTITIES_TOOL,
+    EXTRACT_GRAPH_STRUCT_TOOL,
+    EXTRACT_GRAPH_TOOL,
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages, get_extract_graph_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,7 @@ class NeptuneBase(ABC):
             config.embedder.provider,
             config.embedder.config,
             {"enable_embeddings": True},
+            cache_config=config.embedder.cache,
         )
 
     @staticmethod
@@ -63,10 +66,18 @@ class NeptuneBase(ABC):
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        if self.config.graph_store.extraction_mode == "combined":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            # Without existing relations around the entities there is nothing to delete.
+            to_be_deleted = []
+            if search_output:
+                to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
         deleted_entities = self._delete_entities(to_be_deleted, filters["user_id"])
         added_entities = self._add_entities(to_be_added, filters["user_id"], entity_type_map)
@@ -150,6 +161,45 @@ class NeptuneBase(ABC):
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    def _extract_graph_from_data(self, data, filters):
+        """
+        Extract the entities, with their types, and the relations among them with one LLM call.
+        """
+        system_prompt, user_prompt = get_extract_graph_messages(
+            data, filters["user_id"], self.config.graph_store.custom_prompt
+        )
+
+        _tools = [EXTRACT_GRAPH_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_GRAPH_STRUCT_TOOL]
+
+        extracted_graph = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+        relations = []
+        try:
+            for tool_call in extracted_graph["tool_calls"]:
+                if tool_call["name"] != "extract_graph":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+                relations.extend(tool_call["arguments"]["relations"])
+        except Exception as e:
+            logger.exception(
+                f"Error in extract graph tool: {e}, llm_provider={self.llm_provider}, extracted_graph={extracted_graph}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        relations = self._remove_spaces_from_entities(relations)
+        logger.debug(f"Entity type map: {entity_type_map}\n Extracted relations: {relations}")
+        return entity_type_map, relations
+
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
             item["source"] = item["source"].lower().replace(" ", "_")
@@ -190,25 +240,22 @@ class NeptuneBase(ABC):
 
     def _delete_entities(self, to_be_deleted, user_id):
         """
-        Delete the entities from the graph.
+        Delete the entities from the graph, all relationships in one query.
         """
+        if not to_be_deleted:
+            return []
 
-        results = []
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Delete the specific relationship between nodes
-            cypher, params = self._delete_entities_cypher(source, destination, relationship, user_id)
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+        cypher, params = self._delete_entities_cypher(to_be_deleted, user_id)
+        results = [[] for _ in to_be_deleted]
+        for row in self.graph.query(cypher, params=params):
+            results[row.pop("index")].append(row)
         return results
 
     @abstractmethod
-    def _delete_entities_cypher(self, source, destination, relationship, user_id):
+    def _delete_entities_cypher(self, to_be_deleted, user_id):
         """
-        Returns the OpenCypher query and parameters for deleting entities in the graph DB
+        Returns the OpenCypher query and parameters for deleting relationships in the graph DB, one row per
+        relationship, each returned with its `index` in `to_be_deleted`
         """
 
         pass
@@ -216,138 +263,59 @@ class NeptuneBase(ABC):
     def _add_entities(self, to_be_added, user_id, entity_type_map):
         """
         Add the new entities to the graph. Merge the nodes if they already exist.
+
+        The entities are resolved to existing nodes in one lookup, the ones left are merged in one query per entity
+        type and the relationships in one query per relationship type, since neither can be a parameter.
         """
+        if not to_be_added:
+            return []
 
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            destination_type = entity_type_map.get(destination, "__User__")
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, user_id, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, user_id, threshold=self.threshold)
-
-            cypher, params = self._add_entities_cypher(
-                source_node_search_result,
-                source,
-                source_embedding,
-                source_type,
-                destination_node_search_result,
-                destination,
-                dest_embedding,
-                destination_type,
-                relationship,
-                user_id,
+        # Embed every distinct entity name once instead of once per relation endpoint
+        entity_names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
+
+        node_ids = self._search_nodes(entity_embeddings, user_id, threshold=self.threshold)
+
+        new_nodes = {}
+        for name in entity_names:
+            if name not in node_ids:
+                node_type = entity_type_map.get(name, "__User__")
+                new_nodes.setdefault(node_type, []).append({"name": name, "embedding": entity_embeddings[name]})
+        for node_type, rows in new_nodes.items():
+            cypher, params = self._add_nodes_cypher(rows, node_type, user_id)
+            for row in self.graph.query(cypher, params=params):
+                node_ids[row["name"]] = row["id"]
+
+        new_relationships = {}
+        for index, item in enumerate(to_be_added):
+            new_relationships.setdefault(item["relationship"], []).append(
+                {
+                    "index": index,
+                    "source_id": node_ids.get(item["source"]),
+                    "destination_id": node_ids.get(item["destination"]),
+                }
             )
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+        results = [[] for _ in to_be_added]
+        for relationship, rows in new_relationships.items():
+            cypher, params = self._add_relationships_cypher(rows, relationship, user_id)
+            for row in self.graph.query(cypher, params=params):
+                results[row.pop("index")].append(row)
         return results
 
-    def _add_entities_cypher(
-        self,
-        source_node_list,
-        source,
-        source_embedding,
-        source_type,
-        destination_node_list,
-        destination,
-        dest_embedding,
-        destination_type,
-        relationship,
-        user_id,
-    ):
-        """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
-        """
-        if not destination_node_list and source_node_list:
-            return self._add_entities_by_source_cypher(
-                source_node_list,
-                destination,
-                dest_embedding,
-                destination_type,
-                relationship,
-                user_id)
-        elif destination_node_list and not source_node_list:
-            return self._add_entities_by_destination_cypher(
-                source,
-                source_embedding,
-                source_type,
-                destination_node_list,
-                relationship,
-                user_id)
-        elif source_node_list and destination_node_list:
-            return self._add_relationship_entities_cypher(
-                source_node_list,
-                destination_node_list,
-                relationship,
-                user_id)
-        # else source_node_list and destination_node_list are empty
-        return self._add_new_entities_cypher(
-            source,
-            source_embedding,
-            source_type,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id)
-
-    @abstractmethod
-    def _add_entities_by_source_cypher(
-            self,
-            source_node_list,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id,
-    ):
-        pass
-
     @abstractmethod
-    def _add_entities_by_destination_cypher(
-            self,
-            source,
-            source_embedding,
-            source_type,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
-        pass
-
-    @abstractmethod
-    def _add_relationship_entities_cypher(
-            self,
-            source_node_list,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
+    def _add_nodes_cypher(self, rows, node_type, user_id):
+        """
+        Returns the OpenCypher query and parameters for merging new nodes of one type in the graph DB, returning
+        the `name` and `id` of each node
+        """
         pass
 
     @abstractmethod
-    def _add_new_entities_cypher(
-            self,
-            source,
-            source_embedding,
-            source_type,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id,
-    ):
+    def _add_relationships_cypher(self, rows, relationship, user_id):
+        """
+        Returns the OpenCypher query and parameters for merging relationships of one type between existing nodes in
+        the graph DB, each returned with its `index`
+        """
         pass
 
     def search(self, query, filters, limit=100):
@@ -385,27 +353,26 @@ class NeptuneBase(ABC):
 
         return search_results
 
-    def _search_source_node(self, source_embedding, user_id, threshold=0.9):
-        cypher, params = self._search_source_node_cypher(source_embedding, user_id, threshold)
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    @abstractmethod
-    def _search_source_node_cypher(self, source_embedding, user_id, threshold):
+    def _search_nodes(self, entity_embeddings, user_id, threshold=0.9):
         """
-        Returns the OpenCypher query and parameters to search for source nodes
-        """
-        pass
+        Resolve entities to the most similar existing node of the user, at or above the threshold, in one query.
 
-    def _search_destination_node(self, destination_embedding, user_id, threshold=0.9):
-        cypher, params = self._search_destination_node_cypher(destination_embedding, user_id, threshold)
-        result = self.graph.query(cypher, params=params)
-        return result
+        :param entity_embeddings: embeddings by entity name
+        :param user_id: user_id to use
+        :param threshold: the threshold for similarity
+        :return: ids of the resolved nodes by entity name, entities without a match are left out
+        """
+        cypher, params = self._search_nodes_cypher(entity_embeddings, user_id, threshold)
+        node_ids = {}
+        for row in self.graph.query(cypher, params=params):
+            node_ids.setdefault(row["name"], row["id"])
+        return node_ids
 
     @abstractmethod
-    def _search_destination_node_cypher(self, destination_embedding, user_id, threshold):
+    def _search_nodes_cypher(self, entity_embeddings, user_id, threshold):
         """
-        Returns the OpenCypher query and parameters to search for destination nodes
+        Returns the OpenCypher query and parameters to resolve entities to existing nodes, returning the entity
+        `name` and node `id` of each match
         """
         pass
 
@@ -464,8 +431,8 @@ class NeptuneBase(ABC):
         """
         result_relations = []
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        node_embeddings = self.embedding_model.embed_batch(node_list) if node_list else []
+        for node, n_embedding in zip(node_list, node_embeddings):
             cypher_query, params = self._search_graph_db_cypher(n_embedding, filters, limit)
             ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
@@ -60,379 +60,153 @@ class MemoryGraph(NeptuneBase):
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
         self.vector_store_limit=5
 
-    def _delete_entities_cypher(self, source, destination, relationship, user_id):
+    def _delete_entities_cypher(self, to_be_deleted, user_id):
         """
-        Returns the OpenCypher query and parameters for deleting entities in the graph DB
+        Returns the OpenCypher query and parameters for deleting relationships in the graph DB
 
-        :param source: source node
-        :param destination: destination node
-        :param relationship: relationship label
+        :param to_be_deleted: relationships to delete, with source, destination and relationship
         :param user_id: user_id to use
         :return: str, dict
         """
 
         cypher = f"""
-            MATCH (n {self.node_label} {{name: $source_name, user_id: $user_id}})
-            -[r:{relationship}]->
-            (m {self.node_label} {{name: $dest_name, user_id: $user_id}})
+            UNWIND $rows AS row
+            MATCH (n {self.node_label} {{name: row.source, user_id: $user_id}})
+            -[r]->
+            (m {self.node_label} {{name: row.destination, user_id: $user_id}})
+            WHERE type(r) = row.relationship
             DELETE r
-            RETURN 
+            RETURN
+                row.index AS index,
                 n.name AS source,
                 m.name AS target,
-                type(r) AS relationship
+                row.relationship AS relationship
             """
         params = {
-            "source_name": source,
-            "dest_name": destination,
+            "rows": [
+                {
+                    "index": index,
+                    "source": item["source"],
+                    "destination": item["destination"],
+                    "relationship": item["relationship"],
+                }
+                for index, item in enumerate(to_be_deleted)
+            ],
             "user_id": user_id,
         }
         logger.debug(f"_delete_entities\n  query={cypher}")
         return cypher, params
 
-    def _add_entities_by_source_cypher(
-            self,
-            source_node_list,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id,
-    ):
+    def _add_nodes_cypher(self, rows, node_type, user_id):
         """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
+        Returns the OpenCypher query and parameters for merging new nodes of one type in the graph DB, after adding
+        their embeddings to the vector store
 
-        :param source_node_list: list of source nodes
-        :param destination: destination name
-        :param dest_embedding: destination embedding
-        :param destination_type: destination node label
-        :param relationship: relationship label
+        :param rows: nodes to merge, with name and embedding
+        :param node_type: node label
         :param user_id: user id to use
         :return: str, dict
         """
-        destination_id = str(uuid.uuid4())
-        destination_payload = {
-            "name": destination,
-            "type": destination_type,
-            "user_id": user_id,
-            "created_at": datetime.now(pytz.timezone("US/Pacific")).isoformat(),
-        }
+        created_at = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        node_ids = [str(uuid.uuid4()) for _ in rows]
         self.vector_store.insert(
-            vectors=[dest_embedding],
-            payloads=[destination_payload],
-            ids=[destination_id],
+            vectors=[row["embedding"] for row in rows],
+            payloads=[
+                {"name": row["name"], "type": node_type, "user_id": user_id, "created_at": created_at} for row in rows
+            ],
+            ids=node_ids,
         )
 
-        destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-        destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
+        node_label = self.node_label if self.node_label else f":`{node_type}`"
+        node_extra_set = f", n:`{node_type}`" if self.node_label else ""
 
         cypher = f"""
-                MATCH (source {{user_id: $user_id}})
-                WHERE id(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{`~id`: $destination_id, name: $destination_name, user_id: $user_id}})
+                UNWIND $rows AS row
+                MERGE (n {node_label} {{`~id`: row.id, name: row.name, user_id: $user_id}})
                 ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.updated = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
+                    n.created = timestamp(),
+                    n.updated = timestamp()
+                    {node_extra_set}
                 ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1,
-                    destination.updated = timestamp()
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.updated = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1,
-                    r.updated = timestamp()
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target, id(destination) AS destination_id
+                    n.updated = timestamp()
+                RETURN row.name AS name, id(n) AS id
                 """
-
         params = {
-            "source_id": source_node_list[0]["id(source_candidate)"],
-            "destination_id": destination_id,
-            "destination_name": destination,
-            "dest_embedding": dest_embedding,
+            "rows": [{"id": node_id, "name": row["name"]} for node_id, row in zip(node_ids, rows)],
             "user_id": user_id,
         }
-
-        logger.debug(
-            f"_add_entities:\n  source_node_search_result={source_node_list[0]}\n  query={cypher}"
-        )
+        logger.debug(f"_add_nodes_cypher:\n  query={cypher}")
         return cypher, params
 
-    def _add_entities_by_destination_cypher(
-            self,
-            source,
-            source_embedding,
-            source_type,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
+    def _add_relationships_cypher(self, rows, relationship, user_id):
         """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
+        Returns the OpenCypher query and parameters for merging relationships of one type in the graph DB
 
-        :param source: source node name
-        :param source_embedding: source node embedding
-        :param source_type: source node label
-        :param destination_node_list: list of dest nodes
+        :param rows: relationships to merge, with index, source_id and destination_id
         :param relationship: relationship label
         :param user_id: user id to use
         :return: str, dict
         """
-        source_id = str(uuid.uuid4())
-        source_payload = {
-            "name": source,
-            "type": source_type,
-            "user_id": user_id,
-            "created_at": datetime.now(pytz.timezone("US/Pacific")).isoformat(),
-        }
-        self.vector_store.insert(
-            vectors=[source_embedding],
-            payloads=[source_payload],
-            ids=[source_id],
-        )
-
-        source_label = self.node_label if self.node_label else f":`{source_type}`"
-        source_extra_set = f", source:`{source_type}`" if self.node_label else ""
 
         cypher = f"""
+                UNWIND $rows AS row
+                MATCH (source {{user_id: $user_id}})
+                WHERE id(source) = row.source_id
                 MATCH (destination {{user_id: $user_id}})
-                WHERE id(destination) = $destination_id
-                SET 
+                WHERE id(destination) = row.destination_id
+                SET
+                    source.mentions = coalesce(source.mentions, 0) + 1,
+                    source.updated = timestamp(),
                     destination.mentions = coalesce(destination.mentions, 0) + 1,
                     destination.updated = timestamp()
-                WITH destination
-                MERGE (source {source_label} {{`~id`: $source_id, name: $source_name, user_id: $user_id}})
-                ON CREATE SET
-                    source.created = timestamp(),
-                    source.updated = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1,
-                    source.updated = timestamp()
-                WITH source, destination
                 MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
+                ON CREATE SET
                     r.created = timestamp(),
                     r.updated = timestamp(),
                     r.mentions = 1
                 ON MATCH SET
                     r.mentions = coalesce(r.mentions, 0) + 1,
                     r.updated = timestamp()
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-        params = {
-            "destination_id": destination_node_list[0]["id(destination_candidate)"],
-            "source_id": source_id,
-            "source_name": source,
-            "source_embedding": source_embedding,
-            "user_id": user_id,
-        }
-        logger.debug(
-            f"_add_entities:\n  destination_node_search_result={destination_node_list[0]}\n  query={cypher}"
-        )
-        return cypher, params
-
-    def _add_relationship_entities_cypher(
-            self,
-            source_node_list,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
-        """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
-
-        :param source_node_list: list of source node ids
-        :param destination_node_list: list of dest node ids
-        :param relationship: relationship label
-        :param user_id: user id to use
-        :return: str, dict
-        """
-
-        cypher = f"""
-                MATCH (source {{user_id: $user_id}})
-                WHERE id(source) = $source_id
-                SET 
-                    source.mentions = coalesce(source.mentions, 0) + 1,
-                    source.updated = timestamp()
-                WITH source
-                MATCH (destination {{user_id: $user_id}})
-                WHERE id(destination) = $destination_id
-                SET 
-                    destination.mentions = coalesce(destination.mentions) + 1,
-                    destination.updated = timestamp()
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-        params = {
-            "source_id": source_node_list[0]["id(source_candidate)"],
-            "destination_id": destination_node_list[0]["id(destination_candidate)"],
-            "user_id": user_id,
-        }
-        logger.debug(
-            f"_add_entities:\n  destination_node_search_result={destination_node_list[0]}\n  source_node_search_result={source_node_list[0]}\n  query={cypher}"
-        )
-        return cypher, params
-
-    def _add_new_entities_cypher(
-        self,
-        source,
-        source_embedding,
-        source_type,
-        destination,
-        dest_embedding,
-        destination_type,
-        relationship,
-        user_id,
-    ):
-        """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
-
-        :param source: source node name
-        :param source_embedding: source node embedding
-        :param source_type: source node label
-        :param destination: destination name
-        :param dest_embedding: destination embedding
-        :param destination_type: destination node label
-        :param relationship: relationship label
-        :param user_id: user id to use
-        :return: str, dict
-        """
-        source_id = str(uuid.uuid4())
-        source_payload = {
-            "name": source,
-            "type": source_type,
-            "user_id": user_id,
-            "created_at": datetime.now(pytz.timezone("US/Pacific")).isoformat(),
-        }
-        destination_id = str(uuid.uuid4())
-        destination_payload = {
-            "name": destination,
-            "type": destination_type,
-            "user_id": user_id,
-            "created_at": datetime.now(pytz.timezone("US/Pacific")).isoformat(),
-        }
-        self.vector_store.insert(
-            vectors=[source_embedding, dest_embedding],
-            payloads=[source_payload, destination_payload],
-            ids=[source_id, destination_id],
-        )
-
-        source_label = self.node_label if self.node_label else f":`{source_type}`"
-        source_extra_set = f", source:`{source_type}`" if self.node_label else ""
-        destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-        destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
-
-        cypher = f"""
-                MERGE (n {source_label} {{name: $source_name, user_id: $user_id, `~id`: $source_id}})
-                ON CREATE SET n.created = timestamp(),
-                              n.mentions = 1
-                              {source_extra_set}
-                ON MATCH SET n.mentions = coalesce(n.mentions, 0) + 1
-                WITH n
-                MERGE (m {destination_label} {{name: $dest_name, user_id: $user_id, `~id`: $dest_id}})
-                ON CREATE SET m.created = timestamp(),
-                              m.mentions = 1
-                              {destination_extra_set}
-                ON MATCH SET m.mentions = coalesce(m.mentions, 0) + 1
-                WITH n, m
-                MERGE (n)-[rel:{relationship}]->(m)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN n.name AS source, type(rel) AS relationship, m.name AS target
+                RETURN row.index AS index, source.name AS source, type(r) AS relationship, destination.name AS target
                 """
-        params = {
-            "source_id": source_id,
-            "dest_id": destination_id,
-            "source_name": source,
-            "dest_name": destination,
-            "source_embedding": source_embedding,
-            "dest_embedding": dest_embedding,
-            "user_id": user_id,
-        }
-        logger.debug(
-            f"_add_new_entities_cypher:\n  query={cypher}"
-        )
+        params = {"rows": rows, "user_id": user_id}
+        logger.debug(f"_add_relationships_cypher:\n  query={cypher}")
         return cypher, params
 
-    def _search_source_node_cypher(self, source_embedding, user_id, threshold):
+    def _search_nodes_cypher(self, entity_embeddings, user_id, threshold):
         """
-        Returns the OpenCypher query and parameters to search for source nodes
+        Returns the OpenCypher query and parameters to resolve entities to existing nodes. The candidates come from
+        the vector store, one search per entity, and are checked against the graph in one query
 
-        :param source_embedding: source vector
+        :param entity_embeddings: embeddings by entity name
         :param user_id: user_id to use
         :param threshold: the threshold for similarity
         :return: str, dict
         """
-
-        source_nodes = self.vector_store.search(
-            query="",
-            vectors=source_embedding,
-            limit=self.vector_store_limit,
-            filters={"user_id": user_id},
-        )
-
-        ids = [n.id for n in filter(lambda s: s.score > threshold, source_nodes)]
+        candidates = []
+        for name, embedding in entity_embeddings.items():
+            nodes = self.vector_store.search(
+                query="",
+                vectors=embedding,
+                limit=self.vector_store_limit,
+                filters={"user_id": user_id},
+            )
+            ids = [n.id for n in filter(lambda n: n.score > threshold, nodes)]
+            if ids:
+                candidates.append({"name": name, "ids": ids})
 
         cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE source_candidate.user_id = $user_id AND id(source_candidate) IN $ids
-            RETURN id(source_candidate)
+            UNWIND $candidates AS candidate
+            MATCH (n {self.node_label})
+            WHERE n.user_id = $user_id AND id(n) IN candidate.ids
+            RETURN candidate.name AS name, id(n) AS id
             """
 
         params = {
-            "ids": ids,
-            "source_embedding": source_embedding,
+            "candidates": candidates,
             "user_id": user_id,
-            "threshold": threshold,
         }
-        logger.debug(f"_search_source_node\n  query={cypher}")
-        return cypher, params
-
-    def _search_destination_node_cypher(self, destination_embedding, user_id, threshold):
-        """
-        Returns the OpenCypher query and parameters to search for destination nodes
-
-        :param source_embedding: source vector
-        :param user_id: user_id to use
-        :param threshold: the threshold for similarity
-        :return: str, dict
-        """
-        destination_nodes = self.vector_store.search(
-            query="",
-            vectors=destination_embedding,
-            limit=self.vector_store_limit,
-            filters={"user_id": user_id},
-        )
-
-        ids = [n.id for n in filter(lambda d: d.score > threshold, destination_nodes)]
-
-        cypher = f"""
-            MATCH (destination_candidate {self.node_label})
-            WHERE destination_candidate.user_id = $user_id AND id(destination_candidate) IN $ids
-            RETURN id(destination_candidate)
-            """
-
-        params = {
-            "ids": ids,
-            "destination_embedding": destination_embedding,
-            "user_id": user_id,
-        }
-
-        logger.debug(f"_search_destination_node\n  query={cypher}")
+        logger.debug(f"_search_nodes\n  query={cypher}")
         return cypher, params
 
     def _delete_all_cypher(self, filters):
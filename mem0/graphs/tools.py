@@ -149,6 +149,54 @@ EXTRACT_ENTITIES_TOOL = {
     },
 }
 
+EXTRACT_GRAPH_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "extract_graph",
+        "description": "Extract the entities of the text with their types and the relationships among them.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entities": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "entity": {"type": "string", "description": "The name or identifier of the entity."},
+                            "entity_type": {"type": "string", "description": "The type or category of the entity."},
+                        },
+                        "required": ["entity", "entity_type"],
+                        "additionalProperties": False,
+                    },
+                    "description": "An array of entities with their types.",
+                },
+                "relations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "source": {"type": "string", "description": "The source entity of the relationship."},
+                            "relationship": {
+                                "type": "string",
+                                "description": "The relationship between the source and destination entities.",
+                            },
+                            "destination": {
+                                "type": "string",
+                                "description": "The destination entity of the relationship.",
+                            },
+                        },
+                        "required": ["source", "relationship", "destination"],
+                        "additionalProperties": False,
+                    },
+                    "description": "An array of relationships among the entities.",
+                },
+            },
+            "required": ["entities", "relations"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 UPDATE_MEMORY_STRUCT_TOOL_GRAPH = {
     "type": "function",
     "function": {
@@ -307,6 +355,55 @@ EXTRACT_ENTITIES_STRUCT_TOOL = {
     },
 }
 
+EXTRACT_GRAPH_STRUCT_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "extract_graph",
+        "description": "Extract the entities of the text with their types and the relationships among them.",
+        "strict": True,
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entities": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "entity": {"type": "string", "description": "The name or identifier of the entity."},
+                            "entity_type": {"type": "string", "description": "The type or category of the entity."},
+                        },
+                        "required": ["entity", "entity_type"],
+                        "additionalProperties": False,
+                    },
+                    "description": "An array of entities with their types.",
+                },
+                "relations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "source": {"type": "string", "description": "The source entity of the relationship."},
+                            "relationship": {
+                                "type": "string",
+                                "description": "The relationship between the source and destination entities.",
+                            },
+                            "destination": {
+                                "type": "string",
+                                "description": "The destination entity of the relationship.",
+                            },
+                        },
+                        "required": ["source", "relationship", "destination"],
+                        "additionalProperties": False,
+                    },
+                    "description": "An array of relationships among the entities.",
+                },
+            },
+            "required": ["entities", "relations"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 DELETE_MEMORY_STRUCT_TOOL_GRAPH = {
     "type": "function",
     "function": {
@@ -54,6 +54,30 @@ Strive to construct a coherent and easily understandable knowledge graph by esta
 
 Adhere strictly to these guidelines to ensure high-quality knowledge graph extraction."""
 
+EXTRACT_GRAPH_PROMPT = """
+
+You are an advanced algorithm designed to extract structured information from text to construct knowledge graphs. In a single pass, you identify the entities mentioned in the text with their types and the relationships among them. Follow these key principles:
+
+1. Extract only explicitly stated information from the text.
+2. List every entity mentioned in the text with its type, then establish relationships among these entities.
+3. Use "USER_ID" as the entity for any self-references (e.g., "I," "me," "my," etc.) in user messages.
+4. ***DO NOT*** answer the question itself if the given text is a question.
+CUSTOM_PROMPT
+
+Entities:
+    - Use the name of the entity as it appears in the text, and a short, general type (e.g., "person", "city", "food").
+
+Relationships:
+    - Use consistent, general, and timeless relationship types.
+    - Example: Prefer "professor" over "became_professor."
+    - Relationships should only be established among the entities you listed.
+
+Entity Consistency:
+    - Ensure that relationships are coherent and logically align with the context of the message.
+    - Maintain consistent naming for entities across the extracted entities and relationships.
+
+Adhere strictly to these guidelines to ensure high-quality knowledge graph extraction."""
+
 DELETE_RELATIONS_SYSTEM_PROMPT = """
 You are a graph memory manager specializing in identifying, managing, and optimizing relationships within graph-based memories. Your primary task is to analyze a list of existing relationships and determine which ones should be deleted based on the new information provided.
 Input:
@@ -95,3 +119,8 @@ def get_delete_messages(existing_memories_string, data, user_id):
     return DELETE_RELATIONS_SYSTEM_PROMPT.replace(
         "USER_ID", user_id
     ), f"Here are the existing memories: {existing_memories_string} \n\n New Information: {data}"
+
+
+def get_extract_graph_messages(data, user_id, custom_prompt=None):
+    custom_prompt = f"5. {custom_prompt}" if custom_prompt else ""
+    return EXTRACT_GRAPH_PROMPT.replace("USER_ID", user_id).replace("CUSTOM_PROMPT", custom_prompt), data
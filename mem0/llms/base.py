@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
@@ -112,6 +113,22 @@ class LLMBase(ABC):
         """
         pass
 
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs):
+        """
+        Asynchronously generate a response based on the given messages.
+
+        The default implementation runs `generate_response` in a worker thread. Providers with an async
+        client override it to await the request directly.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            **kwargs: Any other argument accepted by `generate_response`.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        return await asyncio.to_thread(self.generate_response, messages, **kwargs)
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
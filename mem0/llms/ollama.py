@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, Union
 
 try:
-    from ollama import Client
+    from ollama import AsyncClient, Client
 except ImportError:
     raise ImportError("The 'ollama' library is required. Please install it using 'pip install ollama'.")
 
@@ -37,6 +37,7 @@ class OllamaLLM(LLMBase):
             self.config.model = "llama3.1:70b"
 
         self.client = Client(host=self.config.ollama_base_url)
+        self.async_client = AsyncClient(host=self.config.ollama_base_url)
 
     def _parse_response(self, response, tools):
         """
@@ -66,27 +67,7 @@ class OllamaLLM(LLMBase):
         else:
             return content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a response based on the given messages using Ollama.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional Ollama-specific parameters.
-
-        Returns:
-            str: The generated response.
-        """
+    def _prepare_params(self, messages, response_format) -> Dict:
         # Build parameters for Ollama
         params = {
             "model": self.config.model,
@@ -112,6 +93,46 @@ class OllamaLLM(LLMBase):
 
         # Remove OpenAI-specific parameters that Ollama doesn't support
         params.pop("max_tokens", None)  # Ollama uses different parameter names
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using Ollama.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Ollama-specific parameters.
 
+        Returns:
+            str: The generated response.
+        """
+        params = self._prepare_params(messages, response_format)
         response = self.client.chat(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Asynchronously generate a response based on the given messages using the async Ollama client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        params = self._prepare_params(messages, response_format)
+        response = await self.async_client.chat(**params)
+        return self._parse_response(response, tools)
@@ -0,0 +1,361 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Finished tickets are kept this long so their status can still be looked up
+_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+class AddQueue:
+    """
+    Durable queue of `Memory.add` calls drained by a bounded pool of background workers.
+
+    Calls are written to a SQLite table in WAL mode before the caller gets its ticket id back, so they
+    survive a crash and are replayed when the queue is opened again. Calls sharing a scope (the same
+    `user_id`, `agent_id` and `run_id`) run one at a time in the order they were enqueued, failed calls
+    are retried with exponential backoff, and every ticket keeps its status, result or error.
+
+    Delivery is at least once: a call interrupted by a crash or retried after an error is handed to the
+    handler again, with the same ticket id. The handler can save checkpoints for its ticket with
+    `save_checkpoint` and read them back with `get_checkpoints` to resume where the earlier run stopped;
+    checkpoints are dropped once the call is done or has failed for good. Enqueueing with an
+    `idempotency_key` that is already known returns the existing ticket instead of a new one.
+
+    Several queues can share one database file: each only runs, recovers and counts the calls of its own
+    `namespace`.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Any],
+        path: str,
+        namespace: str = "",
+        max_workers: int = 2,
+        max_attempts: int = 3,
+        retry_backoff: float = 1.0,
+        poll_interval: float = 1.0,
+    ):
+        self.handler = handler
+        self.path = path
+        self.namespace = namespace
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._workers = []
+        self._create_queue_table()
+        self._recover()
+
+        if self._count_unfinished():
+            self._start_workers()
+
+    def _create_queue_table(self) -> None:
+        with self._lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS add_queue (
+                    seq             INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id              TEXT UNIQUE NOT NULL,
+                    scope           TEXT NOT NULL,
+                    payload         TEXT NOT NULL,
+                    status          TEXT NOT NULL,
+                    attempts        INTEGER NOT NULL DEFAULT 0,
+                    result          TEXT,
+                    error           TEXT,
+                    created_at      REAL NOT NULL,
+                    updated_at      REAL NOT NULL,
+                    next_attempt_at REAL NOT NULL,
+                    namespace       TEXT NOT NULL DEFAULT ''
+                )
+            """
+            )
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(add_queue)")}
+            if "namespace" not in columns:
+                self.connection.execute("ALTER TABLE add_queue ADD COLUMN namespace TEXT NOT NULL DEFAULT ''")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS add_queue_status_idx ON add_queue (status, next_attempt_at)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS add_queue_scope_idx ON add_queue (scope, seq)")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS add_queue_checkpoints (
+                    id    TEXT NOT NULL,
+                    key   TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (id, key)
+                )
+            """
+            )
+            self.connection.commit()
+
+    def _recover(self) -> None:
+        """Requeue calls that were running when the process stopped and drop long-finished tickets."""
+        now = time.time()
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                recovered = self.connection.execute(
+                    "UPDATE add_queue SET status = 'pending', updated_at = ? "
+                    "WHERE status = 'running' AND namespace = ?",
+                    (now, self.namespace),
+                ).rowcount
+                self.connection.execute(
+                    "DELETE FROM add_queue WHERE status IN ('done', 'failed') AND updated_at < ? AND namespace = ?",
+                    (now - _RETENTION_SECONDS, self.namespace),
+                )
+                self.connection.execute(
+                    "DELETE FROM add_queue_checkpoints WHERE id NOT IN (SELECT id FROM add_queue)"
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to recover the add queue: {e}")
+                raise
+        if recovered:
+            logger.info(f"Replaying {recovered} interrupted add calls from {self.path}")
+
+    def _count_unfinished(self) -> int:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM add_queue WHERE status IN ('pending', 'running') AND namespace = ?",
+                (self.namespace,),
+            ).fetchone()[0]
+
+    def _start_workers(self) -> None:
+        with self._wakeup:
+            if self._workers or self._stopping:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(target=self._run, name=f"mem0-add-queue-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def enqueue(self, kwargs: Dict[str, Any], idempotency_key: Optional[str] = None) -> str:
+        """
+        Persist an `add` call and return its ticket id.
+
+        Args:
+            kwargs (dict): Keyword arguments for the handler. Must be JSON serializable.
+            idempotency_key (str, optional): Ticket id to use. If a ticket with this id already exists, it is
+                returned and the call is not enqueued again. Defaults to a new UUID.
+
+        Returns:
+            str: The ticket id.
+        """
+        ticket_id = idempotency_key or str(uuid.uuid4())
+        scope = json.dumps([kwargs.get("user_id"), kwargs.get("agent_id"), kwargs.get("run_id")])
+        payload = json.dumps(kwargs)
+        now = time.time()
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    """
+                    INSERT OR IGNORE INTO add_queue (
+                        id, scope, payload, status, created_at, updated_at, next_attempt_at, namespace
+                    )
+                    VALUES (?, ?, ?, 'pending', ?, ?, ?, ?)
+                """,
+                    (ticket_id, scope, payload, now, now, now, self.namespace),
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to enqueue add call: {e}")
+                raise
+
+        self._start_workers()
+        with self._wakeup:
+            self._wakeup.notify()
+        return ticket_id
+
+    def get_status(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a ticket.
+
+        Returns:
+            dict or None: The ticket `id`, its `status` ("pending", "running", "done" or "failed"), the number
+                of `attempts`, the `result` of `add` once done, the last `error`, and the `created_at` and
+                `updated_at` timestamps. None if the ticket is unknown.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT id, status, attempts, result, error, created_at, updated_at FROM add_queue WHERE id = ?",
+                (ticket_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "status": row[1],
+            "attempts": row[2],
+            "result": json.loads(row[3]) if row[3] is not None else None,
+            "error": row[4],
+            "created_at": row[5],
+            "updated_at": row[6],
+        }
+
+    def save_checkpoint(self, ticket_id: str, key: str, value: Any) -> None:
+        """
+        Save the progress of a call under `key`, replacing what was saved under it before.
+
+        Args:
+            ticket_id (str): Ticket of the call.
+            key (str): Name of the checkpoint.
+            value: JSON serializable progress.
+        """
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO add_queue_checkpoints (id, key, value) VALUES (?, ?, ?)",
+                    (ticket_id, key, json.dumps(value)),
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to save checkpoint {key} of add call {ticket_id}: {e}")
+                raise
+
+    def get_checkpoints(self, ticket_id: str) -> Dict[str, Any]:
+        """Return the checkpoints saved for a call, by key."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT key, value FROM add_queue_checkpoints WHERE id = ?", (ticket_id,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def wait(self, ticket_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until the ticket is done or failed, or until `timeout` seconds have passed, and return its status."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.get_status(ticket_id)
+            if status is None or status["status"] in ("done", "failed"):
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                return status
+            time.sleep(0.05)
+
+    def _claim(self) -> Optional[tuple]:
+        """Mark the oldest runnable call as running, skipping scopes that still have an earlier call."""
+        now = time.time()
+        with self._lock:
+            if self.connection is None:
+                return None
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+                row = self.connection.execute(
+                    """
+                    SELECT q.id, q.payload, q.attempts FROM add_queue q
+                    WHERE q.status = 'pending' AND q.next_attempt_at <= ? AND q.namespace = ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM add_queue p
+                          WHERE p.namespace = q.namespace AND p.scope = q.scope AND p.seq < q.seq
+                            AND p.status IN ('pending', 'running')
+                      )
+                    ORDER BY q.seq
+                    LIMIT 1
+                """,
+                    (now, self.namespace),
+                ).fetchone()
+                if row is not None:
+                    self.connection.execute(
+                        "UPDATE add_queue SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                        (now, row[0]),
+                    )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to claim add call: {e}")
+                return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2] + 1
+
+    def _finish(self, ticket_id: str, status: str, result=None, error=None, next_attempt_at=None) -> None:
+        now = time.time()
+        with self._lock:
+            if self.connection is None:
+                return
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    """
+                    UPDATE add_queue
+                    SET status = ?, result = ?, error = ?, updated_at = ?, next_attempt_at = ?
+                    WHERE id = ?
+                """,
+                    (
+                        status,
+                        json.dumps(result, default=str) if result is not None else None,
+                        error,
+                        now,
+                        next_attempt_at if next_attempt_at is not None else now,
+                        ticket_id,
+                    ),
+                )
+                if status in ("done", "failed"):
+                    self.connection.execute("DELETE FROM add_queue_checkpoints WHERE id = ?", (ticket_id,))
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to record add call {ticket_id} as {status}: {e}")
+
+    def _run(self) -> None:
+        while not self._stopping:
+            job = self._claim()
+            if job is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+
+            ticket_id, kwargs, attempts = job
+            try:
+                result = self.handler(ticket_id, **kwargs)
+            except Exception as e:
+                if attempts < self.max_attempts:
+                    delay = self.retry_backoff * (2 ** (attempts - 1))
+                    logger.warning(f"Add call {ticket_id} failed (attempt {attempts}), retrying in {delay}s: {e}")
+                    self._finish(ticket_id, "pending", error=str(e), next_attempt_at=time.time() + delay)
+                else:
+                    logger.error(f"Add call {ticket_id} failed after {attempts} attempts: {e}")
+                    self._finish(ticket_id, "failed", error=str(e))
+            else:
+                self._finish(ticket_id, "done", result=result)
+            # A finished call may unblock the next call of its scope
+            with self._wakeup:
+                self._wakeup.notify_all()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers once their current call finishes. Calls that have not started stay in the queue
+        and are picked up the next time it is opened.
+        """
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.join(timeout)
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
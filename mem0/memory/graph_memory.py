@@ -12,19 +12,28 @@ try:
 except ImportError:
     raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
 
+from mem0.graphs.entity_index import EntityNameIndex
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
     EXTRACT_ENTITIES_STRUCT_TOOL,
     EXTRACT_ENTITIES_TOOL,
+    EXTRACT_GRAPH_STRUCT_TOOL,
+    EXTRACT_GRAPH_TOOL,
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages, get_extract_graph_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+_ENTITY_VECTOR_INDEX = "entity_embedding"
+# Nearest neighbours fetched from the vector index per lookup, before keeping the ones in the filters' scope.
+# The number grows while the candidates may hide matches of the scope, up to the maximum.
+_VECTOR_INDEX_CANDIDATES = 100
+_VECTOR_INDEX_MAX_CANDIDATES = 6400
+
 
 class MemoryGraph:
     def __init__(self, config):
@@ -38,7 +47,10 @@ class MemoryGraph:
             driver_config={"notifications_min_severity": "OFF"},
         )
         self.embedding_model = EmbedderFactory.create(
-            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+            self.config.embedder.provider,
+            self.config.embedder.config,
+            self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
         )
         self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
 
@@ -55,6 +67,10 @@ class MemoryGraph:
             except Exception:
                 pass
 
+        self.vector_index = None
+        if self.config.graph_store.config.base_label and getattr(self.config.graph_store.config, "vector_index", True):
+            self.vector_index = self._create_vector_index()
+
         # Default to openai if no specific provider is configured
         self.llm_provider = "openai"
         if self.config.llm and self.config.llm.provider:
@@ -72,6 +88,7 @@ class MemoryGraph:
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
+        self.entity_index = EntityNameIndex()
 
     def add(self, data, filters):
         """
@@ -81,15 +98,23 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        if self.config.graph_store.extraction_mode == "combined":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            # Without existing relations around the entities there is nothing to delete.
+            to_be_deleted = []
+            if search_output:
+                to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+        self.entity_index.add(filters, [name for item in to_be_added for name in (item["source"], item["destination"])])
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -107,8 +132,7 @@ class MemoryGraph:
                 - "contexts": List of search results from the base data store.
                 - "entities": List of related graph data based on the query.
         """
-        entity_type_map = self._retrieve_nodes_from_data(query, filters)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        search_output = self._search_graph_db(node_list=self._match_query_entities(query, filters), filters=filters)
 
         if not search_output:
             return []
@@ -148,6 +172,7 @@ class MemoryGraph:
         if filters.get("run_id"):
             params["run_id"] = filters["run_id"]
         self.graph.query(cypher, params=params)
+        self.entity_index.invalidate(filters)
 
     def get_all(self, filters, limit=100):
         """
@@ -193,6 +218,23 @@ class MemoryGraph:
 
         return final_results
 
+    def _match_query_entities(self, query, filters):
+        """Find the entities a search query mentions, with an LLM call only when `entity_matcher` is "llm"."""
+        if self.config.graph_store.entity_matcher == "llm":
+            return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+        names = self.entity_index.match(query, filters, lambda: self._load_entity_names(filters))
+        # A query naming no known entity still reaches the nodes whose embedding is close to its own
+        return names or [query]
+
+    def _load_entity_names(self, filters):
+        """Names of the nodes in the filters' scope."""
+        cypher = f"""
+        MATCH (n {self.node_label} {{{", ".join(self._scope_properties(filters))}}})
+        RETURN n.name AS name
+        """
+        return [row["name"] for row in self.graph.query(cypher, params=self._scope_params(filters))]
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -268,6 +310,49 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    def _extract_graph_from_data(self, data, filters):
+        """Extract the entities, with their types, and the relations among them with one LLM call."""
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+        if filters.get("run_id"):
+            user_identity += f", run_id: {filters['run_id']}"
+
+        system_prompt, user_prompt = get_extract_graph_messages(
+            data, user_identity, self.config.graph_store.custom_prompt
+        )
+
+        _tools = [EXTRACT_GRAPH_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_GRAPH_STRUCT_TOOL]
+
+        extracted_graph = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+        relations = []
+        try:
+            for tool_call in extracted_graph["tool_calls"]:
+                if tool_call["name"] != "extract_graph":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+                relations.extend(tool_call["arguments"]["relations"])
+        except Exception as e:
+            logger.exception(
+                f"Error in extract graph tool: {e}, llm_provider={self.llm_provider}, extracted_graph={extracted_graph}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        relations = self._remove_spaces_from_entities(relations)
+        logger.debug(f"Entity type map: {entity_type_map}\n Extracted relations: {relations}")
+        return entity_type_map, relations
+
     def _search_graph_db(self, node_list, filters, limit=100):
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
@@ -280,14 +365,19 @@ class MemoryGraph:
             node_props.append("run_id: $run_id")
         node_props_str = ", ".join(node_props)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            cypher_query = f"""
+        scan_query = f"""
             MATCH (n {self.node_label} {{{node_props_str}}})
             WHERE n.embedding IS NOT NULL
             WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
             WHERE similarity >= $threshold
+            """
+        index_query = """
+            UNWIND $matches AS match
+            MATCH (n)
+            WHERE elementId(n) = match.id
+            WITH n, match.similarity AS similarity
+            """
+        relations_query = f"""
             CALL {{
                 WITH n
                 MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
@@ -303,6 +393,12 @@ class MemoryGraph:
             LIMIT $limit
             """
 
+        node_embeddings = self.embedding_model.embed_batch(node_list) if node_list else []
+        index_matches = self._query_vector_index(node_embeddings, filters, self.threshold)
+        for n_embedding, matches in zip(node_embeddings, index_matches):
+            if matches == []:
+                continue
+
             params = {
                 "n_embedding": n_embedding,
                 "threshold": self.threshold,
@@ -314,6 +410,12 @@ class MemoryGraph:
             if filters.get("run_id"):
                 params["run_id"] = filters["run_id"]
 
+            if matches is None:
+                cypher_query = scan_query + relations_query
+            else:
+                cypher_query = index_query + relations_query
+                params["matches"] = matches
+
             ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
 
@@ -356,255 +458,170 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        run_id = filters.get("run_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Build the agent filter for the query
-
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
+        """Delete the relationships from the graph in one statement."""
+        if not to_be_deleted:
+            return []
 
-            if agent_id:
-                params["agent_id"] = agent_id
-            if run_id:
-                params["run_id"] = run_id
-
-            # Build node properties for filtering
-            source_props = ["name: $source_name", "user_id: $user_id"]
-            dest_props = ["name: $dest_name", "user_id: $user_id"]
-            if agent_id:
-                source_props.append("agent_id: $agent_id")
-                dest_props.append("agent_id: $agent_id")
-            if run_id:
-                source_props.append("run_id: $run_id")
-                dest_props.append("run_id: $run_id")
-            source_props_str = ", ".join(source_props)
-            dest_props_str = ", ".join(dest_props)
-
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n {self.node_label} {{{source_props_str}}})
-            -[r:{relationship}]->
-            (m {self.node_label} {{{dest_props_str}}})
-            
+        node_props_str = ", ".join(self._scope_properties(filters))
+        cypher = f"""
+            UNWIND $rows AS row
+            MATCH (n {self.node_label} {{name: row.source, {node_props_str}}})
+            -[r]->
+            (m {self.node_label} {{name: row.destination, {node_props_str}}})
+            WHERE type(r) = row.relationship
             DELETE r
-            RETURN 
+            RETURN
+                row.index AS index,
                 n.name AS source,
                 m.name AS target,
-                type(r) AS relationship
+                row.relationship AS relationship
             """
+        rows = [
+            {
+                "index": index,
+                "source": item["source"],
+                "destination": item["destination"],
+                "relationship": item["relationship"],
+            }
+            for index, item in enumerate(to_be_deleted)
+        ]
+        result = self.graph.query(cypher, params={"rows": rows, **self._scope_params(filters)})
+        return self._group_by_index(result, len(to_be_deleted))
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+    def _add_entities(self, to_be_added, filters, entity_type_map):
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
 
-        return results
+        The entities are resolved to existing nodes in one lookup, the ones left are merged in one statement and the
+        relationships are merged in another one.
+        """
+        if not to_be_added:
+            return []
 
-    def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        run_id = filters.get("run_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            source_label = self.node_label if self.node_label else f":`{source_type}`"
-            source_extra_set = f", source:`{source_type}`" if self.node_label else ""
-            destination_type = entity_type_map.get(destination, "__User__")
-            destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-            destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                # Build destination MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
-                WITH source, destination
+        # Embed every distinct entity name once instead of once per relation endpoint
+        entity_names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
+
+        node_ids = self._search_nodes(entity_embeddings, filters)
+        new_names = [name for name in entity_names if name not in node_ids]
+        if new_names:
+            node_ids.update(self._merge_nodes(new_names, entity_embeddings, filters, entity_type_map))
+        return self._merge_relationships(to_be_added, node_ids)
+
+    def _merge_nodes(self, names, entity_embeddings, filters, entity_type_map):
+        """Merge the nodes of entities that matched no existing node, returning their ids by name."""
+        rows = [
+            {"name": name, "type": entity_type_map.get(name, "__User__"), "embedding": entity_embeddings[name]}
+            for name in names
+        ]
+        # Labels can't be parameters, so each entity type gets its own clause, applied to the rows of that type
+        node_types = list(dict.fromkeys(row["type"] for row in rows))
+        merge_props_str = ", ".join(["name: row.name"] + self._scope_properties(filters))
+
+        if self.node_label:
+            set_labels = "\n".join(
+                f"FOREACH (_ IN CASE WHEN row.type = $node_types[{i}] THEN [1] ELSE [] END | SET n:`{node_type}`)"
+                for i, node_type in enumerate(node_types)
+            )
+            merge = f"""
+            MERGE (n {self.node_label} {{{merge_props_str}}})
+            ON CREATE SET n.created = timestamp()
+            {set_labels}
+            """
+        else:
+            merges = "\n".join(
+                f"""FOREACH (_ IN CASE WHEN row.type = $node_types[{i}] THEN [1] ELSE [] END |
+                MERGE (n:`{node_type}` {{{merge_props_str}}})
+                ON CREATE SET n.created = timestamp()
+            )"""
+                for i, node_type in enumerate(node_types)
+            )
+            merge = f"""
+            {merges}
+            WITH row
+            MATCH (n {{{merge_props_str}}})
+            WHERE row.type IN labels(n)
+            """
+
+        cypher = f"""
+            UNWIND $rows AS row
+            {merge}
+            WITH n, row
+            CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)
+            RETURN row.name AS name, elementId(n) AS id
+            """
+        params = {"rows": rows, "node_types": node_types, **self._scope_params(filters)}
+        return {row["name"]: row["id"] for row in self.graph.query(cypher, params=params)}
+
+    def _merge_relationships(self, to_be_added, node_ids):
+        """Merge the relationships between resolved nodes and count the mentions of both ends."""
+        rows = [
+            {
+                "index": index,
+                "source_id": node_ids.get(item["source"]),
+                "destination_id": node_ids.get(item["destination"]),
+                "relationship": item["relationship"],
+            }
+            for index, item in enumerate(to_be_added)
+        ]
+        # Relationship types can't be parameters either
+        relationships = list(dict.fromkeys(row["relationship"] for row in rows))
+        merges = "\n".join(
+            f"""FOREACH (_ IN CASE WHEN row.relationship = $relationships[{i}] THEN [1] ELSE [] END |
                 MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
                 ON CREATE SET
-                    source.created = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
                     r.created = timestamp(),
                     r.mentions = 1
                 ON MATCH SET
                     r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
+            )"""
+            for i, relationship in enumerate(relationships)
+        )
 
-            else:
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                if run_id:
-                    source_props.append("run_id: $run_id")
-                    dest_props.append("run_id: $run_id")
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET source.created = timestamp(),
-                            source.mentions = 1
-                            {source_extra_set}
-                ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET destination.created = timestamp(),
-                            destination.mentions = 1
-                            {destination_extra_set}
-                ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
-                WITH source, destination
-                MERGE (source)-[rel:{relationship}]->(destination)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN source.name AS source, type(rel) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+        cypher = f"""
+            UNWIND $rows AS row
+            MATCH (source)
+            WHERE elementId(source) = row.source_id
+            MATCH (destination)
+            WHERE elementId(destination) = row.destination_id
+            SET source.mentions = coalesce(source.mentions, 0) + 1
+            SET destination.mentions = coalesce(destination.mentions, 0) + 1
+            {merges}
+            RETURN
+                row.index AS index,
+                source.name AS source,
+                row.relationship AS relationship,
+                destination.name AS target
+            """
+        result = self.graph.query(cypher, params={"rows": rows, "relationships": relationships})
+        return self._group_by_index(result, len(to_be_added))
+
+    @staticmethod
+    def _group_by_index(result, count):
+        """Split the rows of a batched statement back into one list per input item."""
+        grouped = [[] for _ in range(count)]
+        for row in result:
+            grouped[row.pop("index")].append(row)
+        return grouped
+
+    @staticmethod
+    def _scope_properties(filters):
+        """Node properties pinning a pattern to the filters' scope."""
+        props = ["user_id: $user_id"]
+        if filters.get("agent_id"):
+            props.append("agent_id: $agent_id")
+        if filters.get("run_id"):
+            props.append("run_id: $run_id")
+        return props
+
+    @staticmethod
+    def _scope_params(filters):
+        """Parameters of the filters' scope."""
+        params = {"user_id": filters["user_id"]}
+        for key in ("agent_id", "run_id"):
+            if filters.get(key):
+                params[key] = filters[key]
+        return params
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
@@ -614,80 +631,132 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
-        # Build WHERE conditions
-        where_conditions = ["source_candidate.embedding IS NOT NULL", "source_candidate.user_id = $user_id"]
-        if filters.get("agent_id"):
-            where_conditions.append("source_candidate.agent_id = $agent_id")
-        if filters.get("run_id"):
-            where_conditions.append("source_candidate.run_id = $run_id")
-        where_clause = " AND ".join(where_conditions)
+    def _create_vector_index(self):
+        """Create the vector index on entity embeddings, returning its name, or None where it can't be created."""
+        dims = getattr(self.embedding_model.config, "embedding_dims", None)
+        if not isinstance(dims, int) or dims <= 0:
+            logger.info("Embedding dimensions unknown, graph entities will be resolved by scanning nodes")
+            return None
+        try:
+            self.graph.query(
+                f"CREATE VECTOR INDEX {_ENTITY_VECTOR_INDEX} IF NOT EXISTS FOR (n {self.node_label}) ON (n.embedding) "
+                f"OPTIONS {{indexConfig: {{`vector.dimensions`: {dims}, `vector.similarity_function`: 'cosine'}}}}"
+            )
+        except Exception as e:
+            # Vector indexes need Neo4j 5.11+
+            logger.info(f"Vector index unavailable, graph entities will be resolved by scanning nodes: {e}")
+            return None
+        return _ENTITY_VECTOR_INDEX
 
-        cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE {where_clause}
+    def _query_vector_index(self, embeddings, filters, threshold):
+        """
+        Find the nodes of the filters' scope at or above the similarity threshold through the vector index.
+
+        The index is shared by every user, so the nearest candidates are fetched first and the ones out of scope
+        dropped. While the candidates may still hide matches, more are fetched, up to a maximum. All embeddings are
+        looked up in one query per round.
 
-            WITH source_candidate,
-            round(2 * vector.similarity.cosine(source_candidate.embedding, $source_embedding) - 1, 4) AS source_similarity // denormalize for backward compatibility
-            WHERE source_similarity >= $threshold
+        Args:
+            embeddings (list): Embeddings to look up.
+            filters (dict): Scope of the lookup, with `user_id` and optionally `agent_id` and `run_id`.
+            threshold (float): Minimum similarity of a match.
 
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
+        Returns:
+            list: For each embedding, `{"id", "similarity"}` dicts, most similar first, or None when the nodes must
+            be scanned.
+        """
+        results = [None] * len(embeddings)
+        if not self.vector_index or not embeddings:
+            return results
 
-            RETURN elementId(source_candidate)
+        scope = [f"node.{key} = ${key}" for key in self._scope_params(filters)]
+        cypher = f"""
+            UNWIND $entities AS entity
+            CALL {{
+                WITH entity
+                CALL db.index.vector.queryNodes($index_name, $candidates, entity.embedding)
+                YIELD node, score
+                WITH node, round(2 * score - 1, 4) AS similarity // denormalize for backward compatibility
+                RETURN collect(
+                    CASE WHEN {" AND ".join(scope)} AND similarity >= $threshold
+                    THEN {{id: elementId(node), similarity: similarity}} END
+                ) AS matches, count(node) AS fetched, min(similarity) AS lowest
+            }}
+            RETURN entity.key AS key, matches, fetched, lowest
             """
+        params = {"index_name": self.vector_index, "threshold": threshold, **self._scope_params(filters)}
 
-        params = {
-            "source_embedding": source_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
-        if filters.get("run_id"):
-            params["run_id"] = filters["run_id"]
+        pending = list(range(len(embeddings)))
+        candidates = _VECTOR_INDEX_CANDIDATES
+        while pending:
+            entities = [{"key": key, "embedding": embeddings[key]} for key in pending]
+            try:
+                rows = self.graph.query(cypher, params={**params, "entities": entities, "candidates": candidates})
+            except Exception as e:
+                logger.warning(f"Vector index query failed, graph entities will be resolved by scanning nodes: {e}")
+                self.vector_index = None
+                return [None] * len(embeddings)
+
+            pending = []
+            for row in rows:
+                # Past the last candidate, nodes are either missing from the index or below the threshold
+                if row["fetched"] < candidates or row["lowest"] < threshold:
+                    results[row["key"]] = row["matches"]
+                else:
+                    pending.append(row["key"])
+            if candidates >= _VECTOR_INDEX_MAX_CANDIDATES:
+                break
+            candidates = min(candidates * 4, _VECTOR_INDEX_MAX_CANDIDATES)
+        return results
 
-        result = self.graph.query(cypher, params=params)
-        return result
+    def _search_nodes(self, entity_embeddings, filters):
+        """
+        Resolve entities to the most similar existing node of the filters' scope, at or above the threshold.
 
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
-        # Build WHERE conditions
-        where_conditions = ["destination_candidate.embedding IS NOT NULL", "destination_candidate.user_id = $user_id"]
-        if filters.get("agent_id"):
-            where_conditions.append("destination_candidate.agent_id = $agent_id")
-        if filters.get("run_id"):
-            where_conditions.append("destination_candidate.run_id = $run_id")
+        Args:
+            entity_embeddings (dict): Embeddings by entity name.
+            filters (dict): Scope of the lookup, with `user_id` and optionally `agent_id` and `run_id`.
+
+        Returns:
+            dict: Element ids of the resolved nodes by entity name. Entities without a match are left out.
+        """
+        names = list(entity_embeddings)
+        node_ids = {}
+        scan = []
+        index_matches = self._query_vector_index([entity_embeddings[name] for name in names], filters, self.threshold)
+        for name, matches in zip(names, index_matches):
+            if matches is None:
+                scan.append(name)
+            elif matches:
+                node_ids[name] = matches[0]["id"]
+        if not scan:
+            return node_ids
+
+        where_conditions = ["candidate.embedding IS NOT NULL"]
+        where_conditions += [f"candidate.{key} = ${key}" for key in self._scope_params(filters)]
         where_clause = " AND ".join(where_conditions)
 
         cypher = f"""
-            MATCH (destination_candidate {self.node_label})
+            UNWIND $entities AS entity
+            MATCH (candidate {self.node_label})
             WHERE {where_clause}
 
-            WITH destination_candidate,
-            round(2 * vector.similarity.cosine(destination_candidate.embedding, $destination_embedding) - 1, 4) AS destination_similarity // denormalize for backward compatibility
-
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
+            WITH entity, candidate,
+            round(2 * vector.similarity.cosine(candidate.embedding, entity.embedding) - 1, 4) AS similarity // denormalize for backward compatibility
+            WHERE similarity >= $threshold
 
-            RETURN elementId(destination_candidate)
+            WITH entity, candidate, similarity
+            ORDER BY similarity DESC
+            RETURN entity.name AS name, collect(elementId(candidate))[0] AS id
             """
-
         params = {
-            "destination_embedding": destination_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
+            "entities": [{"name": name, "embedding": entity_embeddings[name]} for name in scan],
+            "threshold": self.threshold,
+            **self._scope_params(filters),
         }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
-        if filters.get("run_id"):
-            params["run_id"] = filters["run_id"]
-
-        result = self.graph.query(cypher, params=params)
-        return result
+        for row in self.graph.query(cypher, params=params):
+            node_ids[row["name"]] = row["id"]
+        return node_ids
 
     # Reset is not defined in base.py
     def reset(self):
@@ -696,4 +765,5 @@ class MemoryGraph:
         cypher_query = """
         MATCH (n) DETACH DELETE n
         """
+        self.entity_index.invalidate()
         return self.graph.query(cypher_query)
@@ -12,19 +12,28 @@ try:
 except ImportError:
     raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
 
+from mem0.graphs.entity_index import EntityNameIndex
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
     EXTRACT_ENTITIES_STRUCT_TOOL,
     EXTRACT_ENTITIES_TOOL,
+    EXTRACT_GRAPH_STRUCT_TOOL,
+    EXTRACT_GRAPH_TOOL,
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages, get_extract_graph_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+_ENTITY_VECTOR_INDEX = "entity_embedding"
+# Nearest neighbours fetched from the vector index per lookup, before keeping the ones in the filters' scope.
+# The number grows while the candidates may hide matches of the scope, up to the maximum.
+_VECTOR_INDEX_CANDIDATES = 16
+_VECTOR_INDEX_MAX_CANDIDATES = 4096
+
 
 class MemoryGraph:
     def __init__(self, config):
@@ -34,6 +43,7 @@ class MemoryGraph:
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
         )
         self.embedding_dims = self.embedding_model.config.embedding_dims
 
@@ -47,6 +57,10 @@ class MemoryGraph:
         self.rel_label = ":CONNECTED_TO"
         self.kuzu_create_schema()
 
+        self.vector_index = None
+        if getattr(self.config.graph_store.config, "vector_index", False):
+            self.vector_index = self._create_vector_index()
+
         # Default to openai if no specific provider is configured
         self.llm_provider = "openai"
         if self.config.llm and self.config.llm.provider:
@@ -64,10 +78,11 @@ class MemoryGraph:
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
+        self.entity_index = EntityNameIndex()
 
     def kuzu_create_schema(self):
         self.kuzu_execute(
-            """
+            f"""
             CREATE NODE TABLE IF NOT EXISTS Entity(
                 id SERIAL PRIMARY KEY,
                 user_id STRING,
@@ -76,9 +91,10 @@ class MemoryGraph:
                 name STRING,
                 mentions INT64,
                 created TIMESTAMP,
-                embedding FLOAT[]);
+                embedding FLOAT[{self.embedding_dims}]);
             """
         )
+        self._migrate_embedding_column()
         self.kuzu_execute(
             """
             CREATE REL TABLE IF NOT EXISTS CONNECTED_TO(
@@ -91,6 +107,54 @@ class MemoryGraph:
             """
         )
 
+    def _migrate_embedding_column(self):
+        """
+        Move the embeddings of databases created with a variable-size `embedding FLOAT[]` column to a
+        `FLOAT[dims]` one, which the vector index needs. The old column is kept as `embedding_legacy` and
+        emptied, since Kuzu cannot reliably drop a column of a persisted table. Embeddings of another size are
+        dropped: they came from another embedder and could not be compared with the current one's anyway.
+        """
+        columns = {row["name"]: row["type"] for row in self.kuzu_execute("CALL table_info('Entity') RETURN *")}
+        column_type = f"FLOAT[{self.embedding_dims}]"
+        if columns.get("embedding") == "FLOAT[]":
+            logger.info(f"Migrating Entity.embedding from FLOAT[] to {column_type}")
+            self.kuzu_execute("ALTER TABLE Entity RENAME embedding TO embedding_legacy")
+            columns["embedding_legacy"] = columns.pop("embedding")
+        if "embedding" not in columns:
+            self.kuzu_execute(f"ALTER TABLE Entity ADD embedding {column_type}")
+            columns["embedding"] = column_type
+        if columns["embedding"] != column_type:
+            raise ValueError(
+                f"Entity.embedding is {columns['embedding']} but the embedder produces {column_type} vectors"
+            )
+        if "embedding_legacy" not in columns:
+            return
+
+        # Both statements only touch the nodes left to migrate, so an interrupted migration resumes on restart
+        self.kuzu_execute(
+            f"""
+            MATCH (n:Entity)
+            WHERE n.embedding_legacy IS NOT NULL AND size(n.embedding_legacy) = {self.embedding_dims}
+            SET n.embedding = CAST(n.embedding_legacy, '{column_type}'), n.embedding_legacy = NULL
+            """
+        )
+        self.kuzu_execute("MATCH (n:Entity) WHERE n.embedding_legacy IS NOT NULL SET n.embedding_legacy = NULL")
+
+    def _create_vector_index(self):
+        """Create the HNSW index on the Entity embeddings. Returns its name, or None if Kuzu cannot create it."""
+        try:
+            if not any(
+                row["index_name"] == _ENTITY_VECTOR_INDEX
+                for row in self.kuzu_execute("CALL SHOW_INDEXES() RETURN index_name")
+            ):
+                self.kuzu_execute(
+                    f"CALL CREATE_VECTOR_INDEX('Entity', '{_ENTITY_VECTOR_INDEX}', 'embedding', metric := 'cosine')"
+                )
+            return _ENTITY_VECTOR_INDEX
+        except Exception as e:
+            logger.warning(f"Could not create the Kuzu vector index, entity lookups will scan the nodes: {e}")
+            return None
+
     def kuzu_execute(self, query, parameters=None):
         results = self.graph.execute(query, parameters)
         return list(results.rows_as_dict())
@@ -103,13 +167,22 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        if self.config.graph_store.extraction_mode == "combined":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            # Without existing relations around the entities there is nothing to delete.
+            to_be_deleted = []
+            if search_output:
+                to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+        self.entity_index.add(filters, [name for item in to_be_added for name in (item["source"], item["destination"])])
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -127,8 +200,7 @@ class MemoryGraph:
                 - "contexts": List of search results from the base data store.
                 - "entities": List of related graph data based on the query.
         """
-        entity_type_map = self._retrieve_nodes_from_data(query, filters)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        search_output = self._search_graph_db(node_list=self._match_query_entities(query, filters), filters=filters)
 
         if not search_output:
             return []
@@ -168,6 +240,7 @@ class MemoryGraph:
         if filters.get("run_id"):
             params["run_id"] = filters["run_id"]
         self.kuzu_execute(cypher, parameters=params)
+        self.entity_index.invalidate(filters)
 
     def get_all(self, filters, limit=100):
         """
@@ -219,6 +292,30 @@ class MemoryGraph:
 
         return final_results
 
+    def _match_query_entities(self, query, filters):
+        """Find the entities a search query mentions, with an LLM call only when `entity_matcher` is "llm"."""
+        if self.config.graph_store.entity_matcher == "llm":
+            return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+        names = self.entity_index.match(query, filters, lambda: self._load_entity_names(filters))
+        # A query naming no known entity still reaches the nodes whose embedding is close to its own
+        return names or [query]
+
+    def _load_entity_names(self, filters):
+        """Names of the nodes in the filters' scope."""
+        node_props = ["user_id: $user_id"]
+        params = {"user_id": filters["user_id"]}
+        for key in ("agent_id", "run_id"):
+            if filters.get(key):
+                node_props.append(f"{key}: ${key}")
+                params[key] = filters[key]
+
+        cypher = f"""
+        MATCH (n {self.node_label} {{{", ".join(node_props)}}})
+        RETURN n.name AS name
+        """
+        return [row["name"] for row in self.kuzu_execute(cypher, parameters=params)]
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -294,15 +391,67 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    def _extract_graph_from_data(self, data, filters):
+        """Extract the entities, with their types, and the relations among them with one LLM call."""
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+        if filters.get("run_id"):
+            user_identity += f", run_id: {filters['run_id']}"
+
+        system_prompt, user_prompt = get_extract_graph_messages(
+            data, user_identity, self.config.graph_store.custom_prompt
+        )
+
+        _tools = [EXTRACT_GRAPH_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_GRAPH_STRUCT_TOOL]
+
+        extracted_graph = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+        relations = []
+        try:
+            for tool_call in extracted_graph["tool_calls"]:
+                if tool_call["name"] != "extract_graph":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+                relations.extend(tool_call["arguments"]["relations"])
+        except Exception as e:
+            logger.exception(
+                f"Error in extract graph tool: {e}, llm_provider={self.llm_provider}, extracted_graph={extracted_graph}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        relations = self._remove_spaces_from_entities(relations)
+        logger.debug(f"Entity type map: {entity_type_map}\n Extracted relations: {relations}")
+        return entity_type_map, relations
+
     def _search_graph_db(self, node_list, filters, limit=100, threshold=None):
         """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
+        threshold = threshold if threshold else self.threshold
+        node_embeddings = self.embedding_model.embed_batch(node_list) if node_list else []
+        hits = [
+            {
+                "node": index,
+                "table_id": match["id"]["table"],
+                "offset_id": match["id"]["offset"],
+                "similarity": match["similarity"],
+            }
+            for index, n_embedding in enumerate(node_embeddings)
+            for match in self._search_node(n_embedding, filters, threshold)
+        ]
+        if not hits:
+            return []
 
-        params = {
-            "threshold": threshold if threshold else self.threshold,
-            "user_id": filters["user_id"],
-            "limit": limit,
-        }
+        params = {"hits": hits, "user_id": filters["user_id"]}
         # Build node properties for filtering
         node_props = ["user_id: $user_id"]
         if filters.get("agent_id"):
@@ -313,36 +462,37 @@ class MemoryGraph:
             params["run_id"] = filters["run_id"]
         node_props_str = ", ".join(node_props)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-            params["n_embedding"] = n_embedding
-
-            results = []
-            for match_fragment in [
-                f"(n)-[r]->(m {self.node_label} {{{node_props_str}}}) WITH n as src, r, m as dst, similarity",
-                f"(m {self.node_label} {{{node_props_str}}})-[r]->(n) WITH m as src, r, n as dst, similarity"
-            ]:
-                results.extend(self.kuzu_execute(
-                    f"""
-                    MATCH (n {self.node_label} {{{node_props_str}}})
-                    WHERE n.embedding IS NOT NULL
-                    WITH n, array_cosine_similarity(n.embedding, CAST($n_embedding,'FLOAT[{self.embedding_dims}]')) AS similarity
-                    WHERE similarity >= CAST($threshold, 'DOUBLE')
-                    MATCH {match_fragment}
-                    RETURN
-                        src.name AS source,
-                        id(src) AS source_id,
-                        r.name AS relationship,
-                        id(r) AS relation_id,
-                        dst.name AS destination,
-                        id(dst) AS destination_id,
-                        similarity
-                    LIMIT $limit
-                    """,
-                    parameters=params))
-
-            # Kuzu does not support sort/limit over unions. Do it manually for now.
-            result_relations.extend(sorted(results, key=lambda x: x["similarity"], reverse=True)[:limit])
+        results = []
+        for match_fragment in [
+            f"(n)-[r]->(m {self.node_label} {{{node_props_str}}}) WITH n as src, r, m as dst, similarity, node",
+            f"(m {self.node_label} {{{node_props_str}}})-[r]->(n) WITH m as src, r, n as dst, similarity, node",
+        ]:
+            results.extend(self.kuzu_execute(
+                f"""
+                UNWIND $hits AS hit
+                MATCH (n {self.node_label})
+                WHERE id(n) = internal_id(hit.table_id, hit.offset_id)
+                WITH n, hit.similarity AS similarity, hit.node AS node
+                MATCH {match_fragment}
+                RETURN
+                    node,
+                    src.name AS source,
+                    id(src) AS source_id,
+                    r.name AS relationship,
+                    id(r) AS relation_id,
+                    dst.name AS destination,
+                    id(dst) AS destination_id,
+                    similarity
+                """,
+                parameters=params))
+
+        # Kuzu does not support sort/limit over unions. Do it manually for now.
+        relations_by_node = [[] for _ in node_embeddings]
+        for row in results:
+            relations_by_node[row.pop("node")].append(row)
+        result_relations = []
+        for relations in relations_by_node:
+            result_relations.extend(sorted(relations, key=lambda x: x["similarity"], reverse=True)[:limit])
 
         return result_relations
 
@@ -433,203 +583,70 @@ class MemoryGraph:
 
     def _add_entities(self, to_be_added, filters, entity_type_map):
         """Add the new entities to the graph. Merge the nodes if they already exist."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        run_id = filters.get("run_id", None)
         results = []
+        # Embed every distinct entity name once instead of once per relation endpoint
+        entity_names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names))) if entity_names else {}
         for item in to_be_added:
-            # entities
-            source = item["source"]
-            source_label = self.node_label
+            source_id = self._resolve_node(item["source"], entity_embeddings[item["source"]], filters)
+            destination_id = self._resolve_node(item["destination"], entity_embeddings[item["destination"]], filters)
 
-            destination = item["destination"]
-            destination_label = self.node_label
+            cypher = f"""
+            MATCH (source)
+            WHERE id(source) = internal_id($src_table, $src_offset)
+            SET source.mentions = coalesce(source.mentions, 0) + 1
+            WITH source
+            MATCH (destination)
+            WHERE id(destination) = internal_id($dst_table, $dst_offset)
+            SET destination.mentions = coalesce(destination.mentions, 0) + 1
+            MERGE (source)-[r {self.rel_label} {{name: $relationship_name}}]->(destination)
+            ON CREATE SET
+                r.created = current_timestamp(),
+                r.updated = current_timestamp(),
+                r.mentions = 1
+            ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
+            RETURN
+                source.name AS source,
+                r.name AS relationship,
+                destination.name AS target
+            """
+            params = {
+                "src_table": source_id["table"],
+                "src_offset": source_id["offset"],
+                "dst_table": destination_id["table"],
+                "dst_offset": destination_id["offset"],
+                "relationship_name": item["relationship"],
+            }
+            results.append(self.kuzu_execute(cypher, parameters=params))
 
-            relationship = item["relationship"]
-            relationship_label = self.rel_label
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            if not destination_node_search_result and source_node_search_result:
-                params = {
-                    "table_id": source_node_search_result[0]["id"]["table"],
-                    "offset_id": source_node_search_result[0]["id"]["offset"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "relationship_name": relationship,
-                    "user_id": user_id,
-                }
-                # Build source MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE id(source) = internal_id($table_id, $offset_id)
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = current_timestamp(),
-                    destination.mentions = 1,
-                    destination.embedding = CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1,
-                    destination.embedding = CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
-            elif destination_node_search_result and not source_node_search_result:
-                params = {
-                    "table_id": destination_node_search_result[0]["id"]["table"],
-                    "offset_id": destination_node_search_result[0]["id"]["offset"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                    "relationship_name": relationship,
-                }
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE id(destination) = internal_id($table_id, $offset_id)
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
-                ON CREATE SET
-                source.created = current_timestamp(),
-                source.mentions = 1,
-                source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                source.mentions = coalesce(source.mentions, 0) + 1,
-                source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE id(source) = internal_id($src_table, $src_offset)
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE id(destination) = internal_id($dst_table, $dst_offset)
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.updated = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
-
-                params = {
-                    "src_table": source_node_search_result[0]["id"]["table"],
-                    "src_offset": source_node_search_result[0]["id"]["offset"],
-                    "dst_table": destination_node_search_result[0]["id"]["table"],
-                    "dst_offset": destination_node_search_result[0]["id"]["offset"],
-                    "relationship_name": relationship,
-                }
-            else:
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "relationship_name": relationship,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    source_props.append("run_id: $run_id")
-                    dest_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET
-                    source.created = current_timestamp(),
-                    source.mentions = 1,
-                    source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1,
-                    source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET
-                    destination.created = current_timestamp(),
-                    destination.mentions = 1,
-                    destination.embedding = CAST($dest_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1,
-                    destination.embedding = CAST($dest_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[rel {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    rel.created = current_timestamp(),
-                    rel.mentions = 1
-                ON MATCH SET
-                    rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    rel.name AS relationship,
-                    destination.name AS target
-                """
+        return results
 
-            result = self.kuzu_execute(cypher, parameters=params)
-            results.append(result)
+    def _resolve_node(self, name, embedding, filters):
+        """Id of the node closest to the entity in the filters' scope, or of its node by name, created if missing."""
+        matches = self._search_node(embedding, filters, self.threshold, limit=1)
+        if matches:
+            return matches[0]["id"]
+
+        params = {"name": name, "user_id": filters["user_id"]}
+        props = ["name: $name", "user_id: $user_id"]
+        for key in ("agent_id", "run_id"):
+            if filters.get(key):
+                props.append(f"{key}: ${key}")
+                params[key] = filters[key]
+        props_str = ", ".join(props)
+
+        existing = self.kuzu_execute(
+            f"MATCH (n {self.node_label} {{{props_str}}}) RETURN id(n) AS id LIMIT 1", parameters=params
+        )
+        if existing:
+            return existing[0]["id"]
 
-        return results
+        # The embedding is only written on creation: Kuzu refuses updates to a property covered by a vector index
+        cypher = f"""
+        CREATE (n {self.node_label} {{{props_str}, mentions: 0, created: current_timestamp(), embedding: $embedding}})
+        RETURN id(n) AS id
+        """
+        return self.kuzu_execute(cypher, parameters={**params, "embedding": embedding})[0]["id"]
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
@@ -638,71 +655,107 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
+    def _search_node(self, embedding, filters, threshold, limit=None):
+        """
+        Find the nodes of the filters' scope whose embedding is at least `threshold` similar to the given one.
+
+        Args:
+            embedding (list): Embedding to compare the nodes with.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            threshold (float): Minimum cosine similarity of the returned nodes.
+            limit (int, optional): Maximum number of nodes to return. Defaults to all of them.
+
+        Returns:
+            list: `{"id", "similarity"}` of the matching nodes, most similar first.
+        """
+        if self.vector_index:
+            matches = self._query_vector_index(embedding, filters, threshold)
+            if matches is not None:
+                return matches[:limit] if limit else matches
+
         params = {
-            "source_embedding": source_embedding,
+            "embedding": embedding,
             "user_id": filters["user_id"],
             "threshold": threshold,
         }
-        where_conditions = ["source_candidate.embedding IS NOT NULL", "source_candidate.user_id = $user_id"]
+        where_conditions = ["candidate.embedding IS NOT NULL", "candidate.user_id = $user_id"]
         if filters.get("agent_id"):
-            where_conditions.append("source_candidate.agent_id = $agent_id")
+            where_conditions.append("candidate.agent_id = $agent_id")
             params["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
-            where_conditions.append("source_candidate.run_id = $run_id")
+            where_conditions.append("candidate.run_id = $run_id")
             params["run_id"] = filters["run_id"]
         where_clause = " AND ".join(where_conditions)
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
         cypher = f"""
-            MATCH (source_candidate {self.node_label})
+            MATCH (candidate {self.node_label})
             WHERE {where_clause}
-
-            WITH source_candidate,
-            array_cosine_similarity(source_candidate.embedding, CAST($source_embedding,'FLOAT[{self.embedding_dims}]')) AS source_similarity
-
-            WHERE source_similarity >= $threshold
-
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 2
-
-            RETURN id(source_candidate) as id, source_similarity
+            WITH candidate,
+            array_cosine_similarity(candidate.embedding, CAST($embedding,'FLOAT[{self.embedding_dims}]')) AS similarity
+            WHERE similarity >= $threshold
+            RETURN id(candidate) AS id, similarity
+            ORDER BY similarity DESC
+            {limit_clause}
             """
 
         return self.kuzu_execute(cypher, parameters=params)
 
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
+    def _query_vector_index(self, embedding, filters, threshold):
+        """
+        Find the nodes of the filters' scope at least `threshold` similar to the embedding through the vector index.
+
+        The index returns the nearest nodes of every scope, so the number of candidates grows until the least
+        similar of them falls below the threshold, which means none of the scope's matches was left out. Kuzu's
+        HNSW index can stop seeing the nodes created after nodes were deleted, so when it returns fewer nodes
+        than the table holds, lookups scan the nodes from then on.
+
+        Returns:
+            list: `{"id", "similarity"}` of the matching nodes, most similar first, or None when the index
+            cannot answer and the caller should scan the nodes.
+        """
         params = {
-            "destination_embedding": destination_embedding,
+            "embedding": embedding,
             "user_id": filters["user_id"],
-            "threshold": threshold,
+            "agent_id": filters.get("agent_id") or None,
+            "run_id": filters.get("run_id") or None,
         }
-        where_conditions = ["destination_candidate.embedding IS NOT NULL", "destination_candidate.user_id = $user_id"]
-        if filters.get("agent_id"):
-            where_conditions.append("destination_candidate.agent_id = $agent_id")
-            params["agent_id"] = filters["agent_id"]
-        if filters.get("run_id"):
-            where_conditions.append("destination_candidate.run_id = $run_id")
-            params["run_id"] = filters["run_id"]
-        where_clause = " AND ".join(where_conditions)
-
         cypher = f"""
-            MATCH (destination_candidate {self.node_label})
-            WHERE {where_clause}
-
-            WITH destination_candidate,
-            array_cosine_similarity(destination_candidate.embedding, CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')) AS destination_similarity
-
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 2
-
-            RETURN id(destination_candidate) as id, destination_similarity
+            CALL QUERY_VECTOR_INDEX('Entity', '{self.vector_index}', $embedding, $candidates)
+            RETURN
+                id(node) AS id,
+                1 - distance AS similarity,
+                node.user_id = $user_id
+                    AND ($agent_id IS NULL OR node.agent_id = $agent_id)
+                    AND ($run_id IS NULL OR node.run_id = $run_id) AS in_scope
+            ORDER BY similarity DESC
             """
-
-        return self.kuzu_execute(cypher, parameters=params)
+        candidates = _VECTOR_INDEX_CANDIDATES
+        try:
+            while candidates <= _VECTOR_INDEX_MAX_CANDIDATES:
+                rows = self.kuzu_execute(cypher, parameters={**params, "candidates": candidates})
+                if len(rows) < candidates:
+                    indexed = self.kuzu_execute(
+                        "MATCH (n:Entity) WHERE n.embedding IS NOT NULL RETURN count(n) AS count"
+                    )[0]["count"]
+                    if len(rows) < indexed:
+                        logger.warning(
+                            f"Kuzu vector index returned {len(rows)} of {indexed} nodes, entity lookups will scan "
+                            "the nodes"
+                        )
+                        self.vector_index = None
+                        return None
+                if len(rows) < candidates or rows[-1]["similarity"] < threshold:
+                    return [
+                        {"id": row["id"], "similarity": row["similarity"]}
+                        for row in rows
+                        if row["in_scope"] and row["similarity"] >= threshold
+                    ]
+                candidates *= 4
+        except Exception as e:
+            logger.warning(f"Kuzu vector index query failed, entity lookups will scan the nodes: {e}")
+            self.vector_index = None
+        return None
 
     # Reset is not defined in base.py
     def reset(self):
@@ -711,4 +764,5 @@ class MemoryGraph:
         cypher_query = """
         MATCH (n) DETACH DELETE n
         """
+        self.entity_index.invalidate()
         return self.kuzu_execute(cypher_query)
@@ -1,30 +1,37 @@
 import asyncio
 import concurrent
+import functools
 import gc
 import hashlib
+import inspect
+import itertools
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pytz
 from pydantic import ValidationError
 
-from mem0.configs.base import MemoryConfig, MemoryItem
+from mem0.configs.base import MemoryConfig
 from mem0.configs.enums import MemoryType
 from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
+    get_single_pass_memory_messages,
     get_update_memory_messages,
 )
 from mem0.exceptions import ValidationError as Mem0ValidationError
+from mem0.memory.add_queue import AddQueue
 from mem0.memory.base import MemoryBase
+from mem0.memory.search_cache import SearchCache
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
-from mem0.memory.telemetry import capture_event
+from mem0.memory.telemetry import MEM0_TELEMETRY, capture_event
 from mem0.memory.utils import (
     extract_json,
     get_fact_retrieval_messages,
@@ -40,6 +47,7 @@ from mem0.utils.factory import (
     VectorStoreFactory,
     RerankerFactory,
 )
+from mem0.vector_stores.base import VectorStoreBase
 
 # Suppress SWIG deprecation warnings globally
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*SwigPy.*")
@@ -165,6 +173,386 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+# Payload keys returned at the top level of a memory, next to the MemoryItem fields
+_PROMOTED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+_CORE_AND_PROMOTED_KEYS = frozenset({"data", "hash", "created_at", "updated_at", "id", *_PROMOTED_PAYLOAD_KEYS})
+
+
+def _format_memory_item(mem, score=None, include_score=True) -> Dict[str, Any]:
+    """
+    Format a vector store record as returned by `get`, `get_all` and `search`.
+
+    Produces the same dict as `MemoryItem(...).model_dump()` followed by the promoted payload keys and the
+    leftover payload under "metadata", without building and validating a pydantic model per record.
+    """
+    payload = mem.payload
+    item = {"id": mem.id, "memory": payload.get("data", ""), "hash": payload.get("hash"), "metadata": None}
+    if include_score:
+        item["score"] = score
+    item["created_at"] = payload.get("created_at")
+    item["updated_at"] = payload.get("updated_at")
+
+    for key in _PROMOTED_PAYLOAD_KEYS:
+        if key in payload:
+            item[key] = payload[key]
+
+    if not _CORE_AND_PROMOTED_KEYS.issuperset(payload):
+        item["metadata"] = {k: v for k, v in payload.items() if k not in _CORE_AND_PROMOTED_KEYS}
+    return item
+
+
+def _normalize_add_messages(messages, memory_type: Optional[str] = None) -> list:
+    """Validate `memory_type` and coerce `messages` passed to `add` into a list of message dicts."""
+    if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
+        raise Mem0ValidationError(
+            message=f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories.",
+            error_code="VALIDATION_002",
+            details={"provided_type": memory_type, "valid_type": MemoryType.PROCEDURAL.value},
+            suggestion=f"Use '{MemoryType.PROCEDURAL.value}' to create procedural memories."
+        )
+
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+
+    if isinstance(messages, dict):
+        return [messages]
+
+    if not isinstance(messages, list):
+        raise Mem0ValidationError(
+            message="messages must be str, dict, or list[dict]",
+            error_code="VALIDATION_003",
+            details={"provided_type": type(messages).__name__, "valid_types": ["str", "dict", "list[dict]"]},
+            suggestion="Convert your input to a string, dictionary, or list of dictionaries."
+        )
+
+    return messages
+
+
+_ADD_BATCH_ITEM_KEYS = {"messages", "user_id", "agent_id", "run_id", "metadata", "infer", "memory_type", "prompt"}
+
+
+def _validate_add_batch_item(item) -> Dict[str, Any]:
+    if not isinstance(item, dict) or "messages" not in item:
+        raise Mem0ValidationError(
+            message="Each add_batch item must be a dict with a 'messages' key.",
+            error_code="VALIDATION_004",
+            details={"provided_type": type(item).__name__},
+            suggestion="Pass items such as {'messages': [...], 'user_id': 'alice'}.",
+        )
+
+    unknown_keys = set(item) - _ADD_BATCH_ITEM_KEYS
+    if unknown_keys:
+        raise Mem0ValidationError(
+            message=f"Unsupported add_batch item keys: {sorted(unknown_keys)}",
+            error_code="VALIDATION_004",
+            details={"unknown_keys": sorted(unknown_keys), "valid_keys": sorted(_ADD_BATCH_ITEM_KEYS)},
+            suggestion="Only pass the keyword arguments accepted by `add`.",
+        )
+
+    return item
+
+
+class _PendingWrites:
+    """
+    Vector inserts and history rows produced by one `add_batch` item.
+
+    `_create_memory` buffers its inserts here, so the batch can send one bulk `insert`. Updates and
+    deletes are applied to the vector store right away, and only their history rows are buffered, so
+    that all history is written in one transaction.
+    """
+
+    def __init__(self):
+        self.vectors = []
+        self.ids = []
+        self.payloads = []
+        self.history = []
+
+    def insert(self, vector, memory_id, payload):
+        self.vectors.append(vector)
+        self.ids.append(memory_id)
+        self.payloads.append(payload)
+
+    def add_history(self, memory_id, old_memory, new_memory, event, **kwargs):
+        self.history.append(
+            {"memory_id": memory_id, "old_memory": old_memory, "new_memory": new_memory, "event": event, **kwargs}
+        )
+
+    def discard_inserts(self):
+        """Drop the buffered inserts of a failed item and their history, keeping the history of applied writes."""
+        self.vectors, self.ids, self.payloads = [], [], []
+        self.history = [record for record in self.history if record["event"] != "ADD"]
+
+    def applied_writes(self) -> List[Dict[str, Any]]:
+        """Updates and deletes already applied to the vector store, in the format `add` returns them."""
+        applied = []
+        for record in self.history:
+            if record["event"] == "UPDATE":
+                applied.append(
+                    {
+                        "id": record["memory_id"],
+                        "memory": record["new_memory"],
+                        "event": "UPDATE",
+                        "previous_memory": record["old_memory"],
+                    }
+                )
+            elif record["event"] == "DELETE":
+                applied.append({"id": record["memory_id"], "memory": record["old_memory"], "event": "DELETE"})
+        return applied
+
+
+def _delete_history_records(memories) -> List[Dict[str, Any]]:
+    """Build the DELETE history rows of memories removed together, for one `batch_add_history` transaction."""
+    records = []
+    for memory in memories:
+        payload = memory.payload or {}
+        records.append(
+            {
+                "memory_id": memory.id,
+                "old_memory": payload.get("data", ""),
+                "new_memory": None,
+                "event": "DELETE",
+                "actor_id": payload.get("actor_id"),
+                "role": payload.get("role"),
+                "is_deleted": 1,
+            }
+        )
+    return records
+
+
+# Vector store settings that tell which collection a configuration writes to
+_VECTOR_STORE_IDENTITY_KEYS = (
+    "collection_name",
+    "table_name",
+    "index_name",
+    "path",
+    "url",
+    "host",
+    "port",
+    "db_name",
+    "dbname",
+    "database",
+    "endpoint",
+    "connection_string",
+    "redis_url",
+    "valkey_url",
+)
+
+
+def _vector_store_identity(vector_store_config) -> str:
+    """Short stable hash of the vector store provider and the settings that locate its collection."""
+    settings = vector_store_config.config
+    identity = {"provider": vector_store_config.provider}
+    for key in _VECTOR_STORE_IDENTITY_KEYS:
+        value = settings.get(key) if isinstance(settings, dict) else getattr(settings, key, None)
+        if value is not None:
+            identity[key] = value
+    return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _get_memory_or_none(vector_store, memory_id):
+    """Get a memory by id, or None if it does not exist, whether the store returns None, an empty result or raises."""
+    try:
+        memory = vector_store.get(vector_id=memory_id)
+    except Exception as e:
+        logger.debug(f"Treating memory {memory_id} as missing: {e}")
+        return None
+    return memory or None
+
+
+class _AddJournal:
+    """
+    Progress of a call queued by `enqueue_add`, saved as checkpoints of its ticket so that a replay resumes it.
+
+    The memory actions planned by the LLM are saved before the first one is applied, then the number of
+    applied actions and their results after each one. A replay applies the saved plan from the first action
+    that was not recorded, without asking the LLM again. New memories get ids derived from the ticket and the
+    action's position, so an ADD applied right before a crash, but not recorded yet, is found instead of
+    being written twice.
+    """
+
+    def __init__(self, add_queue, ticket_id):
+        self.add_queue = add_queue
+        self.ticket_id = ticket_id
+        checkpoints = add_queue.get_checkpoints(ticket_id)
+        self.plan = checkpoints.get("plan")
+        progress = checkpoints.get("progress", {"done": 0, "results": []})
+        self.done = progress["done"]
+        self.results = progress["results"]
+
+    def memory_id(self, index) -> str:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"mem0-add-queue:{self.ticket_id}:{index}"))
+
+    def save_plan(self, plan):
+        self.plan = plan
+        self.add_queue.save_checkpoint(self.ticket_id, "plan", plan)
+
+    def advance(self, results):
+        self.done += 1
+        self.results.extend(results)
+        self.add_queue.save_checkpoint(self.ticket_id, "progress", {"done": self.done, "results": self.results})
+
+
+def _has_native_iter_list(vector_store) -> bool:
+    """Whether the store overrides `iter_list` to page through every match instead of a single `list` call."""
+    return getattr(type(vector_store), "iter_list", None) is not VectorStoreBase.iter_list
+
+
+def _warn_if_iter_list_is_capped(vector_store):
+    if not _has_native_iter_list(vector_store):
+        logger.warning(
+            f"{type(vector_store).__name__} has no native iter_list; iter_all returns at most one page of its `list`"
+        )
+
+
+def _delete_matching_memories(vector_store, filters) -> list:
+    """
+    Delete the memories matching `filters` and return them, for their DELETE history rows.
+
+    Stores whose `iter_list` pages through every match delete them with one `delete_by_filter`. The default
+    `iter_list` stops at the store's `list` limit, so other stores delete exactly the listed memories and list
+    again until none is left, which keeps a history row for every deleted memory.
+    """
+    if _has_native_iter_list(vector_store):
+        memories = list(vector_store.iter_list(filters=filters))
+        vector_store.delete_by_filter(filters)
+        return memories
+
+    memories, deleted_ids = [], set()
+    while True:
+        page = [memory for memory in vector_store.iter_list(filters=filters) if memory.id not in deleted_ids]
+        if not page:
+            return memories
+        for memory in page:
+            vector_store.delete(memory.id)
+            deleted_ids.add(memory.id)
+        memories.extend(page)
+
+
+def _format_add_batch_result(index, result=None, error=None, applied=None) -> Dict[str, Any]:
+    if error is not None and applied:
+        return {"index": index, "status": "partial", "error": str(error), "results": applied}
+    if error is not None:
+        return {"index": index, "status": "error", "error": str(error)}
+    return {"index": index, "status": "success", **result}
+
+
+# Number of recent turns embedded to look up candidate memories in single-pass mode
+_SINGLE_PASS_SEARCH_TURNS = 10
+
+
+def _session_search_filters(filters) -> Dict[str, Any]:
+    """Keep only the session identifiers of `filters` for looking up existing memories."""
+    return {key: filters[key] for key in ("user_id", "agent_id", "run_id") if filters.get(key)}
+
+
+def _single_pass_search_turns(messages, is_agent_memory=False) -> List[str]:
+    """Pick the recent raw turns used to look up candidate memories in single-pass mode."""
+    role = "assistant" if is_agent_memory else "user"
+    candidates = [
+        msg
+        for msg in messages
+        if msg.get("role") != "system" and isinstance(msg.get("content"), str) and msg["content"].strip()
+    ]
+    turns = [msg["content"] for msg in candidates if msg["role"] == role] or [msg["content"] for msg in candidates]
+    return list(dict.fromkeys(turns[-_SINGLE_PASS_SEARCH_TURNS:]))
+
+
+def _assign_temp_memory_ids(retrieved_old_memory):
+    """Deduplicate retrieved memories and swap their IDs for integers to guard against UUID hallucinations."""
+    unique_data = {}
+    for item in retrieved_old_memory:
+        unique_data[item["id"]] = item
+    retrieved_old_memory = list(unique_data.values())
+    logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+    temp_uuid_mapping = {}
+    for idx, item in enumerate(retrieved_old_memory):
+        temp_uuid_mapping[str(idx)] = item["id"]
+        retrieved_old_memory[idx]["id"] = str(idx)
+    return retrieved_old_memory, temp_uuid_mapping
+
+
+def _parse_single_pass_response(response) -> Dict[str, Any]:
+    """Parse the facts and memory actions returned by the single-pass prompt."""
+    if not response or not response.strip():
+        logger.warning("Empty response from LLM, no memories to extract")
+        return {}
+    try:
+        response = remove_code_blocks(response)
+        try:
+            parsed = json.loads(response)
+        except json.JSONDecodeError:
+            parsed = json.loads(extract_json(response))
+    except Exception as e:
+        logger.error(f"Invalid JSON response: {e}")
+        return {}
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("memory", []), list):
+        logger.error(f"Unexpected single-pass response structure: {parsed}")
+        return {}
+    logger.debug(f"Single-pass extracted facts: {parsed.get('facts', [])}")
+    return parsed
+
+
+def _single_pass_texts_to_embed(new_memories_with_actions) -> List[str]:
+    """Texts of the ADD and UPDATE actions, which need an embedding before they are written."""
+    return list(
+        dict.fromkeys(
+            resp["text"]
+            for resp in new_memories_with_actions.get("memory", [])
+            if isinstance(resp, dict) and resp.get("event") in ("ADD", "UPDATE") and resp.get("text")
+        )
+    )
+
+
+async def _call_provider(provider, method_name, *args, **kwargs):
+    """
+    Call `method_name` on an LLM, embedder or vector store from async code.
+
+    The provider's native coroutine (`a` + `method_name`, e.g. `aembed`) is awaited when it has one.
+    Providers that don't, such as custom ones not built on the base classes, run the sync method in a
+    worker thread instead.
+    """
+    async_method = getattr(provider, f"a{method_name}", None)
+    if inspect.iscoroutinefunction(async_method):
+        return await async_method(*args, **kwargs)
+    return await asyncio.to_thread(getattr(provider, method_name), *args, **kwargs)
+
+
+def _flush_pending_writes(vector_store, db, pending_by_index) -> Dict[int, Exception]:
+    """
+    Write the buffered inserts of an `add_batch` call with one vector store `insert` and the buffered
+    history records with one transaction. Returns the errors of the items whose writes failed.
+    """
+    errors = {}
+    vectors, ids, payloads = [], [], []
+    for pending in pending_by_index.values():
+        vectors.extend(pending.vectors)
+        ids.extend(pending.ids)
+        payloads.extend(pending.payloads)
+
+    if ids:
+        try:
+            vector_store.insert(vectors=vectors, ids=ids, payloads=payloads)
+        except Exception as e:
+            logger.error(f"Error inserting {len(ids)} batched memories: {e}")
+            errors = {index: e for index, pending in pending_by_index.items() if pending.ids}
+
+    history = []
+    for index, pending in pending_by_index.items():
+        for record in pending.history:
+            # ADD records only describe memories that were actually inserted
+            if index not in errors or record["event"] != "ADD":
+                history.append(record)
+
+    try:
+        db.batch_add_history(history)
+    except Exception as e:
+        logger.error(f"Error writing history for batched memories: {e}")
+        errors.update({index: e for index, pending in pending_by_index.items() if pending.history})
+
+    return errors
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -179,6 +567,7 @@ class Memory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
@@ -196,6 +585,13 @@ class Memory(MemoryBase):
                 config.reranker.config
             )
 
+        # Optional cache of search results, invalidated by writes to the searched scope
+        self.search_cache = None
+        if self.config.search_cache:
+            self.search_cache = SearchCache(
+                max_size=self.config.search_cache.max_size, ttl=self.config.search_cache.ttl
+            )
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
@@ -204,32 +600,46 @@ class Memory(MemoryBase):
             self.enable_graph = True
         else:
             self.graph = None
-        # Create telemetry config manually to avoid deepcopy issues with thread locks
-        telemetry_config_dict = {}
-        if hasattr(self.config.vector_store.config, 'model_dump'):
-            # For pydantic models
-            telemetry_config_dict = self.config.vector_store.config.model_dump()
-        else:
-            # For other objects, manually copy common attributes
-            for attr in ['host', 'port', 'path', 'api_key', 'index_name', 'dimension', 'metric']:
-                if hasattr(self.config.vector_store.config, attr):
-                    telemetry_config_dict[attr] = getattr(self.config.vector_store.config, attr)
-
-        # Override collection name for telemetry
-        telemetry_config_dict['collection_name'] = "mem0migrations"
-
-        # Set path for file-based vector stores
-        telemetry_config = _safe_deepcopy_config(self.config.vector_store.config)
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
-            provider_path = f"migrations_{self.config.vector_store.provider}"
-            telemetry_config_dict['path'] = os.path.join(mem0_dir, provider_path)
-            os.makedirs(telemetry_config_dict['path'], exist_ok=True)
-
-        # Create the config object using the same class as the original
-        telemetry_config = self.config.vector_store.config.__class__(**telemetry_config_dict)
-        self._telemetry_vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, telemetry_config
-        )
+
+        # Worker pool for running the vector store and graph branches in parallel, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # Durable queue behind `enqueue_add`, opened on first use or right away if it holds unfinished calls
+        self._add_queue = None
+        self._add_queue_lock = threading.Lock()
+        if os.path.exists(self._add_queue_path()):
+            self._get_add_queue()
+
+        # The migrations store only backs telemetry, so skip creating it when telemetry is disabled
+        self._telemetry_vector_store = None
+        if MEM0_TELEMETRY:
+            # Create telemetry config manually to avoid deepcopy issues with thread locks
+            telemetry_config_dict = {}
+            if hasattr(self.config.vector_store.config, 'model_dump'):
+                # For pydantic models
+                telemetry_config_dict = self.config.vector_store.config.model_dump()
+            else:
+                # For other objects, manually copy common attributes
+                for attr in ['host', 'port', 'path', 'api_key', 'index_name', 'dimension', 'metric']:
+                    if hasattr(self.config.vector_store.config, attr):
+                        telemetry_config_dict[attr] = getattr(self.config.vector_store.config, attr)
+
+            # Override collection name for telemetry
+            telemetry_config_dict['collection_name'] = "mem0migrations"
+
+            # Set path for file-based vector stores
+            telemetry_config = _safe_deepcopy_config(self.config.vector_store.config)
+            if self.config.vector_store.provider in ["faiss", "qdrant"]:
+                provider_path = f"migrations_{self.config.vector_store.provider}"
+                telemetry_config_dict['path'] = os.path.join(mem0_dir, provider_path)
+                os.makedirs(telemetry_config_dict['path'], exist_ok=True)
+
+            # Create the config object using the same class as the original
+            telemetry_config = self.config.vector_store.config.__class__(**telemetry_config_dict)
+            self._telemetry_vector_store = VectorStoreFactory.create(
+                self.config.vector_store.provider, telemetry_config
+            )
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
     @classmethod
@@ -327,7 +737,31 @@ class Memory(MemoryBase):
             LLMError: If LLM operations fail.
             DatabaseError: If database operations fail.
         """
+        return self._add(
+            messages,
+            user_id=user_id,
+            agent_id=agent_id,
+            run_id=run_id,
+            metadata=metadata,
+            infer=infer,
+            memory_type=memory_type,
+            prompt=prompt,
+        )
 
+    def _add(
+        self,
+        messages,
+        *,
+        user_id=None,
+        agent_id=None,
+        run_id=None,
+        metadata=None,
+        infer=True,
+        memory_type=None,
+        prompt=None,
+        journal=None,
+    ):
+        """Run `add`, recording its progress in the `_AddJournal` of a queued call if one is given."""
         processed_metadata, effective_filters = _build_filters_and_metadata(
             user_id=user_id,
             agent_id=agent_id,
@@ -335,57 +769,248 @@ class Memory(MemoryBase):
             input_metadata=metadata,
         )
 
-        if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
-            raise Mem0ValidationError(
-                message=f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories.",
-                error_code="VALIDATION_002",
-                details={"provided_type": memory_type, "valid_type": MemoryType.PROCEDURAL.value},
-                suggestion=f"Use '{MemoryType.PROCEDURAL.value}' to create procedural memories."
+        messages = _normalize_add_messages(messages, memory_type)
+
+        if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
+            results = self._create_procedural_memory(
+                messages, metadata=processed_metadata, prompt=prompt, journal=journal
             )
+            return results
 
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
+        if self.config.llm.config.get("enable_vision"):
+            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        else:
+            messages = parse_vision_messages(messages)
 
-        elif isinstance(messages, dict):
-            messages = [messages]
+        add_to_vector_store = self._add_to_vector_store
+        if journal is not None:
+            add_to_vector_store = functools.partial(add_to_vector_store, journal=journal)
 
-        elif not isinstance(messages, list):
+        if not self.enable_graph:
+            return {"results": add_to_vector_store(messages, processed_metadata, effective_filters, infer)}
+
+        executor = self._get_executor()
+        future1 = executor.submit(add_to_vector_store, messages, processed_metadata, effective_filters, infer)
+        future2 = executor.submit(self._add_to_graph, messages, effective_filters)
+
+        concurrent.futures.wait([future1, future2])
+
+        vector_store_result = future1.result()
+        graph_result = future2.result()
+
+        return {
+            "results": vector_store_result,
+            "relations": graph_result,
+        }
+
+    def add_batch(self, items: List[Dict[str, Any]], *, concurrency: int = 8):
+        """
+        Create memories for many conversations in one call.
+
+        Only the writes are batched: new memories from all items are written with a single bulk vector
+        store `insert` and all history records in a single transaction. Everything before that runs per
+        item as in `add`: fact extraction, embedding the facts, a similarity search per fact and the
+        memory update call. Items run on the instance's worker pool, up to `concurrency` at a time (and no
+        more than `executor_max_workers`). Items are reconciled against the memories that existed before
+        the batch started, so memories added by one item are not visible to the other items of the batch.
+
+        Args:
+            items (List[Dict[str, Any]]): Items to add. Each item is a dict with a `messages` key and
+                any of the other keyword arguments of `add` (`user_id`, `agent_id`, `run_id`,
+                `metadata`, `infer`, `memory_type`, `prompt`).
+            concurrency (int, optional): Maximum number of items processed in parallel. Defaults to 8.
+
+        Returns:
+            dict: A dictionary with one entry per item, in input order, under the "results" key. Successful
+                items carry `"status": "success"` and the same keys `add` returns; failed items carry
+                `"status": "error"` and an `error` message, without affecting the other items. A failed item
+                that had already updated or deleted memories carries `"status": "partial"`, the `error`, and
+                those writes under "results"; their history is recorded, while its new memories are dropped.
+                Example: `{"results": [{"index": 0, "status": "success", "results": [...]},
+                {"index": 1, "status": "error", "error": "..."}]}`
+        """
+        if not isinstance(items, list):
             raise Mem0ValidationError(
-                message="messages must be str, dict, or list[dict]",
-                error_code="VALIDATION_003",
-                details={"provided_type": type(messages).__name__, "valid_types": ["str", "dict", "list[dict]"]},
-                suggestion="Convert your input to a string, dictionary, or list of dictionaries."
+                message="items must be a list of dicts",
+                error_code="VALIDATION_004",
+                details={"provided_type": type(items).__name__},
+                suggestion="Pass a list such as [{'messages': [...], 'user_id': 'alice'}].",
             )
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        capture_event("mem0.add_batch", self, {"batch_size": len(items), "sync_type": "sync"})
+
+        results = [None] * len(items)
+        pending_by_index = {}
+        executor = self._get_executor()
+        slots = threading.BoundedSemaphore(concurrency)
+        futures = {}
+        for index, item in enumerate(items):
+            pending_by_index[index] = _PendingWrites()
+            slots.acquire()
+            future = executor.submit(self._add_batch_item, item, pending_by_index[index])
+            future.add_done_callback(lambda _: slots.release())
+            futures[future] = index
+
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = _format_add_batch_result(index, future.result())
+            except Exception as e:
+                logger.error(f"Error adding batch item {index}: {e}")
+                pending_by_index[index].discard_inserts()
+                results[index] = _format_add_batch_result(
+                    index, error=e, applied=pending_by_index[index].applied_writes()
+                )
 
-        if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
-            results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
-            return results
+        for index, error in _flush_pending_writes(self.vector_store, self.db, pending_by_index).items():
+            results[index] = _format_add_batch_result(
+                index, error=error, applied=pending_by_index[index].applied_writes()
+            )
+        for pending_writes in pending_by_index.values():
+            for payload in pending_writes.payloads:
+                self._invalidate_search_cache(payload)
+
+        return {"results": results}
+
+    def _add_batch_item(self, item, pending_writes):
+        item = _validate_add_batch_item(item)
+        processed_metadata, effective_filters = _build_filters_and_metadata(
+            user_id=item.get("user_id"),
+            agent_id=item.get("agent_id"),
+            run_id=item.get("run_id"),
+            input_metadata=item.get("metadata"),
+        )
+        memory_type = item.get("memory_type")
+        messages = _normalize_add_messages(item["messages"], memory_type)
+
+        if item.get("agent_id") is not None and memory_type == MemoryType.PROCEDURAL.value:
+            return self._create_procedural_memory(messages, metadata=processed_metadata, prompt=item.get("prompt"))
 
         if self.config.llm.config.get("enable_vision"):
             messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
         else:
             messages = parse_vision_messages(messages)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
-            future2 = executor.submit(self._add_to_graph, messages, effective_filters)
+        vector_store_result = self._add_to_vector_store(
+            messages, processed_metadata, effective_filters, item.get("infer", True), pending_writes=pending_writes
+        )
+        if self.enable_graph:
+            return {"results": vector_store_result, "relations": self._add_to_graph(messages, effective_filters)}
 
-            concurrent.futures.wait([future1, future2])
+        return {"results": vector_store_result}
 
-            vector_store_result = future1.result()
-            graph_result = future2.result()
+    def enqueue_add(
+        self,
+        messages,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        memory_type: Optional[str] = None,
+        prompt: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """
+        Queue a call to `add` and return immediately.
 
-        if self.enable_graph:
-            return {
-                "results": vector_store_result,
-                "relations": graph_result,
-            }
+        The call is written to a durable SQLite queue (`add_queue_<hash>.db` next to the history database by
+        default, one per vector store collection) and run by background workers. Calls for the same
+        `user_id`/`agent_id`/`run_id` run in the order they were queued, failing calls are retried, and calls
+        that had not finished when the process stopped are replayed when a `Memory` with the same vector store
+        configuration opens the queue again. A replayed or retried call resumes from its saved progress: the
+        memory actions planned by the LLM and the ones already applied are not repeated (see `_run_queued_add`
+        for the exceptions). Use `get_add_status` to follow a ticket.
 
-        return {"results": vector_store_result}
+        Args:
+            messages, user_id, agent_id, run_id, metadata, infer, memory_type, prompt: Same as `add`.
+                `messages` and `metadata` must be JSON serializable.
+            idempotency_key (str, optional): Ticket id to use. Queueing again with a known key returns the
+                existing ticket without queueing the call twice. Defaults to a new UUID.
 
-    def _add_to_vector_store(self, messages, metadata, filters, infer):
+        Returns:
+            str: The ticket id.
+
+        Raises:
+            Mem0ValidationError: If the arguments would be rejected by `add`.
+        """
+        # Reject what `add` would reject now rather than in a background worker
+        _build_filters_and_metadata(user_id=user_id, agent_id=agent_id, run_id=run_id, input_metadata=metadata)
+        _normalize_add_messages(messages, memory_type)
+
+        kwargs = {
+            "messages": messages,
+            "user_id": user_id,
+            "agent_id": agent_id,
+            "run_id": run_id,
+            "metadata": metadata,
+            "infer": infer,
+            "memory_type": memory_type,
+            "prompt": prompt,
+        }
+        try:
+            return self._get_add_queue().enqueue(kwargs, idempotency_key=idempotency_key)
+        except TypeError as e:
+            raise Mem0ValidationError(
+                message=f"enqueue_add arguments must be JSON serializable: {e}",
+                error_code="VALIDATION_005",
+                details={"error": str(e)},
+                suggestion="Pass plain strings, numbers, lists and dicts in 'messages' and 'metadata'.",
+            )
+
+    def get_add_status(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a call queued with `enqueue_add`.
+
+        Args:
+            ticket_id (str): Ticket id returned by `enqueue_add`.
+
+        Returns:
+            dict or None: The ticket `id`, its `status` ("pending", "running", "done" or "failed"), the number
+                of `attempts`, the `result` of `add` once done, the last `error`, and the `created_at` and
+                `updated_at` timestamps. None if the ticket is unknown.
+        """
+        return self._get_add_queue().get_status(ticket_id)
+
+    def _add_queue_path(self) -> str:
+        if self.config.add_queue.path:
+            return self.config.add_queue.path
+        history_db_path = self.config.history_db_path
+        directory = mem0_dir if history_db_path == ":memory:" else os.path.dirname(os.path.abspath(history_db_path))
+        return os.path.join(directory, f"add_queue_{_vector_store_identity(self.config.vector_store)}.db")
+
+    def _get_add_queue(self) -> AddQueue:
+        with self._add_queue_lock:
+            if self._add_queue is None:
+                queue_config = self.config.add_queue
+                self._add_queue = AddQueue(
+                    self._run_queued_add,
+                    self._add_queue_path(),
+                    namespace=_vector_store_identity(self.config.vector_store),
+                    max_workers=queue_config.max_workers,
+                    max_attempts=queue_config.max_attempts,
+                    retry_backoff=queue_config.retry_backoff,
+                )
+            return self._add_queue
+
+    def _run_queued_add(self, ticket_id, **kwargs):
+        """
+        Run a call queued by `enqueue_add`, resuming the vector store writes of an earlier, interrupted run.
+
+        What a replay does not repeat: the LLM planning of memory actions, actions recorded as applied, and
+        new memories that already exist. What it can repeat: the one action that was being applied when the
+        run stopped if it was an UPDATE (applied again with the same text) or a DELETE (then missing from the
+        results), and the graph writes, which run again in full.
+        """
+        return self._add(**kwargs, journal=_AddJournal(self._get_add_queue(), ticket_id))
+
+    def _add_to_vector_store(self, messages, metadata, filters, infer, pending_writes=None, journal=None):
         if not infer:
             returned_memories = []
+            valid_messages = []
             for message_dict in messages:
                 if (
                     not isinstance(message_dict, dict)
@@ -398,6 +1023,10 @@ class Memory(MemoryBase):
                 if message_dict["role"] == "system":
                     continue
 
+                valid_messages.append(message_dict)
+
+            all_embeddings = self.embedding_model.embed_batch([m["content"] for m in valid_messages], "add")
+            for message_dict, msg_embeddings in zip(valid_messages, all_embeddings):
                 per_msg_meta = deepcopy(metadata)
                 per_msg_meta["role"] = message_dict["role"]
 
@@ -406,8 +1035,13 @@ class Memory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                mem_id = self._create_memory(
+                    msg_content,
+                    msg_embeddings,
+                    per_msg_meta,
+                    pending_writes=pending_writes,
+                    memory_id=journal.memory_id(len(returned_memories)) if journal is not None else None,
+                )
 
                 returned_memories.append(
                     {
@@ -420,6 +1054,101 @@ class Memory(MemoryBase):
                 )
             return returned_memories
 
+        if journal is not None and journal.plan is not None:
+            plan = journal.plan
+        elif self.config.add_mode == "single_pass":
+            plan = self._plan_single_pass(messages, metadata, filters)
+        else:
+            plan = self._plan_two_pass(messages, metadata, filters)
+        if journal is not None and journal.plan is None:
+            journal.save_plan(plan)
+        new_memories_with_actions, temp_uuid_mapping, new_message_embeddings = plan
+
+        returned_memories = list(journal.results) if journal is not None else []
+        try:
+            for index, resp in enumerate(new_memories_with_actions.get("memory", [])):
+                if journal is not None and index < journal.done:
+                    continue
+                logger.info(resp)
+                applied = len(returned_memories)
+                try:
+                    action_text = resp.get("text")
+                    event_type = resp.get("event")
+                    if not action_text:
+                        logger.info("Skipping memory entry because of empty `text` field.")
+                    elif event_type == "ADD":
+                        memory_id = self._create_memory(
+                            data=action_text,
+                            existing_embeddings=new_message_embeddings,
+                            metadata=deepcopy(metadata),
+                            pending_writes=pending_writes,
+                            memory_id=journal.memory_id(index) if journal is not None else None,
+                        )
+                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
+                    elif event_type == "UPDATE":
+                        self._update_memory(
+                            memory_id=temp_uuid_mapping[resp.get("id")],
+                            data=action_text,
+                            existing_embeddings=new_message_embeddings,
+                            metadata=deepcopy(metadata),
+                            pending_writes=pending_writes,
+                        )
+                        returned_memories.append(
+                            {
+                                "id": temp_uuid_mapping[resp.get("id")],
+                                "memory": action_text,
+                                "event": event_type,
+                                "previous_memory": resp.get("old_memory"),
+                            }
+                        )
+                    elif event_type == "DELETE":
+                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")], pending_writes=pending_writes)
+                        returned_memories.append(
+                            {
+                                "id": temp_uuid_mapping[resp.get("id")],
+                                "memory": action_text,
+                                "event": event_type,
+                            }
+                        )
+                    elif event_type == "NONE":
+                        # Even if content doesn't need updating, update session IDs if provided
+                        memory_id = temp_uuid_mapping.get(resp.get("id"))
+                        if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
+                            # Update only the session identifiers, keep content the same
+                            existing_memory = self.vector_store.get(vector_id=memory_id)
+                            updated_metadata = deepcopy(existing_memory.payload)
+                            if metadata.get("agent_id"):
+                                updated_metadata["agent_id"] = metadata["agent_id"]
+                            if metadata.get("run_id"):
+                                updated_metadata["run_id"] = metadata["run_id"]
+                            updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+
+                            self.vector_store.update(
+                                vector_id=memory_id,
+                                vector=None,  # Keep same embeddings
+                                payload=updated_metadata,
+                            )
+                            self._invalidate_search_cache(updated_metadata)
+                            logger.info(f"Updated session IDs for memory {memory_id}")
+                        else:
+                            logger.info("NOOP for Memory.")
+                except Exception as e:
+                    logger.error(f"Error processing memory action: {resp}, Error: {e}")
+                if journal is not None:
+                    journal.advance(returned_memories[applied:])
+        except Exception as e:
+            logger.error(f"Error iterating new_memories_with_actions: {e}")
+
+        keys, encoded_ids = process_telemetry_filters(filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        )
+        return returned_memories
+
+    def _plan_two_pass(self, messages, metadata, filters):
+        """Extract facts with one LLM call, then decide the memory actions for them with a second one."""
         parsed_messages = parse_messages(messages)
 
         if self.config.custom_fact_extraction_prompt:
@@ -469,8 +1198,8 @@ class Memory(MemoryBase):
             search_filters["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
             search_filters["run_id"] = filters["run_id"]
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
+        fact_embeddings = self.embedding_model.embed_batch(new_retrieved_facts, "add") if new_retrieved_facts else []
+        for new_mem, messages_embeddings in zip(new_retrieved_facts, fact_embeddings):
             new_message_embeddings[new_mem] = messages_embeddings
             existing_memories = self.vector_store.search(
                 query=new_mem,
@@ -481,17 +1210,7 @@ class Memory(MemoryBase):
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
 
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-
-        # mapping UUIDs with integers for handling UUID hallucinations
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
+        retrieved_old_memory, temp_uuid_mapping = _assign_temp_memory_ids(retrieved_old_memory)
 
         if new_retrieved_facts:
             function_calling_prompt = get_update_memory_messages(
@@ -520,81 +1239,56 @@ class Memory(MemoryBase):
         else:
             new_memories_with_actions = {}
 
-        returned_memories = []
-        try:
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(resp)
-                try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        logger.info("Skipping memory entry because of empty `text` field.")
-                        continue
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
 
-                    event_type = resp.get("event")
-                    if event_type == "ADD":
-                        memory_id = self._create_memory(
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
-                    elif event_type == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                            }
-                        )
-                    elif event_type == "NONE":
-                        # Even if content doesn't need updating, update session IDs if provided
-                        memory_id = temp_uuid_mapping.get(resp.get("id"))
-                        if memory_id and (metadata.get("agent_id") or metadata.get("run_id")):
-                            # Update only the session identifiers, keep content the same
-                            existing_memory = self.vector_store.get(vector_id=memory_id)
-                            updated_metadata = deepcopy(existing_memory.payload)
-                            if metadata.get("agent_id"):
-                                updated_metadata["agent_id"] = metadata["agent_id"]
-                            if metadata.get("run_id"):
-                                updated_metadata["run_id"] = metadata["run_id"]
-                            updated_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    def _plan_single_pass(self, messages, metadata, filters):
+        """
+        Extract facts and decide the memory actions for them with a single LLM call.
 
-                            self.vector_store.update(
-                                vector_id=memory_id,
-                                vector=None,  # Keep same embeddings
-                                payload=updated_metadata,
-                            )
-                            logger.info(f"Updated session IDs for memory {memory_id}")
-                        else:
-                            logger.info("NOOP for Memory.")
-                except Exception as e:
-                    logger.error(f"Error processing memory action: {resp}, Error: {e}")
-        except Exception as e:
-            logger.error(f"Error iterating new_memories_with_actions: {e}")
+        Candidate memories are looked up with the raw turns of the conversation rather than the extracted
+        facts, so the search no longer waits for a fact extraction call.
+        """
+        is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
+        turns = _single_pass_search_turns(messages, is_agent_memory)
+        search_filters = _session_search_filters(filters)
 
-        keys, encoded_ids = process_telemetry_filters(filters)
-        capture_event(
-            "mem0.add",
-            self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        retrieved_old_memory = []
+        turn_embeddings = self.embedding_model.embed_batch(turns, "search") if turns else []
+        for turn, turn_embedding in zip(turns, turn_embeddings):
+            existing_memories = self.vector_store.search(
+                query=turn,
+                vectors=turn_embedding,
+                limit=5,
+                filters=search_filters,
+            )
+            for mem in existing_memories:
+                retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
+        retrieved_old_memory, temp_uuid_mapping = _assign_temp_memory_ids(retrieved_old_memory)
+
+        system_prompt, user_prompt = get_single_pass_memory_messages(
+            parse_messages(messages),
+            retrieved_old_memory,
+            is_agent_memory,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
         )
-        return returned_memories
+        try:
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in single-pass memory actions response: {e}")
+            response = ""
+        new_memories_with_actions = _parse_single_pass_response(response)
+
+        action_texts = _single_pass_texts_to_embed(new_memories_with_actions)
+        action_embeddings = self.embedding_model.embed_batch(action_texts, "add") if action_texts else []
+        new_message_embeddings = dict(zip(action_texts, action_embeddings))
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
 
     def _add_to_graph(self, messages, filters):
         added_entities = []
@@ -604,6 +1298,7 @@ class Memory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = self.graph.add(data, filters)
+            self._invalidate_search_cache(filters)
 
         return added_entities
 
@@ -622,33 +1317,7 @@ class Memory(MemoryBase):
         if not memory:
             return None
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        result_item = MemoryItem(
-            id=memory.id,
-            memory=memory.payload.get("data", ""),
-            hash=memory.payload.get("hash"),
-            created_at=memory.payload.get("created_at"),
-            updated_at=memory.payload.get("updated_at"),
-        ).model_dump()
-
-        for key in promoted_payload_keys:
-            if key in memory.payload:
-                result_item[key] = memory.payload[key]
-
-        additional_metadata = {k: v for k, v in memory.payload.items() if k not in core_and_promoted_keys}
-        if additional_metadata:
-            result_item["metadata"] = additional_metadata
-
-        return result_item
+        return _format_memory_item(memory)
 
     def get_all(
         self,
@@ -690,23 +1359,19 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
+        if not self.enable_graph:
+            return {"results": self._get_all_from_vector_store(effective_filters, limit)}
 
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
+        executor = self._get_executor()
+        future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
+        future_graph_entities = executor.submit(self.graph.get_all, effective_filters, limit)
 
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+        concurrent.futures.wait([future_memories, future_graph_entities])
 
-        if self.enable_graph:
-            return {"results": all_memories_result, "relations": graph_entities_result}
+        all_memories_result = future_memories.result()
+        graph_entities_result = future_graph_entities.result()
 
-        return {"results": all_memories_result}
+        return {"results": all_memories_result, "relations": graph_entities_result}
 
     def _get_all_from_vector_store(self, filters, limit):
         memories_result = self.vector_store.list(filters=filters, limit=limit)
@@ -724,36 +1389,50 @@ class Memory(MemoryBase):
         else:
             actual_memories = memories_result
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        return [_format_memory_item(mem, include_score=False) for mem in actual_memories]
+
+    def iter_all(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ):
+        """
+        Stream all memories, without the `limit` of `get_all`.
 
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
+        Memories are read from the vector store page by page through its native cursor, so exporting or
+        processing every memory of a user never holds more than one page in memory. Stores without a native
+        `iter_list` return a single page of their `list` call, capped at its default limit, and log a warning.
+        Graph relations are not included; use `get_all` for those.
 
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters, merged with the ID-based scoping filters.
+            page_size (int, optional): Number of memories fetched from the vector store per round trip.
+                Defaults to 100.
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        Yields:
+            dict: Each memory, in the same format as the items of `get_all`'s "results".
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
 
-            formatted_memories.append(memory_item_dict)
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.iter_all",
+            self,
+            {"page_size": page_size, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
+        )
 
-        return formatted_memories
+        _warn_if_iter_list_is_capped(self.vector_store)
+        for mem in self.vector_store.iter_list(filters=effective_filters, page_size=page_size):
+            yield _format_memory_item(mem, include_score=False)
 
     def search(
         self,
@@ -829,18 +1508,26 @@ class Memory(MemoryBase):
             },
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = self.search_cache.key(query, effective_filters, limit, threshold, rerank)
+            if cache_key is not None:
+                cached = self.search_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        if self.enable_graph:
+            executor = self._get_executor()
             future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
-            future_graph_entities = (
-                executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
-            )
+            future_graph_entities = executor.submit(self.graph.search, query, effective_filters, limit)
 
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
+            concurrent.futures.wait([future_memories, future_graph_entities])
 
             original_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+            graph_entities = future_graph_entities.result()
+        else:
+            original_memories = self._search_vector_store(query, effective_filters, limit, threshold)
+            graph_entities = None
 
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
@@ -851,9 +1538,13 @@ class Memory(MemoryBase):
                 logger.warning(f"Reranking failed, using original results: {e}")
 
         if self.enable_graph:
-            return {"results": original_memories, "relations": graph_entities}
+            result = {"results": original_memories, "relations": graph_entities}
+        else:
+            result = {"results": original_memories}
 
-        return {"results": original_memories}
+        if cache_key is not None:
+            self.search_cache.set(cache_key, result)
+        return result
 
     def _process_metadata_filters(self, metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -955,40 +1646,10 @@ class Memory(MemoryBase):
         embeddings = self.embedding_model.embed(query, "search")
         memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
+        return [
+            _format_memory_item(mem, mem.score) for mem in memories if threshold is None or mem.score >= threshold
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-
-        return original_memories
-
     def update(self, memory_id, data):
         """
         Update a memory by ID.
@@ -1046,16 +1707,15 @@ class Memory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
-        # delete all vector memories and reset the collections
-        memories = self.vector_store.list(filters=filters)[0]
-        for memory in memories:
-            self._delete_memory(memory.id)
-        self.vector_store.reset()
+        memories = _delete_matching_memories(self.vector_store, filters)
+        self._invalidate_search_cache(filters)
+        self.db.batch_add_history(_delete_history_records(memories))
 
         logger.info(f"Deleted {len(memories)} memories")
 
         if self.enable_graph:
             self.graph.delete_all(filters)
+            self._invalidate_search_cache(filters)
 
         return {"message": "Memories deleted successfully!"}
 
@@ -1072,24 +1732,34 @@ class Memory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "sync"})
         return self.db.get_history(memory_id)
 
-    def _create_memory(self, data, existing_embeddings, metadata=None):
+    def _create_memory(self, data, existing_embeddings, metadata=None, pending_writes=None, memory_id=None):
         logger.debug(f"Creating memory with {data=}")
+        # Explicit ids come from a queued call, whose interrupted earlier run may have written this memory
+        if memory_id is not None and _get_memory_or_none(self.vector_store, memory_id) is not None:
+            logger.info(f"Memory {memory_id} was already added by an earlier run of its queued call")
+            return memory_id
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
             embeddings = self.embedding_model.embed(data, memory_action="add")
-        memory_id = str(uuid.uuid4())
+        memory_id = memory_id or str(uuid.uuid4())
         metadata = metadata or {}
         metadata["data"] = data
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
-        self.db.add_history(
+        if pending_writes is not None:
+            pending_writes.insert(embeddings, memory_id, metadata)
+            history_writer = pending_writes
+        else:
+            self.vector_store.insert(
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
+            self._invalidate_search_cache(metadata)
+            history_writer = self.db
+        history_writer.add_history(
             memory_id,
             None,
             data,
@@ -1100,7 +1770,7 @@ class Memory(MemoryBase):
         )
         return memory_id
 
-    def _create_procedural_memory(self, messages, metadata=None, prompt=None):
+    def _create_procedural_memory(self, messages, metadata=None, prompt=None, journal=None):
         """
         Create a procedural memory
 
@@ -1108,9 +1778,16 @@ class Memory(MemoryBase):
             messages (list): List of messages to create a procedural memory from.
             metadata (dict): Metadata to create a procedural memory from.
             prompt (str, optional): Prompt to use for the procedural memory creation. Defaults to None.
+            journal (_AddJournal, optional): Progress of the queued call the memory is created for.
+                Defaults to None.
         """
         logger.info("Creating procedural memory")
 
+        if journal is not None:
+            existing = _get_memory_or_none(self.vector_store, journal.memory_id(0))
+            if existing is not None:
+                return {"results": [{"id": existing.id, "memory": existing.payload.get("data"), "event": "ADD"}]}
+
         parsed_messages = [
             {"role": "system", "content": prompt or PROCEDURAL_MEMORY_SYSTEM_PROMPT},
             *messages,
@@ -1132,14 +1809,19 @@ class Memory(MemoryBase):
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
         embeddings = self.embedding_model.embed(procedural_memory, memory_action="add")
-        memory_id = self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
+        memory_id = self._create_memory(
+            procedural_memory,
+            {procedural_memory: embeddings},
+            metadata=metadata,
+            memory_id=journal.memory_id(0) if journal is not None else None,
+        )
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
 
         result = {"results": [{"id": memory_id, "memory": procedural_memory, "event": "ADD"}]}
 
         return result
 
-    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None, pending_writes=None):
         logger.info(f"Updating memory with {data=}")
 
         try:
@@ -1179,9 +1861,12 @@ class Memory(MemoryBase):
             vector=embeddings,
             payload=new_metadata,
         )
+        self._invalidate_search_cache(existing_memory.payload)
+        self._invalidate_search_cache(new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
-        self.db.add_history(
+        history_writer = pending_writes if pending_writes is not None else self.db
+        history_writer.add_history(
             memory_id,
             prev_value,
             data,
@@ -1193,12 +1878,14 @@ class Memory(MemoryBase):
         )
         return memory_id
 
-    def _delete_memory(self, memory_id):
+    def _delete_memory(self, memory_id, pending_writes=None):
         logger.info(f"Deleting memory with {memory_id=}")
         existing_memory = self.vector_store.get(vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
         self.vector_store.delete(vector_id=memory_id)
-        self.db.add_history(
+        self._invalidate_search_cache(existing_memory.payload)
+        history_writer = pending_writes if pending_writes is not None else self.db
+        history_writer.add_history(
             memory_id,
             prev_value,
             None,
@@ -1209,6 +1896,39 @@ class Memory(MemoryBase):
         )
         return memory_id
 
+    def _invalidate_search_cache(self, payload=None):
+        """Invalidate cached searches over the scope of `payload`, or all of them without a payload."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(payload)
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.config.executor_max_workers, thread_name_prefix="mem0"
+                )
+            return self._executor
+
+    def close(self):
+        """
+        Shut down the worker pool and the `enqueue_add` workers, waiting for running operations to finish,
+        then flush vector stores that buffer writes (e.g. FAISS).
+
+        Queued calls that have not started stay in the queue. The pool and the queue are created again if
+        the instance is used after closing.
+        """
+        with self._add_queue_lock:
+            add_queue, self._add_queue = self._add_queue, None
+        if add_queue is not None:
+            add_queue.close()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        flush = getattr(self.vector_store, "flush", None)
+        if callable(flush):
+            flush()
+
     def reset(self):
         """
         Reset the memory store by:
@@ -1232,6 +1952,8 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+        if self.search_cache is not None:
+            self.search_cache.clear()
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
     def chat(self, query):
@@ -1246,6 +1968,7 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
@@ -1263,6 +1986,13 @@ class AsyncMemory(MemoryBase):
                 config.reranker.config
             )
 
+        # Optional cache of search results, invalidated by writes to the searched scope
+        self.search_cache = None
+        if self.config.search_cache:
+            self.search_cache = SearchCache(
+                max_size=self.config.search_cache.max_size, ttl=self.config.search_cache.ttl
+            )
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
@@ -1272,13 +2002,18 @@ class AsyncMemory(MemoryBase):
         else:
             self.graph = None
 
-        telemetry_config = _safe_deepcopy_config(self.config.vector_store.config)
-        telemetry_config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
-            provider_path = f"migrations_{self.config.vector_store.provider}"
-            telemetry_config.path = os.path.join(mem0_dir, provider_path)
-            os.makedirs(telemetry_config.path, exist_ok=True)
-        self._telemetry_vector_store = VectorStoreFactory.create(self.config.vector_store.provider, telemetry_config)
+        # The migrations store only backs telemetry, so skip creating it when telemetry is disabled
+        self._telemetry_vector_store = None
+        if MEM0_TELEMETRY:
+            telemetry_config = _safe_deepcopy_config(self.config.vector_store.config)
+            telemetry_config.collection_name = "mem0migrations"
+            if self.config.vector_store.provider in ["faiss", "qdrant"]:
+                provider_path = f"migrations_{self.config.vector_store.provider}"
+                telemetry_config.path = os.path.join(mem0_dir, provider_path)
+                os.makedirs(telemetry_config.path, exist_ok=True)
+            self._telemetry_vector_store = VectorStoreFactory.create(
+                self.config.vector_store.provider, telemetry_config
+            )
 
         capture_event("mem0.init", self, {"sync_type": "async"})
 
@@ -1400,10 +2135,98 @@ class AsyncMemory(MemoryBase):
         vector_store_result, graph_result = await asyncio.gather(vector_store_task, graph_task)
 
         if self.enable_graph:
-            return {
-                "results": vector_store_result,
-                "relations": graph_result,
-            }
+            return {
+                "results": vector_store_result,
+                "relations": graph_result,
+            }
+
+        return {"results": vector_store_result}
+
+    async def add_batch(self, items: List[Dict[str, Any]], *, concurrency: int = 8):
+        """
+        Create memories for many conversations in one call asynchronously.
+
+        See `Memory.add_batch`: only the writes are batched, new memories with one bulk vector store
+        `insert` and history records with one transaction. Fact extraction, embeddings, searches and the
+        memory update call still run per item, at most `concurrency` items at a time, and failures are
+        reported per item.
+
+        Args:
+            items (List[Dict[str, Any]]): Items to add, each a dict with a `messages` key and any of the
+                other keyword arguments of `add`.
+            concurrency (int, optional): Maximum number of items processed in parallel. Defaults to 8.
+
+        Returns:
+            dict: One entry per item, in input order, under the "results" key.
+        """
+        if not isinstance(items, list):
+            raise Mem0ValidationError(
+                message="items must be a list of dicts",
+                error_code="VALIDATION_004",
+                details={"provided_type": type(items).__name__},
+                suggestion="Pass a list such as [{'messages': [...], 'user_id': 'alice'}].",
+            )
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        capture_event("mem0.add_batch", self, {"batch_size": len(items), "sync_type": "async"})
+
+        semaphore = asyncio.Semaphore(concurrency)
+        pending_by_index = {index: _PendingWrites() for index in range(len(items))}
+
+        async def run_item(index, item):
+            async with semaphore:
+                try:
+                    return _format_add_batch_result(index, await self._add_batch_item(item, pending_by_index[index]))
+                except Exception as e:
+                    logger.error(f"Error adding batch item {index} (async): {e}")
+                    pending_by_index[index].discard_inserts()
+                    return _format_add_batch_result(index, error=e, applied=pending_by_index[index].applied_writes())
+
+        results = await asyncio.gather(*(run_item(index, item) for index, item in enumerate(items)))
+
+        flush_errors = await asyncio.to_thread(
+            _flush_pending_writes, self.vector_store, self.db, pending_by_index
+        )
+        for index, error in flush_errors.items():
+            results[index] = _format_add_batch_result(
+                index, error=error, applied=pending_by_index[index].applied_writes()
+            )
+        for pending_writes in pending_by_index.values():
+            for payload in pending_writes.payloads:
+                self._invalidate_search_cache(payload)
+
+        return {"results": list(results)}
+
+    async def _add_batch_item(self, item, pending_writes):
+        item = _validate_add_batch_item(item)
+        processed_metadata, effective_filters = _build_filters_and_metadata(
+            user_id=item.get("user_id"),
+            agent_id=item.get("agent_id"),
+            run_id=item.get("run_id"),
+            input_metadata=item.get("metadata"),
+        )
+        memory_type = item.get("memory_type")
+        messages = _normalize_add_messages(item["messages"], memory_type)
+
+        if item.get("agent_id") is not None and memory_type == MemoryType.PROCEDURAL.value:
+            return await self._create_procedural_memory(
+                messages, metadata=processed_metadata, prompt=item.get("prompt")
+            )
+
+        if self.config.llm.config.get("enable_vision"):
+            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        else:
+            messages = parse_vision_messages(messages)
+
+        vector_store_result, graph_result = await asyncio.gather(
+            self._add_to_vector_store(
+                messages, processed_metadata, effective_filters, item.get("infer", True), pending_writes=pending_writes
+            ),
+            self._add_to_graph(messages, effective_filters),
+        )
+        if self.enable_graph:
+            return {"results": vector_store_result, "relations": graph_result}
 
         return {"results": vector_store_result}
 
@@ -1413,9 +2236,11 @@ class AsyncMemory(MemoryBase):
         metadata: dict,
         effective_filters: dict,
         infer: bool,
+        pending_writes=None,
     ):
         if not infer:
             returned_memories = []
+            valid_messages = []
             for message_dict in messages:
                 if (
                     not isinstance(message_dict, dict)
@@ -1428,6 +2253,12 @@ class AsyncMemory(MemoryBase):
                 if message_dict["role"] == "system":
                     continue
 
+                valid_messages.append(message_dict)
+
+            all_embeddings = await _call_provider(
+                self.embedding_model, "embed_batch", [m["content"] for m in valid_messages], "add"
+            )
+            for message_dict, msg_embeddings in zip(valid_messages, all_embeddings):
                 per_msg_meta = deepcopy(metadata)
                 per_msg_meta["role"] = message_dict["role"]
 
@@ -1436,8 +2267,9 @@ class AsyncMemory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                mem_id = await self._create_memory(
+                    msg_content, msg_embeddings, per_msg_meta, pending_writes=pending_writes
+                )
 
                 returned_memories.append(
                     {
@@ -1450,104 +2282,11 @@ class AsyncMemory(MemoryBase):
                 )
             return returned_memories
 
-        parsed_messages = parse_messages(messages)
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
-        else:
-            # Determine if this should use agent memory extraction based on agent_id presence
-            # and role types in messages
-            is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
-
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
-        try:
-            response = remove_code_blocks(response)
-            if not response.strip():
-                new_retrieved_facts = []
-            else:
-                try:
-                    # First try direct JSON parsing
-                    new_retrieved_facts = json.loads(response)["facts"]
-                except json.JSONDecodeError:
-                    # Try extracting JSON from response using built-in function
-                    extracted_json = extract_json(response)
-                    new_retrieved_facts = json.loads(extracted_json)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        # Search for existing memories using the provided session identifiers
-        # Use all available session identifiers for accurate memory retrieval
-        search_filters = {}
-        if effective_filters.get("user_id"):
-            search_filters["user_id"] = effective_filters["user_id"]
-        if effective_filters.get("agent_id"):
-            search_filters["agent_id"] = effective_filters["agent_id"]
-        if effective_filters.get("run_id"):
-            search_filters["run_id"] = effective_filters["run_id"]
-
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
-                limit=5,
-                filters=search_filters,
-            )
-            return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
-
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
-            try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-            try:
-                if not response or not response.strip():
-                    logger.warning("Empty response from LLM, no memories to extract")
-                    new_memories_with_actions = {}
-                else:
-                    response = remove_code_blocks(response)
-                    new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+        if self.config.add_mode == "single_pass":
+            plan = await self._plan_single_pass(messages, metadata, effective_filters)
         else:
-            new_memories_with_actions = {}
+            plan = await self._plan_two_pass(messages, metadata, effective_filters)
+        new_memories_with_actions, temp_uuid_mapping, new_message_embeddings = plan
 
         returned_memories = []
         try:
@@ -1566,6 +2305,7 @@ class AsyncMemory(MemoryBase):
                                 data=action_text,
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
+                                pending_writes=pending_writes,
                             )
                         )
                         memory_tasks.append((task, resp, "ADD", None))
@@ -1576,11 +2316,16 @@ class AsyncMemory(MemoryBase):
                                 data=action_text,
                                 existing_embeddings=new_message_embeddings,
                                 metadata=deepcopy(metadata),
+                                pending_writes=pending_writes,
                             )
                         )
                         memory_tasks.append((task, resp, "UPDATE", temp_uuid_mapping[resp["id"]]))
                     elif event_type == "DELETE":
-                        task = asyncio.create_task(self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")]))
+                        task = asyncio.create_task(
+                            self._delete_memory(
+                                memory_id=temp_uuid_mapping[resp.get("id")], pending_writes=pending_writes
+                            )
+                        )
                         memory_tasks.append((task, resp, "DELETE", temp_uuid_mapping[resp.get("id")]))
                     elif event_type == "NONE":
                         # Even if content doesn't need updating, update session IDs if provided
@@ -1602,6 +2347,7 @@ class AsyncMemory(MemoryBase):
                                     vector=None,  # Keep same embeddings
                                     payload=updated_metadata,
                                 )
+                                self._invalidate_search_cache(updated_metadata)
                                 logger.info(f"Updated session IDs for memory {mem_id} (async)")
 
                             task = asyncio.create_task(update_session_ids(memory_id, metadata))
@@ -1640,6 +2386,165 @@ class AsyncMemory(MemoryBase):
         )
         return returned_memories
 
+    async def _plan_two_pass(self, messages, metadata, effective_filters):
+        """Extract facts with one LLM call, then decide the memory actions for them with a second one."""
+        parsed_messages = parse_messages(messages)
+        if self.config.custom_fact_extraction_prompt:
+            system_prompt = self.config.custom_fact_extraction_prompt
+            user_prompt = f"Input:\n{parsed_messages}"
+        else:
+            # Determine if this should use agent memory extraction based on agent_id presence
+            # and role types in messages
+            is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
+            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
+
+        response = await _call_provider(
+            self.llm,
+            "generate_response",
+            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+            response_format={"type": "json_object"},
+        )
+        try:
+            response = remove_code_blocks(response)
+            if not response.strip():
+                new_retrieved_facts = []
+            else:
+                try:
+                    # First try direct JSON parsing
+                    new_retrieved_facts = json.loads(response)["facts"]
+                except json.JSONDecodeError:
+                    # Try extracting JSON from response using built-in function
+                    extracted_json = extract_json(response)
+                    new_retrieved_facts = json.loads(extracted_json)["facts"]
+        except Exception as e:
+            logger.error(f"Error in new_retrieved_facts: {e}")
+            new_retrieved_facts = []
+
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        retrieved_old_memory = []
+        new_message_embeddings = {}
+        # Search for existing memories using the provided session identifiers
+        # Use all available session identifiers for accurate memory retrieval
+        search_filters = {}
+        if effective_filters.get("user_id"):
+            search_filters["user_id"] = effective_filters["user_id"]
+        if effective_filters.get("agent_id"):
+            search_filters["agent_id"] = effective_filters["agent_id"]
+        if effective_filters.get("run_id"):
+            search_filters["run_id"] = effective_filters["run_id"]
+
+        if new_retrieved_facts:
+            fact_embeddings = await _call_provider(self.embedding_model, "embed_batch", new_retrieved_facts, "add")
+            new_message_embeddings.update(zip(new_retrieved_facts, fact_embeddings))
+
+        async def process_fact_for_search(new_mem_content):
+            embeddings = new_message_embeddings[new_mem_content]
+            existing_mems = await _call_provider(
+                self.vector_store,
+                "search",
+                query=new_mem_content,
+                vectors=embeddings,
+                limit=5,
+                filters=search_filters,
+            )
+            return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
+
+        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
+        search_results_list = await asyncio.gather(*search_tasks)
+        for result_group in search_results_list:
+            retrieved_old_memory.extend(result_group)
+
+        retrieved_old_memory, temp_uuid_mapping = _assign_temp_memory_ids(retrieved_old_memory)
+
+        if new_retrieved_facts:
+            function_calling_prompt = get_update_memory_messages(
+                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            )
+            try:
+                response = await _call_provider(
+                    self.llm,
+                    "generate_response",
+                    messages=[{"role": "user", "content": function_calling_prompt}],
+                    response_format={"type": "json_object"},
+                )
+            except Exception as e:
+                logger.error(f"Error in new memory actions response: {e}")
+                response = ""
+            try:
+                if not response or not response.strip():
+                    logger.warning("Empty response from LLM, no memories to extract")
+                    new_memories_with_actions = {}
+                else:
+                    response = remove_code_blocks(response)
+                    new_memories_with_actions = json.loads(response)
+            except Exception as e:
+                logger.error(f"Invalid JSON response: {e}")
+                new_memories_with_actions = {}
+        else:
+            new_memories_with_actions = {}
+
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
+
+    async def _plan_single_pass(self, messages, metadata, effective_filters):
+        """
+        Extract facts and decide the memory actions for them with a single LLM call.
+
+        Candidate memories are looked up with the raw turns of the conversation rather than the extracted
+        facts, so the search no longer waits for a fact extraction call.
+        """
+        is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
+        turns = _single_pass_search_turns(messages, is_agent_memory)
+        search_filters = _session_search_filters(effective_filters)
+
+        turn_embeddings = await _call_provider(self.embedding_model, "embed_batch", turns, "search") if turns else []
+        search_results_list = await asyncio.gather(
+            *[
+                _call_provider(
+                    self.vector_store,
+                    "search",
+                    query=turn,
+                    vectors=turn_embedding,
+                    limit=5,
+                    filters=search_filters,
+                )
+                for turn, turn_embedding in zip(turns, turn_embeddings)
+            ]
+        )
+        retrieved_old_memory = [
+            {"id": mem.id, "text": mem.payload.get("data", "")}
+            for existing_mems in search_results_list
+            for mem in existing_mems
+        ]
+        retrieved_old_memory, temp_uuid_mapping = _assign_temp_memory_ids(retrieved_old_memory)
+
+        system_prompt, user_prompt = get_single_pass_memory_messages(
+            parse_messages(messages),
+            retrieved_old_memory,
+            is_agent_memory,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
+        )
+        try:
+            response = await _call_provider(
+                self.llm,
+                "generate_response",
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in single-pass memory actions response: {e}")
+            response = ""
+        new_memories_with_actions = _parse_single_pass_response(response)
+
+        action_texts = _single_pass_texts_to_embed(new_memories_with_actions)
+        action_embeddings = (
+            await _call_provider(self.embedding_model, "embed_batch", action_texts, "add") if action_texts else []
+        )
+        new_message_embeddings = dict(zip(action_texts, action_embeddings))
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings
+
     async def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -1648,6 +2553,7 @@ class AsyncMemory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            self._invalidate_search_cache(filters)
 
         return added_entities
 
@@ -1666,33 +2572,7 @@ class AsyncMemory(MemoryBase):
         if not memory:
             return None
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        result_item = MemoryItem(
-            id=memory.id,
-            memory=memory.payload.get("data", ""),
-            hash=memory.payload.get("hash"),
-            created_at=memory.payload.get("created_at"),
-            updated_at=memory.payload.get("updated_at"),
-        ).model_dump()
-
-        for key in promoted_payload_keys:
-            if key in memory.payload:
-                result_item[key] = memory.payload[key]
-
-        additional_metadata = {k: v for k, v in memory.payload.items() if k not in core_and_promoted_keys}
-        if additional_metadata:
-            result_item["metadata"] = additional_metadata
-
-        return result_item
+        return _format_memory_item(memory)
 
     async def get_all(
         self,
@@ -1773,36 +2653,54 @@ class AsyncMemory(MemoryBase):
         else:
             actual_memories = memories_result
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        return [_format_memory_item(mem, include_score=False) for mem in actual_memories]
+
+    async def iter_all(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ):
+        """
+        Stream all memories asynchronously, without the `limit` of `get_all`.
 
-        formatted_memories = []
-        for mem in actual_memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-            ).model_dump(exclude={"score"})
+        Each page is read from the vector store's native cursor in a worker thread. Stores without a native
+        `iter_list` return a single page of their `list` call, capped at its default limit, and log a warning.
+        Graph relations are not included; use `get_all` for those.
 
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters, merged with the ID-based scoping filters.
+            page_size (int, optional): Number of memories fetched from the vector store per round trip.
+                Defaults to 100.
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
+        Yields:
+            dict: Each memory, in the same format as the items of `get_all`'s "results".
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
 
-            formatted_memories.append(memory_item_dict)
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.iter_all",
+            self,
+            {"page_size": page_size, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+        )
 
-        return formatted_memories
+        _warn_if_iter_list_is_capped(self.vector_store)
+        records = self.vector_store.iter_list(filters=effective_filters, page_size=page_size)
+        while True:
+            page = await asyncio.to_thread(lambda: list(itertools.islice(records, page_size)))
+            for mem in page:
+                yield _format_memory_item(mem, include_score=False)
+            if len(page) < page_size:
+                return
 
     async def search(
         self,
@@ -1880,6 +2778,14 @@ class AsyncMemory(MemoryBase):
             },
         )
 
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = self.search_cache.key(query, effective_filters, limit, threshold, rerank)
+            if cache_key is not None:
+                cached = self.search_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
         vector_store_task = asyncio.create_task(self._search_vector_store(query, effective_filters, limit, threshold))
 
         graph_task = None
@@ -1907,9 +2813,13 @@ class AsyncMemory(MemoryBase):
                 logger.warning(f"Reranking failed, using original results: {e}")
 
         if self.enable_graph:
-            return {"results": original_memories, "relations": graph_entities}
+            result = {"results": original_memories, "relations": graph_entities}
+        else:
+            result = {"results": original_memories}
 
-        return {"results": original_memories}
+        if cache_key is not None:
+            self.search_cache.set(cache_key, result)
+        return result
 
     def _process_metadata_filters(self, metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2008,45 +2918,15 @@ class AsyncMemory(MemoryBase):
         return False
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        embeddings = await _call_provider(self.embedding_model, "embed", query, "search")
+        memories = await _call_provider(
+            self.vector_store, "search", query=query, vectors=embeddings, limit=limit, filters=filters
         )
 
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
+        return [
+            _format_memory_item(mem, mem.score) for mem in memories if threshold is None or mem.score >= threshold
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload.get("data", ""),
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-
-        return original_memories
-
     async def update(self, memory_id, data):
         """
         Update a memory by ID asynchronously.
@@ -2064,7 +2944,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await _call_provider(self.embedding_model, "embed", data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -2105,18 +2985,15 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
-
-        delete_tasks = []
-        for memory in memories[0]:
-            delete_tasks.append(self._delete_memory(memory.id))
-
-        await asyncio.gather(*delete_tasks)
+        memories = await asyncio.to_thread(_delete_matching_memories, self.vector_store, filters)
+        self._invalidate_search_cache(filters)
+        await asyncio.to_thread(self.db.batch_add_history, _delete_history_records(memories))
 
-        logger.info(f"Deleted {len(memories[0])} memories")
+        logger.info(f"Deleted {len(memories)} memories")
 
         if self.enable_graph:
             await asyncio.to_thread(self.graph.delete_all, filters)
+            self._invalidate_search_cache(filters)
 
         return {"message": "Memories deleted successfully!"}
 
@@ -2133,12 +3010,12 @@ class AsyncMemory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "async"})
         return await asyncio.to_thread(self.db.get_history, memory_id)
 
-    async def _create_memory(self, data, existing_embeddings, metadata=None):
+    async def _create_memory(self, data, existing_embeddings, metadata=None, pending_writes=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await _call_provider(self.embedding_model, "embed", data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -2146,23 +3023,26 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        history_record = dict(
+            created_at=metadata.get("created_at"),
+            actor_id=metadata.get("actor_id"),
+            role=metadata.get("role"),
+        )
+        if pending_writes is not None:
+            pending_writes.insert(embeddings, memory_id, metadata)
+            pending_writes.add_history(memory_id, None, data, "ADD", **history_record)
+            return memory_id
+
+        await _call_provider(
+            self.vector_store,
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
         )
+        self._invalidate_search_cache(metadata)
 
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
+        await asyncio.to_thread(self.db.add_history, memory_id, None, data, "ADD", **history_record)
 
         return memory_id
 
@@ -2200,7 +3080,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await _call_provider(self.llm, "generate_response", messages=parsed_messages)
                 procedural_memory = remove_code_blocks(procedural_memory)
         
         except Exception as e:
@@ -2211,7 +3091,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await _call_provider(self.embedding_model, "embed", procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -2219,7 +3099,7 @@ class AsyncMemory(MemoryBase):
 
         return result
 
-    async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+    async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None, pending_writes=None):
         logger.info(f"Updating memory with {data=}")
 
         try:
@@ -2253,7 +3133,7 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await _call_provider(self.embedding_model, "embed", data, "update")
 
         await asyncio.to_thread(
             self.vector_store.update,
@@ -2261,40 +3141,46 @@ class AsyncMemory(MemoryBase):
             vector=embeddings,
             payload=new_metadata,
         )
+        self._invalidate_search_cache(existing_memory.payload)
+        self._invalidate_search_cache(new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
+        history_record = dict(
             created_at=new_metadata["created_at"],
             updated_at=new_metadata["updated_at"],
             actor_id=new_metadata.get("actor_id"),
             role=new_metadata.get("role"),
         )
+        if pending_writes is not None:
+            pending_writes.add_history(memory_id, prev_value, data, "UPDATE", **history_record)
+        else:
+            await asyncio.to_thread(self.db.add_history, memory_id, prev_value, data, "UPDATE", **history_record)
         return memory_id
 
-    async def _delete_memory(self, memory_id):
+    async def _delete_memory(self, memory_id, pending_writes=None):
         logger.info(f"Deleting memory with {memory_id=}")
         existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
         prev_value = existing_memory.payload.get("data", "")
 
         await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            prev_value,
-            None,
-            "DELETE",
+        self._invalidate_search_cache(existing_memory.payload)
+        history_record = dict(
             actor_id=existing_memory.payload.get("actor_id"),
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
+        if pending_writes is not None:
+            pending_writes.add_history(memory_id, prev_value, None, "DELETE", **history_record)
+        else:
+            await asyncio.to_thread(self.db.add_history, memory_id, prev_value, None, "DELETE", **history_record)
 
         return memory_id
 
+    def _invalidate_search_cache(self, payload=None):
+        """Invalidate cached searches over the scope of `payload`, or all of them without a payload."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(payload)
+
     async def reset(self):
         """
         Reset the memory store asynchronously by:
@@ -2319,6 +3205,8 @@ class AsyncMemory(MemoryBase):
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
+        if self.search_cache is not None:
+            self.search_cache.clear()
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
     async def chat(self, query):
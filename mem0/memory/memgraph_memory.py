@@ -12,15 +12,18 @@ try:
 except ImportError:
     raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
 
+from mem0.graphs.entity_index import EntityNameIndex
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
     EXTRACT_ENTITIES_STRUCT_TOOL,
     EXTRACT_ENTITIES_TOOL,
+    EXTRACT_GRAPH_STRUCT_TOOL,
+    EXTRACT_GRAPH_TOOL,
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages, get_extract_graph_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
@@ -38,6 +41,7 @@ class MemoryGraph:
             self.config.embedder.provider,
             self.config.embedder.config,
             {"enable_embeddings": True},
+            cache_config=self.config.embedder.cache,
         )
 
         # Default to openai if no specific provider is configured
@@ -57,6 +61,7 @@ class MemoryGraph:
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
+        self.entity_index = EntityNameIndex()
 
         # Setup Memgraph:
         # 1. Create vector index (created Entity label on all nodes)
@@ -86,15 +91,25 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        if self.config.graph_store.extraction_mode == "combined":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            # Without existing relations around the entities there is nothing to delete.
+            to_be_deleted = []
+            if search_output:
+                to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+            search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+        self.entity_index.add(
+            self._index_scope(filters), [name for item in to_be_added for name in (item["source"], item["destination"])]
+        )
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -112,8 +127,7 @@ class MemoryGraph:
                 - "contexts": List of search results from the base data store.
                 - "entities": List of related graph data based on the query.
         """
-        entity_type_map = self._retrieve_nodes_from_data(query, filters)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        search_output = self._search_graph_db(node_list=self._match_query_entities(query, filters), filters=filters)
 
         if not search_output:
             return []
@@ -149,6 +163,7 @@ class MemoryGraph:
             """
             params = {"user_id": filters["user_id"]}
         self.graph.query(cypher, params=params)
+        self.entity_index.invalidate(filters)
 
     def get_all(self, filters, limit=100):
         """
@@ -196,6 +211,33 @@ class MemoryGraph:
 
         return final_results
 
+    def _match_query_entities(self, query, filters):
+        """Find the entities a search query mentions, with an LLM call only when `entity_matcher` is "llm"."""
+        if self.config.graph_store.entity_matcher == "llm":
+            return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+        names = self.entity_index.match(query, self._index_scope(filters), lambda: self._load_entity_names(filters))
+        # A query naming no known entity still reaches the nodes whose embedding is close to its own
+        return names or [query]
+
+    @staticmethod
+    def _index_scope(filters):
+        """Filters of the entity name index: nodes are scoped by user_id and agent_id only."""
+        return {"user_id": filters["user_id"], "agent_id": filters.get("agent_id")}
+
+    def _load_entity_names(self, filters):
+        """Names of the nodes in the filters' scope."""
+        agent_filter = "AND n.agent_id = $agent_id" if filters.get("agent_id") else ""
+        cypher = f"""
+        MATCH (n:Entity)
+        WHERE n.user_id = $user_id {agent_filter}
+        RETURN n.name AS name
+        """
+        params = {"user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
+        return [row["name"] for row in self.graph.query(cypher, params=params)]
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -270,12 +312,49 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    def _extract_graph_from_data(self, data, filters):
+        """Extract the entities, with their types, and the relations among them with one LLM call."""
+        system_prompt, user_prompt = get_extract_graph_messages(
+            data, filters["user_id"], self.config.graph_store.custom_prompt
+        )
+
+        _tools = [EXTRACT_GRAPH_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_GRAPH_STRUCT_TOOL]
+
+        extracted_graph = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+        relations = []
+        try:
+            for tool_call in extracted_graph["tool_calls"]:
+                if tool_call["name"] != "extract_graph":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+                relations.extend(tool_call["arguments"]["relations"])
+        except Exception as e:
+            logger.exception(
+                f"Error in extract graph tool: {e}, llm_provider={self.llm_provider}, extracted_graph={extracted_graph}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        relations = self._remove_spaces_from_entities(relations)
+        logger.debug(f"Entity type map: {entity_type_map}\n Extracted relations: {relations}")
+        return entity_type_map, relations
+
     def _search_graph_db(self, node_list, filters, limit=100):
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        node_embeddings = self.embedding_model.embed_batch(node_list) if node_list else []
+        for node, n_embedding in zip(node_list, node_embeddings):
 
             # Build query based on whether agent_id is provided
             if filters.get("agent_id"):
@@ -361,170 +440,142 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Build the agent filter for the query
-            agent_filter = ""
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
-
-            if agent_id:
-                agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
-                params["agent_id"] = agent_id
+        """Delete the relationships from the graph in one statement."""
+        if not to_be_deleted:
+            return []
 
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n:Entity {{name: $source_name, user_id: $user_id}})
-            -[r:{relationship}]->
-            (m:Entity {{name: $dest_name, user_id: $user_id}})
-            WHERE 1=1 {agent_filter}
+        params = {
+            "rows": [
+                {
+                    "index": index,
+                    "source": item["source"],
+                    "destination": item["destination"],
+                    "relationship": item["relationship"],
+                }
+                for index, item in enumerate(to_be_deleted)
+            ],
+            "user_id": filters["user_id"],
+        }
+        agent_id_clause = ""
+        if filters.get("agent_id"):
+            agent_id_clause = ", agent_id: $agent_id"
+            params["agent_id"] = filters["agent_id"]
+
+        cypher = f"""
+            UNWIND $rows AS row
+            MATCH (n:Entity {{name: row.source, user_id: $user_id{agent_id_clause}}})
+            -[r]->
+            (m:Entity {{name: row.destination, user_id: $user_id{agent_id_clause}}})
+            WHERE type(r) = row.relationship
             DELETE r
-            RETURN 
+            RETURN
+                row.index AS index,
                 n.name AS source,
                 m.name AS target,
-                type(r) AS relationship
+                row.relationship AS relationship
             """
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-
-        return results
+        result = self.graph.query(cypher, params=params)
+        return self._group_by_index(result, len(to_be_deleted))
 
     # added Entity label to all nodes for vector search to work
     def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        results = []
-
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            destination_type = entity_type_map.get(destination, "__User__")
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            # Prepare agent_id for node creation
-            agent_id_clause = ""
-            if agent_id:
-                agent_id_clause = ", agent_id: $agent_id"
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                cypher = f"""
-                    MATCH (source:Entity)
-                    WHERE id(source) = $source_id
-                    MERGE (destination:{destination_type}:Entity {{name: $destination_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET
-                        destination.created = timestamp(),
-                        destination.embedding = $destination_embedding,
-                        destination:Entity
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
 
-                params = {
-                    "source_id": source_node_search_result[0]["id(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                cypher = f"""
-                    MATCH (destination:Entity)
-                    WHERE id(destination) = $destination_id
-                    MERGE (source:{source_type}:Entity {{name: $source_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET
-                        source.created = timestamp(),
-                        source.embedding = $source_embedding,
-                        source:Entity
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
+        The entities are resolved to existing nodes in one lookup, the ones left are merged in one statement and the
+        relationships are merged in another one.
+        """
+        if not to_be_added:
+            return []
 
-                params = {
-                    "destination_id": destination_node_search_result[0]["id(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                    MATCH (source:Entity)
-                    WHERE id(source) = $source_id
-                    MATCH (destination:Entity)
-                    WHERE id(destination) = $destination_id
+        # Embed every distinct entity name once instead of once per relation endpoint
+        entity_names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
+
+        node_ids = self._search_nodes(entity_embeddings, filters, threshold=self.threshold)
+        new_names = [name for name in entity_names if name not in node_ids]
+        if new_names:
+            node_ids.update(self._merge_nodes(new_names, entity_embeddings, filters, entity_type_map))
+        return self._merge_relationships(to_be_added, node_ids)
+
+    def _merge_nodes(self, names, entity_embeddings, filters, entity_type_map):
+        """Merge the nodes of entities that matched no existing node, returning their ids by name."""
+        rows = [
+            {"name": name, "type": entity_type_map.get(name, "__User__"), "embedding": entity_embeddings[name]}
+            for name in names
+        ]
+        params = {"rows": rows, "user_id": filters["user_id"]}
+        agent_id_clause = ""
+        if filters.get("agent_id"):
+            agent_id_clause = ", agent_id: $agent_id"
+            params["agent_id"] = filters["agent_id"]
+
+        # Labels can't be parameters, so each entity type gets its own clause, applied to the rows of that type
+        params["node_types"] = list(dict.fromkeys(row["type"] for row in rows))
+        merges = "\n".join(
+            f"""FOREACH (_ IN CASE WHEN row.type = $node_types[{i}] THEN [1] ELSE [] END |
+                    MERGE (n:{node_type}:Entity {{name: row.name, user_id: $user_id{agent_id_clause}}})
+                    ON CREATE SET n.created = timestamp()
+                )"""
+            for i, node_type in enumerate(params["node_types"])
+        )
+
+        cypher = f"""
+            UNWIND $rows AS row
+            {merges}
+            WITH row
+            MATCH (n:Entity {{name: row.name, user_id: $user_id{agent_id_clause}}})
+            WHERE row.type IN labels(n)
+            SET n.embedding = row.embedding
+            RETURN row.name AS name, id(n) AS id
+            """
+        return {row["name"]: row["id"] for row in self.graph.query(cypher, params=params)}
+
+    def _merge_relationships(self, to_be_added, node_ids):
+        """Merge the relationships between resolved nodes."""
+        rows = [
+            {
+                "index": index,
+                "source_id": node_ids.get(item["source"]),
+                "destination_id": node_ids.get(item["destination"]),
+                "relationship": item["relationship"],
+            }
+            for index, item in enumerate(to_be_added)
+        ]
+        # Relationship types can't be parameters either
+        relationships = list(dict.fromkeys(row["relationship"] for row in rows))
+        merges = "\n".join(
+            f"""FOREACH (_ IN CASE WHEN row.relationship = $relationships[{i}] THEN [1] ELSE [] END |
                     MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created_at = timestamp(),
-                        r.updated_at = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-                params = {
-                    "source_id": source_node_search_result[0]["id(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["id(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
+                    ON CREATE SET r.created = timestamp()
+                )"""
+            for i, relationship in enumerate(relationships)
+        )
 
-            else:
-                cypher = f"""
-                    MERGE (n:{source_type}:Entity {{name: $source_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET n.created = timestamp(), n.embedding = $source_embedding, n:Entity
-                    ON MATCH SET n.embedding = $source_embedding
-                    MERGE (m:{destination_type}:Entity {{name: $dest_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET m.created = timestamp(), m.embedding = $dest_embedding, m:Entity
-                    ON MATCH SET m.embedding = $dest_embedding
-                    MERGE (n)-[rel:{relationship}]->(m)
-                    ON CREATE SET rel.created = timestamp()
-                    RETURN n.name AS source, type(rel) AS relationship, m.name AS target
-                    """
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
+        cypher = f"""
+            UNWIND $rows AS row
+            MATCH (source:Entity)
+            WHERE id(source) = row.source_id
+            MATCH (destination:Entity)
+            WHERE id(destination) = row.destination_id
+            {merges}
+            RETURN
+                row.index AS index,
+                source.name AS source,
+                row.relationship AS relationship,
+                destination.name AS target
+            """
+        result = self.graph.query(cypher, params={"rows": rows, "relationships": relationships})
+        return self._group_by_index(result, len(to_be_added))
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+    @staticmethod
+    def _group_by_index(result, count):
+        """Split the rows of a batched statement back into one list per input item."""
+        grouped = [[] for _ in range(count)]
+        for row in result:
+            grouped[row.pop("index")].append(row)
+        return grouped
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
@@ -534,84 +585,40 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
-        """Search for source nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND source_candidate.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
-
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
-        """Search for destination nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
+    def _search_nodes(self, entity_embeddings, filters, threshold=0.9):
+        """
+        Resolve entities to their nearest node when it is in the filters' scope and similar enough, in one query.
 
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND node.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
+        Args:
+            entity_embeddings (dict): Embeddings by entity name.
+            filters (dict): Scope of the lookup, with `user_id` and optionally `agent_id`.
+            threshold (float): Minimum similarity of a match.
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        Returns:
+            dict: Ids of the resolved nodes by entity name. Entities without a match are left out.
+        """
+        params = {
+            "entities": [{"name": name, "embedding": embedding} for name, embedding in entity_embeddings.items()],
+            "user_id": filters["user_id"],
+            "threshold": threshold,
+        }
+        agent_filter = ""
+        if filters.get("agent_id"):
+            agent_filter = "AND candidate.agent_id = $agent_id"
+            params["agent_id"] = filters["agent_id"]
+
+        cypher = f"""
+            UNWIND $entities AS entity
+            CALL vector_search.search("memzero", 1, entity.embedding)
+            YIELD distance, node, similarity
+            WITH entity, node AS candidate, similarity
+            WHERE candidate.user_id = $user_id
+            {agent_filter}
+            AND similarity >= $threshold
+            RETURN entity.name AS name, id(candidate) AS id;
+            """
 
+        return {row["name"]: row["id"] for row in self.graph.query(cypher, params=params)}
 
     def _vector_index_exists(self, index_info, index_name):
         """
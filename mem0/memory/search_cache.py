@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+_SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+
+class SearchCache:
+    """
+    Cache of `search` results, invalidated per scope.
+
+    Every session identifier value (a `user_id`, `agent_id` or `run_id`) has a generation counter that
+    writes to a memory of that scope bump. Cache keys embed the counters of the searched scope as read
+    before the search runs, so a write that lands while a search is in flight, or any time afterwards,
+    sends the next identical search back to the vector store. Entries also expire after `ttl` seconds
+    and the least recently used ones are evicted beyond `max_size`.
+
+    Counters are stamps drawn from one increasing sequence, so they only ever move to values no search has
+    read before. That lets the cache forget the counters of scopes without cached entries once there are
+    more than `4 * max_size` of them: those scopes then read the latest stamp, which differs from every key
+    built before their last write.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: Optional[float] = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations: Dict[tuple, int] = {}
+        self._stamp = 0
+        self._floor = 0
+        self._global_generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, query: str, filters: Dict[str, Any], limit: int, threshold, rerank: bool) -> Optional[tuple]:
+        """
+        Build the cache key of a search, or None if the search cannot be cached.
+
+        Searches whose session identifiers are not plain values (e.g. `{"user_id": {"in": [...]}}`) cannot
+        be matched to the writes that affect them and are never cached.
+        """
+        scope = []
+        for scope_key in _SCOPE_KEYS:
+            value = filters.get(scope_key)
+            if value is None:
+                continue
+            if not isinstance(value, (str, int)):
+                return None
+            scope.append((scope_key, value))
+        if not scope:
+            return None
+
+        try:
+            normalized_filters = json.dumps(filters, sort_keys=True)
+        except TypeError:
+            return None
+
+        with self._lock:
+            generations = tuple((item, self._generations.get(item, self._floor)) for item in scope)
+            global_generation = self._global_generation
+        return (" ".join(query.split()), normalized_filters, limit, threshold, rerank, generations, global_generation)
+
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers may modify the results they get back
+        return deepcopy(entry[1])
+
+    def set(self, key: tuple, value: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Invalidate the cached searches that may include a memory with this payload.
+
+        Bumps the generation of every session identifier in `payload`. Without identifiers, every cached
+        search is invalidated.
+        """
+        scope = [(key, payload[key]) for key in _SCOPE_KEYS if payload and payload.get(key) is not None]
+        with self._lock:
+            if not scope:
+                self._global_generation += 1
+                self._entries.clear()
+                return
+            self._stamp += 1
+            for item in scope:
+                self._generations[item] = self._stamp
+            if len(self._generations) > 4 * self.max_size:
+                self._prune_generations()
+
+    def _prune_generations(self) -> None:
+        """Forget the counters of scopes that no cached entry was keyed on. Called with the lock held."""
+        live = {item for key in self._entries for item, _ in key[5]}
+        # Live scopes that were never written keep reading the current floor, which their entries were keyed on
+        generations = {item: self._generations.get(item, self._floor) for item in live}
+        self._floor = self._stamp
+        self._generations = generations
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._global_generation += 1
+            self._entries.clear()
+            self._generations.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit, miss and eviction counters, the hit rate and the number of cached searches."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
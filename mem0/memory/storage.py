@@ -166,6 +166,51 @@ class SQLiteManager:
                 logger.error(f"Failed to add history record: {e}")
                 raise
 
+    def batch_add_history(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert many history records in a single transaction.
+
+        Each record accepts the same fields as `add_history`: `memory_id`, `old_memory`,
+        `new_memory` and `event` are required, the remaining fields are optional.
+        """
+        if not records:
+            return
+
+        rows = [
+            (
+                str(uuid.uuid4()),
+                record["memory_id"],
+                record.get("old_memory"),
+                record.get("new_memory"),
+                record["event"],
+                record.get("created_at"),
+                record.get("updated_at"),
+                record.get("is_deleted", 0),
+                record.get("actor_id"),
+                record.get("role"),
+            )
+            for record in records
+        ]
+
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    """
+                    INSERT INTO history (
+                        id, memory_id, old_memory, new_memory, event,
+                        created_at, updated_at, is_deleted, actor_id, role
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to add history records: {e}")
+                raise
+
     def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
         with self._lock:
             cur = self.connection.execute(
@@ -1,7 +1,12 @@
+import atexit
 import logging
 import os
 import platform
+import queue
 import sys
+import threading
+import time
+import weakref
 
 from posthog import Posthog
 
@@ -21,46 +26,120 @@ if not isinstance(MEM0_TELEMETRY, bool):
 logging.getLogger("posthog").setLevel(logging.CRITICAL + 1)
 logging.getLogger("urllib3").setLevel(logging.CRITICAL + 1)
 
-
-class AnonymousTelemetry:
-    def __init__(self, vector_store=None):
-        self.posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
-
-        self.user_id = get_or_create_user_id(vector_store)
-
-        if not MEM0_TELEMETRY:
-            self.posthog.disabled = True
-
-    def capture_event(self, event_name, properties=None, user_email=None):
-        if properties is None:
-            properties = {}
-        properties = {
-            "client_source": "python",
-            "client_version": mem0.__version__,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "os_version": platform.version(),
-            "os_release": platform.release(),
-            "processor": platform.processor(),
-            "machine": platform.machine(),
-            **properties,
-        }
-        distinct_id = self.user_id if user_email is None else user_email
-        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
-
-    def close(self):
-        self.posthog.shutdown()
-
-
-client_telemetry = AnonymousTelemetry()
+logger = logging.getLogger(__name__)
+
+
+class TelemetrySink:
+    """
+    Process-wide telemetry pipeline.
+
+    Events are put on a bounded queue and sent from a background thread through a single PostHog client,
+    which batches them before upload. The anonymous user id is resolved on that thread and cached per
+    telemetry vector store, so callers never wait on telemetry I/O. Events are dropped when the queue is full
+    and once the sink is closed.
+    """
+
+    def __init__(self, max_queue_size: int = 10000):
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._user_ids = weakref.WeakKeyDictionary()
+        self._default_user_id = None
+        self._static_properties = None
+        self._posthog = None
+        self._thread = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def enqueue(self, event_name, properties, vector_store=None, user_email=None):
+        if self._closed or not self._ensure_started():
+            return
+        try:
+            self._queue.put_nowait((event_name, properties, vector_store, user_email))
+        except queue.Full:
+            pass
+
+    def _ensure_started(self) -> bool:
+        if self._thread is not None:
+            return True
+        with self._lock:
+            if self._closed:
+                return False
+            if self._thread is None:
+                self._posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
+                thread = threading.Thread(target=self._run, name="mem0-telemetry", daemon=True)
+                thread.start()
+                atexit.register(self.close)
+                self._thread = thread
+            return True
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._send(*item)
+            except Exception as e:
+                logger.debug(f"Failed to send telemetry event: {e}")
+
+    def _send(self, event_name, properties, vector_store, user_email):
+        if self._static_properties is None:
+            self._static_properties = {
+                "client_source": "python",
+                "client_version": mem0.__version__,
+                "python_version": sys.version,
+                "os": sys.platform,
+                "os_version": platform.version(),
+                "os_release": platform.release(),
+                "processor": platform.processor(),
+                "machine": platform.machine(),
+            }
+        distinct_id = user_email if user_email is not None else self._resolve_user_id(vector_store)
+        self._posthog.capture(
+            distinct_id=distinct_id, event=event_name, properties={**self._static_properties, **(properties or {})}
+        )
+
+    def _resolve_user_id(self, vector_store):
+        if vector_store is None:
+            if self._default_user_id is None:
+                self._default_user_id = get_or_create_user_id(None)
+            return self._default_user_id
+        try:
+            user_id = self._user_ids.get(vector_store)
+        except TypeError:
+            # Not weak-referenceable, resolve without caching
+            return get_or_create_user_id(vector_store)
+        if user_id is None:
+            user_id = get_or_create_user_id(vector_store)
+            self._user_ids[vector_store] = user_id
+        return user_id
+
+    def close(self, timeout: float = 5.0):
+        """Send the queued events and stop the background thread. Events enqueued afterwards are dropped."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            # The worker drains the queue meanwhile; if it cannot make room in time, leave the daemon thread be
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.debug("Telemetry queue still full on close, dropping the remaining events")
+        else:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        # PostHog retries failed uploads, so bound the final flush to keep interpreter exit fast when offline
+        flusher = threading.Thread(target=self._posthog.shutdown, daemon=True)
+        flusher.start()
+        flusher.join(timeout)
+
+
+telemetry_sink = TelemetrySink()
 
 
 def capture_event(event_name, memory_instance, additional_data=None):
-    oss_telemetry = AnonymousTelemetry(
-        vector_store=memory_instance._telemetry_vector_store
-        if hasattr(memory_instance, "_telemetry_vector_store")
-        else None,
-    )
+    if not MEM0_TELEMETRY:
+        return
 
     event_data = {
         "collection": memory_instance.collection_name,
@@ -77,14 +156,17 @@ def capture_event(event_name, memory_instance, additional_data=None):
     if additional_data:
         event_data.update(additional_data)
 
-    oss_telemetry.capture_event(event_name, event_data)
+    telemetry_sink.enqueue(event_name, event_data, vector_store=getattr(memory_instance, "_telemetry_vector_store", None))
 
 
 def capture_client_event(event_name, instance, additional_data=None):
+    if not MEM0_TELEMETRY:
+        return
+
     event_data = {
         "function": f"{instance.__class__.__module__}.{instance.__class__.__name__}",
     }
     if additional_data:
         event_data.update(additional_data)
 
-    client_telemetry.capture_event(event_name, event_data, instance.user_email)
+    telemetry_sink.enqueue(event_name, event_data, user_email=instance.user_email)
@@ -150,6 +150,19 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
+        if isinstance(self.mem0_client, Memory):
+            # `Memory.add` takes no filters, so the session ids they scope the completion to scope the write.
+            # The durable queue keeps the call if the process exits before it runs.
+            filters = filters or {}
+            self.mem0_client.enqueue_add(
+                messages=messages,
+                user_id=user_id or filters.get("user_id"),
+                agent_id=agent_id or filters.get("agent_id"),
+                run_id=run_id or filters.get("run_id"),
+                metadata=metadata,
+            )
+            return
+
         def add_task():
             logger.debug("Adding to memory asynchronously")
             self.mem0_client.add(
@@ -149,14 +149,19 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config, vector_config: Optional[dict]):
+    def create(cls, provider_name, config, vector_config: Optional[dict], cache_config=None):
         if provider_name == "upstash_vector" and vector_config and vector_config.enable_embeddings:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if cache_config is not None:
+                from mem0.embeddings.cache import CachedEmbedding
+
+                embedder = CachedEmbedding(embedder, provider_name, cache_config)
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -17,6 +18,14 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Asynchronously insert vectors into a collection. Runs `insert` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        """Asynchronously search for similar vectors. Runs `search` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.search, query=query, vectors=vectors, limit=limit, filters=filters)
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
@@ -52,6 +61,42 @@ class VectorStoreBase(ABC):
         """List all memories."""
         pass
 
+    def iter_list(self, filters=None, page_size=100):
+        """
+        Iterate over all memories matching `filters`, fetching `page_size` records per round trip.
+
+        Stores with a native cursor override this to page through the whole collection. The default
+        yields the records of a single `list` call, so it stops at the store's own `list` limit (100 for
+        most stores) and ignores `page_size`; `Memory.iter_all` logs a warning when it falls back to it.
+        """
+        result = self.list(filters=filters)
+        # Stores return either a flat list of records or a list wrapping one page
+        if isinstance(result, (list, tuple)) and result and isinstance(result[0], (list, tuple)):
+            result = result[0]
+        yield from result or []
+
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose payload matches `filters`.
+
+        Stores override this with a single server-side delete. The default lists the matching ids with
+        `iter_list` and deletes them one by one.
+
+        Returns:
+            Optional[int]: Number of deleted vectors, or None when the store does not report it.
+        """
+        self._require_filters(filters)
+        vector_ids = [record.id for record in self.iter_list(filters=filters)]
+        for vector_id in vector_ids:
+            self.delete(vector_id)
+        return len(vector_ids)
+
+    @staticmethod
+    def _require_filters(filters):
+        """Refuse to delete by an empty filter, which would match the whole collection."""
+        if not filters:
+            raise ValueError("delete_by_filter requires at least one filter. Use reset() to delete every vector.")
+
     @abstractmethod
     def reset(self):
         """Reset by delete the collection and recreate it."""
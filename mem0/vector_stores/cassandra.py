@@ -1,7 +1,8 @@
+import itertools
 import json
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from pydantic import BaseModel
@@ -9,6 +10,7 @@ from pydantic import BaseModel
 try:
     from cassandra.cluster import Cluster
     from cassandra.auth import PlainTextAuthProvider
+    from cassandra.query import SimpleStatement
 except ImportError:
     raise ImportError(
         "Apache Cassandra vector store requires cassandra-driver. "
@@ -19,6 +21,16 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Session identifiers copied out of the JSON payload into their own indexed columns
+_SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+_SIMILARITY_FUNCTIONS = {"cosine": "COSINE", "euclidean": "EUCLIDEAN", "dot_product": "DOT_PRODUCT"}
+
+# Upper bound of `LIMIT` in an ANN query (`sai_vector_search_max_top_k` defaults to 1000)
+_MAX_ANN_LIMIT = 1000
+# How many more rows an ANN query fetches when filters on non-indexed payload keys drop some of them
+_ANN_OVERFETCH = 4
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -39,6 +51,8 @@ class CassandraDB(VectorStoreBase):
         secure_connect_bundle: Optional[str] = None,
         protocol_version: int = 4,
         load_balancing_policy: Optional[Any] = None,
+        use_sai: Optional[bool] = None,
+        fetch_size: int = 1000,
     ):
         """
         Initialize the Apache Cassandra vector store.
@@ -54,6 +68,10 @@ class CassandraDB(VectorStoreBase):
             secure_connect_bundle (str, optional): Path to secure connect bundle for Astra DB
             protocol_version (int): CQL protocol version (default: 4)
             load_balancing_policy (Any, optional): Custom load balancing policy
+            use_sai (bool, optional): Search through a Storage-Attached Index (SAI) vector index with
+                `ORDER BY vector ANN OF` queries. None uses it when the cluster supports it, False always
+                scans the table. (default: None)
+            fetch_size (int): Rows per page when search falls back to scanning the table (default: 1000)
         """
         self.contact_points = contact_points
         self.port = port
@@ -65,10 +83,14 @@ class CassandraDB(VectorStoreBase):
         self.secure_connect_bundle = secure_connect_bundle
         self.protocol_version = protocol_version
         self.load_balancing_policy = load_balancing_policy
+        self.use_sai = use_sai
+        self.fetch_size = fetch_size
 
         # Initialize connection
         self.cluster = None
         self.session = None
+        self._prepared = {}
+        self._ann_enabled = False
         self._setup_connection()
         
         # Create keyspace and table if they don't exist
@@ -132,20 +154,144 @@ class CassandraDB(VectorStoreBase):
 
     def _create_table(self):
         """Create table with vector column if it doesn't exist."""
-        try:
-            # Create table with vector stored as list<float> and payload as text (JSON)
-            query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{self.collection_name} (
-                    id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
+        self._ann_enabled = self._ensure_table(self.collection_name, self.embedding_model_dims)
+
+    def _ensure_table(self, table_name: str, dims: int, distance: str = "cosine") -> bool:
+        """
+        Create the table and its indexes, migrating tables created without the scope columns.
+
+        Returns:
+            bool: Whether the table can be searched through an SAI vector index.
+        """
+        table = f"{self.keyspace}.{table_name}"
+        vector_types = ["list<float>"] if self.use_sai is False else [f"vector<float, {dims}>", "list<float>"]
+        for vector_type in vector_types:
+            try:
+                self.session.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        id text PRIMARY KEY,
+                        vector {vector_type},
+                        payload text,
+                        user_id text,
+                        agent_id text,
+                        run_id text
+                    )
+                """)
+                break
+            except Exception as e:
+                if vector_type == vector_types[-1] or self.use_sai:
+                    logger.error(f"Failed to create table: {e}")
+                    raise
+                logger.warning(f"Vector columns are not supported by this cluster, falling back to list<float>: {e}")
+        logger.info(f"Table '{table_name}' is ready")
+
+        columns = self._table_columns(table_name)
+        missing_scope_columns = [column for column in _SCOPE_COLUMNS if columns and column not in columns]
+        if missing_scope_columns:
+            for column in missing_scope_columns:
+                self.session.execute(f"ALTER TABLE {table} ADD {column} text")
+            self._backfill_scope_columns(table_name)
+
+        vector_column_type = columns.get("vector", "")
+        if self.use_sai is False or not vector_column_type.startswith("vector"):
+            if self.use_sai:
+                raise ValueError(
+                    f"Table '{table_name}' stores vectors as {vector_column_type or 'an unknown type'}, which SAI "
+                    "cannot index. Recreate the collection on a cluster with vector support to use ANN search."
                 )
-            """
-            self.session.execute(query)
-            logger.info(f"Table '{self.collection_name}' is ready")
+            if columns:
+                logger.info(f"Table '{table_name}' has no vector index, search will scan the table")
+            self._create_scope_indexes(table_name, sai=False)
+            return False
+
+        try:
+            self.session.execute(f"""
+                CREATE CUSTOM INDEX IF NOT EXISTS {table_name}_vector_idx ON {table} (vector)
+                USING 'StorageAttachedIndex'
+                WITH OPTIONS = {{'similarity_function': '{_SIMILARITY_FUNCTIONS.get(distance, "COSINE")}'}}
+            """)
         except Exception as e:
-            logger.error(f"Failed to create table: {e}")
-            raise
+            if self.use_sai:
+                logger.error(f"Failed to create vector index: {e}")
+                raise
+            logger.warning(f"Failed to create SAI vector index, search will scan the table: {e}")
+            self._create_scope_indexes(table_name, sai=False)
+            return False
+        self._create_scope_indexes(table_name, sai=True)
+        return True
+
+    def _table_columns(self, table_name: str) -> Dict[str, str]:
+        """Return the CQL type of every column of the table, or an empty dict if the schema cannot be read."""
+        try:
+            rows = self.session.execute(
+                self._prepare(
+                    "SELECT column_name, type FROM system_schema.columns WHERE keyspace_name = ? AND table_name = ?"
+                ),
+                (self.keyspace, table_name),
+            )
+            return {row.column_name: row.type for row in rows}
+        except Exception as e:
+            logger.debug(f"Failed to read the schema of table '{table_name}': {e}")
+            return {}
+
+    def _create_scope_indexes(self, table_name: str, sai: bool):
+        """Index the scope columns, with SAI when available and regular secondary indexes otherwise."""
+        using = " USING 'StorageAttachedIndex'" if sai else ""
+        for column in _SCOPE_COLUMNS:
+            try:
+                self.session.execute(
+                    f"CREATE {'CUSTOM ' if sai else ''}INDEX IF NOT EXISTS {table_name}_{column}_idx "
+                    f"ON {self.keyspace}.{table_name} ({column}){using}"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to index column '{column}' of table '{table_name}': {e}")
+
+    def _backfill_scope_columns(self, table_name: str):
+        """Copy the session identifiers of rows written before the scope columns existed out of their payload."""
+        logger.info(f"Backfilling scope columns of table '{table_name}'")
+        table = f"{self.keyspace}.{table_name}"
+        update = self._prepare(f"UPDATE {table} SET user_id = ?, agent_id = ?, run_id = ? WHERE id = ?")
+        rows = self.session.execute(SimpleStatement(f"SELECT id, payload FROM {table}", fetch_size=self.fetch_size))
+        for row in rows:
+            payload = self._decode_payload(row.payload)
+            if payload is not None:
+                self.session.execute(update, (*self._scope_values(payload), row.id))
+
+    def _prepare(self, query: str):
+        """Prepare a statement once per session."""
+        prepared = self._prepared.get(query)
+        if prepared is None:
+            prepared = self.session.prepare(query)
+            self._prepared[query] = prepared
+        return prepared
+
+    @staticmethod
+    def _scope_values(payload: Dict) -> Tuple[Optional[str], ...]:
+        return tuple(
+            str(payload[column]) if payload.get(column) is not None else None for column in _SCOPE_COLUMNS
+        )
+
+    @staticmethod
+    def _decode_payload(payload: Optional[str]) -> Optional[Dict]:
+        try:
+            return json.loads(payload) if payload else {}
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _split_filters(filters: Optional[Dict]) -> Tuple[Dict, Dict]:
+        """Split filters into those on scope columns, which Cassandra evaluates, and those on other payload keys."""
+        scope, rest = {}, {}
+        for key, value in (filters or {}).items():
+            if key in _SCOPE_COLUMNS and isinstance(value, str):
+                scope[key] = value
+            else:
+                rest[key] = value
+        return scope, rest
+
+    @staticmethod
+    def _matches(payload: Optional[Dict], filters: Dict) -> bool:
+        return payload is not None and all(payload.get(k) == v for k, v in filters.items())
 
     def create_col(self, name: str = None, vector_size: int = None, distance: str = "cosine"):
         """
@@ -160,14 +306,9 @@ class CassandraDB(VectorStoreBase):
         dims = vector_size or self.embedding_model_dims
 
         try:
-            query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
-                    id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
-                )
-            """
-            self.session.execute(query)
+            ann_enabled = self._ensure_table(table_name, dims, distance)
+            if table_name == self.collection_name:
+                self._ann_enabled = ann_enabled
             logger.info(f"Created collection '{table_name}' with vector dimension {dims}")
         except Exception as e:
             logger.error(f"Failed to create collection: {e}")
@@ -195,16 +336,15 @@ class CassandraDB(VectorStoreBase):
             ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
 
         try:
-            query = f"""
-                INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload)
-                VALUES (?, ?, ?)
-            """
-            prepared = self.session.prepare(query)
+            prepared = self._prepare(f"""
+                INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload, user_id, agent_id, run_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """)
 
             for vector, payload, vec_id in zip(vectors, payloads, ids):
                 self.session.execute(
                     prepared,
-                    (vec_id, vector, json.dumps(payload))
+                    (vec_id, [float(x) for x in vector], json.dumps(payload), *self._scope_values(payload))
                 )
         except Exception as e:
             logger.error(f"Failed to insert vectors: {e}")
@@ -220,6 +360,10 @@ class CassandraDB(VectorStoreBase):
         """
         Search for similar vectors using cosine similarity.
 
+        Uses an ANN query on the SAI vector index when the table has one, and otherwise scores the
+        table page by page. Filters on `user_id`, `agent_id` and `run_id` are evaluated by Cassandra,
+        other filters on the decoded payloads.
+
         Args:
             query (str): Query string (not used in vector search)
             vectors (List[float]): Query vector
@@ -227,58 +371,92 @@ class CassandraDB(VectorStoreBase):
             filters (Dict, optional): Filters to apply to the search
 
         Returns:
-            List[OutputData]: Search results
+            List[OutputData]: Search results, scored by cosine distance
         """
         try:
-            # Fetch all vectors (in production, you'd want pagination or filtering)
-            query_cql = f"""
-                SELECT id, vector, payload
-                FROM {self.keyspace}.{self.collection_name}
-            """
-            rows = self.session.execute(query_cql)
-
-            # Calculate cosine similarity in Python
-            query_vec = np.array(vectors)
-            scored_results = []
-
-            for row in rows:
-                if not row.vector:
-                    continue
-
-                vec = np.array(row.vector)
-                
-                # Cosine similarity
-                similarity = np.dot(query_vec, vec) / (np.linalg.norm(query_vec) * np.linalg.norm(vec))
-                distance = 1 - similarity
-
-                # Apply filters if provided
-                if filters:
-                    try:
-                        payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
-
-                scored_results.append((row.id, distance, row.payload))
-
-            # Sort by distance and limit
-            scored_results.sort(key=lambda x: x[1])
-            scored_results = scored_results[:limit]
-
-            return [
-                OutputData(
-                    id=r[0],
-                    score=float(r[1]),
-                    payload=json.loads(r[2]) if r[2] else {}
-                )
-                for r in scored_results
-            ]
+            scope, rest = self._split_filters(filters)
+            if self._ann_enabled:
+                return self._ann_search(vectors, limit, scope, rest)
+            return self._scan_search(vectors, limit, scope, rest)
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise
 
+    def _where(self, scope: Dict) -> str:
+        return f"WHERE {' AND '.join(f'{column} = ?' for column in scope)}" if scope else ""
+
+    def _ann_search(self, vectors: List[float], limit: int, scope: Dict, rest: Dict) -> List[OutputData]:
+        query_vec = [float(x) for x in vectors]
+        prepared = self._prepare(f"""
+            SELECT id, payload, similarity_cosine(vector, ?) AS similarity
+            FROM {self.keyspace}.{self.collection_name}
+            {self._where(scope)}
+            ORDER BY vector ANN OF ?
+            LIMIT ?
+        """)
+
+        fetch_k = min(limit * _ANN_OVERFETCH if rest else limit, _MAX_ANN_LIMIT)
+        while True:
+            rows = list(self.session.execute(prepared, (query_vec, *scope.values(), query_vec, fetch_k)))
+            results = []
+            for row in rows:
+                payload = self._decode_payload(row.payload)
+                if rest and not self._matches(payload, rest):
+                    continue
+                # similarity_cosine is (1 + cos) / 2, scores stay cosine distances like the table scan
+                results.append(OutputData(id=row.id, score=2 * (1 - float(row.similarity)), payload=payload or {}))
+                if len(results) == limit:
+                    return results
+            if len(rows) < fetch_k or fetch_k >= _MAX_ANN_LIMIT:
+                return results
+            fetch_k = min(fetch_k * _ANN_OVERFETCH, _MAX_ANN_LIMIT)
+
+    def _scan_search(self, vectors: List[float], limit: int, scope: Dict, rest: Dict) -> List[OutputData]:
+        """Score the rows in scope in blocks of `fetch_size`, keeping the running top `limit`."""
+        query_vec = np.asarray(vectors, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        prepared = self._prepare(f"""
+            SELECT id, vector, payload
+            FROM {self.keyspace}.{self.collection_name}
+            {self._where(scope)}{" ALLOW FILTERING" if scope else ""}
+        """)
+        statement = prepared.bind(tuple(scope.values()))
+        statement.fetch_size = self.fetch_size
+        rows = iter(self.session.execute(statement))
+
+        best_rows = []
+        best_distances = np.empty(0, dtype=np.float32)
+        while True:
+            block = [row for row in itertools.islice(rows, self.fetch_size) if row.vector]
+            if not block:
+                break
+            if rest:
+                block = [(row, self._decode_payload(row.payload)) for row in block]
+                block = [(row, payload) for row, payload in block if self._matches(payload, rest)]
+            else:
+                block = [(row, None) for row in block]
+            if not block:
+                continue
+
+            matrix = np.asarray([row.vector for row, _ in block], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * query_norm
+            distances = 1 - (matrix @ query_vec) / np.where(norms == 0, 1, norms)
+
+            best_rows += block
+            best_distances = np.concatenate([best_distances, distances])
+            if len(best_rows) > limit:
+                keep = np.argpartition(best_distances, limit - 1)[:limit]
+                best_rows = [best_rows[i] for i in keep]
+                best_distances = best_distances[keep]
+
+        results = []
+        for i in np.argsort(best_distances, kind="stable")[:limit]:
+            row, payload = best_rows[i]
+            if payload is None:
+                payload = self._decode_payload(row.payload)
+            results.append(OutputData(id=row.id, score=float(best_distances[i]), payload=payload or {}))
+        return results
+
     def delete(self, vector_id: str):
         """
         Delete a vector by ID.
@@ -320,16 +498,16 @@ class CassandraDB(VectorStoreBase):
                     WHERE id = ?
                 """
                 prepared = self.session.prepare(query)
-                self.session.execute(prepared, (vector, vector_id))
+                self.session.execute(prepared, ([float(x) for x in vector], vector_id))
 
             if payload is not None:
                 query = f"""
                     UPDATE {self.keyspace}.{self.collection_name}
-                    SET payload = ?
+                    SET payload = ?, user_id = ?, agent_id = ?, run_id = ?
                     WHERE id = ?
                 """
                 prepared = self.session.prepare(query)
-                self.session.execute(prepared, (json.dumps(payload), vector_id))
+                self.session.execute(prepared, (json.dumps(payload), *self._scope_values(payload), vector_id))
 
             logger.info(f"Updated vector with id: {vector_id}")
         except Exception as e:
@@ -418,7 +596,8 @@ class CassandraDB(VectorStoreBase):
                 "name": self.collection_name,
                 "keyspace": self.keyspace,
                 "count": count,
-                "vector_dims": self.embedding_model_dims
+                "vector_dims": self.embedding_model_dims,
+                "ann_search": self._ann_enabled,
             }
         except Exception as e:
             logger.error(f"Failed to get collection info: {e}")
@@ -440,38 +619,56 @@ class CassandraDB(VectorStoreBase):
             List[List[OutputData]]: List of vectors
         """
         try:
-            query = f"""
-                SELECT id, vector, payload
+            scope, rest = self._split_filters(filters)
+            prepared = self._prepare(f"""
+                SELECT id, payload
                 FROM {self.keyspace}.{self.collection_name}
-                LIMIT {limit}
-            """
-            rows = self.session.execute(query)
+                {self._where(scope)}{" ALLOW FILTERING" if scope and not self._ann_enabled else ""}
+            """)
+            statement = prepared.bind(tuple(scope.values()))
+            statement.fetch_size = self.fetch_size if rest else min(limit, self.fetch_size)
 
             results = []
-            for row in rows:
-                # Apply filters if provided
-                if filters:
-                    try:
-                        payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
-
-                results.append(
-                    OutputData(
-                        id=row.id,
-                        score=None,
-                        payload=json.loads(row.payload) if row.payload else {}
-                    )
-                )
+            for row in self.session.execute(statement):
+                payload = self._decode_payload(row.payload)
+                if rest and not self._matches(payload, rest):
+                    continue
+                results.append(OutputData(id=row.id, score=None, payload=payload or {}))
+                if len(results) >= limit:
+                    break
 
             return [results]
         except Exception as e:
             logger.error(f"Failed to list vectors: {e}")
             return [[]]
 
+    def iter_list(self, filters: Optional[Dict] = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters, letting the driver fetch `page_size` rows per page.
+
+        Args:
+            filters (Dict, optional): Filters to apply
+            page_size (int): Number of rows fetched per page
+
+        Yields:
+            OutputData: The matching vectors
+        """
+        scope, rest = self._split_filters(filters)
+        prepared = self._prepare(f"""
+            SELECT id, payload
+            FROM {self.keyspace}.{self.collection_name}
+            {self._where(scope)}{" ALLOW FILTERING" if scope and not self._ann_enabled else ""}
+        """)
+        statement = prepared.bind(tuple(scope.values()))
+        statement.fetch_size = page_size
+
+        # The result set requests the next page when the current one is consumed
+        for row in self.session.execute(statement):
+            payload = self._decode_payload(row.payload)
+            if rest and not self._matches(payload, rest):
+                continue
+            yield OutputData(id=row.id, score=None, payload=payload or {})
+
     def reset(self):
         """Reset the collection by truncating it."""
         try:
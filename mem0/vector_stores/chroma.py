@@ -169,6 +169,16 @@ class ChromaDB(VectorStoreBase):
         """
         self.collection.delete(ids=vector_id)
 
+    def delete_by_filter(self, filters: Dict):
+        """
+        Delete all vectors matching the filters in a single request.
+
+        Args:
+            filters (Dict): Filters selecting the vectors to delete.
+        """
+        self._require_filters(filters)
+        self.collection.delete(where=self._generate_where_clause(filters))
+
     def update(
         self,
         vector_id: str,
@@ -237,6 +247,27 @@ class ChromaDB(VectorStoreBase):
         results = self.collection.get(where=where_clause, limit=limit)
         return [self._parse_output(results)]
 
+    def iter_list(self, filters: Optional[Dict] = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters, one `get` with an increasing offset per page.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of vectors fetched per request. Defaults to 100.
+
+        Yields:
+            OutputData: The matching vectors.
+        """
+        where_clause = self._generate_where_clause(filters) if filters else None
+        offset = 0
+        while True:
+            results = self.collection.get(where=where_clause, limit=page_size, offset=offset)
+            page = self._parse_output(results)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -14,6 +14,9 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# How long Elasticsearch keeps the point in time of `iter_list` alive between two pages
+_PIT_KEEP_ALIVE = "1m"
+
 
 class OutputData(BaseModel):
     id: str
@@ -162,6 +165,23 @@ class ElasticsearchDB(VectorStoreBase):
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
 
+    def delete_by_filter(self, filters: Dict) -> int:
+        """
+        Delete all memories matching the filters with a single `delete_by_query`.
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        self._require_filters(filters)
+        response = self.client.delete_by_query(
+            index=self.collection_name,
+            query=self._filter_query(filters),
+            # Make the deletions visible to the next search, like the deletes by id
+            refresh=True,
+            conflicts="proceed",
+        )
+        return response["deleted"]
+
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload."""
         doc = {}
@@ -203,6 +223,12 @@ class ElasticsearchDB(VectorStoreBase):
         """Get information about a collection (index)."""
         return self.client.indices.get(index=name)
 
+    @staticmethod
+    def _filter_query(filters: Optional[Dict]) -> Dict[str, Any]:
+        if not filters:
+            return {"match_all": {}}
+        return {"bool": {"must": [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]}}
+
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
         """List all memories."""
         query: Dict[str, Any] = {"query": {"match_all": {}}}
@@ -230,6 +256,46 @@ class ElasticsearchDB(VectorStoreBase):
 
         return [results]
 
+    def iter_list(self, filters: Optional[Dict] = None, page_size: int = 100):
+        """
+        Iterate over all memories matching the filters with `search_after` over a point in time.
+
+        The point in time pins the index to one snapshot for the whole iteration, and `_shard_doc` gives
+        the stable sort that `search_after` resumes from.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of hits fetched per request. Defaults to 100.
+
+        Yields:
+            OutputData: The matching memories.
+        """
+        query = self._filter_query(filters)
+        pit_id = self.client.open_point_in_time(index=self.collection_name, keep_alive=_PIT_KEEP_ALIVE)["id"]
+        try:
+            search_after = None
+            while True:
+                body: Dict[str, Any] = {
+                    "query": query,
+                    "size": page_size,
+                    "pit": {"id": pit_id, "keep_alive": _PIT_KEEP_ALIVE},
+                    "sort": [{"_shard_doc": "asc"}],
+                    "_source": ["metadata"],
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+                response = self.client.search(body=body)
+                # Every response may carry a refreshed point in time id
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                for hit in hits:
+                    yield OutputData(id=hit["_id"], score=1.0, payload=hit.get("_source", {}).get("metadata", {}))
+                if len(hits) < page_size:
+                    return
+                search_after = hits[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(id=pit_id)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -1,9 +1,17 @@
+import json
 import logging
+import math
 import os
 import pickle
+import sqlite3
+import struct
+import threading
+import time
 import uuid
+import zlib
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 from pydantic import BaseModel
@@ -30,6 +38,27 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Every mutation log record is prefixed with its length and CRC32
+_LOG_RECORD_HEADER = struct.Struct("<II")
+
+# Index types that need training, and stay flat until enough vectors have arrived
+_TRAINED_INDEX_TYPES = ("ivf_flat", "ivf_pq")
+
+# Payload keys mapped to the index ids holding each of their values, so that scoped searches only visit their scope
+_INDEXED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id", "role")
+
+# Scopes up to this size are searched by computing their distances directly, which is exact for every index type
+_EXACT_SEARCH_MAX_CANDIDATES = 2048
+
+# Scopes covering at least this share of the index are searched by over-fetching rather than through a selector
+_OVERFETCH_MIN_FRACTION = 0.5
+
+# Searches skip up to this many tombstones by fetching as many more neighbors, and exclude more through a selector
+_MAX_OVERFETCHED_TOMBSTONES = 256
+
+# HNSW graphs have to be rebuilt to drop tombstones, which only happens once they make up this share of the index
+_HNSW_REBUILD_MIN_TOMBSTONE_RATIO = 0.1
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -37,6 +66,109 @@ class OutputData(BaseModel):
     payload: Optional[Dict]  # metadata
 
 
+class SQLiteDocstore(MutableMapping):
+    """
+    Payload store of the FAISS vector store kept in SQLite, used instead of the pickled dict with `docstore="sqlite"`.
+
+    Payloads are stored as JSON next to the index id of their vector and read on demand, so opening a collection
+    only loads the id mappings and every read returns a new dict. Writes stay in an open transaction until
+    `commit`, which the store calls once the matching mutation log record is written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS docstore (
+                id       TEXT PRIMARY KEY,
+                index_id INTEGER,
+                payload  TEXT NOT NULL
+            )
+        """
+        )
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self.connection.commit()
+
+    def __getitem__(self, vector_id: str) -> Dict:
+        row = self.connection.execute("SELECT payload FROM docstore WHERE id = ?", (vector_id,)).fetchone()
+        if row is None:
+            raise KeyError(vector_id)
+        return json.loads(row[0])
+
+    def __setitem__(self, vector_id: str, payload: Dict):
+        self.connection.execute(
+            "INSERT INTO docstore (id, payload) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET payload = excluded.payload",
+            (vector_id, json.dumps(payload)),
+        )
+
+    def __delitem__(self, vector_id: str):
+        if not self.connection.execute("DELETE FROM docstore WHERE id = ?", (vector_id,)).rowcount:
+            raise KeyError(vector_id)
+
+    def __contains__(self, vector_id) -> bool:
+        return self.connection.execute("SELECT 1 FROM docstore WHERE id = ?", (vector_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (vector_id,) in self.connection.execute("SELECT id FROM docstore ORDER BY rowid"):
+            yield vector_id
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM docstore").fetchone()[0]
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Iterate over the ids and payloads in insertion order, reading them as they are consumed."""
+        for vector_id, payload in self.connection.execute("SELECT id, payload FROM docstore ORDER BY rowid"):
+            yield vector_id, json.loads(payload)
+
+    def put(self, vector_id: str, index_id: int, payload: Dict):
+        """Store a payload together with the index id of its vector."""
+        self.connection.execute(
+            """
+            INSERT INTO docstore (id, index_id, payload) VALUES (?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET index_id = excluded.index_id, payload = excluded.payload
+        """,
+            (vector_id, index_id, json.dumps(payload)),
+        )
+
+    def put_many(self, rows: List[Tuple[str, int, Dict]]):
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO docstore (id, index_id, payload) VALUES (?, ?, ?)",
+            ((vector_id, index_id, json.dumps(payload)) for vector_id, index_id, payload in rows),
+        )
+
+    def index_ids(self) -> Iterator[Tuple[int, str]]:
+        """Iterate over the index id and memory id of every stored payload."""
+        return self.connection.execute("SELECT index_id, id FROM docstore WHERE index_id IS NOT NULL")
+
+    def indexed_values(self, keys) -> Iterator[tuple]:
+        """Iterate over the index id and the values of `keys` of every payload, without decoding the payloads."""
+        columns = ", ".join(f"json_extract(payload, '$.{key}')" for key in keys)
+        return self.connection.execute(f"SELECT index_id, {columns} FROM docstore WHERE index_id IS NOT NULL")
+
+    def get_meta(self, key: str, default: int = 0) -> int:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key: str, value: int):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def clear(self):
+        self.connection.execute("DELETE FROM docstore")
+        self.connection.execute("DELETE FROM meta")
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        if self.connection:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+
 class FAISS(VectorStoreBase):
     def __init__(
         self,
@@ -45,6 +177,19 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        flush_every_n: int = 1000,
+        flush_interval: Optional[float] = 60.0,
+        compaction_threshold: int = 1000,
+        index_type: str = "flat",
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 64,
+        nlist: int = 1024,
+        nprobe: int = 16,
+        pq_m: int = 16,
+        pq_nbits: int = 8,
+        train_min_vectors: Optional[int] = None,
+        docstore: str = "pickle",
     ):
         """
         Initialize the FAISS vector store.
@@ -56,17 +201,68 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            flush_every_n (int, optional): Number of logged mutations after which the index and docstore are
+                snapshotted and the mutation log is truncated. Defaults to 1000.
+            flush_interval (float, optional): Seconds after which a mutation triggers a snapshot regardless of
+                `flush_every_n`. None disables time-based snapshots. Defaults to 60.0.
+            compaction_threshold (int, optional): Number of deleted vectors after which they are removed from the
+                index in the background. HNSW graphs, which are rebuilt to drop them, also wait until they make up
+                a tenth of the index. Defaults to 1000.
+            index_type (str, optional): Index to build. Options: 'flat' (exact search), 'hnsw', 'ivf_flat', 'ivf_pq'.
+                Defaults to "flat".
+            hnsw_m (int, optional): Number of neighbors per node of the HNSW graph. Defaults to 32.
+            ef_construction (int, optional): HNSW search depth when adding vectors. Defaults to 40.
+            ef_search (int, optional): Default HNSW search depth. Defaults to 64.
+            nlist (int, optional): Number of IVF clusters. Defaults to 1024.
+            nprobe (int, optional): Default number of IVF clusters visited per search. Defaults to 16.
+            pq_m (int, optional): Number of product-quantizer sub-vectors for 'ivf_pq'. Must divide
+                `embedding_model_dims`. Defaults to 16.
+            pq_nbits (int, optional): Bits per product-quantizer code for 'ivf_pq'. Defaults to 8.
+            train_min_vectors (int, optional): Number of vectors after which IVF indexes are trained. Until then
+                the store searches a flat index. Defaults to 39 vectors per IVF cluster.
+            docstore (str, optional): Where payloads are kept. Options: 'pickle' (in memory, pickled with every
+                snapshot), 'sqlite' (on disk, read on demand). Existing collections are migrated to the configured
+                backend when opened. Defaults to "pickle".
         """
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
-
-        # Initialize storage structures
+        self.flush_every_n = flush_every_n
+        self.flush_interval = flush_interval
+        self.compaction_threshold = compaction_threshold
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.pq_m = pq_m
+        self.pq_nbits = pq_nbits
+        self.train_min_vectors = train_min_vectors
+        self.docstore_backend = docstore
+
+        # Initialize storage structures. Vectors are stored under stable int64 ids, mapped to memory ids both ways.
         self.index = None
         self.docstore = {}
         self.index_to_id = {}
+        self.id_to_index = {}
+        self._next_index_id = 0
+        self._payload_index = {}
+
+        # Deleted vectors stay in the index, and its snapshots, as tombstones until they are compacted in one batch
+        self._tombstones = set()
+        self._tombstone_selector = None
+        self._lock = threading.RLock()
+        self._compaction_thread = None
+
+        # Mutations not yet folded into a snapshot are appended to the log
+        self._log_file = None
+        self._log_seq = 0
+        self._snapshot_seq = 0
+        self._pending_mutations = 0
+        self._last_snapshot_at = time.monotonic()
 
         # Create directory if it doesn't exist
         if self.path:
@@ -74,47 +270,570 @@ class FAISS(VectorStoreBase):
 
             # Try to load existing index if available
             index_path = f"{self.path}/{collection_name}.faiss"
-            docstore_path = f"{self.path}/{collection_name}.pkl"
-            if os.path.exists(index_path) and os.path.exists(docstore_path):
+            docstore_path = self._existing_docstore_path()
+            if os.path.exists(index_path) and docstore_path is not None:
                 self._load(index_path, docstore_path)
+                self._replay_log()
+                if self.index is not None:
+                    self._restore_tombstones()
+                    self._ensure_index_type()
+                    self._ensure_docstore_backend(docstore_path)
             else:
                 self.create_col(collection_name)
 
+    def _existing_docstore_path(self) -> Optional[str]:
+        """Return the docstore file to load, preferring the configured backend if both files exist."""
+        paths = [self._docstore_path("sqlite"), self._docstore_path("pickle")]
+        if self.docstore_backend == "pickle":
+            paths.reverse()
+        return next((path for path in paths if os.path.exists(path)), None)
+
     def _load(self, index_path: str, docstore_path: str):
         """
         Load FAISS index and docstore from disk.
 
         Args:
             index_path (str): Path to FAISS index file.
-            docstore_path (str): Path to docstore pickle file.
+            docstore_path (str): Path to docstore pickle or SQLite file.
         """
         try:
             self.index = faiss.read_index(index_path)
-            with open(docstore_path, "rb") as f:
-                self.docstore, self.index_to_id = pickle.load(f)
+            self._payload_index = {}
+            if docstore_path.endswith(".db"):
+                self.docstore = SQLiteDocstore(docstore_path)
+                self.index_to_id = dict(self.docstore.index_ids())
+                self._snapshot_seq = self._log_seq = self.docstore.get_meta("log_seq")
+                next_index_id = self.docstore.get_meta("next_index_id")
+                for index_id, *values in self.docstore.indexed_values(_INDEXED_PAYLOAD_KEYS):
+                    self._index_payload(index_id, dict(zip(_INDEXED_PAYLOAD_KEYS, values)))
+            else:
+                with open(docstore_path, "rb") as f:
+                    state = pickle.load(f)
+                # Snapshots written before the mutation log existed hold only the docstore and the mapping
+                self.docstore, self.index_to_id = state[0], state[1]
+                self._snapshot_seq = self._log_seq = state[2] if len(state) > 2 else 0
+                next_index_id = state[3] if len(state) > 3 else 0
+                for index_id, vector_id in self.index_to_id.items():
+                    self._index_payload(index_id, self.docstore.get(vector_id))
+            self.id_to_index = {vector_id: index_id for index_id, vector_id in self.index_to_id.items()}
+            self._next_index_id = self._first_free_index_id(next_index_id)
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
 
+            self._close_docstore()
             self.docstore = {}
             self.index_to_id = {}
+            self.id_to_index = {}
+            self._payload_index = {}
+
+    def _restore_tombstones(self):
+        """Mark the vectors of the loaded index that no memory maps to as tombstones."""
+        if self._is_positional():
+            return
+        ids = self._stored_index_ids()
+        mapped = np.fromiter(self.index_to_id, dtype=np.int64, count=len(self.index_to_id))
+        self._tombstones = set(ids[~np.isin(ids, mapped)].tolist())
+        self._tombstone_selector = None
+
+    def _ensure_docstore_backend(self, loaded_path: str):
+        """Move a docstore loaded from the other backend's file to the configured backend."""
+        target_path = self._docstore_path()
+        if loaded_path == target_path:
+            return
+        with self._lock:
+            if self.docstore_backend == "sqlite":
+                # Build the database next to its destination so that it only appears once complete
+                if os.path.exists(f"{target_path}.tmp"):
+                    os.remove(f"{target_path}.tmp")
+                store = SQLiteDocstore(f"{target_path}.tmp")
+                store.put_many(
+                    (vector_id, self.id_to_index.get(vector_id), payload)
+                    for vector_id, payload in self.docstore.items()
+                )
+                store.close()
+                os.replace(f"{target_path}.tmp", target_path)
+                self.docstore = SQLiteDocstore(target_path)
+            else:
+                docstore = dict(self.docstore.items())
+                self._close_docstore()
+                self.docstore = docstore
+            self._save_locked()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(f"{loaded_path}{suffix}"):
+                    os.remove(f"{loaded_path}{suffix}")
+        logger.info(f"Migrated the docstore of {self.collection_name} from {loaded_path} to {target_path}")
+
+    def _close_docstore(self):
+        if isinstance(self.docstore, SQLiteDocstore):
+            self.docstore.close()
+
+    def _payload_copy(self, payload: Dict) -> Dict:
+        # Payloads read from SQLite are already private to the caller
+        return payload if isinstance(self.docstore, SQLiteDocstore) else payload.copy()
+
+    def _first_free_index_id(self, next_index_id: int) -> int:
+        """Return an index id above every id used by the loaded index, the docstore and the snapshot."""
+        stored_ids = self._stored_index_ids()
+        if len(stored_ids):
+            next_index_id = max(next_index_id, int(stored_ids.max()) + 1)
+        if self.index_to_id:
+            next_index_id = max(next_index_id, max(self.index_to_id) + 1)
+        return next_index_id
+
+    def _is_positional(self) -> bool:
+        """Whether the index was written by an earlier version that identified vectors by their position."""
+        return isinstance(self.index, faiss.IndexFlat)
+
+    def _current_index_type(self) -> str:
+        if isinstance(self.index, faiss.IndexIVFPQ):
+            return "ivf_pq"
+        if isinstance(self.index, faiss.IndexIVFFlat):
+            return "ivf_flat"
+        if isinstance(self.index, faiss.IndexIDMap) and isinstance(
+            faiss.downcast_index(self.index.index), faiss.IndexHNSW
+        ):
+            return "hnsw"
+        return "flat"
+
+    def _stored_index_ids(self) -> np.ndarray:
+        """Return the ids of every vector in the index, tombstones included."""
+        if isinstance(self.index, faiss.IndexIDMap):
+            return faiss.vector_to_array(self.index.id_map)
+        if isinstance(self.index, faiss.IndexIVF):
+            invlists = self.index.invlists
+            ids = [
+                faiss.rev_swig_ptr(invlists.get_ids(list_no), invlists.list_size(list_no)).copy()
+                for list_no in range(self.index.nlist)
+                if invlists.list_size(list_no)
+            ]
+            return np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+        return np.arange(self.index.ntotal, dtype=np.int64)
+
+    def _live_vectors(self):
+        """Return the ids and vectors of every memory in the index, leaving out tombstones."""
+        ids = self._stored_index_ids()
+        if not len(ids):
+            return ids, np.empty((0, self.embedding_model_dims), dtype=np.float32)
+        if isinstance(self.index, faiss.IndexIDMap):
+            vectors = self.index.index.reconstruct_n(0, self.index.ntotal)
+        elif isinstance(self.index, faiss.IndexIVF):
+            vectors = self.index.reconstruct_batch(ids)
+        else:
+            vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        live = np.fromiter(self.index_to_id, dtype=np.int64, count=len(self.index_to_id))
+        keep = np.isin(ids, live)
+        return ids[keep], vectors[keep]
+
+    def _min_training_vectors(self) -> int:
+        if self.train_min_vectors is not None:
+            return self.train_min_vectors
+        # FAISS warns below 39 training points per cluster, and PQ needs one per code
+        minimum = 39 * self.nlist
+        if self.index_type == "ivf_pq":
+            minimum = max(minimum, 2**self.pq_nbits)
+        return minimum
+
+    def _metric(self, distance_strategy: str) -> int:
+        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
+            return faiss.METRIC_INNER_PRODUCT
+        return faiss.METRIC_L2
+
+    def _new_index(self, index_type: str, training_vectors: Optional[np.ndarray] = None, distance: str = None):
+        """Build an empty index of the given type, training it on `training_vectors` if it needs training."""
+        distance_strategy = distance or self.distance_strategy
+        if index_type == "hnsw":
+            hnsw = faiss.IndexHNSWFlat(self.embedding_model_dims, self.hnsw_m, self._metric(distance_strategy))
+            hnsw.hnsw.efConstruction = self.ef_construction
+            hnsw.hnsw.efSearch = self.ef_search
+            return faiss.IndexIDMap2(hnsw)
+
+        if index_type in _TRAINED_INDEX_TYPES:
+            quantizer = self._new_flat_index(distance_strategy)
+            if index_type == "ivf_pq":
+                index = faiss.IndexIVFPQ(
+                    quantizer,
+                    self.embedding_model_dims,
+                    self.nlist,
+                    self.pq_m,
+                    self.pq_nbits,
+                    self._metric(distance_strategy),
+                )
+            else:
+                index = faiss.IndexIVFFlat(
+                    quantizer, self.embedding_model_dims, self.nlist, self._metric(distance_strategy)
+                )
+            index.train(training_vectors)
+            index.nprobe = self.nprobe
+            # IVF lists store the ids themselves; the hash table lets vectors be reconstructed and removed by id
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+            return index
+
+        return faiss.IndexIDMap2(self._new_flat_index(distance_strategy))
+
+    def _rebuild_locked(self, index_type: str):
+        """Move the live vectors to a new index of `index_type`, dropping tombstones."""
+        ids, vectors = self._live_vectors()
+        if index_type in _TRAINED_INDEX_TYPES and len(ids) < self._min_training_vectors():
+            index_type = "flat"
+        index = self._new_index(index_type, training_vectors=vectors)
+        if len(ids):
+            index.add_with_ids(vectors, ids)
+        self.index = index
+        self._tombstones.clear()
+        self._tombstone_selector = None
+
+    def _ensure_index_type(self):
+        """Rebuild a loaded index whose type no longer matches `index_type`, and train it if it is due."""
+        with self._lock:
+            current = self._current_index_type()
+            if self._is_positional():
+                removed = self.index.ntotal - len(self.index_to_id)
+                self._rebuild_locked(self.index_type)
+                logger.info(
+                    f"Migrated FAISS index {self.collection_name} to an id-mapped index, "
+                    f"dropping {removed} deleted vectors"
+                )
+            elif current != self.index_type and not (
+                current == "flat" and self.index_type in _TRAINED_INDEX_TYPES
+            ):
+                logger.info(f"Rebuilding FAISS index {self.collection_name} from {current} to {self.index_type}")
+                self._rebuild_locked(self.index_type)
+            elif not self._maybe_train_locked():
+                return
+            self._next_index_id = self._first_free_index_id(self._next_index_id)
+            self._save_locked()
+
+    def _maybe_train_locked(self) -> bool:
+        """Replace the flat index used before training with the configured IVF index once enough vectors arrived."""
+        if self.index_type not in _TRAINED_INDEX_TYPES or self._current_index_type() != "flat":
+            return False
+        if len(self.index_to_id) < self._min_training_vectors():
+            return False
+        logger.info(f"Training {self.index_type} index for {self.collection_name} on {len(self.index_to_id)} vectors")
+        self._rebuild_locked(self.index_type)
+        return True
+
+    def _index_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.faiss"
+
+    def _docstore_path(self, backend: Optional[str] = None) -> str:
+        extension = "db" if (backend or self.docstore_backend) == "sqlite" else "pkl"
+        return f"{self.path}/{self.collection_name}.{extension}"
+
+    def _log_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.log"
+
+    def _replay_log(self):
+        """Apply the mutations logged after the loaded snapshot, stopping at the first torn or corrupt record."""
+        log_path = self._log_path()
+        if self.index is None or not os.path.exists(log_path):
+            return
+
+        replayed = 0
+        # Index ids already present, so that inserts which reached the index snapshot are not added twice
+        self._replay_index_ids = set(self._stored_index_ids().tolist())
+        with open(log_path, "rb") as f:
+            while True:
+                header = f.read(_LOG_RECORD_HEADER.size)
+                if len(header) < _LOG_RECORD_HEADER.size:
+                    break
+                length, checksum = _LOG_RECORD_HEADER.unpack(header)
+                data = f.read(length)
+                if len(data) < length or zlib.crc32(data) != checksum:
+                    logger.warning(f"Ignoring a truncated record at the end of {log_path}")
+                    break
+                seq, op, args = pickle.loads(data)
+                if seq <= self._snapshot_seq:
+                    # Already part of the snapshot
+                    continue
+                try:
+                    self._apply(op, *args)
+                except Exception as e:
+                    logger.warning(f"Stopped replaying {log_path} at mutation {seq}: {e}")
+                    break
+                self._log_seq = seq
+                replayed += 1
+        del self._replay_index_ids
+
+        if replayed:
+            logger.info(f"Replayed {replayed} logged mutations from {log_path}")
+            # Fold the replayed mutations into a fresh snapshot, which also drops any torn record
+            self.flush()
+
+    def _apply(self, op: str, *args):
+        """Apply a logged mutation to the in-memory state."""
+        if op == "insert":
+            start, vectors_np, ids, payloads = args
+            index_ids = list(range(start, start + len(ids)))
+            if not self._is_positional():
+                if start not in self._replay_index_ids:
+                    self.index.add_with_ids(vectors_np, np.array(index_ids, dtype=np.int64))
+                    self._replay_index_ids.update(index_ids)
+            elif start + len(ids) <= self.index.ntotal:
+                # The vectors reached the index snapshot but the docstore snapshot predates them
+                pass
+            elif start == self.index.ntotal:
+                self.index.add(vectors_np)
+            else:
+                raise ValueError(f"Logged insert at position {start} does not follow the index ({self.index.ntotal})")
+            for index_id, vector_id, payload in zip(index_ids, ids, payloads):
+                self._map(vector_id, index_id, payload)
+            self._next_index_id = max(self._next_index_id, start + len(ids))
+        elif op == "delete":
+            index_to_delete, vector_id = args
+            self._unmap(vector_id, index_to_delete)
+        elif op == "delete_many":
+            for index_to_delete, vector_id in args[0]:
+                self._unmap(vector_id, index_to_delete)
+        elif op == "update_payload":
+            vector_id, payload = args
+            self._set_payload(vector_id, payload)
+
+    def _log(self, op: str, *args):
+        """
+        Append a mutation to the log, and snapshot once `flush_every_n` mutations or `flush_interval` seconds
+        have accumulated since the last snapshot.
+        """
+        if not self.path or self.index is None:
+            return
+
+        self._log_seq += 1
+        data = pickle.dumps((self._log_seq, op, args), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            if self._log_file is None:
+                os.makedirs(self.path, exist_ok=True)
+                self._log_file = open(self._log_path(), "ab")
+            self._log_file.write(_LOG_RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data)
+            # Hand the record to the OS so it survives a crash of this process
+            self._log_file.flush()
+        except Exception as e:
+            logger.warning(f"Failed to append to the FAISS mutation log: {e}")
+        if isinstance(self.docstore, SQLiteDocstore):
+            # Payload writes only become durable once the mutation that replays them is logged
+            self.docstore.commit()
+
+        self._pending_mutations += 1
+        if self._pending_mutations >= self.flush_every_n or (
+            self.flush_interval is not None and time.monotonic() - self._last_snapshot_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def _close_log(self):
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
 
     def _save(self):
-        """Save FAISS index and docstore to disk."""
+        """
+        Atomically snapshot the FAISS index and docstore to disk and truncate the mutation log.
+
+        Both files are written next to their destination and renamed over it, so a crash leaves either the
+        previous or the new snapshot. The docstore snapshot records the last mutation it includes, and
+        mutations logged after it are replayed on load.
+        """
         if not self.path or not self.index:
             return
 
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self):
         try:
+            # Tombstones are written with the index and recognized on load as the ids no memory maps to
             os.makedirs(self.path, exist_ok=True)
-            index_path = f"{self.path}/{self.collection_name}.faiss"
-            docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-            faiss.write_index(self.index, index_path)
-            with open(docstore_path, "wb") as f:
-                pickle.dump((self.docstore, self.index_to_id), f)
+            index_path = self._index_path()
+            docstore_path = self._docstore_path()
+
+            faiss.write_index(self.index, f"{index_path}.tmp")
+            if isinstance(self.docstore, SQLiteDocstore):
+                os.replace(f"{index_path}.tmp", index_path)
+                # The payloads are already in the database, which only needs to record the snapshot
+                self.docstore.set_meta("log_seq", self._log_seq)
+                self.docstore.set_meta("next_index_id", self._next_index_id)
+                self.docstore.commit()
+            else:
+                with open(f"{docstore_path}.tmp", "wb") as f:
+                    pickle.dump(
+                        (self.docstore, self.index_to_id, self._log_seq, self._next_index_id),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(f"{index_path}.tmp", index_path)
+                os.replace(f"{docstore_path}.tmp", docstore_path)
+
+            self._close_log()
+            if os.path.exists(self._log_path()):
+                os.remove(self._log_path())
+            self._snapshot_seq = self._log_seq
+            self._pending_mutations = 0
+            self._last_snapshot_at = time.monotonic()
         except Exception as e:
             logger.warning(f"Failed to save FAISS index: {e}")
 
+    def flush(self):
+        """Snapshot the index and docstore to disk now, folding in every logged mutation."""
+        self._save()
+
+    def close(self):
+        """Flush pending mutations to a snapshot and close the mutation log and docstore."""
+        self.flush()
+        self._close_log()
+        with self._lock:
+            self._close_docstore()
+
+    def _map(self, vector_id: str, index_id: int, payload: Dict):
+        if isinstance(self.docstore, SQLiteDocstore):
+            self.docstore.put(vector_id, index_id, payload)
+        else:
+            self.docstore[vector_id] = payload
+        self.index_to_id[index_id] = vector_id
+        self.id_to_index[vector_id] = index_id
+        self._index_payload(index_id, payload)
+
+    def _unmap(self, vector_id: str, index_id: Optional[int] = None):
+        """Drop a memory from the docstore and mappings and mark its vector as a tombstone."""
+        if index_id is None:
+            index_id = self.id_to_index.get(vector_id)
+        payload = self.docstore.pop(vector_id, None)
+        if index_id is not None:
+            self._index_payload(index_id, payload, remove=True)
+        if self.id_to_index.get(vector_id) == index_id:
+            self.id_to_index.pop(vector_id, None)
+        if index_id is not None and self.index_to_id.pop(index_id, None) is not None:
+            if not self._is_positional():
+                self._tombstones.add(index_id)
+                self._tombstone_selector = None
+
+    def _set_payload(self, vector_id: str, payload: Dict):
+        index_id = self.id_to_index.get(vector_id)
+        if index_id is not None:
+            self._index_payload(index_id, self.docstore.get(vector_id), remove=True)
+            self._index_payload(index_id, payload)
+        self.docstore[vector_id] = payload
+
+    def _index_payload(self, index_id: int, payload: Optional[Dict], remove: bool = False):
+        """Add or remove an index id in the payload index entries of its indexed payload values."""
+        if not payload:
+            return
+        for key in _INDEXED_PAYLOAD_KEYS:
+            value = payload.get(key)
+            if value is None or not isinstance(value, (str, int)):
+                continue
+            if remove:
+                index_ids = self._payload_index.get((key, value))
+                if index_ids is not None:
+                    index_ids.discard(index_id)
+                    if not index_ids:
+                        del self._payload_index[(key, value)]
+            else:
+                self._payload_index.setdefault((key, value), set()).add(index_id)
+
+    def _candidate_ids(self, filters: Optional[Dict]) -> Optional[set]:
+        """
+        Return the index ids of the memories matching `filters`, or None if no filter is on an indexed key.
+
+        Indexed keys with plain values narrow the candidates through the payload index, and every other filter,
+        including indexed keys with values the payload index cannot answer, is then checked on the candidates'
+        payloads only.
+        """
+        if not filters:
+            return None
+        candidates = None
+        narrowed = set()
+        for key in _INDEXED_PAYLOAD_KEYS:
+            value = filters.get(key)
+            if value is None:
+                continue
+            if isinstance(value, (str, int)):
+                matching = self._payload_index.get((key, value), set())
+            elif isinstance(value, list) and all(isinstance(item, (str, int)) for item in value):
+                matching = set().union(*(self._payload_index.get((key, item), set()) for item in value))
+            else:
+                continue
+            narrowed.add(key)
+            candidates = set(matching) if candidates is None else candidates & matching
+            if not candidates:
+                return set()
+        if candidates is None:
+            return None
+
+        if any(key not in narrowed for key in filters):
+            candidates = {
+                index_id
+                for index_id in candidates
+                if self._apply_filters(self.docstore.get(self.index_to_id.get(index_id)), filters)
+            }
+        return candidates
+
+    def _compact_locked(self):
+        """Remove every tombstoned vector from an index that supports removal, in a single pass."""
+        tombstones = np.fromiter(self._tombstones, dtype=np.int64, count=len(self._tombstones))
+        if isinstance(self.index, faiss.IndexIVF):
+            # Removal through the IVF direct map only accepts an explicit array of ids
+            self.index.remove_ids(faiss.IDSelectorArray(len(tombstones), faiss.swig_ptr(tombstones)))
+        else:
+            self.index.remove_ids(faiss.IDSelectorBatch(tombstones))
+        self._tombstones.clear()
+        self._tombstone_selector = None
+
+    def compact(self):
+        """Remove deleted vectors from the index now instead of waiting for `compaction_threshold` deletes."""
+        with self._lock:
+            if not self._tombstones or self._is_positional():
+                return
+            if self._current_index_type() != "hnsw":
+                self._compact_locked()
+                return
+            # HNSW graphs do not support removal, so the live vectors are moved to a new graph, built without
+            # holding the lock so that reads and writes go on meanwhile
+            index, next_index_id = self.index, self._next_index_id
+            ids, vectors = self._live_vectors()
+
+        rebuilt = self._new_index("hnsw")
+        if len(ids):
+            rebuilt.add_with_ids(vectors, ids)
+
+        with self._lock:
+            if self.index is not index:
+                # The index was replaced while the graph was built, e.g. by a change of index type
+                return
+            # Catch up with the writes made while the graph was built: index ids are never reused, so new
+            # vectors have ids from `next_index_id` on and deleted ones are no longer mapped
+            added = [index_id for index_id in range(next_index_id, self._next_index_id) if index_id in self.index_to_id]
+            if added:
+                rebuilt.add_with_ids(
+                    np.vstack([index.reconstruct(index_id) for index_id in added]), np.array(added, dtype=np.int64)
+                )
+            self.index = rebuilt
+            self._tombstones = set(ids.tolist()) - self.index_to_id.keys()
+            self._tombstone_selector = None
+
+    def _tombstones_excluded(self):
+        """Return an id selector leaving out the tombstones, cached until they change."""
+        if self._tombstone_selector is None:
+            tombstones = faiss.IDSelectorBatch(
+                np.fromiter(self._tombstones, dtype=np.int64, count=len(self._tombstones))
+            )
+            # The negation only points to the batch selector, which has to stay alive with it
+            self._tombstone_selector = (faiss.IDSelectorNot(tombstones), tombstones)
+        return self._tombstone_selector[0]
+
+    def _maybe_compact_in_background(self):
+        if len(self._tombstones) < self.compaction_threshold:
+            return
+        if (
+            self._current_index_type() == "hnsw"
+            and len(self._tombstones) < _HNSW_REBUILD_MIN_TOMBSTONE_RATIO * self.index.ntotal
+        ):
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, name="mem0-faiss-compaction", daemon=True)
+        self._compaction_thread.start()
+
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
         Parse the output data.
@@ -131,7 +850,9 @@ class FAISS(VectorStoreBase):
             limit = len(ids)
 
         results = []
-        for i in range(min(len(ids), limit)):
+        for i in range(len(ids)):
+            if len(results) >= limit:
+                break
             if ids[i] == -1:  # FAISS returns -1 for empty results
                 continue
 
@@ -144,7 +865,7 @@ class FAISS(VectorStoreBase):
             if payload is None:
                 continue
 
-            payload_copy = payload.copy()
+            payload_copy = self._payload_copy(payload)
 
             score = float(scores[i])
             entry = OutputData(
@@ -170,18 +891,36 @@ class FAISS(VectorStoreBase):
         """
         distance_strategy = distance or self.distance_strategy
 
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
-
-        self.collection_name = name
+        with self._lock:
+            # Trained index types start flat until enough vectors have arrived
+            index_type = "flat" if self.index_type in _TRAINED_INDEX_TYPES else self.index_type
+            self.index = self._new_index(index_type, distance=distance_strategy)
+
+            self.collection_name = name
+            if self.docstore_backend == "sqlite":
+                if not isinstance(self.docstore, SQLiteDocstore):
+                    os.makedirs(self.path, exist_ok=True)
+                    self.docstore = SQLiteDocstore(self._docstore_path())
+                self.docstore.clear()
+            else:
+                self.docstore = {}
+            self.index_to_id = {}
+            self.id_to_index = {}
+            self._payload_index = {}
+            self._tombstones = set()
+            self._tombstone_selector = None
+            self._next_index_id = 0
 
-        self._save()
+            self._save()
 
         return self
 
+    def _new_flat_index(self, distance_strategy: str):
+        # Create index based on distance strategy
+        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
+            return faiss.IndexFlatIP(self.embedding_model_dims)
+        return faiss.IndexFlatL2(self.embedding_model_dims)
+
     def insert(
         self,
         vectors: List[list],
@@ -213,19 +952,42 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
 
-        self.index.add(vectors_np)
+        payloads = [payload.copy() for payload in payloads]
+        with self._lock:
+            self._insert_locked(vectors_np, list(ids), payloads)
+
+        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+
+    def _insert_locked(self, vectors_np: np.ndarray, ids: List[str], payloads: List[Dict]):
+        # Re-inserting a memory replaces its previous vector
+        for vector_id in ids:
+            if vector_id in self.id_to_index:
+                self._delete_locked(vector_id)
+
+        starting_idx = self._next_index_id
+        self._next_index_id += len(ids)
+        self.index.add_with_ids(vectors_np, np.arange(starting_idx, starting_idx + len(ids), dtype=np.int64))
 
-        starting_idx = len(self.index_to_id)
         for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
-            self.docstore[vector_id] = payload.copy()
-            self.index_to_id[starting_idx + i] = vector_id
+            self._map(vector_id, starting_idx + i, payload)
 
-        self._save()
+        self._log("insert", starting_idx, vectors_np, ids, payloads)
+        self._maybe_train_locked()
 
-        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+    def _delete_locked(self, vector_id: str):
+        index_to_delete = self.id_to_index[vector_id]
+        self._unmap(vector_id, index_to_delete)
+        self._log("delete", index_to_delete, vector_id)
+        self._maybe_compact_in_background()
 
     def search(
-        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+        self,
+        query: str,
+        vectors: List[list],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None,
     ) -> List[OutputData]:
         """
         Search for similar vectors.
@@ -235,6 +997,10 @@ class FAISS(VectorStoreBase):
             vectors (List[list]): List of vectors to search.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+            ef_search (int, optional): HNSW search depth for this call; higher trades speed for recall.
+                Defaults to the configured `ef_search`.
+            nprobe (int, optional): Number of IVF clusters to visit for this call; higher trades speed for recall.
+                Defaults to the configured `nprobe`.
 
         Returns:
             List[OutputData]: Search results.
@@ -250,10 +1016,25 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(query_vectors)
 
-        fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        with self._lock:
+            candidates = self._candidate_ids(filters)
+            if candidates is not None:
+                scores, indices = self._scoped_search(query_vectors, candidates, limit, ef_search, nprobe)
+            else:
+                fetch_k = limit * 2 if filters else limit
+                if len(self._tombstones) <= _MAX_OVERFETCHED_TOMBSTONES:
+                    # Tombstoned vectors can take up to that many of the nearest slots
+                    fetch_k += len(self._tombstones)
+                    params = self._search_params(ef_search, nprobe)
+                else:
+                    params = self._search_params(ef_search, nprobe, self._tombstones_excluded())
+                scores, indices = self.index.search(query_vectors, fetch_k, params=params)
 
-        results = self._parse_output(scores[0], indices[0], limit)
+        if candidates is not None:
+            # Every candidate already matches the filters
+            return self._parse_output(scores, indices, limit)
+
+        results = self._parse_output(scores[0], indices[0], None if filters else limit)
 
         if filters:
             filtered_results = []
@@ -266,6 +1047,64 @@ class FAISS(VectorStoreBase):
 
         return results
 
+    def _scoped_search(self, query_vectors: np.ndarray, candidates: set, limit: int, ef_search=None, nprobe=None):
+        """
+        Search the first query among the index ids in `candidates` only, returning its scores and ids.
+
+        Small scopes are scored directly. Scopes covering most of the index are searched by over-fetching,
+        and the others through an id selector, which the index applies while it searches.
+        """
+        if not candidates:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+        candidate_ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        if len(candidate_ids) <= _EXACT_SEARCH_MAX_CANDIDATES:
+            return self._exact_search(query_vectors[0], candidate_ids, limit)
+
+        expected = min(limit, len(candidate_ids))
+        # Inverse of the share of the index in scope, i.e. how many neighbors to visit per neighbor in scope
+        spread = len(self.index_to_id) / len(candidate_ids)
+        if spread <= 1 / _OVERFETCH_MIN_FRACTION and len(self._tombstones) <= _MAX_OVERFETCHED_TOMBSTONES:
+            fetch_k = math.ceil(limit * spread) * 2 + len(self._tombstones)
+            scores, indices = self.index.search(query_vectors, fetch_k, params=self._search_params(ef_search, nprobe))
+            in_scope = np.isin(indices[0], candidate_ids)
+            if in_scope.sum() >= expected:
+                return scores[0][in_scope], indices[0][in_scope]
+
+        selector = faiss.IDSelectorBatch(candidate_ids)
+        if self._current_index_type() == "hnsw":
+            # The graph walk also visits out-of-scope nodes, so its beam has to widen with the spread
+            ef_search = max(ef_search or self.ef_search, math.ceil(limit * spread))
+        scores, indices = self.index.search(
+            query_vectors, limit, params=self._search_params(ef_search, nprobe, selector)
+        )
+        found = indices[0] != -1
+        if found.sum() < expected:
+            # Approximate indexes can miss in-scope neighbors, e.g. IVF clusters beyond nprobe
+            return self._exact_search(query_vectors[0], candidate_ids, limit)
+        return scores[0][found], indices[0][found]
+
+    def _exact_search(self, query_vector: np.ndarray, candidate_ids: np.ndarray, limit: int):
+        """Score every candidate against the query and return the `limit` best scores and ids."""
+        vectors = self.index.reconstruct_batch(candidate_ids)
+        if self.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            scores = vectors @ query_vector
+            order = np.argsort(-scores, kind="stable")[:limit]
+        else:
+            scores = ((vectors - query_vector) ** 2).sum(axis=1)
+            order = np.argsort(scores, kind="stable")[:limit]
+        return scores[order], candidate_ids[order]
+
+    def _search_params(self, ef_search: Optional[int] = None, nprobe: Optional[int] = None, selector=None):
+        """Return the search parameters of the current index type, or None for unfiltered flat searches."""
+        index_type = self._current_index_type()
+        if index_type == "hnsw":
+            return faiss.SearchParametersHNSW(efSearch=ef_search or self.ef_search, sel=selector)
+        if index_type in _TRAINED_INDEX_TYPES:
+            return faiss.SearchParametersIVF(nprobe=nprobe or self.nprobe, sel=selector)
+        if selector is not None:
+            return faiss.SearchParameters(sel=selector)
+        return None
+
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
         Apply filters to a payload.
@@ -302,22 +1141,48 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        index_to_delete = None
-        for idx, vid in self.index_to_id.items():
-            if vid == vector_id:
-                index_to_delete = idx
-                break
-
-        if index_to_delete is not None:
-            self.docstore.pop(vector_id, None)
-            self.index_to_id.pop(index_to_delete, None)
-
-            self._save()
+        with self._lock:
+            found = vector_id in self.id_to_index
+            if found:
+                self._delete_locked(vector_id)
 
+        if found:
             logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
         else:
             logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
 
+    def delete_by_filter(self, filters: Dict) -> int:
+        """
+        Delete all vectors matching the filters as a single logged mutation.
+
+        Args:
+            filters (Dict): Filters selecting the vectors to delete.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        self._require_filters(filters)
+        if self.index is None:
+            return 0
+
+        with self._lock:
+            candidates = self._candidate_ids(filters)
+            if candidates is None:
+                vector_ids = [
+                    vector_id for vector_id, payload in self.docstore.items() if self._apply_filters(payload, filters)
+                ]
+            else:
+                vector_ids = [self.index_to_id[index_id] for index_id in candidates]
+            deleted = [(self.id_to_index[vector_id], vector_id) for vector_id in vector_ids]
+            for index_to_delete, vector_id in deleted:
+                self._unmap(vector_id, index_to_delete)
+            if deleted:
+                self._log("delete_many", deleted)
+                self._maybe_compact_in_background()
+
+        logger.info(f"Deleted {len(deleted)} vectors from collection {self.collection_name}")
+        return len(deleted)
+
     def update(
         self,
         vector_id: str,
@@ -335,20 +1200,21 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
-            raise ValueError(f"Vector {vector_id} not found")
+        with self._lock:
+            if vector_id not in self.docstore:
+                raise ValueError(f"Vector {vector_id} not found")
 
-        current_payload = self.docstore[vector_id].copy()
+            current_payload = self.docstore[vector_id] if payload is None else payload.copy()
 
-        if payload is not None:
-            self.docstore[vector_id] = payload.copy()
-            current_payload = self.docstore[vector_id].copy()
-
-        if vector is not None:
-            self.delete(vector_id)
-            self.insert([vector], [current_payload], [vector_id])
-        else:
-            self._save()
+            if vector is not None:
+                vectors_np = np.array([vector], dtype=np.float32)
+                if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                    faiss.normalize_L2(vectors_np)
+                # The new vector gets a new index id and the old one becomes a tombstone
+                self._insert_locked(vectors_np, [vector_id], [current_payload])
+            elif payload is not None:
+                self._set_payload(vector_id, current_payload)
+                self._log("update_payload", vector_id, current_payload)
 
         logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
 
@@ -368,7 +1234,7 @@ class FAISS(VectorStoreBase):
         if vector_id not in self.docstore:
             return None
 
-        payload = self.docstore[vector_id].copy()
+        payload = self._payload_copy(self.docstore[vector_id])
 
         return OutputData(
             id=vector_id,
@@ -400,23 +1266,30 @@ class FAISS(VectorStoreBase):
         """
         Delete a collection.
         """
+        self._close_log()
+        with self._lock:
+            self._close_docstore()
         if self.path:
             try:
-                index_path = f"{self.path}/{self.collection_name}.faiss"
-                docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-                if os.path.exists(index_path):
-                    os.remove(index_path)
-                if os.path.exists(docstore_path):
-                    os.remove(docstore_path)
+                file_paths = [self._index_path(), self._docstore_path(), self._log_path()]
+                if self.docstore_backend == "sqlite":
+                    file_paths += [f"{self._docstore_path()}-wal", f"{self._docstore_path()}-shm"]
+                for file_path in file_paths:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
 
                 logger.info(f"Deleted collection {self.collection_name}")
             except Exception as e:
                 logger.warning(f"Failed to delete collection: {e}")
 
-        self.index = None
-        self.docstore = {}
-        self.index_to_id = {}
+        with self._lock:
+            self.index = None
+            self.docstore = {}
+            self.index_to_id = {}
+            self.id_to_index = {}
+            self._payload_index = {}
+            self._tombstones = set()
+            self._tombstone_selector = None
 
     def col_info(self) -> Dict:
         """
@@ -430,9 +1303,10 @@ class FAISS(VectorStoreBase):
 
         return {
             "name": self.collection_name,
-            "count": self.index.ntotal,
+            "count": self.index.ntotal - len(self._tombstones),
             "dimension": self.index.d,
             "distance": self.distance_strategy,
+            "index_type": self._current_index_type(),
         }
 
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
@@ -452,26 +1326,71 @@ class FAISS(VectorStoreBase):
         results = []
         count = 0
 
-        for vector_id, payload in self.docstore.items():
-            if filters and not self._apply_filters(payload, filters):
-                continue
-
-            payload_copy = payload.copy()
-
-            results.append(
-                OutputData(
-                    id=vector_id,
-                    score=None,
-                    payload=payload_copy,
+        with self._lock:
+            candidates = self._candidate_ids(filters)
+            if candidates is None:
+                # Payloads are read as the loop consumes them, so the walk stops at `limit`
+                entries = self.docstore.items()
+            else:
+                # Index ids grow with insertion, like the docstore order
+                vector_ids = [self.index_to_id[index_id] for index_id in sorted(candidates)]
+                entries = ((vector_id, self.docstore[vector_id]) for vector_id in vector_ids)
+
+            for vector_id, payload in entries:
+                if candidates is None and filters and not self._apply_filters(payload, filters):
+                    continue
+
+                payload_copy = self._payload_copy(payload)
+
+                results.append(
+                    OutputData(
+                        id=vector_id,
+                        score=None,
+                        payload=payload_copy,
+                    )
                 )
-            )
 
-            count += 1
-            if count >= limit:
-                break
+                count += 1
+                if count >= limit:
+                    break
 
         return [results]
 
+    def iter_list(self, filters: Optional[Dict] = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters, holding the lock for one page at a time.
+
+        The matching ids are taken once up front, so writers only wait for the current page, and memories
+        deleted during the iteration are skipped.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of payloads read per lock acquisition. Defaults to 100.
+
+        Yields:
+            OutputData: The matching vectors.
+        """
+        if self.index is None:
+            return
+
+        with self._lock:
+            candidates = self._candidate_ids(filters)
+            if candidates is None:
+                vector_ids = list(self.docstore)
+            else:
+                vector_ids = [self.index_to_id[index_id] for index_id in sorted(candidates)]
+        check_filters = candidates is None and bool(filters)
+
+        for start in range(0, len(vector_ids), page_size):
+            page = []
+            with self._lock:
+                for vector_id in vector_ids[start : start + page_size]:
+                    payload = self.docstore.get(vector_id)
+                    if payload is None or (check_filters and not self._apply_filters(payload, filters)):
+                        continue
+                    page.append(OutputData(id=vector_id, score=None, payload=self._payload_copy(payload)))
+            yield from page
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
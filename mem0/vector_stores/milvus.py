@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Dict, Optional
 
@@ -172,6 +173,20 @@ class MilvusDB(VectorStoreBase):
         """
         self.client.delete(collection_name=self.collection_name, ids=vector_id)
 
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete all vectors matching the filters with a single filter expression.
+
+        Args:
+            filters (dict): Filters selecting the vectors to delete.
+
+        Returns:
+            int: Number of deleted vectors, when the server reports it.
+        """
+        self._require_filters(filters)
+        result = self.client.delete(collection_name=self.collection_name, filter=self._create_filter(filters))
+        return result.get("delete_count") if isinstance(result, dict) else None
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector and its payload.
@@ -243,6 +258,38 @@ class MilvusDB(VectorStoreBase):
             memories.append(obj)
         return [memories]
 
+    def iter_list(self, filters: dict = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters, `page_size` vectors per query.
+
+        Pages are keyed on the primary key, as pymilvus' `QueryIterator` does: each query asks for the ids
+        after the last one returned, so the cost of a page does not grow with its position.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of vectors fetched per query. Defaults to 100.
+
+        Yields:
+            OutputData: The matching vectors.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        last_id = None
+        while True:
+            conditions = [f"({query_filter})"] if query_filter else []
+            if last_id is not None:
+                conditions.append(f"(id > {json.dumps(last_id)})")
+            result = self.client.query(
+                collection_name=self.collection_name,
+                filter=" and ".join(conditions),
+                limit=page_size,
+                output_fields=["id", "metadata"],
+            )
+            for data in result:
+                yield OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
+            if len(result) < page_size:
+                return
+            last_id = max(data.get("id") for data in result)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
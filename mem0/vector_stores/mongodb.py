@@ -300,6 +300,25 @@ class MongoDB(VectorStoreBase):
             logger.error(f"Error listing documents: {e}")
             return []
 
+    def iter_list(self, filters: Optional[Dict] = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters through a server-side cursor.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list.
+            page_size (int, optional): Number of documents the cursor fetches per batch. Defaults to 100.
+
+        Yields:
+            OutputData: The matching vectors, without their embeddings.
+        """
+        query = {"$and": [{"payload." + key: value} for key, value in filters.items()]} if filters else {}
+        cursor = self.collection.find(query, {"payload": 1}).batch_size(page_size)
+        try:
+            for doc in cursor:
+                yield OutputData(id=str(doc["_id"]), score=None, payload=doc.get("payload"))
+        finally:
+            cursor.close()
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from contextlib import contextmanager
@@ -8,7 +9,7 @@ from pydantic import BaseModel
 # Try to import psycopg (psycopg3) first, then fall back to psycopg2
 try:
     from psycopg.types.json import Json
-    from psycopg_pool import ConnectionPool
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
     PSYCOPG_VERSION = 3
     logger = logging.getLogger(__name__)
     logger.info("Using psycopg (psycopg3) with ConnectionPool for PostgreSQL connections")
@@ -29,6 +30,9 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Session identifiers copied out of the payload into generated columns, so that filters on them use B-tree indexes
+_SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -53,6 +57,8 @@ class PGVector(VectorStoreBase):
         sslmode=None,
         connection_string=None,
         connection_pool=None,
+        hnsw_iterative_scan="relaxed_order",
+        migrate_scope_columns=False,
     ):
         """
         Initialize the PGVector database.
@@ -72,12 +78,24 @@ class PGVector(VectorStoreBase):
             sslmode (str, optional): SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')
             connection_string (str, optional): PostgreSQL connection string (overrides individual connection parameters)
             connection_pool (Any, optional): psycopg2 connection pool object (overrides connection string and individual parameters)
+            hnsw_iterative_scan (str, optional): Iterative HNSW index scan mode used by filtered searches on
+                pgvector 0.8+, "relaxed_order" or "strict_order". None disables iterative scans.
+            migrate_scope_columns (bool, optional): Run `migrate` on startup when the collection already exists.
+                Defaults to False.
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        self.hnsw_iterative_scan = hnsw_iterative_scan
         self.connection_pool = None
+        # Scope columns present in the table, filters on other keys go through the JSONB payload
+        self._scope_columns = set()
+        # Async pool used by ainsert/asearch, opened on first use. Only available with psycopg3 when
+        # the store manages its own connections; otherwise the async methods fall back to worker threads.
+        self._async_pool_kwargs = None
+        self._async_pool = None
+        self._async_pool_lock = None
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
         if connection_pool is not None:
@@ -102,6 +120,7 @@ class PGVector(VectorStoreBase):
             if PSYCOPG_VERSION == 3:
                 # psycopg3 ConnectionPool
                 self.connection_pool = ConnectionPool(conninfo=connection_string, min_size=minconn, max_size=maxconn, open=True)
+                self._async_pool_kwargs = {"conninfo": connection_string, "min_size": minconn, "max_size": maxconn}
             else:
                 # psycopg2 ThreadedConnectionPool
                 self.connection_pool = ConnectionPool(minconn=minconn, maxconn=maxconn, dsn=connection_string)
@@ -109,6 +128,16 @@ class PGVector(VectorStoreBase):
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col()
+        elif migrate_scope_columns:
+            self.migrate()
+        else:
+            self._scope_columns = self._existing_scope_columns()
+            if self._scope_columns != set(_SCOPE_COLUMNS):
+                logger.info(
+                    f"Collection {self.collection_name} has no indexed scope columns, scope filters read the JSONB "
+                    "payload. Call migrate() or set migrate_scope_columns to add them."
+                )
+        self._iterative_scan = self._iterative_scan_mode()
 
     @contextmanager
     def _get_cursor(self, commit: bool = False):
@@ -149,6 +178,10 @@ class PGVector(VectorStoreBase):
         Create a new collection (table in PostgreSQL).
         Will also initialize vector search index if specified.
         """
+        scope_columns = ",".join(
+            f"\n                    {column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED"
+            for column in _SCOPE_COLUMNS
+        )
         with self._get_cursor(commit=True) as cur:
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
             cur.execute(
@@ -156,10 +189,11 @@ class PGVector(VectorStoreBase):
                 CREATE TABLE IF NOT EXISTS {self.collection_name} (
                     id UUID PRIMARY KEY,
                     vector vector({self.embedding_model_dims}),
-                    payload JSONB
+                    payload JSONB,{scope_columns}
                 );
                 """
             )
+            self._create_scope_indexes(cur)
             if self.use_diskann and self.embedding_model_dims < 2000:
                 cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
                 if cur.fetchone():
@@ -179,6 +213,81 @@ class PGVector(VectorStoreBase):
                     USING hnsw (vector vector_cosine_ops)
                     """
                 )
+        self._scope_columns = set(_SCOPE_COLUMNS)
+
+    def _create_scope_indexes(self, cur) -> None:
+        for column in _SCOPE_COLUMNS:
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.collection_name}_{column}_idx ON {self.collection_name} ({column})"
+            )
+
+    def _existing_scope_columns(self) -> set:
+        """Return the scope columns the table already has."""
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s
+                """,
+                (self.collection_name,),
+            )
+            return {row[0] for row in cur.fetchall()} & set(_SCOPE_COLUMNS)
+
+    def migrate(self) -> None:
+        """
+        Add the indexed scope columns to a collection created before they existed.
+
+        Adding a stored generated column rewrites the whole table under an ACCESS EXCLUSIVE lock, which
+        blocks reads and writes until it finishes, so run it during a maintenance window. Scope filters keep
+        reading the JSONB payload until the migration has committed.
+        """
+        existing = self._existing_scope_columns()
+        missing = [column for column in _SCOPE_COLUMNS if column not in existing]
+        if missing:
+            logger.warning(
+                f"Adding scope columns {missing} to collection {self.collection_name}. This rewrites the table "
+                "and locks it until done."
+            )
+            with self._get_cursor(commit=True) as cur:
+                for column in missing:
+                    cur.execute(
+                        f"ALTER TABLE {self.collection_name} ADD COLUMN IF NOT EXISTS {column} "
+                        f"TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED"
+                    )
+                self._create_scope_indexes(cur)
+        self._scope_columns = set(_SCOPE_COLUMNS)
+
+    def _iterative_scan_mode(self) -> Optional[str]:
+        """Return the iterative scan mode to use for filtered searches, or None if the HNSW index cannot do it."""
+        uses_diskann = self.use_diskann and self.embedding_model_dims < 2000
+        if not self.hnsw_iterative_scan or not self.use_hnsw or uses_diskann:
+            return None
+        try:
+            with self._get_cursor() as cur:
+                cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+                row = cur.fetchone()
+            version = tuple(int(part) for part in row[0].split(".")[:2])
+        except Exception as e:
+            logger.debug(f"Failed to read the pgvector version: {e}")
+            return None
+        # Iterative index scans were added in pgvector 0.8.0
+        return self.hnsw_iterative_scan if len(version) == 2 and version >= (0, 8) else None
+
+    def _build_filter_clause(self, filters):
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                if k in self._scope_columns:
+                    filter_conditions.append(f"{k} = %s")
+                    filter_params.append(str(v))
+                else:
+                    filter_conditions.append("payload->>%s = %s")
+                    filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
 
     def insert(self, vectors: list[list[float]], payloads=None, ids=None) -> None:
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
@@ -218,29 +327,77 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
+        with self._get_cursor() as cur:
+            if filters and self._iterative_scan:
+                cur.execute(self._iterative_scan_statement())
+            cur.execute(*self._build_search_query(vectors, limit, filters))
+            results = cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+    def _iterative_scan_statement(self) -> str:
+        # Lets the HNSW scan keep going until enough rows pass the filters, for this transaction only
+        return f"SET LOCAL hnsw.iterative_scan = {self._iterative_scan}"
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+    def _build_search_query(self, vectors, limit, filters):
+        filter_clause, filter_params = self._build_filter_clause(filters)
 
-        with self._get_cursor() as cur:
-            cur.execute(
-                f"""
+        query = f"""
                 SELECT id, vector <=> %s::vector AS distance, payload
                 FROM {self.collection_name}
                 {filter_clause}
                 ORDER BY distance
                 LIMIT %s
-                """,
-                (vectors, *filter_params, limit),
-            )
+                """
+        if filter_clause and self._iterative_scan == "relaxed_order":
+            # Relaxed iterative scans may return rows slightly out of order
+            query = f"WITH results AS MATERIALIZED ({query}) SELECT * FROM results ORDER BY distance"
+        return query, (vectors, *filter_params, limit)
+
+    async def _get_async_pool(self):
+        if self._async_pool is None:
+            if self._async_pool_lock is None:
+                self._async_pool_lock = asyncio.Lock()
+            async with self._async_pool_lock:
+                if self._async_pool is None:
+                    pool = AsyncConnectionPool(**self._async_pool_kwargs, open=False)
+                    await pool.open()
+                    self._async_pool = pool
+        return self._async_pool
+
+    async def ainsert(self, vectors: list[list[float]], payloads=None, ids=None) -> None:
+        """Asynchronously insert vectors using the async connection pool when available."""
+        if self._async_pool_kwargs is None:
+            return await super().ainsert(vectors, payloads, ids)
 
-            results = cur.fetchall()
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        json_payloads = [json.dumps(payload) for payload in payloads]
+        data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(
+                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                    data,
+                )
+
+    async def asearch(
+        self,
+        query: str,
+        vectors: list[float],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+    ) -> List[OutputData]:
+        """Asynchronously search for similar vectors using the async connection pool when available."""
+        if self._async_pool_kwargs is None:
+            return await super().asearch(query, vectors, limit, filters)
+
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                if filters and self._iterative_scan:
+                    await cur.execute(self._iterative_scan_statement())
+                await cur.execute(*self._build_search_query(vectors, limit, filters))
+                results = await cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
     def delete(self, vector_id: str) -> None:
@@ -253,6 +410,22 @@ class PGVector(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
 
+    def delete_by_filter(self, filters: dict) -> int:
+        """
+        Delete all vectors matching the filters in a single statement.
+
+        Args:
+            filters (dict): Filters selecting the vectors to delete.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        self._require_filters(filters)
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"DELETE FROM {self.collection_name} {filter_clause}", tuple(filter_params))
+            return cur.rowcount
+
     def update(
         self,
         vector_id: str,
@@ -362,15 +535,7 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._build_filter_clause(filters)
 
         query = f"""
             SELECT id, vector, payload
@@ -384,6 +549,39 @@ class PGVector(VectorStoreBase):
             results = cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def iter_list(self, filters: Optional[dict] = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters with keyset pagination on the primary key.
+
+        Every page is a separate query resuming after the last id of the previous one, so no cursor or
+        transaction stays open between pages.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list.
+            page_size (int, optional): Number of rows fetched per query. Defaults to 100.
+
+        Yields:
+            OutputData: The matching vectors, without their embeddings.
+        """
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        keyset_clause = f"{filter_clause} AND id > %s" if filter_clause else "WHERE id > %s"
+        first_page_query = f"SELECT id, payload FROM {self.collection_name} {filter_clause} ORDER BY id LIMIT %s"
+        next_page_query = f"SELECT id, payload FROM {self.collection_name} {keyset_clause} ORDER BY id LIMIT %s"
+
+        last_id = None
+        while True:
+            with self._get_cursor() as cur:
+                if last_id is None:
+                    cur.execute(first_page_query, (*filter_params, page_size))
+                else:
+                    cur.execute(next_page_query, (*filter_params, last_id, page_size))
+                rows = cur.fetchall()
+            for row in rows:
+                yield OutputData(id=str(row[0]), score=None, payload=row[1])
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
     def __del__(self) -> None:
         """
         Close the database connection pool when the object is deleted.
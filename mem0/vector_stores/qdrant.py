@@ -2,11 +2,12 @@ import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
     MatchValue,
     PointIdsList,
     PointStruct,
@@ -46,6 +47,10 @@ class Qdrant(VectorStoreBase):
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
         """
+        # Connection parameters for the async client. It is only used for remote servers we connect to
+        # ourselves: a user-supplied client can't be mirrored and local storage allows a single client.
+        self._async_client_params = None
+        self._async_client = None
         if client:
             self.client = client
             self.is_local = False
@@ -67,6 +72,7 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                self._async_client_params = params
 
             self.client = QdrantClient(**params)
 
@@ -181,6 +187,61 @@ class Qdrant(VectorStoreBase):
         )
         return hits.points
 
+    @property
+    def async_client(self):
+        """Async client for remote servers, created on first use. None when the store can't use one."""
+        if self._async_client is None and self._async_client_params is not None:
+            self._async_client = AsyncQdrantClient(**self._async_client_params)
+        return self._async_client
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Asynchronously insert vectors into a collection.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if self.async_client is None:
+            return await super().ainsert(vectors, payloads, ids)
+
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        points = [
+            PointStruct(
+                id=idx if ids is None else ids[idx],
+                vector=vector,
+                payload=payloads[idx] if payloads else {},
+            )
+            for idx, vector in enumerate(vectors)
+        ]
+        await self.async_client.upsert(collection_name=self.collection_name, points=points)
+
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Asynchronously search for similar vectors.
+
+        Args:
+            query (str): Query.
+            vectors (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        if self.async_client is None:
+            return await super().asearch(query, vectors, limit, filters)
+
+        query_filter = self._create_filter(filters) if filters else None
+        hits = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            limit=limit,
+        )
+        return hits.points
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -195,6 +256,19 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete all vectors matching the filters in a single request.
+
+        Args:
+            filters (dict): Filters selecting the vectors to delete.
+        """
+        self._require_filters(filters)
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(filter=self._create_filter(filters)),
+        )
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
@@ -263,6 +337,32 @@ class Qdrant(VectorStoreBase):
         )
         return result
 
+    def iter_list(self, filters: dict = None, page_size: int = 100):
+        """
+        Iterate over all vectors matching the filters, following the scroll offsets page by page.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of vectors fetched per scroll request. Defaults to 100.
+
+        Yields:
+            Record: The matching vectors, with their payloads.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=query_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            yield from points
+            if offset is None:
+                return
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
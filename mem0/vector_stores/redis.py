@@ -7,9 +7,10 @@ import numpy as np
 import pytz
 import redis
 from redis.commands.search.query import Query
-from redisvl.index import SearchIndex
+from redisvl.index import AsyncSearchIndex, SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.query.filter import Tag
+from redisvl.redis.utils import convert_bytes
 
 from mem0.memory.utils import extract_json
 from mem0.vector_stores.base import VectorStoreBase
@@ -51,6 +52,7 @@ class RedisDB(VectorStoreBase):
         redis_url: str,
         collection_name: str,
         embedding_model_dims: int,
+        batch_size: int = 500,
     ):
         """
         Initialize the Redis vector store.
@@ -59,8 +61,10 @@ class RedisDB(VectorStoreBase):
             redis_url (str): Redis URL.
             collection_name (str): Collection name.
             embedding_model_dims (int): Embedding model dimensions.
+            batch_size (int): Commands sent per pipeline round trip by bulk writes and get_many.
         """
         self.embedding_model_dims = embedding_model_dims
+        self.batch_size = batch_size
         index_schema = {
             "name": collection_name,
             "prefix": f"mem0:{collection_name}",
@@ -71,7 +75,9 @@ class RedisDB(VectorStoreBase):
 
         self.schema = {"index": index_schema, "fields": fields}
 
+        self.redis_url = redis_url
         self.client = redis.Redis.from_url(redis_url)
+        self._async_index = None
         self.index = SearchIndex.from_dict(self.schema)
         self.index.set_client(self.client)
         self.index.create(overwrite=True)
@@ -119,7 +125,14 @@ class RedisDB(VectorStoreBase):
 
         return index
 
-    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+    @property
+    def async_index(self) -> AsyncSearchIndex:
+        """Async index used by ainsert/asearch, connected on first use."""
+        if self._async_index is None:
+            self._async_index = AsyncSearchIndex.from_dict(self.schema, redis_url=self.redis_url)
+        return self._async_index
+
+    def _build_entries(self, vectors: list, payloads: list, ids: list) -> list:
         data = []
         for vector, payload, id in zip(vectors, payloads, ids):
             # Start with required fields
@@ -140,13 +153,34 @@ class RedisDB(VectorStoreBase):
             entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
 
             data.append(entry)
-        self.index.load(data, id_field="memory_id")
+        return data
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        self.index.load(self._build_entries(vectors, payloads, ids), id_field="memory_id", batch_size=self.batch_size)
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        await self.async_index.load(
+            self._build_entries(vectors, payloads, ids), id_field="memory_id", batch_size=self.batch_size
+        )
+
+    def _pipelined(self, items: list, queue) -> list:
+        """Queue commands for each item on non-transactional pipelines of `batch_size` items and return the replies."""
+        replies = []
+        for start in range(0, len(items), self.batch_size):
+            pipe = self.client.pipeline(transaction=False)
+            for item in items[start : start + self.batch_size]:
+                queue(pipe, item)
+            replies.extend(pipe.execute())
+        return replies
+
+    def _key(self, vector_id) -> str:
+        return f"{self.schema['index']['prefix']}:{vector_id}"
+
+    def _build_query(self, vectors: list, limit: int, filters: dict) -> VectorQuery:
         conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
         filter = reduce(lambda x, y: x & y, conditions)
 
-        v = VectorQuery(
+        return VectorQuery(
             vector=np.array(vectors, dtype=np.float32).tobytes(),
             vector_field_name="embedding",
             return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
@@ -154,8 +188,7 @@ class RedisDB(VectorStoreBase):
             num_results=limit,
         )
 
-        results = self.index.query(v)
-
+    def _to_results(self, results) -> list:
         return [
             MemoryResult(
                 id=result["memory_id"],
@@ -182,10 +215,40 @@ class RedisDB(VectorStoreBase):
             for result in results
         ]
 
+    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+        return self._to_results(self.index.query(self._build_query(vectors, limit, filters)))
+
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+        return self._to_results(await self.async_index.query(self._build_query(vectors, limit, filters)))
+
     def delete(self, vector_id):
-        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
+        self.index.drop_keys(self._key(vector_id))
 
-    def update(self, vector_id=None, vector=None, payload=None):
+    def delete_many(self, vector_ids: list) -> int:
+        """Delete vectors by ID, `batch_size` per round trip, and return how many existed."""
+        return sum(self._pipelined(list(vector_ids), lambda pipe, vector_id: pipe.delete(self._key(vector_id))))
+
+    def delete_by_filter(self, filters: dict) -> int:
+        """
+        Delete all vectors matching the filters and return how many were deleted.
+
+        Each round trip searches for the keys of up to `batch_size` matching hashes, without their content,
+        and deletes them on a pipeline, until no hash matches.
+        """
+        self._require_filters(filters)
+        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
+        query = Query(str(reduce(lambda x, y: x & y, conditions))).no_content().paging(0, self.batch_size)
+
+        deleted = 0
+        while True:
+            keys = [doc.id for doc in self.index.search(query).docs]
+            # Deleted hashes leave the index at once, so every search starts again from the first page
+            removed = sum(self._pipelined(keys, lambda pipe, key: pipe.delete(key))) if keys else 0
+            deleted += removed
+            if len(keys) < self.batch_size or not removed:
+                return deleted
+
+    def _build_update_entry(self, vector_id, vector, payload) -> dict:
         data = {
             "memory_id": vector_id,
             "hash": payload["hash"],
@@ -200,11 +263,23 @@ class RedisDB(VectorStoreBase):
                 data[field] = payload[field]
 
         data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+        return data
 
-    def get(self, vector_id):
-        result = self.index.fetch(vector_id)
-        payload = {
+    def update(self, vector_id=None, vector=None, payload=None):
+        self.update_many([(vector_id, vector, payload)])
+
+    def update_many(self, updates: list):
+        """Update vectors from (vector_id, vector, payload) tuples, `batch_size` per round trip."""
+        updates = list(updates)
+        self.index.load(
+            data=[self._build_update_entry(*update) for update in updates],
+            keys=[self._key(vector_id) for vector_id, _, _ in updates],
+            id_field="memory_id",
+            batch_size=self.batch_size,
+        )
+
+    def _to_payload(self, result: dict) -> dict:
+        return {
             "hash": result["hash"],
             "data": result["memory"],
             "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=pytz.timezone("US/Pacific")).isoformat(
@@ -223,7 +298,20 @@ class RedisDB(VectorStoreBase):
             **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
         }
 
-        return MemoryResult(id=result["memory_id"], payload=payload)
+    def get(self, vector_id):
+        result = self.index.fetch(vector_id)
+        return MemoryResult(id=result["memory_id"], payload=self._to_payload(result))
+
+    def get_many(self, vector_ids: list) -> list:
+        """Get vectors by ID with pipelined HGETALL calls, skipping the ones that do not exist."""
+        replies = self._pipelined(list(vector_ids), lambda pipe, vector_id: pipe.hgetall(self._key(vector_id)))
+        results = []
+        for reply in replies:
+            if not reply:
+                continue
+            result = convert_bytes(reply)
+            results.append(MemoryResult(id=result["memory_id"], payload=self._to_payload(result)))
+        return results
 
     def list_cols(self):
         return self.index.listall()
@@ -252,44 +340,70 @@ class RedisDB(VectorStoreBase):
         # Recreate the index with the same parameters
         self.create_col(collection_name, self.embedding_model_dims)
 
+    def _to_list_result(self, result) -> MemoryResult:
+        return MemoryResult(
+            id=result["memory_id"],
+            payload={
+                "hash": result["hash"],
+                "data": result["memory"],
+                "created_at": datetime.fromtimestamp(
+                    int(result["created_at"]), tz=pytz.timezone("US/Pacific")
+                ).isoformat(timespec="microseconds"),
+                **(
+                    {
+                        "updated_at": datetime.fromtimestamp(
+                            int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
+                        ).isoformat(timespec="microseconds")
+                    }
+                    if result.__dict__.get("updated_at")
+                    else {}
+                ),
+                **{
+                    field: result[field]
+                    for field in ["agent_id", "run_id", "user_id"]
+                    if field in result.__dict__
+                },
+                **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
+            },
+        )
+
+    def _list_query(self, filters: dict = None) -> Query:
+        conditions = [Tag(key) == value for key, value in (filters or {}).items() if value is not None]
+        return Query(str(reduce(lambda x, y: x & y, conditions)) if conditions else "*").sort_by(
+            "created_at", asc=False
+        )
+
     def list(self, filters: dict = None, limit: int = None) -> list:
         """
         List all recent created memories from the vector store.
         """
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
-        query = Query(str(filter)).sort_by("created_at", asc=False)
+        query = self._list_query(filters)
         if limit is not None:
-            query = Query(str(filter)).sort_by("created_at", asc=False).paging(0, limit)
+            query = query.paging(0, limit)
 
         results = self.index.search(query)
-        return [
-            [
-                MemoryResult(
-                    id=result["memory_id"],
-                    payload={
-                        "hash": result["hash"],
-                        "data": result["memory"],
-                        "created_at": datetime.fromtimestamp(
-                            int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                        ).isoformat(timespec="microseconds"),
-                        **(
-                            {
-                                "updated_at": datetime.fromtimestamp(
-                                    int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                                ).isoformat(timespec="microseconds")
-                            }
-                            if result.__dict__.get("updated_at")
-                            else {}
-                        ),
-                        **{
-                            field: result[field]
-                            for field in ["agent_id", "run_id", "user_id"]
-                            if field in result.__dict__
-                        },
-                        **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-                    },
-                )
-                for result in results.docs
-            ]
-        ]
+        return [[self._to_list_result(result) for result in results.docs]]
+
+    def iter_list(self, filters: dict = None, page_size: int = 100):
+        """
+        Iterate over all memories matching the filters, most recent first, one paged search per round trip.
+
+        Pages are read by offset over the `created_at` sort, not through a cursor, so memories added or deleted
+        while iterating shift later pages and some memories may be returned twice or skipped. Offsets past the server's
+        MAXSEARCHRESULTS (10000 by default) make the search fail, so raise it to iterate larger collections.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of memories fetched per search. Defaults to 100.
+
+        Yields:
+            MemoryResult: The matching memories.
+        """
+        offset = 0
+        while True:
+            docs = self.index.search(self._list_query(filters).paging(offset, page_size)).docs
+            for result in docs:
+                yield self._to_list_result(result)
+            if len(docs) < page_size:
+                return
+            offset += len(docs)
@@ -7,6 +7,7 @@ import numpy as np
 import pytz
 import valkey
 from pydantic import BaseModel
+from valkey.commands.search.query import Query
 from valkey.exceptions import ResponseError
 
 from mem0.memory.utils import extract_json
@@ -52,6 +53,7 @@ class ValkeyDB(VectorStoreBase):
         hnsw_m: int = 16,
         hnsw_ef_construction: int = 200,
         hnsw_ef_runtime: int = 10,
+        batch_size: int = 500,
     ):
         """
         Initialize the Valkey vector store.
@@ -65,6 +67,8 @@ class ValkeyDB(VectorStoreBase):
             hnsw_m (int, optional): HNSW M parameter (connections per node). Defaults to 16.
             hnsw_ef_construction (int, optional): HNSW ef_construction parameter. Defaults to 200.
             hnsw_ef_runtime (int, optional): HNSW ef_runtime parameter. Defaults to 10.
+            batch_size (int, optional): Commands sent per pipeline round trip by bulk writes and get_many.
+                Defaults to 500.
         """
         self.embedding_model_dims = embedding_model_dims
         self.collection_name = collection_name
@@ -74,6 +78,7 @@ class ValkeyDB(VectorStoreBase):
         self.hnsw_m = hnsw_m
         self.hnsw_ef_construction = hnsw_ef_construction
         self.hnsw_ef_runtime = hnsw_ef_runtime
+        self.batch_size = batch_size
 
         # Validate index type
         if self.index_type not in ["hnsw", "flat"]:
@@ -265,54 +270,87 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error creating collection {collection_name}: {e}")
             raise
 
-    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+    def _build_hash_data(self, vector_id, vector, payload):
         """
-        Insert vectors and their payloads into the index.
+        Build the hash stored for a vector.
 
         Args:
-            vectors (list): List of vectors to insert.
-            payloads (list, optional): List of payloads corresponding to the vectors.
-            ids (list, optional): List of IDs for the vectors.
+            vector_id (str): ID of the vector.
+            vector (list): Vector data.
+            payload (dict): Payload of the vector. `created_at` is set to now if missing.
+
+        Returns:
+            dict: Hash fields.
         """
-        for vector, payload, id in zip(vectors, payloads, ids):
-            try:
-                # Create the key for the hash
-                key = f"{self.prefix}:{id}"
-
-                # Check for required fields and provide defaults if missing
-                if "data" not in payload:
-                    # Silently use default value for missing 'data' field
-                    pass
-
-                # Ensure created_at is present
-                if "created_at" not in payload:
-                    payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-                # Prepare the hash data
-                hash_data = {
-                    "memory_id": id,
-                    "hash": payload.get("hash", f"hash_{id}"),  # Use a default hash if not provided
-                    "memory": payload.get("data", f"data_{id}"),  # Use a default data if not provided
-                    "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                    "embedding": np.array(vector, dtype=np.float32).tobytes(),
-                }
+        # Ensure created_at is present
+        if "created_at" not in payload:
+            payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
 
-                # Add optional fields
-                for field in ["agent_id", "run_id", "user_id"]:
-                    if field in payload:
-                        hash_data[field] = payload[field]
+        # Prepare the hash data
+        hash_data = {
+            "memory_id": vector_id,
+            "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
+            "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+        }
 
-                # Add metadata
-                hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        # Add updated_at if available
+        if "updated_at" in payload:
+            hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
 
-                # Store in Valkey
-                self.client.hset(key, mapping=hash_data)
-                logger.debug(f"Successfully inserted vector with ID {id}")
+        # Add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                hash_data[field] = payload[field]
+
+        # Add metadata
+        hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return hash_data
+
+    def _pipelined(self, items, queue):
+        """
+        Send one or more commands per item through non-transactional pipelines of `batch_size` items.
+
+        Args:
+            items (list): Items to send commands for.
+            queue (callable): Called with the pipeline and an item to queue the item's commands.
+
+        Returns:
+            list: Replies of all the commands, in order.
+        """
+        replies = []
+        for start in range(0, len(items), self.batch_size):
+            pipe = self.client.pipeline(transaction=False)
+            for item in items[start : start + self.batch_size]:
+                queue(pipe, item)
+            replies.extend(pipe.execute())
+        return replies
+
+    def _write_hashes(self, entries, operation):
+        hashes = []
+        for vector_id, vector, payload in entries:
+            try:
+                hashes.append((f"{self.prefix}:{vector_id}", self._build_hash_data(vector_id, vector, payload)))
             except KeyError as e:
-                logger.error(f"Error inserting vector with ID {id}: Missing required field {e}")
-            except Exception as e:
-                logger.exception(f"Error inserting vector with ID {id}: {e}")
-                raise
+                logger.error(f"Error {operation} vector with ID {vector_id}: Missing required field {e}")
+        try:
+            self._pipelined(hashes, lambda pipe, item: pipe.hset(item[0], mapping=item[1]))
+            logger.debug(f"Successfully wrote {len(hashes)} vectors")
+        except Exception as e:
+            logger.exception(f"Error {operation} vectors: {e}")
+            raise
+
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        """
+        Insert vectors and their payloads into the index, `batch_size` vectors per round trip.
+
+        Args:
+            vectors (list): List of vectors to insert.
+            payloads (list, optional): List of payloads corresponding to the vectors.
+            ids (list, optional): List of IDs for the vectors.
+        """
+        self._write_hashes(list(zip(ids, vectors, payloads)), "inserting")
 
     def _build_search_query(self, knn_part, filters=None):
         """
@@ -464,6 +502,92 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error deleting vector with ID {vector_id}: {e}")
             raise
 
+    def delete_many(self, vector_ids):
+        """
+        Delete vectors from the index, `batch_size` vectors per round trip.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+
+        Returns:
+            int: Number of vectors that existed and were deleted.
+        """
+        try:
+            replies = self._pipelined(
+                list(vector_ids), lambda pipe, vector_id: pipe.delete(f"{self.prefix}:{vector_id}")
+            )
+            logger.debug(f"Successfully deleted {sum(replies)} vectors")
+            return sum(replies)
+        except Exception as e:
+            logger.exception(f"Error deleting vectors: {e}")
+            raise
+
+    def delete_by_filter(self, filters):
+        """
+        Delete all vectors matching the filters, `batch_size` vectors per round trip.
+
+        Valkey search only answers KNN queries, so each round trip takes up to `batch_size` matching ids from
+        a KNN query on a zero vector and deletes them on a pipeline, until no vector matches.
+
+        Args:
+            filters (dict): Filters selecting the vectors to delete.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        self._require_filters(filters)
+        knn_part = f"[KNN {self.batch_size} @embedding $vec_param AS vector_score]"
+        query = Query(self._build_search_query(knn_part, filters)).no_content().paging(0, self.batch_size).dialect(2)
+        params = {"vec_param": np.zeros(self.embedding_model_dims, dtype=np.float32).tobytes()}
+
+        deleted = 0
+        while True:
+            keys = [doc.id for doc in self._execute_search(query, params).docs]
+            removed = sum(self._pipelined(keys, lambda pipe, key: pipe.delete(key))) if keys else 0
+            deleted += removed
+            if len(keys) < self.batch_size or not removed:
+                logger.debug(f"Deleted {deleted} vectors matching {filters}")
+                return deleted
+
+    def iter_list(self, filters: dict = None, page_size: int = 100):
+        """
+        Iterate over all memories matching the filters, `page_size` hashes per round trip.
+
+        Valkey search only answers KNN queries, whose cost grows with the offset of each page, so this walks the
+        collection's keys with SCAN instead, reads each batch of hashes on a pipeline and keeps the ones whose
+        payload equals every non-None filter value. Memories written or deleted while iterating may or may not
+        be returned, as with SCAN.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            page_size (int, optional): Number of keys read per round trip. Defaults to 100.
+
+        Yields:
+            OutputData: The matching memories.
+        """
+        conditions = {key: value for key, value in (filters or {}).items() if value is not None}
+        seen = set()
+        keys = []
+        for key in self.client.scan_iter(match=f"{self.prefix}:*", count=page_size):
+            keys.append(key)
+            if len(keys) == page_size:
+                yield from self._matching_hashes(keys, conditions, seen)
+                keys = []
+        yield from self._matching_hashes(keys, conditions, seen)
+
+    def _matching_hashes(self, keys, conditions, seen):
+        replies = self._pipelined(keys, lambda pipe, key: pipe.hgetall(key)) if keys else []
+        for key, result in zip(keys, replies):
+            if not result:
+                continue
+            vector_id = self._convert_bytes(key).rsplit(":", 1)[-1]
+            payload, memory_id = self._process_document_fields(self._convert_bytes(result), vector_id)
+            # SCAN can return a key more than once
+            if memory_id in seen or any(payload.get(k) != v for k, v in conditions.items()):
+                continue
+            seen.add(memory_id)
+            yield OutputData(id=memory_id, payload=payload, score=0.0)
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector in the index.
@@ -475,36 +599,7 @@ class ValkeyDB(VectorStoreBase):
         """
         try:
             key = f"{self.prefix}:{vector_id}"
-
-            # Check for required fields and provide defaults if missing
-            if "data" not in payload:
-                # Silently use default value for missing 'data' field
-                pass
-
-            # Ensure created_at is present
-            if "created_at" not in payload:
-                payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-            # Prepare the hash data
-            hash_data = {
-                "memory_id": vector_id,
-                "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
-                "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Add updated_at if available
-            if "updated_at" in payload:
-                hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
-
-            # Add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    hash_data[field] = payload[field]
-
-            # Add metadata
-            hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+            hash_data = self._build_hash_data(vector_id, vector, payload)
 
             # Update in Valkey
             self.client.hset(key, mapping=hash_data)
@@ -515,6 +610,15 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error updating vector with ID {vector_id}: {e}")
             raise
 
+    def update_many(self, updates):
+        """
+        Update vectors in the index, `batch_size` vectors per round trip.
+
+        Args:
+            updates (list): (vector_id, vector, payload) tuples, as passed to `update`.
+        """
+        self._write_hashes(list(updates), "updating")
+
     def _format_timestamp(self, timestamp, timezone=None):
         """
         Format a timestamp with the specified timezone.
@@ -652,6 +756,33 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error getting vector with ID {vector_id}: {e}")
             raise
 
+    def get_many(self, vector_ids):
+        """
+        Get vectors by ID with pipelined HGETALL calls, `batch_size` vectors per round trip.
+
+        Args:
+            vector_ids (list): IDs of the vectors to get.
+
+        Returns:
+            list: OutputData of the vectors that exist, in the order of `vector_ids`.
+        """
+        vector_ids = list(vector_ids)
+        try:
+            replies = self._pipelined(
+                vector_ids, lambda pipe, vector_id: pipe.hgetall(f"{self.prefix}:{vector_id}")
+            )
+        except Exception as e:
+            logger.exception(f"Error getting vectors: {e}")
+            raise
+
+        results = []
+        for vector_id, result in zip(vector_ids, replies):
+            if not result:
+                continue
+            payload, memory_id = self._process_document_fields(self._convert_bytes(result), vector_id)
+            results.append(OutputData(id=memory_id, payload=payload, score=0.0))
+        return results
+
     def list_cols(self):
         """
         List all collections (indices) in Valkey.
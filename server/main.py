@@ -109,6 +109,30 @@ def add_memory(memory_create: MemoryCreate):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/memories/queue", summary="Queue memory creation", status_code=202)
+def enqueue_memory(memory_create: MemoryCreate):
+    """Queue new memories to be stored in the background and return a ticket to follow them."""
+    if not any([memory_create.user_id, memory_create.agent_id, memory_create.run_id]):
+        raise HTTPException(status_code=400, detail="At least one identifier (user_id, agent_id, run_id) is required.")
+
+    params = {k: v for k, v in memory_create.model_dump().items() if v is not None and k != "messages"}
+    try:
+        ticket_id = MEMORY_INSTANCE.enqueue_add(messages=[m.model_dump() for m in memory_create.messages], **params)
+        return {"ticket_id": ticket_id}
+    except Exception as e:
+        logging.exception("Error in enqueue_memory:")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/memories/queue/{ticket_id}", summary="Get the status of queued memory creation")
+def get_queued_memory(ticket_id: str):
+    """Retrieve the status and, once done, the result of a queued memory creation."""
+    status = MEMORY_INSTANCE.get_add_status(ticket_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown ticket.")
+    return status
+
+
 @app.get("/memories", summary="Get memories")
 def get_all_memories(
     user_id: Optional[str] = None,
@@ -49,3 +49,20 @@ def test_get_update_memory_messages_non_empty_memory():
     assert str(memory_data) in result
     # And that the non-empty memory message is present
     assert "current content of my memory" in result
+
+
+def test_get_single_pass_memory_messages():
+    memory_data = [{"id": "0", "text": "existing memory"}]
+    system_prompt, user_prompt = prompts.get_single_pass_memory_messages("user: I moved to Berlin\n", memory_data)
+
+    assert system_prompt.startswith(prompts.SINGLE_PASS_MEMORY_PROMPT.strip())
+    assert '"facts"' in system_prompt and '"memory"' in system_prompt
+    assert str(memory_data) in user_prompt
+    assert user_prompt.endswith("user: I moved to Berlin\n")
+
+    system_prompt, user_prompt = prompts.get_single_pass_memory_messages(
+        "assistant: I am a travel bot\n", [], is_agent_memory=True, custom_update_memory_prompt="custom rules"
+    )
+    assert system_prompt.startswith("custom rules")
+    assert "facts about the assistant" in system_prompt
+    assert "Existing memory is empty" in user_prompt
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.cache import CachedEmbedding
+from mem0.embeddings.configs import EmbedderConfig, EmbeddingCacheConfig
+from mem0.utils.factory import EmbedderFactory
+
+
+class CountingEmbedding(EmbeddingBase):
+    def __init__(self, config=None):
+        super().__init__(config or BaseEmbedderConfig(model="test-model", embedding_dims=2))
+        self.calls = []
+
+    def embed(self, text, memory_action=None):
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts, memory_action=None):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0 if memory_action == "search" else 0.0] for text in texts]
+
+
+@pytest.fixture
+def inner():
+    return CountingEmbedding()
+
+
+def test_embed_hits_memory_tier(inner):
+    embedder = CachedEmbedding(inner, "test", EmbeddingCacheConfig())
+
+    first = embedder.embed("alice", "add")
+    second = embedder.embed("alice", "add")
+
+    assert first == second == [5.0, 0.0]
+    assert inner.calls == [["alice"]]
+    assert embedder.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_memory_action_is_part_of_the_key(inner):
+    embedder = CachedEmbedding(inner, "test", EmbeddingCacheConfig())
+
+    assert embedder.embed("alice", "add") == [5.0, 0.0]
+    assert embedder.embed("alice", "search") == [5.0, 1.0]
+    assert len(inner.calls) == 2
+
+
+def test_embed_batch_only_sends_misses(inner):
+    embedder = CachedEmbedding(inner, "test", EmbeddingCacheConfig())
+    embedder.embed("alice", "add")
+
+    result = embedder.embed_batch(["bob", "alice", "carol", "bob"], "add")
+
+    assert result == [[3.0, 0.0], [5.0, 0.0], [5.0, 0.0], [3.0, 0.0]]
+    assert inner.calls[-1] == ["bob", "carol"]
+
+
+def test_lru_evicts_least_recently_used(inner):
+    embedder = CachedEmbedding(inner, "test", EmbeddingCacheConfig(max_size=2))
+    embedder.embed("a")
+    embedder.embed("b")
+    embedder.embed("a")
+    embedder.embed("c")
+
+    embedder.embed("a")
+    embedder.embed("b")
+
+    assert inner.calls == [["a"], ["b"], ["c"], ["b"]]
+
+
+def test_disk_tier_survives_new_instance(inner, tmp_path):
+    path = str(tmp_path / "cache.db")
+    CachedEmbedding(inner, "test", EmbeddingCacheConfig(persist=True, path=path)).embed("alice", "add")
+
+    fresh_inner = CountingEmbedding()
+    embedder = CachedEmbedding(fresh_inner, "test", EmbeddingCacheConfig(persist=True, path=path))
+
+    assert embedder.embed("alice", "add") == [5.0, 0.0]
+    assert fresh_inner.calls == []
+    assert embedder.stats()["hits"] == 1
+
+
+def test_model_change_misses_disk_tier(inner, tmp_path):
+    path = str(tmp_path / "cache.db")
+    CachedEmbedding(inner, "test", EmbeddingCacheConfig(persist=True, path=path)).embed("alice")
+
+    other_model = CountingEmbedding(BaseEmbedderConfig(model="other-model", embedding_dims=2))
+    CachedEmbedding(other_model, "test", EmbeddingCacheConfig(persist=True, path=path)).embed("alice")
+
+    assert other_model.calls == [["alice"]]
+
+
+def test_wrapped_attributes_are_exposed(inner):
+    embedder = CachedEmbedding(inner, "test", EmbeddingCacheConfig())
+
+    assert embedder.config.embedding_dims == 2
+    assert embedder.calls is inner.calls
+
+
+def test_factory_wraps_only_when_cache_configured():
+    with patch("mem0.embeddings.openai.OpenAI"):
+        plain = EmbedderFactory.create("openai", {}, None)
+        cached = EmbedderFactory.create("openai", {}, None, cache_config=EmbeddingCacheConfig())
+
+    assert not isinstance(plain, CachedEmbedding)
+    assert isinstance(cached, CachedEmbedding)
+    assert cached.config.model == "text-embedding-3-small"
+
+
+def test_embedder_config_cache_is_opt_in():
+    assert EmbedderConfig().cache is None
+    assert EmbedderConfig(cache={"max_size": 10}).cache.max_size == 10
@@ -43,4 +43,15 @@ def test_embed_removes_newlines(mock_fastembed_client):
     embedding = embedder.embed(text_with_newlines)
     
     mock_fastembed_client.embed.assert_called_once_with("Hello world")
-    assert list(embedding) == [0.7, 0.8, 0.9]
\ No newline at end of file
+    assert list(embedding) == [0.7, 0.8, 0.9]
+
+def test_embed_batch_single_call(mock_fastembed_client):
+    config = BaseEmbedderConfig(model="jinaai/jina-embeddings-v2-base-en", embedding_dims=768)
+    embedder = FastEmbedEmbedding(config)
+
+    mock_fastembed_client.embed.return_value = iter([np.array([0.1, 0.2]), np.array([0.3, 0.4])])
+
+    embeddings = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_fastembed_client.embed.assert_called_once_with(["Hello world", "Second text"])
+    assert [list(embedding) for embedding in embeddings] == [[0.1, 0.2], [0.3, 0.4]]
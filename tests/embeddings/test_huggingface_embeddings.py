@@ -101,3 +101,14 @@ def test_embed_with_huggingface_base_url():
             truncate=True,
         )
         assert result == [0.1, 0.2, 0.3]
+
+
+def test_embed_batch_single_encode_call(mock_sentence_transformer):
+    config = BaseEmbedderConfig()
+    embedder = HuggingFaceEmbedding(config)
+
+    mock_sentence_transformer.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+    result = embedder.embed_batch(["first", "second"])
+
+    mock_sentence_transformer.encode.assert_called_once_with(["first", "second"], convert_to_numpy=True)
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
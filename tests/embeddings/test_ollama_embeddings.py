@@ -30,6 +30,38 @@ def test_embed_text(mock_ollama_client):
     assert embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
 
 
+def test_embed_batch_uses_the_same_endpoint_as_embed(mock_ollama_client):
+    config = BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512)
+    embedder = OllamaEmbedding(config)
+
+    mock_ollama_client.embeddings.side_effect = [{"embedding": [0.1, 0.2]}, {"embedding": [0.3, 0.4]}]
+
+    embeddings = embedder.embed_batch(["first", "second"])
+
+    assert mock_ollama_client.embeddings.call_count == 2
+    mock_ollama_client.embed.assert_not_called()
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_embed_api_batches_in_a_single_request(mock_ollama_client):
+    config = BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512, ollama_use_embed_api=True)
+    embedder = OllamaEmbedding(config)
+
+    mock_ollama_client.embed.side_effect = [
+        {"embeddings": [[0.1, 0.2], [0.3, 0.4]]},
+        {"embeddings": [[0.5, 0.6]]},
+    ]
+
+    embeddings = embedder.embed_batch(["first", "second"])
+    embedding = embedder.embed("third")
+
+    mock_ollama_client.embed.assert_any_call(model="nomic-embed-text", input=["first", "second"])
+    mock_ollama_client.embed.assert_any_call(model="nomic-embed-text", input=["third"])
+    mock_ollama_client.embeddings.assert_not_called()
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+    assert embedding == [0.5, 0.6]
+
+
 def test_ensure_model_exists(mock_ollama_client):
     config = BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512)
     embedder = OllamaEmbedding(config)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -88,3 +88,50 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_embed_batch_splits_large_inputs(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_openai_client.embeddings.create.side_effect = lambda input, **kwargs: Mock(
+        data=[Mock(embedding=[float(len(text))]) for text in input]
+    )
+
+    texts = [str(i) for i in range(2050)]
+    result = embedder.embed_batch(texts)
+
+    assert mock_openai_client.embeddings.create.call_count == 2
+    assert len(result) == 2050
+    assert result[-1] == [4.0]
+
+
+@pytest.mark.asyncio
+async def test_aembed_batch_uses_async_client(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="test"))
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        mock_async_openai.return_value.embeddings.create = AsyncMock(return_value=mock_response)
+        result = await embedder.aembed_batch(["first", "second\nline"])
+
+    mock_async_openai.return_value.embeddings.create.assert_awaited_once_with(
+        input=["first", "second line"], model="text-embedding-3-small", dimensions=1536
+    )
+    mock_openai_client.embeddings.create.assert_not_called()
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -32,3 +32,20 @@ def test_generate_response_without_tools(mock_ollama_client):
         model="llama3.1:70b", messages=messages, options={"temperature": 0.7, "num_predict": 100, "top_p": 1.0}
     )
     assert response == "I'm doing well, thank you for asking!"
+
+
+@pytest.mark.asyncio
+async def test_agenerate_response_uses_async_client(mock_ollama_client):
+    config = OllamaConfig(model="llama3.1:70b", temperature=0.7, max_tokens=100, top_p=1.0)
+    with patch("mem0.llms.ollama.AsyncClient") as mock_async_client:
+        mock_async_client.return_value.chat = AsyncMock(return_value={"message": {"content": "Hi there!"}})
+        llm = OllamaLLM(config)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        response = await llm.agenerate_response(messages)
+
+    mock_async_client.return_value.chat.assert_awaited_once_with(
+        model="llama3.1:70b", messages=messages, options={"temperature": 0.7, "num_predict": 100, "top_p": 1.0}
+    )
+    mock_ollama_client.chat.assert_not_called()
+    assert response == "Hi there!"
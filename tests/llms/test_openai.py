@@ -1,5 +1,5 @@
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -207,3 +207,22 @@ def test_callback_with_tools(mock_openai_client):
     mock_callback.assert_called_once()
     # Check that tool_calls exists in the message
     assert hasattr(mock_callback.call_args[0][1].choices[0].message, 'tool_calls')
+
+
+@pytest.mark.asyncio
+async def test_agenerate_response_uses_async_client(mock_openai_client):
+    config = OpenAIConfig(model="gpt-4.1-nano-2025-04-14", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = OpenAILLM(config)
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(content="I'm doing well, thank you for asking!"))]
+    with patch("mem0.llms.openai.AsyncOpenAI") as mock_async_openai:
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(return_value=mock_response)
+        response = await llm.agenerate_response(messages)
+
+    mock_async_openai.return_value.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4.1-nano-2025-04-14", messages=messages, temperature=0.7, max_tokens=100, top_p=1.0, store=False
+    )
+    mock_openai_client.chat.completions.create.assert_not_called()
+    assert response == "I'm doing well, thank you for asking!"
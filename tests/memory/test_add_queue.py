@@ -0,0 +1,196 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from mem0.memory.add_queue import AddQueue
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "add_queue.db")
+
+
+def test_enqueue_runs_handler_and_records_result(queue_path):
+    calls = []
+
+    def handler(ticket_id, **kwargs):
+        calls.append(kwargs)
+        return {"results": [{"memory": kwargs["messages"]}]}
+
+    queue = AddQueue(handler, queue_path, poll_interval=0.05)
+    try:
+        ticket_id = queue.enqueue({"messages": "I like tea", "user_id": "alice"})
+        status = queue.wait(ticket_id, timeout=5)
+    finally:
+        queue.close()
+
+    assert status["status"] == "done"
+    assert status["attempts"] == 1
+    assert status["result"] == {"results": [{"memory": "I like tea"}]}
+    assert calls == [{"messages": "I like tea", "user_id": "alice"}]
+
+
+def test_calls_for_a_scope_run_in_order(queue_path):
+    order = []
+    running = set()
+    overlap = []
+    lock = threading.Lock()
+
+    def handler(ticket_id, **kwargs):
+        with lock:
+            if kwargs["user_id"] in running:
+                overlap.append(kwargs["user_id"])
+            running.add(kwargs["user_id"])
+        time.sleep(0.01)
+        with lock:
+            order.append((kwargs["user_id"], kwargs["messages"]))
+            running.discard(kwargs["user_id"])
+
+    queue = AddQueue(handler, queue_path, max_workers=4, poll_interval=0.05)
+    try:
+        tickets = [
+            queue.enqueue({"messages": index, "user_id": user_id})
+            for index in range(5)
+            for user_id in ("alice", "bob")
+        ]
+        statuses = [queue.wait(ticket_id, timeout=10) for ticket_id in tickets]
+    finally:
+        queue.close()
+
+    assert all(status["status"] == "done" for status in statuses)
+    assert overlap == []
+    for user_id in ("alice", "bob"):
+        assert [messages for owner, messages in order if owner == user_id] == list(range(5))
+
+
+def test_failing_call_is_retried_then_marked_failed(queue_path):
+    attempts = []
+
+    def handler(ticket_id, **kwargs):
+        attempts.append(kwargs["messages"])
+        if kwargs["messages"] == "flaky" and attempts.count("flaky") < 2:
+            raise RuntimeError("llm timeout")
+        if kwargs["messages"] == "broken":
+            raise RuntimeError("invalid input")
+        return {"results": []}
+
+    queue = AddQueue(handler, queue_path, max_attempts=2, retry_backoff=0, poll_interval=0.05)
+    try:
+        flaky = queue.enqueue({"messages": "flaky", "user_id": "alice"})
+        broken = queue.enqueue({"messages": "broken", "user_id": "bob"})
+        flaky_status = queue.wait(flaky, timeout=5)
+        broken_status = queue.wait(broken, timeout=5)
+    finally:
+        queue.close()
+
+    assert flaky_status["status"] == "done"
+    assert flaky_status["attempts"] == 2
+    assert broken_status["status"] == "failed"
+    assert broken_status["attempts"] == 2
+    assert broken_status["error"] == "invalid input"
+
+
+def test_interrupted_calls_are_replayed_on_open(queue_path):
+    handled = []
+    queue = AddQueue(lambda ticket_id, **kwargs: handled.append(kwargs), queue_path)
+    queue.close()  # Stop the workers so the call stays queued
+
+    connection = sqlite3.connect(queue_path)
+    connection.execute(
+        "INSERT INTO add_queue (id, scope, payload, status, attempts, created_at, updated_at, next_attempt_at) "
+        "VALUES ('ticket-1', '[\"alice\", null, null]', '{\"messages\": \"hi\", \"user_id\": \"alice\"}', "
+        "'running', 1, 0, 0, 0)"
+    )
+    connection.commit()
+    connection.close()
+
+    queue = AddQueue(
+        lambda ticket_id, **kwargs: handled.append(kwargs) or {"results": []}, queue_path, poll_interval=0.05
+    )
+    try:
+        status = queue.wait("ticket-1", timeout=5)
+    finally:
+        queue.close()
+
+    assert status["status"] == "done"
+    assert status["attempts"] == 2
+    assert handled == [{"messages": "hi", "user_id": "alice"}]
+
+
+def test_replayed_call_keeps_its_ticket_id(queue_path):
+    tickets = []
+
+    def handler(ticket_id, **kwargs):
+        tickets.append(ticket_id)
+        if len(tickets) == 1:
+            raise RuntimeError("llm timeout")
+        return {"results": []}
+
+    queue = AddQueue(handler, queue_path, retry_backoff=0, poll_interval=0.05)
+    try:
+        ticket_id = queue.enqueue({"messages": "hi", "user_id": "alice"})
+        status = queue.wait(ticket_id, timeout=5)
+    finally:
+        queue.close()
+
+    assert status["status"] == "done"
+    assert tickets == [ticket_id, ticket_id]
+
+
+def test_checkpoints_survive_retries_and_are_dropped_once_done(queue_path):
+    seen = []
+
+    def handler(ticket_id, **kwargs):
+        seen.append(queue.get_checkpoints(ticket_id))
+        queue.save_checkpoint(ticket_id, "progress", {"done": len(seen)})
+        if len(seen) == 1:
+            raise RuntimeError("llm timeout")
+        return {"results": []}
+
+    queue = AddQueue(handler, queue_path, retry_backoff=0, poll_interval=0.05)
+    try:
+        ticket_id = queue.enqueue({"messages": "hi", "user_id": "alice"})
+        status = queue.wait(ticket_id, timeout=5)
+        checkpoints = queue.get_checkpoints(ticket_id)
+    finally:
+        queue.close()
+
+    assert status["status"] == "done"
+    assert seen == [{}, {"progress": {"done": 1}}]
+    assert checkpoints == {}
+
+
+def test_queues_sharing_a_file_only_run_their_own_calls(queue_path):
+    queue = AddQueue(lambda ticket_id, **kwargs: None, queue_path, namespace="collection-a")
+    queue._stopping = True  # Keep the call queued without starting workers
+    ticket_id = queue.enqueue({"messages": "hi", "user_id": "alice"})
+    queue.close()
+
+    handled = []
+    other = AddQueue(
+        lambda ticket_id, **kwargs: handled.append(kwargs), queue_path, namespace="collection-b", poll_interval=0.05
+    )
+    try:
+        time.sleep(0.2)
+        other_status = other.get_status(ticket_id)
+    finally:
+        other.close()
+
+    assert handled == []
+    assert other_status["status"] == "pending"
+
+    owner = AddQueue(
+        lambda ticket_id, **kwargs: handled.append(kwargs) or {"results": []},
+        queue_path,
+        namespace="collection-a",
+        poll_interval=0.05,
+    )
+    try:
+        status = owner.wait(ticket_id, timeout=5)
+    finally:
+        owner.close()
+
+    assert status["status"] == "done"
+    assert handled == [{"messages": "hi", "user_id": "alice"}]
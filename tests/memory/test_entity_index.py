@@ -0,0 +1,94 @@
+from unittest.mock import Mock
+
+from mem0.graphs.entity_index import EntityNameIndex
+
+
+def test_match_prefers_longest_names_and_self_references():
+    index = EntityNameIndex()
+    load = Mock(return_value=["pizza", "cheese_pizza", "new_york", "alice"])
+
+    assert index.match("Where in New York can I get cheese pizza?", {"user_id": "alice"}, load) == [
+        "new_york",
+        "alice",
+        "cheese_pizza",
+    ]
+    assert index.match("Is pizza my favourite?", {"user_id": "alice"}, load) == ["pizza", "alice"]
+    load.assert_called_once()
+
+
+def test_scopes_are_loaded_separately():
+    index = EntityNameIndex()
+    alice = Mock(return_value=["paris"])
+    alice_run = Mock(return_value=["berlin"])
+
+    assert index.match("paris or berlin", {"user_id": "alice"}, alice) == ["paris"]
+    assert index.match("paris or berlin", {"user_id": "alice", "run_id": "r1"}, alice_run) == ["berlin"]
+
+
+def test_writes_reach_the_scopes_that_see_them():
+    index = EntityNameIndex()
+    index.match("", {"user_id": "alice"}, lambda: [])
+    index.match("", {"user_id": "alice", "run_id": "r1"}, lambda: [])
+    index.match("", {"user_id": "bob"}, lambda: [])
+
+    index.add({"user_id": "alice", "run_id": "r2"}, ["lisbon"])
+
+    reload = Mock(return_value=[])
+    assert index.match("lisbon", {"user_id": "alice"}, reload) == ["lisbon"]
+    assert index.match("lisbon", {"user_id": "alice", "run_id": "r1"}, reload) == []
+    assert index.match("lisbon", {"user_id": "bob"}, reload) == []
+    reload.assert_not_called()
+
+
+def test_invalidate_and_expiry_reload_names():
+    index = EntityNameIndex(ttl=None)
+    load = Mock(return_value=["paris"])
+    index.match("paris", {"user_id": "alice"}, load)
+
+    index.invalidate({"user_id": "alice"})
+    index.match("paris", {"user_id": "alice"}, load)
+    assert load.call_count == 2
+
+    index.ttl = 0
+    index.match("paris", {"user_id": "alice"}, load)
+    assert load.call_count == 3
+
+
+def test_names_loaded_during_a_write_are_not_cached():
+    index = EntityNameIndex()
+
+    def load():
+        index.add({"user_id": "alice"}, ["rome"])
+        return ["paris"]
+
+    assert index.match("paris", {"user_id": "alice"}, load) == ["paris"]
+    reload = Mock(return_value=["paris", "rome"])
+    assert index.match("rome", {"user_id": "alice"}, reload) == ["rome"]
+    reload.assert_called_once()
+
+
+def test_max_scopes_evicts_least_recently_used():
+    index = EntityNameIndex(max_scopes=1)
+    load = Mock(return_value=[])
+    index.match("", {"user_id": "alice"}, load)
+    index.match("", {"user_id": "bob"}, load)
+    index.match("", {"user_id": "alice"}, load)
+
+    assert load.call_count == 3
+
+
+def test_write_counters_stay_bounded():
+    index = EntityNameIndex(max_scopes=2)
+
+    def load():
+        for i in range(10):
+            index.add({"user_id": f"user-{i}"}, [])
+        index.add({"user_id": "alice"}, ["rome"])
+        return ["paris"]
+
+    index.match("paris", {"user_id": "alice"}, load)
+
+    assert len(index._generations) <= index.max_scopes
+    reload = Mock(return_value=["paris", "rome"])
+    assert index.match("rome", {"user_id": "alice"}, reload) == ["rome"]
+    reload.assert_called_once()
@@ -1,3 +1,4 @@
+import kuzu
 import numpy as np
 import pytest
 from unittest.mock import Mock, patch
@@ -40,6 +41,7 @@ class TestKuzu:
 
         # Mock graph store config
         config.graph_store.config.db = ":memory:"
+        config.graph_store.config.vector_index = False
         config.graph_store.threshold = 0.7
 
         # Mock LLM config
@@ -58,6 +60,7 @@ class TestKuzu:
             return self.embeddings[text]
 
         mock_model.embed.side_effect = mock_embed
+        mock_model.embed_batch.side_effect = lambda texts: [mock_embed(text) for text in texts]
         return mock_model
 
     @pytest.fixture
@@ -190,6 +193,163 @@ class TestKuzu:
         assert get_node_count(kuzu_memory) == 0
         assert get_edge_count(kuzu_memory) == 0
 
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_search_matches_entities_locally(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that search finds the entities of the query by name, without an LLM call"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+        mock_config.graph_store.entity_matcher = "local"
+
+        kuzu_memory = MemoryGraph(mock_config)
+        filters = {"user_id": "test_user"}
+        kuzu_memory._add_entities(
+            [
+                {"source": "alice", "destination": "bob", "relationship": "knows"},
+                {"source": "charlie", "destination": "dave", "relationship": "knows"},
+            ],
+            filters,
+            {},
+        )
+
+        results = kuzu_memory.search("Who does Bob know?", filters)
+
+        assert results == [{"source": "alice", "relationship": "knows", "destination": "bob"}]
+        mock_llm.generate_response.assert_not_called()
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_vector_index(self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm):
+        """Test that entity lookups go through the vector index and keep to the filters' scope"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+        mock_config.graph_store.config.vector_index = True
+
+        kuzu_memory = MemoryGraph(mock_config)
+        assert kuzu_memory.vector_index == "entity_embedding"
+        embedding_type = [
+            row["type"] for row in kuzu_memory.kuzu_execute("CALL table_info('Entity') RETURN *")
+            if row["name"] == "embedding"
+        ]
+        assert embedding_type == ["FLOAT[384]"]
+
+        data = [{"source": "alice", "destination": "bob", "relationship": "knows"}]
+        kuzu_memory._add_entities(data, {"user_id": "other_user"}, {})
+        kuzu_memory._add_entities(data, {"user_id": "test_user", "agent_id": "test_agent"}, {})
+        assert get_node_count(kuzu_memory) == 4
+
+        # Fewer candidates than nodes above the threshold: the lookup widens until the scope's node shows up
+        with patch("mem0.memory.kuzu_memory._VECTOR_INDEX_CANDIDATES", 1), patch.object(
+            kuzu_memory, "kuzu_execute", wraps=kuzu_memory.kuzu_execute
+        ) as kuzu_execute:
+            matches = kuzu_memory._search_node(self.embeddings["bob"], {"user_id": "test_user"}, 0.9)
+
+        assert len(matches) == 1
+        assert kuzu_execute.call_count == 2
+        assert all("QUERY_VECTOR_INDEX" in c.args[0] for c in kuzu_execute.call_args_list)
+
+        results = kuzu_memory._search_graph_db(["bob"], {"user_id": "test_user", "agent_id": "test_agent"})
+        assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("alice", "knows", "bob")]
+        assert kuzu_memory._search_graph_db(["bob"], {"user_id": "test_user", "agent_id": "other_agent"}) == []
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_vector_index_after_delete(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that nodes created after a delete are found when the vector index no longer returns them"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+        mock_config.graph_store.config.vector_index = True
+
+        kuzu_memory = MemoryGraph(mock_config)
+        kuzu_memory._add_entities(
+            [{"source": "alice", "destination": "bob", "relationship": "knows"}], {"user_id": "v"}, {}
+        )
+        kuzu_memory.delete_all({"user_id": "v"})
+        kuzu_memory._add_entities(
+            [{"source": "charlie", "destination": "dave", "relationship": "knows"}], {"user_id": "u"}, {}
+        )
+
+        results = kuzu_memory._search_graph_db(["charlie"], {"user_id": "u"})
+        assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("charlie", "knows", "dave")]
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_without_vector_index(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that entity lookups scan the nodes when the vector index is disabled"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+
+        kuzu_memory = MemoryGraph(mock_config)
+        assert kuzu_memory.vector_index is None
+        assert kuzu_memory.kuzu_execute("CALL SHOW_INDEXES() RETURN *") == []
+
+        filters = {"user_id": "test_user"}
+        kuzu_memory._add_entities([{"source": "alice", "destination": "bob", "relationship": "knows"}], filters, {})
+        kuzu_memory._add_entities([{"source": "bob", "destination": "charlie", "relationship": "knows"}], filters, {})
+
+        assert get_node_count(kuzu_memory) == 3
+        results = kuzu_memory._search_graph_db(["bob"], filters)
+        assert {(r["source"], r["destination"]) for r in results} == {("alice", "bob"), ("bob", "charlie")}
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_migrates_variable_size_embeddings(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm, tmp_path
+    ):
+        """Test that a database created with an `embedding FLOAT[]` column is migrated and indexed"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+        db_path = str(tmp_path / "graph.kuzu")
+        mock_config.graph_store.config.db = db_path
+        mock_config.graph_store.config.vector_index = True
+
+        legacy = kuzu.Connection(kuzu.Database(db_path))
+        legacy.execute(
+            "CREATE NODE TABLE Entity(id SERIAL PRIMARY KEY, user_id STRING, agent_id STRING, run_id STRING, "
+            "name STRING, mentions INT64, created TIMESTAMP, embedding FLOAT[])"
+        )
+        legacy.execute(
+            "CREATE REL TABLE CONNECTED_TO(FROM Entity TO Entity, name STRING, mentions INT64, created TIMESTAMP, "
+            "updated TIMESTAMP)"
+        )
+        for name, embedding in [("alice", self.embeddings["alice"]), ("bob", self.embeddings["bob"]), ("eve", [1.0])]:
+            legacy.execute(
+                "CREATE (:Entity {user_id: 'test_user', name: $name, mentions: 1, embedding: $embedding})",
+                {"name": name, "embedding": embedding},
+            )
+        legacy.execute(
+            "MATCH (a:Entity {name: 'alice'}), (b:Entity {name: 'bob'}) "
+            "CREATE (a)-[:CONNECTED_TO {name: 'knows', mentions: 1}]->(b)"
+        )
+        legacy.close()
+
+        kuzu_memory = MemoryGraph(mock_config)
+
+        assert kuzu_memory.vector_index == "entity_embedding"
+        columns = {row["name"]: row["type"] for row in kuzu_memory.kuzu_execute("CALL table_info('Entity') RETURN *")}
+        assert columns["embedding"] == "FLOAT[384]"
+        rows = kuzu_memory.kuzu_execute(
+            "MATCH (n:Entity) RETURN n.name AS name, n.embedding IS NULL AS missing, "
+            "n.embedding_legacy IS NULL AS emptied ORDER BY n.name"
+        )
+        assert rows == [
+            {"name": "alice", "missing": False, "emptied": True},
+            {"name": "bob", "missing": False, "emptied": True},
+            {"name": "eve", "missing": True, "emptied": True},
+        ]
+        results = kuzu_memory._search_graph_db(["bob"], {"user_id": "test_user"})
+        assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("alice", "knows", "bob")]
+
+        # Reopening the migrated database is a no-op
+        MemoryGraph(mock_config)
+
+
 def get_node_count(kuzu_memory):
     results = kuzu_memory.kuzu_execute(
         """
@@ -1,15 +1,23 @@
 import logging
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
+from mem0.configs.base import MemoryConfig
+from mem0.exceptions import ValidationError as Mem0ValidationError
 from mem0.memory.main import AsyncMemory, Memory
+from mem0.vector_stores.base import VectorStoreBase
 
 
 def _setup_mocks(mocker):
     """Helper to setup common mocks for both sync and async fixtures"""
     mock_embedder = mocker.MagicMock()
     mock_embedder.return_value.embed.return_value = [0.1, 0.2, 0.3]
+    mock_embedder.return_value.embed_batch.side_effect = lambda texts, memory_action=None: [
+        [0.1, 0.2, 0.3] for _ in texts
+    ]
     mocker.patch("mem0.utils.factory.EmbedderFactory.create", mock_embedder)
 
     mock_vector_store = mocker.MagicMock()
@@ -127,3 +135,552 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Empty response from LLM, no memories to extract" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestAddBatch:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+
+        memory = Memory()
+        memory.config = mocker.MagicMock()
+        memory.config.llm.config = {}
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.config.executor_max_workers = None
+        memory.db = mocker.MagicMock()
+        memory.api_version = "v1.1"
+
+        return memory
+
+    def test_add_batch_bulk_writes(self, mock_memory):
+        result = mock_memory.add_batch(
+            [
+                {"messages": "I like pizza", "user_id": "alice", "infer": False},
+                {"messages": [{"role": "user", "content": "I live in Paris"}], "user_id": "bob", "infer": False},
+            ]
+        )
+
+        assert [item["status"] for item in result["results"]] == ["success", "success"]
+        assert [item["index"] for item in result["results"]] == [0, 1]
+        assert result["results"][0]["results"][0]["memory"] == "I like pizza"
+        assert result["results"][1]["results"][0]["memory"] == "I live in Paris"
+
+        mock_memory.vector_store.insert.assert_called_once()
+        insert_kwargs = mock_memory.vector_store.insert.call_args.kwargs
+        assert len(insert_kwargs["ids"]) == 2
+        assert {payload["user_id"] for payload in insert_kwargs["payloads"]} == {"alice", "bob"}
+
+        mock_memory.db.add_history.assert_not_called()
+        mock_memory.db.batch_add_history.assert_called_once()
+        history = mock_memory.db.batch_add_history.call_args.args[0]
+        assert sorted(record["new_memory"] for record in history) == ["I like pizza", "I live in Paris"]
+        assert all(record["event"] == "ADD" for record in history)
+
+    def test_add_batch_runs_items_on_the_shared_pool_up_to_concurrency(self, mock_memory, mocker):
+        running, peak, lock = 0, 0, threading.Lock()
+        add_batch_item = mock_memory._add_batch_item
+
+        def track(item, pending_writes):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return add_batch_item(item, pending_writes)
+
+        mocker.patch.object(mock_memory, "_add_batch_item", side_effect=track)
+        items = [{"messages": f"Fact {i}", "user_id": "alice", "infer": False} for i in range(6)]
+
+        result = mock_memory.add_batch(items, concurrency=2)
+
+        assert [item["status"] for item in result["results"]] == ["success"] * 6
+        assert peak <= 2
+        assert mock_memory._executor is not None
+        assert len(mock_memory.vector_store.insert.call_args.kwargs["ids"]) == 6
+
+    def test_add_batch_reports_invalid_items(self, mock_memory):
+        result = mock_memory.add_batch(
+            [
+                {"messages": "I like pizza", "user_id": "alice", "infer": False},
+                {"messages": "No scope", "infer": False},
+                {"user_id": "alice"},
+            ]
+        )
+
+        statuses = [item["status"] for item in result["results"]]
+        assert statuses == ["success", "error", "error"]
+        assert "user_id" in result["results"][1]["error"]
+        assert len(mock_memory.vector_store.insert.call_args.kwargs["ids"]) == 1
+
+    def test_add_batch_insert_failure_marks_items(self, mock_memory):
+        mock_memory.vector_store.insert.side_effect = Exception("store unavailable")
+
+        result = mock_memory.add_batch([{"messages": "I like pizza", "user_id": "alice", "infer": False}])
+
+        assert result["results"][0]["status"] == "error"
+        assert "store unavailable" in result["results"][0]["error"]
+        mock_memory.db.batch_add_history.assert_called_once_with([])
+
+    def test_add_batch_failed_item_keeps_history_of_applied_updates(self, mock_memory, mocker):
+        mock_memory.llm.generate_response.side_effect = [
+            '{"facts": ["Lives in Berlin", "Likes techno"]}',
+            '{"memory": [{"id": "0", "text": "Lives in Berlin", "event": "UPDATE", "old_memory": "Lives in Paris"}, '
+            '{"id": "1", "text": "Likes techno", "event": "ADD"}]}',
+        ]
+        existing = MagicMock(id="mem-1", payload={"data": "Lives in Paris", "user_id": "alice"})
+        mock_memory.vector_store.search.return_value = [existing]
+        mock_memory.vector_store.get.return_value = existing
+        mock_memory.enable_graph = True
+        mocker.patch.object(mock_memory, "_add_to_graph", side_effect=RuntimeError("graph unavailable"))
+
+        result = mock_memory.add_batch([{"messages": "I moved to Berlin and I like techno", "user_id": "alice"}])
+
+        assert result["results"] == [
+            {
+                "index": 0,
+                "status": "partial",
+                "error": "graph unavailable",
+                "results": [
+                    {"id": "mem-1", "memory": "Lives in Berlin", "event": "UPDATE", "previous_memory": "Lives in Paris"}
+                ],
+            }
+        ]
+        mock_memory.vector_store.update.assert_called_once()
+        mock_memory.vector_store.insert.assert_not_called()
+        history = mock_memory.db.batch_add_history.call_args.args[0]
+        assert [(record["memory_id"], record["event"]) for record in history] == [("mem-1", "UPDATE")]
+
+
+@pytest.mark.asyncio
+async def test_async_add_batch_bulk_writes(mocker):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+
+    memory = AsyncMemory()
+    memory.config = mocker.MagicMock()
+    memory.config.llm.config = {}
+    memory.db = mocker.MagicMock()
+
+    result = await memory.add_batch(
+        [
+            {"messages": "I like pizza", "user_id": "alice", "infer": False},
+            {"messages": "I live in Paris", "user_id": "bob", "infer": False},
+        ],
+        concurrency=2,
+    )
+
+    assert [item["status"] for item in result["results"]] == ["success", "success"]
+    memory.vector_store.insert.assert_called_once()
+    assert len(memory.vector_store.insert.call_args.kwargs["ids"]) == 2
+    memory.db.add_history.assert_not_called()
+    assert len(memory.db.batch_add_history.call_args.args[0]) == 2
+
+
+SINGLE_PASS_RESPONSE = """{
+    "facts": ["Lives in Berlin", "Likes techno"],
+    "memory": [
+        {"id": "0", "text": "Lives in Berlin", "event": "UPDATE", "old_memory": "Lives in Paris"},
+        {"id": "1", "text": "Likes techno", "event": "ADD"}
+    ]
+}"""
+
+
+def _single_pass_memory(memory, mocker):
+    memory.config = mocker.MagicMock()
+    memory.config.add_mode = "single_pass"
+    memory.config.custom_fact_extraction_prompt = None
+    memory.config.custom_update_memory_prompt = None
+    memory.db = mocker.MagicMock()
+    memory.api_version = "v1.1"
+    memory.llm.generate_response.return_value = SINGLE_PASS_RESPONSE
+    memory.vector_store.search.return_value = [MagicMock(id="existing-id", payload={"data": "Lives in Paris"})]
+    memory.vector_store.get.return_value = MagicMock(payload={"data": "Lives in Paris", "user_id": "alice"})
+    return memory
+
+
+class TestSinglePassAdd:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        return _single_pass_memory(Memory(), mocker)
+
+    def test_single_pass_uses_one_llm_call(self, mock_memory):
+        messages = [
+            {"role": "user", "content": "I moved to Berlin"},
+            {"role": "assistant", "content": "Nice city!"},
+            {"role": "user", "content": "I like techno"},
+        ]
+
+        result = mock_memory._add_to_vector_store(messages, {"user_id": "alice"}, {"user_id": "alice"}, infer=True)
+
+        assert mock_memory.llm.generate_response.call_count == 1
+        assert mock_memory.embedding_model.embed_batch.call_args_list[0].args == (
+            ["I moved to Berlin", "I like techno"],
+            "search",
+        )
+        assert [call.kwargs["query"] for call in mock_memory.vector_store.search.call_args_list] == [
+            "I moved to Berlin",
+            "I like techno",
+        ]
+        assert all(call.kwargs["filters"] == {"user_id": "alice"} for call in mock_memory.vector_store.search.call_args_list)
+
+        assert [(item["event"], item["memory"]) for item in result] == [
+            ("UPDATE", "Lives in Berlin"),
+            ("ADD", "Likes techno"),
+        ]
+        assert result[0]["id"] == "existing-id"
+        mock_memory.vector_store.update.assert_called_once()
+        mock_memory.vector_store.insert.assert_called_once()
+        mock_memory.embedding_model.embed.assert_not_called()
+
+    def test_single_pass_invalid_response(self, mock_memory, caplog):
+        mock_memory.llm.generate_response.return_value = "not json"
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._add_to_vector_store(
+                [{"role": "user", "content": "test"}], {}, {"user_id": "alice"}, infer=True
+            )
+
+        assert result == []
+        assert mock_memory.llm.generate_response.call_count == 1
+        assert "Invalid JSON response" in caplog.text
+        mock_memory.vector_store.insert.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_single_pass_uses_one_llm_call(mocker):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = _single_pass_memory(AsyncMemory(), mocker)
+
+    result = await memory._add_to_vector_store(
+        [{"role": "user", "content": "I moved to Berlin and I like techno"}],
+        {"user_id": "alice"},
+        {"user_id": "alice"},
+        infer=True,
+    )
+
+    assert memory.llm.generate_response.call_count == 1
+    memory.vector_store.search.assert_called_once()
+    assert sorted(item["event"] for item in result) == ["ADD", "UPDATE"]
+
+
+def test_enqueue_add_runs_add_in_background(mocker, tmp_path):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = Memory(MemoryConfig(add_queue={"path": str(tmp_path / "add_queue.db")}))
+    memory.vector_store.get.return_value = None
+    add = mocker.patch.object(memory, "_add", return_value={"results": [{"id": "1", "memory": "Likes tea"}]})
+
+    with pytest.raises(Mem0ValidationError):
+        memory.enqueue_add("I like tea")
+
+    ticket_id = memory.enqueue_add("I like tea", user_id="alice", metadata={"source": "chat"})
+    status = memory._add_queue.wait(ticket_id, timeout=5)
+    memory.close()
+
+    assert status["status"] == "done"
+    assert status["result"] == {"results": [{"id": "1", "memory": "Likes tea"}]}
+    add.assert_called_once_with(
+        messages="I like tea",
+        user_id="alice",
+        agent_id=None,
+        run_id=None,
+        metadata={"source": "chat"},
+        infer=True,
+        memory_type=None,
+        prompt=None,
+        journal=mocker.ANY,
+    )
+    assert add.call_args.kwargs["journal"].ticket_id == ticket_id
+    assert memory.get_add_status(ticket_id)["status"] == "done"
+    assert memory.get_add_status("unknown") is None
+    memory.close()
+
+
+def test_add_queue_file_is_keyed_by_vector_store_collection(mocker, tmp_path):
+    history_db_path = str(tmp_path / "history.db")
+    paths = []
+    for collection_name in ("alice_memories", "bob_memories", "alice_memories"):
+        _setup_mocks(mocker)
+        config = MemoryConfig(
+            history_db_path=history_db_path,
+            vector_store={"provider": "qdrant", "config": {"collection_name": collection_name, "path": str(tmp_path)}},
+        )
+        paths.append(Memory(config)._add_queue_path())
+
+    assert paths[0] == paths[2] != paths[1]
+    assert all(path.startswith(str(tmp_path)) for path in paths)
+
+
+def test_replayed_queued_add_returns_the_memories_it_already_added(mocker, tmp_path):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = Memory(MemoryConfig(add_queue={"path": str(tmp_path / "add_queue.db")}))
+    memory.llm.generate_response.side_effect = [
+        '{"facts": ["Likes tea"]}',
+        '{"memory": [{"id": "0", "text": "Likes tea", "event": "ADD"}]}',
+    ]
+    stored = {}
+    memory.vector_store.insert.side_effect = lambda vectors, ids, payloads: stored.update(zip(ids, payloads))
+    memory.vector_store.get.side_effect = lambda vector_id: (
+        MagicMock(id=vector_id, payload=stored[vector_id]) if vector_id in stored else None
+    )
+
+    first = memory._run_queued_add("ticket-1", messages="I like tea", user_id="alice")
+    # The call is handed over again, e.g. after a crash before its ticket was marked as done
+    replayed = memory._run_queued_add("ticket-1", messages="I like tea", user_id="alice")
+    memory.close()
+
+    assert memory.vector_store.insert.call_count == 1
+    assert memory.llm.generate_response.call_count == 2
+    assert [item["event"] for item in first["results"]] == ["ADD"]
+    assert replayed == {"results": [{"id": first["results"][0]["id"], "memory": "Likes tea", "event": "ADD"}]}
+
+
+class _Crash(BaseException):
+    """Stops a run the way a killed process would, past the `except Exception` handlers."""
+
+
+def _memory_with_recorded_writes(mocker, tmp_path, stored):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = Memory(MemoryConfig(add_queue={"path": str(tmp_path / "add_queue.db")}))
+    memory.db = mocker.MagicMock()
+    memory.vector_store.get.side_effect = lambda vector_id: (
+        MagicMock(id=vector_id, payload=stored[vector_id]) if vector_id in stored else None
+    )
+    memory.vector_store.search.return_value = [MagicMock(id="mem-1", payload=stored["mem-1"])]
+    memory.llm.generate_response.side_effect = [
+        '{"facts": ["Lives in Berlin", "Likes techno", "Plays chess"]}',
+        '{"memory": [{"id": "0", "text": "Lives in Berlin", "event": "UPDATE", "old_memory": "Lives in Paris"}, '
+        '{"id": "1", "text": "Likes techno", "event": "ADD"}, {"id": "2", "text": "Plays chess", "event": "ADD"}]}',
+    ]
+    return memory
+
+
+@pytest.mark.parametrize("written_before_crash", [False, True])
+def test_queued_add_resumes_an_interrupted_run_without_repeating_applied_actions(
+    mocker, tmp_path, written_before_crash
+):
+    stored = {"mem-1": {"data": "Lives in Paris", "user_id": "alice"}}
+    memory = _memory_with_recorded_writes(mocker, tmp_path, stored)
+    inserted = []
+
+    def insert(vectors, ids, payloads):
+        if len(inserted) == 1 and not written_before_crash:
+            raise _Crash()
+        stored.update(zip(ids, payloads))
+        inserted.extend(ids)
+        if len(inserted) == 2:
+            raise _Crash()
+
+    memory.vector_store.insert.side_effect = insert
+
+    with pytest.raises(_Crash):
+        memory._run_queued_add("ticket-1", messages="I moved to Berlin", user_id="alice")
+    memory.vector_store.insert.side_effect = lambda vectors, ids, payloads: inserted.extend(ids)
+    result = memory._run_queued_add("ticket-1", messages="I moved to Berlin", user_id="alice")
+    memory.close()
+
+    # Neither the LLM planning nor the recorded UPDATE and first ADD run again
+    assert memory.llm.generate_response.call_count == 2
+    memory.vector_store.update.assert_called_once()
+    # The second ADD is written once, whether or not it reached the store before the crash
+    assert len(inserted) == len(set(inserted)) == 2
+    assert [(item["event"], item["memory"]) for item in result["results"]] == [
+        ("UPDATE", "Lives in Berlin"),
+        ("ADD", "Likes techno"),
+        ("ADD", "Plays chess"),
+    ]
+    assert [item["id"] for item in result["results"][1:]] == inserted
+
+
+@pytest.mark.parametrize(
+    "missing",
+    [IndexError("list index out of range"), KeyError("memory_id"), TypeError("'NoneType' is not subscriptable"), []],
+)
+def test_enqueue_add_runs_on_stores_that_raise_or_return_empty_for_missing_ids(mocker, tmp_path, missing):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+    memory = Memory(MemoryConfig(add_queue={"path": str(tmp_path / "add_queue.db")}))
+    memory.db = mocker.MagicMock()
+    if isinstance(missing, Exception):
+        memory.vector_store.get.side_effect = missing
+    else:
+        memory.vector_store.get.return_value = missing
+
+    ticket_id = memory.enqueue_add("I like tea", user_id="alice", infer=False)
+    status = memory._add_queue.wait(ticket_id, timeout=5)
+    memory.close()
+
+    assert status["status"] == "done"
+    assert status["attempts"] == 1
+    assert [item["memory"] for item in status["result"]["results"]] == ["I like tea"]
+    memory.vector_store.insert.assert_called_once()
+
+
+class TestSearchCache:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory(MemoryConfig(search_cache={"max_size": 10}))
+        memory.db = mocker.MagicMock()
+        memory.vector_store.search.return_value = [
+            MagicMock(id="1", score=0.9, payload={"data": "Likes tea", "user_id": "alice"})
+        ]
+        return memory
+
+    def test_repeated_search_is_served_from_cache(self, mock_memory):
+        first = mock_memory.search("what does alice drink", user_id="alice")
+        second = mock_memory.search("what does alice drink", user_id="alice")
+
+        assert first == second
+        assert mock_memory.vector_store.search.call_count == 1
+        assert mock_memory.embedding_model.embed.call_count == 1
+        assert mock_memory.search_cache.stats()["hits"] == 1
+
+    def test_write_to_scope_invalidates_cache(self, mock_memory):
+        mock_memory.search("what does alice drink", user_id="alice")
+        mock_memory.search("what does bob drink", user_id="bob")
+
+        mock_memory._create_memory("Likes coffee", {}, metadata={"user_id": "alice"})
+        mock_memory.search("what does alice drink", user_id="alice")
+        mock_memory.search("what does bob drink", user_id="bob")
+
+        assert mock_memory.vector_store.search.call_count == 3
+
+        mock_memory.vector_store.get.return_value = MagicMock(payload={"data": "Likes tea", "user_id": "bob"})
+        mock_memory._delete_memory("1")
+        mock_memory.search("what does bob drink", user_id="bob")
+
+        assert mock_memory.vector_store.search.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_call_provider_prefers_native_coroutine(mocker):
+    from mem0.memory.main import _call_provider
+
+    class NativeProvider:
+        def embed(self, text, memory_action=None):
+            raise AssertionError("sync method should not be used")
+
+        async def aembed(self, text, memory_action=None):
+            return [len(text), memory_action]
+
+    to_thread = mocker.patch("mem0.memory.main.asyncio.to_thread")
+
+    assert await _call_provider(NativeProvider(), "embed", "abc", "search") == [3, "search"]
+    to_thread.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_call_provider_falls_back_to_thread_for_sync_providers():
+    from mem0.memory.main import _call_provider
+
+    provider = MagicMock()
+    provider.search.return_value = ["hit"]
+
+    assert await _call_provider(provider, "search", query="q", vectors=[0.1]) == ["hit"]
+    provider.search.assert_called_once_with(query="q", vectors=[0.1])
+
+
+@pytest.mark.asyncio
+async def test_async_iter_all_streams_pages(mocker):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+
+    memory = AsyncMemory()
+    records = [MagicMock(id=str(i), payload={"data": f"memory {i}", "user_id": "alice"}) for i in range(5)]
+    memory.vector_store.iter_list.return_value = iter(records)
+
+    results = [item async for item in memory.iter_all(user_id="alice", page_size=2)]
+
+    assert [item["id"] for item in results] == ["0", "1", "2", "3", "4"]
+    assert results[4]["memory"] == "memory 4"
+    memory.vector_store.iter_list.assert_called_once_with(filters={"user_id": "alice"}, page_size=2)
+
+
+@pytest.mark.asyncio
+async def test_async_delete_all_deletes_by_filter(mocker):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+
+    memory = AsyncMemory()
+    memory.db = mocker.MagicMock()
+    records = [MagicMock(id=str(i), payload={"data": f"memory {i}", "actor_id": "bob"}) for i in range(150)]
+    memory.vector_store.iter_list.return_value = iter(records)
+
+    await memory.delete_all(user_id="alice")
+
+    memory.vector_store.iter_list.assert_called_once_with(filters={"user_id": "alice"})
+    memory.vector_store.delete_by_filter.assert_called_once_with({"user_id": "alice"})
+    memory.vector_store.delete.assert_not_called()
+    memory.db.batch_add_history.assert_called_once()
+    (history,) = memory.db.batch_add_history.call_args.args
+    assert len(history) == 150
+    assert history[149] == {
+        "memory_id": "149",
+        "old_memory": "memory 149",
+        "new_memory": None,
+        "event": "DELETE",
+        "actor_id": "bob",
+        "role": None,
+        "is_deleted": 1,
+    }
+
+
+class _ListLimitedStore(VectorStoreBase):
+    """Keeps records in memory and lists at most `limit` of them, like stores without a native `iter_list`."""
+
+    create_col = insert = search = update = get = list_cols = delete_col = col_info = reset = None
+
+    def __init__(self, records, limit):
+        self.records = {record.id: record for record in records}
+        self.limit = limit
+
+    def list(self, filters=None, limit=None):
+        return [list(self.records.values())[: self.limit]]
+
+    def delete(self, vector_id):
+        del self.records[vector_id]
+
+    def delete_by_filter(self, filters):
+        raise AssertionError("delete_by_filter would delete memories the default iter_list did not list")
+
+
+def test_delete_all_deletes_listed_memories_when_iter_list_stops_at_the_list_limit(mocker):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+
+    memory = Memory()
+    memory.db = mocker.MagicMock()
+    records = [MagicMock(id=str(i), payload={"data": f"memory {i}"}) for i in range(25)]
+    memory.vector_store = _ListLimitedStore(records, limit=10)
+
+    memory.delete_all(user_id="alice")
+
+    assert memory.vector_store.records == {}
+    (history,) = memory.db.batch_add_history.call_args.args
+    assert [record["memory_id"] for record in history] == [str(i) for i in range(25)]
+
+
+def test_iter_all_warns_when_the_store_has_no_native_iter_list(mocker, caplog):
+    _setup_mocks(mocker)
+    mocker.patch("mem0.memory.main.capture_event")
+
+    memory = Memory()
+    records = [MagicMock(id=str(i), payload={"data": f"memory {i}"}) for i in range(25)]
+    memory.vector_store = _ListLimitedStore(records, limit=10)
+
+    with caplog.at_level(logging.WARNING, logger="mem0.memory.main"):
+        results = list(memory.iter_all(user_id="alice"))
+
+    assert len(results) == 10
+    assert "_ListLimitedStore has no native iter_list" in caplog.text
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+pytest.importorskip("langchain_memgraph")
+
+from mem0.memory.memgraph_memory import MemoryGraph  # noqa: E402
+
+
+@pytest.fixture
+def memgraph():
+    config = Mock()
+    config.graph_store.config.url = "bolt://localhost:7687"
+    config.graph_store.config.username = "memgraph"
+    config.graph_store.config.password = "password"
+    config.graph_store.threshold = 0.7
+    config.graph_store.llm = None
+    config.embedder.config = {"embedding_dims": 4}
+
+    embedding_model = Mock()
+    embedding_model.embed_batch.side_effect = lambda texts: [[0.1, 0.2, 0.3, 0.4] for _ in texts]
+    with patch("mem0.memory.memgraph_memory.Memgraph") as memgraph_client, patch(
+        "mem0.memory.memgraph_memory.EmbedderFactory.create", return_value=embedding_model
+    ), patch("mem0.memory.memgraph_memory.LlmFactory.create", return_value=Mock()):
+        memgraph_client.return_value = MagicMock()
+        graph = MemoryGraph(config)
+    graph.graph.query.reset_mock()
+    return graph
+
+
+def test_add_entities_batches_lookups_and_writes(memgraph):
+    to_be_added = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+    ]
+    memgraph.graph.query.side_effect = [
+        [{"name": "alice", "id": 1}],
+        [{"name": "pizza", "id": 2}, {"name": "paris", "id": 3}],
+        [
+            {"index": 0, "source": "alice", "relationship": "likes", "target": "pizza"},
+            {"index": 1, "source": "alice", "relationship": "lives_in", "target": "paris"},
+        ],
+    ]
+
+    result = memgraph._add_entities(
+        to_be_added, {"user_id": "alice", "agent_id": "bot"}, {"alice": "person", "pizza": "food", "paris": "city"}
+    )
+
+    assert memgraph.graph.query.call_count == 3
+    lookup, nodes, relationships = memgraph.graph.query.call_args_list
+
+    assert "UNWIND $entities AS entity" in lookup.args[0]
+    assert 'CALL vector_search.search("memzero", 1, entity.embedding)' in lookup.args[0]
+    assert "AND candidate.agent_id = $agent_id" in lookup.args[0]
+    assert [entity["name"] for entity in lookup.kwargs["params"]["entities"]] == ["alice", "pizza", "paris"]
+
+    assert [row["name"] for row in nodes.kwargs["params"]["rows"]] == ["pizza", "paris"]
+    assert "MERGE (n:food:Entity {name: row.name, user_id: $user_id, agent_id: $agent_id})" in nodes.args[0]
+    assert "MERGE (n:city:Entity {name: row.name, user_id: $user_id, agent_id: $agent_id})" in nodes.args[0]
+
+    assert [(row["source_id"], row["destination_id"]) for row in relationships.kwargs["params"]["rows"]] == [
+        (1, 2),
+        (1, 3),
+    ]
+    assert "MERGE (source)-[r:likes]->(destination)" in relationships.args[0]
+    assert "MERGE (source)-[r:lives_in]->(destination)" in relationships.args[0]
+
+    assert result == [
+        [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "paris"}],
+    ]
+
+
+def test_add_entities_skips_node_merge_when_all_resolved(memgraph):
+    memgraph.graph.query.side_effect = [
+        [{"name": "alice", "id": 1}, {"name": "pizza", "id": 2}],
+        [{"index": 0, "source": "alice", "relationship": "likes", "target": "pizza"}],
+    ]
+
+    memgraph._add_entities([{"source": "alice", "relationship": "likes", "destination": "pizza"}], {"user_id": "alice"}, {})
+
+    assert memgraph.graph.query.call_count == 2
+
+
+def test_delete_entities_in_one_statement(memgraph):
+    memgraph.graph.query.return_value = [{"index": 0, "source": "alice", "target": "pizza", "relationship": "likes"}]
+    to_be_deleted = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+    ]
+
+    result = memgraph._delete_entities(to_be_deleted, {"user_id": "alice"})
+
+    assert result == [[{"source": "alice", "target": "pizza", "relationship": "likes"}], []]
+    memgraph.graph.query.assert_called_once()
+    cypher = memgraph.graph.query.call_args.args[0]
+    assert "UNWIND $rows AS row" in cypher
+    assert "WHERE type(r) = row.relationship" in cypher
+    assert "agent_id" not in cypher
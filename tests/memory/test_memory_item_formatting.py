@@ -0,0 +1,66 @@
+from typing import Dict, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from mem0.configs.base import MemoryItem
+from mem0.memory.main import _format_memory_item
+
+
+class OutputData(BaseModel):
+    id: Optional[str]
+    score: Optional[float]
+    payload: Optional[Dict]
+
+
+PROMOTED_PAYLOAD_KEYS = ["user_id", "agent_id", "run_id", "actor_id", "role"]
+CORE_AND_PROMOTED_KEYS = {"data", "hash", "created_at", "updated_at", "id", *PROMOTED_PAYLOAD_KEYS}
+
+
+def _format_with_model_dump(mem, include_score=True):
+    """The per-record pydantic formatting `_format_memory_item` replaces, kept as the reference."""
+    item = MemoryItem(
+        id=mem.id,
+        memory=mem.payload.get("data", ""),
+        hash=mem.payload.get("hash"),
+        created_at=mem.payload.get("created_at"),
+        updated_at=mem.payload.get("updated_at"),
+        score=mem.score,
+    ).model_dump(exclude=None if include_score else {"score"})
+
+    for key in PROMOTED_PAYLOAD_KEYS:
+        if key in mem.payload:
+            item[key] = mem.payload[key]
+
+    additional_metadata = {k: v for k, v in mem.payload.items() if k not in CORE_AND_PROMOTED_KEYS}
+    if additional_metadata:
+        item["metadata"] = additional_metadata
+    return item
+
+
+def _make_records(count):
+    records = []
+    for index in range(count):
+        payload = {
+            "data": f"Memory number {index}",
+            "hash": f"hash-{index}",
+            "created_at": "2025-01-01T00:00:00-08:00",
+            "user_id": f"user-{index % 10}",
+        }
+        if index % 2:
+            payload.update(agent_id="agent", role="user", updated_at="2025-01-02T00:00:00-08:00")
+        if index % 3:
+            payload.update(category="food", tags=["a", "b"])
+        records.append(OutputData(id=f"id-{index}", score=1 / (index + 1), payload=payload))
+    return records
+
+
+@pytest.mark.parametrize("include_score", [True, False])
+def test_matches_model_dump_formatting(include_score):
+    records = _make_records(12) + [OutputData(id="empty", score=None, payload={})]
+
+    for mem in records:
+        expected = _format_with_model_dump(mem, include_score)
+        actual = _format_memory_item(mem, mem.score, include_score=include_score)
+        assert actual == expected
+        assert list(actual) == list(expected)
@@ -262,11 +262,11 @@ class TestNeo4jCypherSyntaxFix:
         with open(graph_memory_path, 'r') as f:
             content = f.read()
         
-        # Check that search methods handle both agent_id and run_id
-        assert 'where_conditions.append("source_candidate.agent_id = $agent_id")' in content
-        assert 'where_conditions.append("source_candidate.run_id = $run_id")' in content
-        assert 'where_conditions.append("destination_candidate.agent_id = $agent_id")' in content
-        assert 'where_conditions.append("destination_candidate.run_id = $run_id")' in content
+        # Check that the entity lookup scopes its candidates with every filter, agent_id and run_id included
+        assert 'for key in ("agent_id", "run_id"):' in content
+        assert 'params[key] = filters[key]' in content
+        assert 'f"candidate.{key} = ${key}" for key in self._scope_params(filters)' in content
+        assert 'f"node.{key} = ${key}" for key in self._scope_params(filters)' in content
 
     def test_add_entities_integration(self):
         """Test that both agent_id and run_id are properly integrated into add_entities"""
@@ -280,13 +280,9 @@ class TestNeo4jCypherSyntaxFix:
         with open(graph_memory_path, 'r') as f:
             content = f.read()
         
-        # Check that add_entities handles both agent_id and run_id
-        assert 'agent_id = filters.get("agent_id", None)' in content
-        assert 'run_id = filters.get("run_id", None)' in content
-        
-        # Check that merge properties include both
-        assert 'if agent_id:' in content
-        assert 'if run_id:' in content
-        assert 'merge_props.append("agent_id: $agent_id")' in content
-        assert 'merge_props.append("run_id: $run_id")' in content
+        # Check that the scope properties of merged and deleted nodes include both
+        assert 'props.append("agent_id: $agent_id")' in content
+        assert 'props.append("run_id: $run_id")' in content
+        assert 'merge_props_str = ", ".join(["name: row.name"] + self._scope_properties(filters))' in content
+        assert 'node_props_str = ", ".join(self._scope_properties(filters))' in content
 
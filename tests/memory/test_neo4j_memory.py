@@ -0,0 +1,377 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from mem0.memory.graph_memory import _ENTITY_VECTOR_INDEX, _VECTOR_INDEX_CANDIDATES, MemoryGraph
+
+
+def _config(base_label=True, vector_index=True):
+    config = Mock()
+    config.graph_store.config.url = "bolt://localhost:7687"
+    config.graph_store.config.username = "neo4j"
+    config.graph_store.config.password = "password"
+    config.graph_store.config.database = None
+    config.graph_store.config.base_label = base_label
+    config.graph_store.config.vector_index = vector_index
+    config.graph_store.threshold = 0.7
+    config.graph_store.llm = None
+    return config
+
+
+@pytest.fixture
+def make_graph():
+    def make(base_label=True, vector_index=True, dims=4):
+        embedding_model = Mock()
+        embedding_model.config.embedding_dims = dims
+        embedding_model.embed_batch.side_effect = lambda texts: [[0.1, 0.2, 0.3, 0.4] for _ in texts]
+        with patch("mem0.memory.graph_memory.Neo4jGraph") as neo4j_graph, patch(
+            "mem0.memory.graph_memory.EmbedderFactory.create", return_value=embedding_model
+        ), patch("mem0.memory.graph_memory.LlmFactory.create", return_value=Mock()):
+            neo4j_graph.return_value = MagicMock()
+            return MemoryGraph(_config(base_label, vector_index))
+
+    return make
+
+
+def _index_row(key, matches, fetched, lowest):
+    return {"key": key, "matches": matches, "fetched": fetched, "lowest": lowest}
+
+
+def test_init_creates_vector_index(make_graph):
+    graph = make_graph()
+
+    assert graph.vector_index == _ENTITY_VECTOR_INDEX
+    statement = graph.graph.query.call_args_list[-1].args[0]
+    assert "CREATE VECTOR INDEX entity_embedding IF NOT EXISTS FOR (n :`__Entity__`) ON (n.embedding)" in statement
+    assert "`vector.dimensions`: 4" in statement
+    assert "'cosine'" in statement
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"base_label": False}, {"vector_index": False}, {"dims": None}],
+)
+def test_init_skips_vector_index(make_graph, kwargs):
+    graph = make_graph(**kwargs)
+
+    assert graph.vector_index is None
+    assert not any("VECTOR INDEX" in c.args[0] for c in graph.graph.query.call_args_list)
+
+
+def test_init_falls_back_when_vector_index_unsupported():
+    def query(statement, *args, **kwargs):
+        if "VECTOR INDEX" in statement:
+            raise Exception("Invalid input 'VECTOR'")
+        return []
+
+    embedding_model = Mock()
+    embedding_model.config.embedding_dims = 4
+    with patch("mem0.memory.graph_memory.Neo4jGraph") as neo4j_graph, patch(
+        "mem0.memory.graph_memory.EmbedderFactory.create", return_value=embedding_model
+    ), patch("mem0.memory.graph_memory.LlmFactory.create", return_value=Mock()):
+        neo4j_graph.return_value.query.side_effect = query
+        graph = MemoryGraph(_config())
+
+    assert graph.vector_index is None
+
+
+def test_search_nodes_queries_vector_index(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    graph.graph.query.return_value = [
+        _index_row(0, [{"id": "4:abc:1", "similarity": 0.95}, {"id": "4:abc:2", "similarity": 0.8}], 3, 0.2),
+        _index_row(1, [], 3, 0.2),
+    ]
+
+    node_ids = graph._search_nodes({"alice": [0.1] * 4, "pizza": [0.2] * 4}, {"user_id": "alice", "agent_id": "bot"})
+
+    assert node_ids == {"alice": "4:abc:1"}
+    assert graph.graph.query.call_count == 1
+    cypher, params = graph.graph.query.call_args.args[0], graph.graph.query.call_args.kwargs["params"]
+    assert "UNWIND $entities AS entity" in cypher
+    assert "db.index.vector.queryNodes($index_name, $candidates, entity.embedding)" in cypher
+    assert "node.user_id = $user_id AND node.agent_id = $agent_id" in cypher
+    assert "vector.similarity.cosine" not in cypher
+    assert [entity["key"] for entity in params["entities"]] == [0, 1]
+    assert params["candidates"] == _VECTOR_INDEX_CANDIDATES
+    assert params["agent_id"] == "bot"
+
+
+def test_vector_index_widens_candidates_while_scope_may_hide_matches(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    graph.graph.query.side_effect = [
+        [_index_row(0, [], _VECTOR_INDEX_CANDIDATES, 0.97), _index_row(1, [], 12, 0.1)],
+        [_index_row(0, [{"id": "4:abc:7", "similarity": 0.96}], 37, 0.1)],
+    ]
+
+    node_ids = graph._search_nodes({"alice": [0.1] * 4, "pizza": [0.2] * 4}, {"user_id": "alice"})
+
+    assert node_ids == {"alice": "4:abc:7"}
+    calls = [c.kwargs["params"] for c in graph.graph.query.call_args_list]
+    assert [params["candidates"] for params in calls] == [_VECTOR_INDEX_CANDIDATES, _VECTOR_INDEX_CANDIDATES * 4]
+    assert [entity["key"] for entity in calls[1]["entities"]] == [0]
+
+
+def test_vector_index_falls_back_to_scan_past_max_candidates(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+
+    def query(cypher, params):
+        if "queryNodes" in cypher:
+            return [_index_row(entity["key"], [], params["candidates"], 0.99) for entity in params["entities"]]
+        return [{"name": "alice", "id": "4:abc:3"}]
+
+    graph.graph.query.side_effect = query
+
+    assert graph._search_nodes({"alice": [0.1] * 4}, {"user_id": "alice"}) == {"alice": "4:abc:3"}
+    assert "vector.similarity.cosine(candidate.embedding, entity.embedding)" in graph.graph.query.call_args.args[0]
+    assert graph.vector_index == _ENTITY_VECTOR_INDEX
+
+
+def test_vector_index_failure_falls_back_to_scan(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    graph.graph.query.side_effect = [Exception("There is no such vector schema index"), []]
+
+    assert graph._search_nodes({"alice": [0.1] * 4}, {"user_id": "alice"}) == {}
+
+    assert graph.vector_index is None
+    assert "vector.similarity.cosine" in graph.graph.query.call_args.args[0]
+
+
+def test_search_graph_db_expands_index_matches(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    relation = {"source": "alice", "relationship": "likes", "destination": "pizza", "similarity": 0.93}
+    graph.graph.query.side_effect = [
+        [_index_row(0, [{"id": "4:abc:1", "similarity": 0.93}], 2, 0.1), _index_row(1, [], 2, 0.1)],
+        [relation],
+    ]
+
+    result = graph._search_graph_db(["alice", "unknown"], {"user_id": "alice"})
+
+    assert result == [relation]
+    assert graph.graph.query.call_count == 2
+    cypher, params = graph.graph.query.call_args.args[0], graph.graph.query.call_args.kwargs["params"]
+    assert "UNWIND $matches AS match" in cypher
+    assert "vector.similarity.cosine" not in cypher
+    assert params["matches"] == [{"id": "4:abc:1", "similarity": 0.93}]
+
+
+def test_search_graph_db_scans_without_vector_index(make_graph):
+    graph = make_graph(base_label=False)
+    graph.graph.query.reset_mock()
+    graph.graph.query.return_value = []
+
+    graph._search_graph_db(["alice"], {"user_id": "alice"})
+
+    cypher = graph.graph.query.call_args.args[0]
+    assert "vector.similarity.cosine(n.embedding, $n_embedding)" in cypher
+    assert "queryNodes" not in cypher
+
+
+def test_add_entities_batches_lookups_and_writes(make_graph):
+    graph = make_graph(base_label=False)
+    graph.graph.query.reset_mock()
+    to_be_added = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        {"source": "bob", "relationship": "likes", "destination": "pizza"},
+    ]
+    graph.graph.query.side_effect = [
+        [{"name": "alice", "id": "4:abc:1"}],
+        [{"name": "pizza", "id": "4:abc:2"}, {"name": "paris", "id": "4:abc:3"}, {"name": "bob", "id": "4:abc:4"}],
+        [
+            {"index": 0, "source": "alice", "relationship": "likes", "target": "pizza"},
+            {"index": 1, "source": "alice", "relationship": "lives_in", "target": "paris"},
+            {"index": 2, "source": "bob", "relationship": "likes", "target": "pizza"},
+        ],
+    ]
+
+    result = graph._add_entities(
+        to_be_added, {"user_id": "alice"}, {"alice": "person", "pizza": "food", "paris": "city", "bob": "person"}
+    )
+
+    assert graph.graph.query.call_count == 3
+    graph.embedding_model.embed_batch.assert_called_once_with(["alice", "pizza", "paris", "bob"])
+    lookup, nodes, relationships = graph.graph.query.call_args_list
+
+    assert [entity["name"] for entity in lookup.kwargs["params"]["entities"]] == ["alice", "pizza", "paris", "bob"]
+
+    node_params = nodes.kwargs["params"]
+    assert [row["name"] for row in node_params["rows"]] == ["pizza", "paris", "bob"]
+    assert node_params["node_types"] == ["food", "city", "person"]
+    assert "UNWIND $rows AS row" in nodes.args[0]
+    assert "MERGE (n:`food` {name: row.name, user_id: $user_id})" in nodes.args[0]
+    assert "CALL db.create.setNodeVectorProperty(n, 'embedding', row.embedding)" in nodes.args[0]
+
+    relationship_params = relationships.kwargs["params"]
+    assert relationship_params["relationships"] == ["likes", "lives_in"]
+    assert [(row["source_id"], row["destination_id"]) for row in relationship_params["rows"]] == [
+        ("4:abc:1", "4:abc:2"),
+        ("4:abc:1", "4:abc:3"),
+        ("4:abc:4", "4:abc:2"),
+    ]
+    assert "MERGE (source)-[r:likes]->(destination)" in relationships.args[0]
+    assert "MERGE (source)-[r:lives_in]->(destination)" in relationships.args[0]
+
+    assert result == [
+        [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "paris"}],
+        [{"source": "bob", "relationship": "likes", "target": "pizza"}],
+    ]
+
+
+def test_add_entities_sets_type_labels_under_base_label(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    graph.graph.query.side_effect = [
+        [_index_row(0, [], 0, None), _index_row(1, [], 0, None)],
+        [{"name": "alice", "id": "4:abc:1"}, {"name": "pizza", "id": "4:abc:2"}],
+        [{"index": 0, "source": "alice", "relationship": "likes", "target": "pizza"}],
+    ]
+
+    graph._add_entities(
+        [{"source": "alice", "relationship": "likes", "destination": "pizza"}],
+        {"user_id": "alice", "run_id": "run-1"},
+        {"alice": "person", "pizza": "food"},
+    )
+
+    cypher = graph.graph.query.call_args_list[1].args[0]
+    assert "MERGE (n :`__Entity__` {name: row.name, user_id: $user_id, run_id: $run_id})" in cypher
+    assert "SET n:`person`" in cypher
+    assert "SET n:`food`" in cypher
+
+
+def test_add_entities_without_relations(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+
+    assert graph._add_entities([], {"user_id": "alice"}, {}) == []
+    graph.graph.query.assert_not_called()
+
+
+def test_delete_entities_in_one_statement(make_graph):
+    graph = make_graph()
+    graph.graph.query.reset_mock()
+    graph.graph.query.return_value = [{"index": 1, "source": "alice", "target": "paris", "relationship": "lives_in"}]
+    to_be_deleted = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+    ]
+
+    result = graph._delete_entities(to_be_deleted, {"user_id": "alice", "agent_id": "bot"})
+
+    assert result == [[], [{"source": "alice", "target": "paris", "relationship": "lives_in"}]]
+    graph.graph.query.assert_called_once()
+    cypher, params = graph.graph.query.call_args.args[0], graph.graph.query.call_args.kwargs["params"]
+    assert "UNWIND $rows AS row" in cypher
+    assert "{name: row.source, user_id: $user_id, agent_id: $agent_id}" in cypher
+    assert "WHERE type(r) = row.relationship" in cypher
+    assert [row["relationship"] for row in params["rows"]] == ["likes", "lives_in"]
+    assert params["agent_id"] == "bot"
+
+
+def _extract_graph_response(entities, relations):
+    return {"tool_calls": [{"name": "extract_graph", "arguments": {"entities": entities, "relations": relations}}]}
+
+
+@pytest.mark.parametrize("search_output", [[], [{"source": "alice", "relationship": "likes", "destination": "sushi"}]])
+def test_add_combined_extraction(make_graph, search_output):
+    graph = make_graph()
+    graph.config.graph_store.extraction_mode = "combined"
+    graph.llm.generate_response.return_value = _extract_graph_response(
+        [{"entity": "Alice", "entity_type": "Person"}, {"entity": "Pizza", "entity_type": "Food"}],
+        [{"source": "Alice", "relationship": "Likes", "destination": "Pizza"}],
+    )
+    graph._search_graph_db = MagicMock(return_value=search_output)
+    graph._get_delete_entities_from_search_output = MagicMock(return_value=[])
+    graph._delete_entities = MagicMock(return_value=[])
+    graph._add_entities = MagicMock(return_value=[])
+
+    graph.add("Alice likes pizza", {"user_id": "alice"})
+
+    graph.llm.generate_response.assert_called_once()
+    assert graph.llm.generate_response.call_args.kwargs["tools"][0]["function"]["name"] == "extract_graph"
+    assert "user_id: alice" in graph.llm.generate_response.call_args.kwargs["messages"][0]["content"]
+    graph._search_graph_db.assert_called_once_with(node_list=["alice", "pizza"], filters={"user_id": "alice"})
+    assert graph._get_delete_entities_from_search_output.called == bool(search_output)
+    graph._add_entities.assert_called_once_with(
+        [{"source": "alice", "relationship": "likes", "destination": "pizza"}],
+        {"user_id": "alice"},
+        {"alice": "person", "pizza": "food"},
+    )
+
+
+def test_extract_graph_from_data_uses_custom_prompt(make_graph):
+    graph = make_graph()
+    graph.config.graph_store.custom_prompt = "Only extract food preferences."
+    graph.llm.generate_response.return_value = {"tool_calls": []}
+
+    assert graph._extract_graph_from_data("Alice likes pizza", {"user_id": "alice"}) == ({}, [])
+    system_prompt = graph.llm.generate_response.call_args.kwargs["messages"][0]["content"]
+    assert "5. Only extract food preferences." in system_prompt
+    assert "CUSTOM_PROMPT" not in system_prompt
+
+
+def test_search_matches_entities_without_llm(make_graph):
+    graph = make_graph()
+    graph.config.graph_store.entity_matcher = "local"
+    graph.graph.query.return_value = [{"name": "alice"}, {"name": "pizza"}]
+    graph._search_graph_db = MagicMock(return_value=[])
+
+    graph.search("Does Alice like pizza?", {"user_id": "alice", "agent_id": "bot"})
+    graph.search("What food does alice like?", {"user_id": "alice", "agent_id": "bot"})
+
+    graph.llm.generate_response.assert_not_called()
+    load = graph.graph.query.call_args
+    assert "MATCH (n :`__Entity__` {user_id: $user_id, agent_id: $agent_id})" in load.args[0]
+    assert load.kwargs["params"] == {"user_id": "alice", "agent_id": "bot"}
+    assert [c.kwargs["node_list"] for c in graph._search_graph_db.call_args_list] == [["alice", "pizza"], ["alice"]]
+
+
+def test_search_falls_back_to_query_embedding(make_graph):
+    graph = make_graph()
+    graph.config.graph_store.entity_matcher = "local"
+    graph.graph.query.return_value = [{"name": "alice"}]
+    graph._search_graph_db = MagicMock(return_value=[])
+
+    graph.search("What is good to cook tonight?", {"user_id": "bob"})
+
+    graph._search_graph_db.assert_called_once_with(
+        node_list=["What is good to cook tonight?"], filters={"user_id": "bob"}
+    )
+
+
+def test_search_extracts_entities_with_llm_when_opted_in(make_graph):
+    graph = make_graph()
+    graph.config.graph_store.entity_matcher = "llm"
+    graph.llm.generate_response.return_value = {
+        "tool_calls": [
+            {"name": "extract_entities", "arguments": {"entities": [{"entity": "Alice", "entity_type": "person"}]}}
+        ]
+    }
+    graph._search_graph_db = MagicMock(return_value=[])
+
+    graph.search("Does Alice like pizza?", {"user_id": "alice"})
+
+    graph.llm.generate_response.assert_called_once()
+    graph._search_graph_db.assert_called_once_with(node_list=["alice"], filters={"user_id": "alice"})
+
+
+def test_add_refreshes_entity_index(make_graph):
+    graph = make_graph()
+    graph.config.graph_store.extraction_mode = "combined"
+    graph.llm.generate_response.return_value = _extract_graph_response(
+        [{"entity": "Alice", "entity_type": "person"}, {"entity": "Lisbon", "entity_type": "city"}],
+        [{"source": "Alice", "relationship": "lives_in", "destination": "Lisbon"}],
+    )
+    graph._search_graph_db = MagicMock(return_value=[])
+    graph._add_entities = MagicMock(return_value=[])
+    graph.graph.query.return_value = []
+    graph.entity_index.match("", {"user_id": "alice"}, lambda: [])
+
+    graph.add("I moved to Lisbon", {"user_id": "alice"})
+
+    assert graph.entity_index.match("Lisbon?", {"user_id": "alice"}, lambda: []) == ["lisbon"]
@@ -241,54 +241,6 @@ class TestNeptuneMemory(unittest.TestCase):
         self.memory_graph._delete_all_cypher.assert_called_once_with(self.test_filters)
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
-    def test_search_source_node(self):
-        """Test the _search_source_node method."""
-        # Mock embedding
-        mock_embedding = [0.1, 0.2, 0.3]
-
-        # Mock the _search_source_node_cypher method
-        mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_embedding": mock_embedding, "user_id": self.user_id, "threshold": 0.9}
-        self.memory_graph._search_source_node_cypher = MagicMock(return_value=(mock_cypher, mock_params))
-
-        # Mock the graph.query result
-        mock_query_result = [{"id(source_candidate)": 123, "cosine_similarity": 0.95}]
-        self.mock_graph.query.return_value = mock_query_result
-
-        # Call the _search_source_node method
-        result = self.memory_graph._search_source_node(mock_embedding, self.user_id, threshold=0.9)
-
-        # Verify the method calls
-        self.memory_graph._search_source_node_cypher.assert_called_once_with(mock_embedding, self.user_id, 0.9)
-        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
-
-        # Check the result
-        self.assertEqual(result, mock_query_result)
-
-    def test_search_destination_node(self):
-        """Test the _search_destination_node method."""
-        # Mock embedding
-        mock_embedding = [0.1, 0.2, 0.3]
-
-        # Mock the _search_destination_node_cypher method
-        mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"destination_embedding": mock_embedding, "user_id": self.user_id, "threshold": 0.9}
-        self.memory_graph._search_destination_node_cypher = MagicMock(return_value=(mock_cypher, mock_params))
-
-        # Mock the graph.query result
-        mock_query_result = [{"id(destination_candidate)": 456, "cosine_similarity": 0.92}]
-        self.mock_graph.query.return_value = mock_query_result
-
-        # Call the _search_destination_node method
-        result = self.memory_graph._search_destination_node(mock_embedding, self.user_id, threshold=0.9)
-
-        # Verify the method calls
-        self.memory_graph._search_destination_node_cypher.assert_called_once_with(mock_embedding, self.user_id, 0.9)
-        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
-
-        # Check the result
-        self.assertEqual(result, mock_query_result)
-
     def test_search_graph_db(self):
         """Test the _search_graph_db method."""
         # Mock node list
@@ -296,7 +248,7 @@ class TestNeptuneMemory(unittest.TestCase):
 
         # Mock embedding
         mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
+        self.mock_embedding_model.embed_batch.return_value = [mock_embedding, mock_embedding]
 
         # Mock the _search_graph_db_cypher method
         mock_cypher = "MATCH (n) RETURN n"
@@ -312,7 +264,7 @@ class TestNeptuneMemory(unittest.TestCase):
         result = self.memory_graph._search_graph_db(node_list, self.test_filters, limit=10)
 
         # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
+        self.mock_embedding_model.embed_batch.assert_called_once_with(node_list)
         self.assertEqual(self.memory_graph._search_graph_db_cypher.call_count, 2)
         self.assertEqual(self.mock_graph.query.call_count, 2)
 
@@ -320,69 +272,178 @@ class TestNeptuneMemory(unittest.TestCase):
         expected_result = mock_query_result1 + mock_query_result2
         self.assertEqual(result, expected_result)
 
+    def test_search_nodes(self):
+        """Test the _search_nodes method."""
+        # Mock embeddings
+        mock_embedding = [0.1, 0.2, 0.3]
+        entity_embeddings = {"alice": mock_embedding, "bob": mock_embedding}
+
+        # Mock the _search_nodes_cypher method
+        mock_cypher = "MATCH (n) RETURN n"
+        mock_params = {"user_id": self.user_id, "threshold": 0.9}
+        self.memory_graph._search_nodes_cypher = MagicMock(return_value=(mock_cypher, mock_params))
+
+        # Mock the graph.query result, with two candidates for alice
+        self.mock_graph.query.return_value = [
+            {"name": "alice", "id": 123},
+            {"name": "alice", "id": 124},
+            {"name": "bob", "id": 456},
+        ]
+
+        # Call the _search_nodes method
+        result = self.memory_graph._search_nodes(entity_embeddings, self.user_id, threshold=0.9)
+
+        # Verify the method calls
+        self.memory_graph._search_nodes_cypher.assert_called_once_with(entity_embeddings, self.user_id, 0.9)
+        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
+
+        # Check the result
+        self.assertEqual(result, {"alice": 123, "bob": 456})
+
+    def test_search_nodes_cypher(self):
+        """Test that the vector store candidates are checked against the graph in one query."""
+        mock_embedding = [0.1, 0.2, 0.3]
+        self.mock_vector_store.search.side_effect = [
+            [MagicMock(id="n1", score=0.95), MagicMock(id="n2", score=0.5)],
+            [MagicMock(id="n3", score=0.6)],
+        ]
+
+        cypher, params = self.memory_graph._search_nodes_cypher(
+            {"alice": mock_embedding, "bob": mock_embedding}, self.user_id, 0.9
+        )
+
+        self.assertEqual(self.mock_vector_store.search.call_count, 2)
+        self.assertIn("UNWIND $candidates AS candidate", cypher)
+        self.assertEqual(params["candidates"], [{"name": "alice", "ids": ["n1"]}])
+
     def test_add_entities(self):
         """Test the _add_entities method."""
         # Mock data
-        to_be_added = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
-        entity_type_map = {"alice": "person", "bob": "person"}
+        to_be_added = [
+            {"source": "alice", "relationship": "knows", "destination": "bob"},
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            {"source": "carol", "relationship": "knows", "destination": "bob"},
+        ]
+        entity_type_map = {"alice": "person", "bob": "person", "pizza": "food", "carol": "person"}
 
         # Mock embeddings
         mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
-
-        # Mock search results
-        mock_source_search = [{"id(source_candidate)": 123, "cosine_similarity": 0.95}]
-        mock_dest_search = [{"id(destination_candidate)": 456, "cosine_similarity": 0.92}]
+        self.mock_embedding_model.embed_batch.return_value = [mock_embedding] * 4
 
-        # Mock the search methods
-        self.memory_graph._search_source_node = MagicMock(return_value=mock_source_search)
-        self.memory_graph._search_destination_node = MagicMock(return_value=mock_dest_search)
+        # Only alice resolves to an existing node
+        self.memory_graph._search_nodes = MagicMock(return_value={"alice": 123})
 
-        # Mock the _add_entities_cypher method
-        mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_id": 123, "destination_id": 456}
-        self.memory_graph._add_entities_cypher = MagicMock(return_value=(mock_cypher, mock_params))
+        # Mock the cypher methods
+        self.memory_graph._add_nodes_cypher = MagicMock(
+            side_effect=lambda rows, node_type, user_id: (f"nodes {node_type}", {"rows": rows})
+        )
+        self.memory_graph._add_relationships_cypher = MagicMock(
+            side_effect=lambda rows, relationship, user_id: (f"relationships {relationship}", {"rows": rows})
+        )
 
-        # Mock the graph.query result
-        mock_query_result = [{"source": "alice", "relationship": "knows", "target": "bob"}]
-        self.mock_graph.query.return_value = mock_query_result
+        # Mock the graph.query results: nodes per type, then relationships per type
+        self.mock_graph.query.side_effect = [
+            [{"name": "bob", "id": 456}, {"name": "carol", "id": 789}],
+            [{"name": "pizza", "id": 321}],
+            [
+                {"index": 0, "source": "alice", "relationship": "knows", "target": "bob"},
+                {"index": 2, "source": "carol", "relationship": "knows", "target": "bob"},
+            ],
+            [{"index": 1, "source": "alice", "relationship": "likes", "target": "pizza"}],
+        ]
 
         # Call the _add_entities method
         result = self.memory_graph._add_entities(to_be_added, self.user_id, entity_type_map)
 
         # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
-        self.memory_graph._search_source_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.7)
-        self.memory_graph._search_destination_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.7)
-        self.memory_graph._add_entities_cypher.assert_called_once()
-        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob", "pizza", "carol"])
+        self.memory_graph._search_nodes.assert_called_once()
+        self.assertEqual(self.memory_graph._search_nodes.call_args.kwargs["threshold"], 0.7)
+        self.assertEqual(
+            [(c.args[1], [r["name"] for r in c.args[0]]) for c in self.memory_graph._add_nodes_cypher.call_args_list],
+            [("person", ["bob", "carol"]), ("food", ["pizza"])],
+        )
+        self.assertEqual(
+            [(c.args[1], c.args[0]) for c in self.memory_graph._add_relationships_cypher.call_args_list],
+            [
+                (
+                    "knows",
+                    [
+                        {"index": 0, "source_id": 123, "destination_id": 456},
+                        {"index": 2, "source_id": 789, "destination_id": 456},
+                    ],
+                ),
+                ("likes", [{"index": 1, "source_id": 123, "destination_id": 321}]),
+            ],
+        )
+        self.assertEqual(self.mock_graph.query.call_count, 4)
 
         # Check the result
-        self.assertEqual(result, [mock_query_result])
+        self.assertEqual(
+            result,
+            [
+                [{"source": "alice", "relationship": "knows", "target": "bob"}],
+                [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+                [{"source": "carol", "relationship": "knows", "target": "bob"}],
+            ],
+        )
+
+    def test_add_entities_cypher(self):
+        """Test the batched node and relationship queries."""
+        rows = [{"name": "bob", "embedding": [0.1, 0.2, 0.3]}]
+        cypher, params = self.memory_graph._add_nodes_cypher(rows, "person", self.user_id)
+        self.assertIn("UNWIND $rows AS row", cypher)
+        self.assertIn("n:`person`", cypher)
+        self.assertEqual([row["name"] for row in params["rows"]], ["bob"])
+        self.mock_vector_store.insert.assert_called_once()
+        self.assertEqual(len(params["rows"][0]["id"]), 36)
+
+        rows = [{"index": 0, "source_id": 123, "destination_id": 456}]
+        cypher, params = self.memory_graph._add_relationships_cypher(rows, "knows", self.user_id)
+        self.assertIn("UNWIND $rows AS row", cypher)
+        self.assertIn("MERGE (source)-[r:knows]->(destination)", cypher)
+        self.assertIn("row.index AS index", cypher)
+        self.assertEqual(params, {"rows": rows, "user_id": self.user_id})
 
     def test_delete_entities(self):
         """Test the _delete_entities method."""
         # Mock data
-        to_be_deleted = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
+        to_be_deleted = [
+            {"source": "alice", "relationship": "knows", "destination": "bob"},
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        ]
 
         # Mock the _delete_entities_cypher method
         mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_name": "alice", "dest_name": "bob", "user_id": self.user_id}
+        mock_params = {"rows": [], "user_id": self.user_id}
         self.memory_graph._delete_entities_cypher = MagicMock(return_value=(mock_cypher, mock_params))
 
         # Mock the graph.query result
-        mock_query_result = [{"source": "alice", "relationship": "knows", "target": "bob"}]
-        self.mock_graph.query.return_value = mock_query_result
+        self.mock_graph.query.return_value = [
+            {"index": 1, "source": "alice", "relationship": "likes", "target": "pizza"}
+        ]
 
         # Call the _delete_entities method
         result = self.memory_graph._delete_entities(to_be_deleted, self.user_id)
 
         # Verify the method calls
-        self.memory_graph._delete_entities_cypher.assert_called_once_with("alice", "bob", "knows", self.user_id)
+        self.memory_graph._delete_entities_cypher.assert_called_once_with(to_be_deleted, self.user_id)
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result
-        self.assertEqual(result, [mock_query_result])
+        self.assertEqual(result, [[], [{"source": "alice", "relationship": "likes", "target": "pizza"}]])
+
+    def test_delete_entities_cypher(self):
+        """Test that the relationships are deleted in one query."""
+        to_be_deleted = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
+
+        cypher, params = self.memory_graph._delete_entities_cypher(to_be_deleted, self.user_id)
+
+        self.assertIn("UNWIND $rows AS row", cypher)
+        self.assertIn("WHERE type(r) = row.relationship", cypher)
+        self.assertEqual(
+            params["rows"], [{"index": 0, "source": "alice", "destination": "bob", "relationship": "knows"}]
+        )
 
 
 if __name__ == "__main__":
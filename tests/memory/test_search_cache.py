@@ -0,0 +1,82 @@
+import time
+
+from mem0.memory.search_cache import SearchCache
+
+
+def test_hit_after_set_and_copy_on_read():
+    cache = SearchCache()
+    key = cache.key("  where do I   live ", {"user_id": "alice"}, 10, None, True)
+    assert cache.get(key) is None
+
+    cache.set(key, {"results": [{"memory": "Lives in Berlin"}]})
+    cached = cache.get(cache.key("where do I live", {"user_id": "alice"}, 10, None, True))
+    cached["results"].clear()
+
+    assert cache.get(key) == {"results": [{"memory": "Lives in Berlin"}]}
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "hit_rate": 2 / 3, "size": 1}
+
+
+def test_key_covers_search_arguments():
+    cache = SearchCache()
+    base = cache.key("query", {"user_id": "alice"}, 10, None, True)
+
+    assert base != cache.key("query", {"user_id": "bob"}, 10, None, True)
+    assert base != cache.key("query", {"user_id": "alice", "category": "food"}, 10, None, True)
+    assert base != cache.key("query", {"user_id": "alice"}, 5, None, True)
+    assert base != cache.key("query", {"user_id": "alice"}, 10, 0.5, True)
+    assert base != cache.key("query", {"user_id": "alice"}, 10, None, False)
+    assert cache.key("query", {"user_id": {"in": ["alice", "bob"]}}, 10, None, True) is None
+
+
+def test_writes_invalidate_only_their_scope():
+    cache = SearchCache()
+    alice = cache.key("query", {"user_id": "alice"}, 10, None, True)
+    alice_run = cache.key("query", {"user_id": "alice", "run_id": "r1"}, 10, None, True)
+    bob = cache.key("query", {"user_id": "bob"}, 10, None, True)
+    for key in (alice, alice_run, bob):
+        cache.set(key, {"results": []})
+
+    cache.invalidate({"user_id": "alice", "run_id": "r2", "data": "Likes tea"})
+
+    assert cache.get(cache.key("query", {"user_id": "alice"}, 10, None, True)) is None
+    assert cache.get(cache.key("query", {"user_id": "alice", "run_id": "r1"}, 10, None, True)) is None
+    assert cache.get(cache.key("query", {"user_id": "bob"}, 10, None, True)) == {"results": []}
+
+
+def test_search_started_before_a_write_is_not_served_after_it():
+    cache = SearchCache()
+    key = cache.key("query", {"user_id": "alice"}, 10, None, True)
+    cache.invalidate({"user_id": "alice"})  # Write lands while the search is running
+    cache.set(key, {"results": []})
+
+    assert cache.get(cache.key("query", {"user_id": "alice"}, 10, None, True)) is None
+
+
+def test_ttl_and_size_eviction():
+    cache = SearchCache(max_size=2, ttl=0.01)
+    keys = [cache.key(f"query {index}", {"user_id": "alice"}, 10, None, True) for index in range(3)]
+    for key in keys:
+        cache.set(key, {"results": []})
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == {"results": []}
+    time.sleep(0.02)
+    assert cache.get(keys[2]) is None
+
+
+def test_generations_of_scopes_without_entries_are_pruned():
+    cache = SearchCache(max_size=2)
+    kept = cache.key("query", {"user_id": "alice"}, 10, None, True)
+    cache.set(kept, {"results": ["alice"]})
+    in_flight = cache.key("query", {"user_id": "bob"}, 10, None, True)
+    cache.invalidate({"user_id": "bob"})
+
+    for i in range(100):
+        cache.invalidate({"user_id": f"user-{i}"})
+
+    assert len(cache._generations) <= 4 * cache.max_size
+    assert cache.get(cache.key("query", {"user_id": "alice"}, 10, None, True)) == {"results": ["alice"]}
+    # A search that read bob's counter before his write must not be served once the counter is forgotten
+    cache.set(in_flight, {"results": ["stale"]})
+    assert cache.get(cache.key("query", {"user_id": "bob"}, 10, None, True)) is None
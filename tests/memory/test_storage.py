@@ -155,6 +155,47 @@ class TestSQLiteManager:
         assert len(ids) == 3
         assert len(set(ids)) == 3
 
+    def test_batch_add_history(self, sqlite_manager, sample_data):
+        """Test that batch_add_history writes every record in one call."""
+        other_id = str(uuid.uuid4())
+        sqlite_manager.batch_add_history(
+            [
+                {
+                    "memory_id": sample_data["memory_id"],
+                    "old_memory": None,
+                    "new_memory": sample_data["new_memory"],
+                    "event": "ADD",
+                    "created_at": sample_data["created_at"],
+                    "actor_id": sample_data["actor_id"],
+                    "role": sample_data["role"],
+                },
+                {"memory_id": other_id, "old_memory": "Old", "new_memory": None, "event": "DELETE", "is_deleted": 1},
+            ]
+        )
+
+        added = sqlite_manager.get_history(sample_data["memory_id"])
+        deleted = sqlite_manager.get_history(other_id)
+
+        assert len(added) == 1
+        assert added[0]["new_memory"] == sample_data["new_memory"]
+        assert added[0]["actor_id"] == sample_data["actor_id"]
+        assert added[0]["is_deleted"] is False
+        assert len(deleted) == 1
+        assert deleted[0]["event"] == "DELETE"
+        assert deleted[0]["is_deleted"] is True
+
+    def test_batch_add_history_rolls_back_on_error(self, sqlite_manager, sample_data):
+        """Test that a failing record leaves no partial batch behind."""
+        with pytest.raises(KeyError):
+            sqlite_manager.batch_add_history(
+                [
+                    {"memory_id": sample_data["memory_id"], "new_memory": "ok", "event": "ADD"},
+                    {"memory_id": sample_data["memory_id"], "new_memory": "missing event"},
+                ]
+            )
+
+        assert sqlite_manager.get_history(sample_data["memory_id"]) == []
+
     # ========== Get History Tests ==========
 
     def test_get_history_empty(self, sqlite_manager):
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from mem0.configs.base import MemoryConfig
+from mem0.exceptions import ValidationError as Mem0ValidationError
 from mem0.memory.main import Memory
 
 
@@ -89,10 +90,39 @@ def test_add(memory_instance, version, enable_graph):
         [{"role": "user", "content": "Test message"}], {"user_id": "test_user"}, {"user_id": "test_user"}, True
     )
 
-    # Remove the conditional assertion for _add_to_graph
-    memory_instance._add_to_graph.assert_called_once_with(
-        [{"role": "user", "content": "Test message"}], {"user_id": "test_user"}
-    )
+    if enable_graph:
+        memory_instance._add_to_graph.assert_called_once_with(
+            [{"role": "user", "content": "Test message"}], {"user_id": "test_user"}
+        )
+    else:
+        memory_instance._add_to_graph.assert_not_called()
+
+
+def test_add_reuses_executor_until_close(memory_instance):
+    memory_instance.enable_graph = True
+    memory_instance._add_to_vector_store = Mock(return_value=[])
+    memory_instance._add_to_graph = Mock(return_value=[])
+
+    memory_instance.add(messages="first", user_id="test_user")
+    executor = memory_instance._executor
+    memory_instance.add(messages="second", user_id="test_user")
+
+    assert executor is not None
+    assert memory_instance._executor is executor
+
+    memory_instance.close()
+
+    assert memory_instance._executor is None
+    assert executor._shutdown
+
+
+def test_search_without_graph_runs_inline(memory_instance):
+    memory_instance.enable_graph = False
+    memory_instance._search_vector_store = Mock(return_value=[])
+
+    memory_instance.search("query", user_id="test_user")
+
+    assert memory_instance._executor is None
 
 
 def test_get(memory_instance):
@@ -194,14 +224,22 @@ def test_delete(memory_instance):
 def test_delete_all(memory_instance, version, enable_graph):
     memory_instance.config.version = version
     memory_instance.enable_graph = enable_graph
-    mock_memories = [Mock(id="1"), Mock(id="2")]
-    memory_instance.vector_store.list = Mock(return_value=(mock_memories, None))
-    memory_instance._delete_memory = Mock()
+    mock_memories = [Mock(id="1", payload={"data": "Memory 1"}), Mock(id="2", payload={"data": "Memory 2"})]
+    memory_instance.vector_store.iter_list = Mock(return_value=iter(mock_memories))
+    memory_instance.db = Mock()
     memory_instance.graph.delete_all = Mock()
 
     result = memory_instance.delete_all(user_id="test_user")
 
-    assert memory_instance._delete_memory.call_count == 2
+    memory_instance.vector_store.iter_list.assert_called_once_with(filters={"user_id": "test_user"})
+    memory_instance.vector_store.delete_by_filter.assert_called_once_with({"user_id": "test_user"})
+    memory_instance.vector_store.delete.assert_not_called()
+    memory_instance.vector_store.reset.assert_not_called()
+    (records,) = memory_instance.db.batch_add_history.call_args.args
+    assert [(r["memory_id"], r["old_memory"], r["event"], r["is_deleted"]) for r in records] == [
+        ("1", "Memory 1", "DELETE", 1),
+        ("2", "Memory 2", "DELETE", 1),
+    ]
 
     if enable_graph:
         memory_instance.graph.delete_all.assert_called_once_with({"user_id": "test_user"})
@@ -260,6 +298,28 @@ def test_get_all(memory_instance, version, enable_graph, expected_result):
         memory_instance.graph.get_all.assert_not_called()
 
 
+def test_iter_all_streams_every_page(memory_instance):
+    memory_instance.enable_graph = True
+    mock_memories = [Mock(id=str(i), payload={"data": f"Memory {i}", "user_id": "test_user"}) for i in range(250)]
+    memory_instance.vector_store.iter_list = Mock(return_value=iter(mock_memories))
+    memory_instance.graph.get_all = Mock()
+
+    results = list(memory_instance.iter_all(user_id="test_user", filters={"actor_id": "bob"}, page_size=50))
+
+    assert [item["id"] for item in results] == [str(i) for i in range(250)]
+    assert results[0]["memory"] == "Memory 0"
+    assert "score" not in results[0]
+    memory_instance.vector_store.iter_list.assert_called_once_with(
+        filters={"user_id": "test_user", "actor_id": "bob"}, page_size=50
+    )
+    memory_instance.graph.get_all.assert_not_called()
+
+
+def test_iter_all_requires_an_id(memory_instance):
+    with pytest.raises(Mem0ValidationError):
+        next(memory_instance.iter_all(filters={"actor_id": "bob"}))
+
+
 def test_custom_prompts(memory_custom_instance):
     messages = [{"role": "user", "content": "Test message"}]
     from mem0.embeddings.mock import MockEmbeddings
@@ -98,3 +98,23 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
     assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+
+def test_completions_create_scopes_queued_add_with_filters(mock_litellm):
+    mock_memory = Mock(spec=Memory)
+    mock_memory.search.return_value = {"results": []}
+    mock_litellm.completion.return_value = {"choices": [{"message": {"content": "Hi"}}]}
+    mock_litellm.supports_function_calling.return_value = True
+    completions = Completions(mock_memory)
+
+    completions.create(
+        model="gpt-4.1-nano-2025-04-14",
+        messages=[{"role": "user", "content": "Hello"}],
+        user_id="test_user",
+        filters={"agent_id": "support", "category": "billing"},
+    )
+
+    mock_memory.enqueue_add.assert_called_once()
+    add_kwargs = mock_memory.enqueue_add.call_args.kwargs
+    assert (add_kwargs["user_id"], add_kwargs["agent_id"], add_kwargs["run_id"]) == ("test_user", "support", None)
+    assert mock_memory.search.call_args.kwargs["filters"] == {"agent_id": "support", "category": "billing"}
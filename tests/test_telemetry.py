@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -33,3 +35,90 @@ def test_telemetry_disabled():
 
 def test_telemetry_default_enabled():
     assert use_telemetry() is True
+
+
+class _VectorStore:
+    pass
+
+
+def test_sink_sends_events_from_background_thread():
+    from mem0.memory.telemetry import TelemetrySink
+
+    vector_store = _VectorStore()
+    with patch("mem0.memory.telemetry.Posthog") as mock_posthog, patch(
+        "mem0.memory.telemetry.get_or_create_user_id", return_value="user-1"
+    ) as mock_get_user_id:
+        sink = TelemetrySink()
+        sink.enqueue("mem0.add", {"limit": 1}, vector_store=vector_store)
+        sink.enqueue("mem0.search", {"limit": 2}, vector_store=vector_store)
+        sink.close()
+
+    client = mock_posthog.return_value
+    assert client.capture.call_count == 2
+    assert client.capture.call_args.kwargs["distinct_id"] == "user-1"
+    assert client.capture.call_args.kwargs["properties"]["limit"] == 2
+    assert client.capture.call_args.kwargs["properties"]["client_source"] == "python"
+    mock_get_user_id.assert_called_once_with(vector_store)
+    client.shutdown.assert_called_once()
+
+
+def test_sink_uses_email_as_distinct_id():
+    from mem0.memory.telemetry import TelemetrySink
+
+    with patch("mem0.memory.telemetry.Posthog") as mock_posthog, patch(
+        "mem0.memory.telemetry.get_or_create_user_id"
+    ) as mock_get_user_id:
+        sink = TelemetrySink()
+        sink.enqueue("client.add", {}, user_email="user@example.com")
+        sink.close()
+
+    assert mock_posthog.return_value.capture.call_args.kwargs["distinct_id"] == "user@example.com"
+    mock_get_user_id.assert_not_called()
+
+
+def test_sink_drops_events_after_close():
+    from mem0.memory.telemetry import TelemetrySink
+
+    with patch("mem0.memory.telemetry.Posthog") as mock_posthog, patch(
+        "mem0.memory.telemetry.get_or_create_user_id", return_value="user-1"
+    ), patch("mem0.memory.telemetry.atexit.register") as mock_register:
+        sink = TelemetrySink()
+        sink.enqueue("mem0.add", {})
+        sink.close()
+        sink.enqueue("mem0.search", {})
+        sink.close()
+
+    assert mock_posthog.call_count == 1
+    assert mock_posthog.return_value.capture.call_count == 1
+    mock_register.assert_called_once()
+    assert sink._thread is None
+
+
+def test_sink_close_does_not_block_on_a_full_queue():
+    from mem0.memory.telemetry import TelemetrySink
+
+    release = threading.Event()
+    with patch("mem0.memory.telemetry.Posthog") as mock_posthog, patch(
+        "mem0.memory.telemetry.get_or_create_user_id", return_value="user-1"
+    ):
+        mock_posthog.return_value.capture.side_effect = lambda **kwargs: release.wait()
+        sink = TelemetrySink(max_queue_size=1)
+        for _ in range(3):
+            sink.enqueue("mem0.add", {})
+
+        start = time.monotonic()
+        sink.close(timeout=0.1)
+        elapsed = time.monotonic() - start
+        release.set()
+
+    assert elapsed < 1
+
+
+def test_capture_event_is_noop_when_disabled():
+    from mem0.memory import telemetry
+
+    with patch.object(telemetry, "MEM0_TELEMETRY", False), patch.object(telemetry, "telemetry_sink") as mock_sink:
+        telemetry.capture_event("mem0.add", object())
+        telemetry.capture_client_event("client.add", object())
+
+    mock_sink.enqueue.assert_not_called()
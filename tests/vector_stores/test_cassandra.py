@@ -314,3 +314,155 @@ def test_insert_without_payloads(cassandra_instance):
     assert cassandra_instance.session.prepare.called
     assert cassandra_instance.session.execute.called
 
+
+
+def _row(**fields):
+    row = Mock()
+    for name, value in fields.items():
+        setattr(row, name, value)
+    return row
+
+
+def _executed_queries(session):
+    return [" ".join(str(call.args[0]).split()) for call in session.execute.call_args_list]
+
+
+def _prepared_queries(session):
+    return [" ".join(call.args[0].split()) for call in session.prepare.call_args_list]
+
+
+@pytest.fixture
+def sai_instance(mock_cluster, mock_session):
+    """Create a CassandraDB instance on a table with a vector column and scope columns."""
+    columns = {"id": "text", "vector": "vector<float, 3>", "payload": "text",
+               "user_id": "text", "agent_id": "text", "run_id": "text"}
+    with patch('mem0.vector_stores.cassandra.Cluster') as mock_cluster_class, \
+            patch.object(CassandraDB, '_table_columns', return_value=columns):
+        mock_cluster_class.return_value = mock_cluster
+        instance = CassandraDB(
+            contact_points=['127.0.0.1'],
+            keyspace='test_keyspace',
+            collection_name='test_collection',
+            embedding_model_dims=3,
+        )
+    return instance
+
+
+def test_sai_indexes_created(sai_instance):
+    """The vector column and the scope columns get Storage-Attached Indexes."""
+    queries = _executed_queries(sai_instance.session)
+
+    assert sai_instance._ann_enabled
+    assert any("vector vector<float, 3>" in q and "user_id text" in q for q in queries)
+    vector_index = next(q for q in queries if "test_collection_vector_idx" in q)
+    assert "USING 'StorageAttachedIndex'" in vector_index
+    assert "'similarity_function': 'COSINE'" in vector_index
+    for column in ("user_id", "agent_id", "run_id"):
+        assert any(f"test_collection_{column}_idx" in q and "StorageAttachedIndex" in q for q in queries)
+    assert sai_instance.col_info()["ann_search"] is True
+
+
+def test_sai_search_uses_ann_query(sai_instance):
+    """Search orders by the vector index and pushes scope filters down to Cassandra."""
+    sai_instance.session.execute = Mock(return_value=[
+        _row(id="id1", payload=json.dumps({"user_id": "alice"}), similarity=1.0),
+        _row(id="id2", payload=json.dumps({"user_id": "alice"}), similarity=0.75),
+    ])
+
+    results = sai_instance.search(query="test", vectors=[0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice"})
+
+    query = _prepared_queries(sai_instance.session)[-1]
+    assert "WHERE user_id = ?" in query
+    assert "ORDER BY vector ANN OF ?" in query
+    assert "ALLOW FILTERING" not in query
+    params = sai_instance.session.execute.call_args.args[1]
+    assert params == ([0.1, 0.2, 0.3], "alice", [0.1, 0.2, 0.3], 2)
+    assert [r.id for r in results] == ["id1", "id2"]
+    assert results[0].score == pytest.approx(0.0)
+    assert results[1].score == pytest.approx(0.5)
+
+
+def test_sai_search_overfetches_for_payload_filters(sai_instance):
+    """Filters on non-indexed payload keys widen the ANN query until enough rows match."""
+    first_page = [_row(id=f"id{i}", payload=json.dumps({"category": "B"}), similarity=0.9) for i in range(4)]
+    second_page = first_page + [_row(id="match", payload=json.dumps({"category": "A"}), similarity=0.8)]
+    sai_instance.session.execute = Mock(side_effect=[first_page, second_page])
+
+    results = sai_instance.search(query="test", vectors=[0.1, 0.2, 0.3], limit=1, filters={"category": "A"})
+
+    assert [r.id for r in results] == ["match"]
+    limits = [call.args[1][-1] for call in sai_instance.session.execute.call_args_list]
+    assert limits == [4, 16]
+
+
+def test_scan_search_scores_in_blocks(cassandra_instance):
+    """Without a vector index, search keeps the best rows across pages of the table."""
+    cassandra_instance.fetch_size = 2
+    rows = [
+        _row(id="far", vector=[0.0, 1.0, 0.0], payload=json.dumps({"user_id": "alice"})),
+        _row(id="close", vector=[1.0, 0.1, 0.0], payload=json.dumps({"user_id": "alice"})),
+        _row(id="empty", vector=None, payload=json.dumps({"user_id": "alice"})),
+        _row(id="exact", vector=[2.0, 0.0, 0.0], payload=json.dumps({"user_id": "alice"})),
+        _row(id="opposite", vector=[-1.0, 0.0, 0.0], payload=json.dumps({"user_id": "alice"})),
+    ]
+    cassandra_instance.session.execute = Mock(return_value=rows)
+
+    results = cassandra_instance.search(query="test", vectors=[1.0, 0.0, 0.0], limit=2, filters={"user_id": "alice"})
+
+    assert [r.id for r in results] == ["exact", "close"]
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+    assert results[0].payload == {"user_id": "alice"}
+    query = _prepared_queries(cassandra_instance.session)[-1]
+    assert "WHERE user_id = ? ALLOW FILTERING" in query
+    statement = cassandra_instance.session.execute.call_args.args[0]
+    assert statement.fetch_size == 2
+
+
+def test_insert_writes_scope_columns(cassandra_instance):
+    """Session identifiers are copied into their own columns."""
+    cassandra_instance.insert(
+        vectors=[[0.1, 0.2, 0.3]], payloads=[{"user_id": "alice", "run_id": "r1"}], ids=["id1"]
+    )
+
+    params = cassandra_instance.session.execute.call_args.args[1]
+    assert params == ("id1", [0.1, 0.2, 0.3], json.dumps({"user_id": "alice", "run_id": "r1"}), "alice", None, "r1")
+
+
+def test_iter_list_pages_through_the_driver(sai_instance):
+    """iter_list sets the page size on the statement and filters payload keys client-side."""
+    rows = [_row(id=f"id{i}", payload=json.dumps({"user_id": "alice", "category": "AB"[i % 2]})) for i in range(5)]
+    sai_instance.session.execute = Mock(return_value=iter(rows))
+
+    results = list(sai_instance.iter_list(filters={"user_id": "alice", "category": "A"}, page_size=2))
+
+    assert [r.id for r in results] == ["id0", "id2", "id4"]
+    query = _prepared_queries(sai_instance.session)[-1]
+    assert query.endswith("WHERE user_id = ?")
+    statement = sai_instance.session.execute.call_args.args[0]
+    assert statement.fetch_size == 2
+
+
+def test_legacy_table_is_migrated(mock_cluster, mock_session):
+    """Tables created before the scope columns get them added and backfilled from the payloads."""
+    columns = {"id": "text", "vector": "list<float>", "payload": "text"}
+    legacy_rows = [_row(id="id1", payload=json.dumps({"user_id": "alice", "agent_id": "bot"}))]
+
+    def execute(statement, *args):
+        if "SELECT id, payload" in str(getattr(statement, "query_string", statement)):
+            return legacy_rows
+        return Mock()
+
+    mock_session.execute = Mock(side_effect=execute)
+    with patch('mem0.vector_stores.cassandra.Cluster') as mock_cluster_class, \
+            patch.object(CassandraDB, '_table_columns', return_value=columns):
+        mock_cluster_class.return_value = mock_cluster
+        instance = CassandraDB(contact_points=['127.0.0.1'], keyspace='ks', collection_name='legacy')
+
+    queries = _executed_queries(mock_session)
+    for column in ("user_id", "agent_id", "run_id"):
+        assert f"ALTER TABLE ks.legacy ADD {column} text" in queries
+        assert any(f"CREATE INDEX IF NOT EXISTS legacy_{column}_idx" in q for q in queries)
+    assert not any("StorageAttachedIndex" in q for q in queries)
+    backfill = [call.args[1] for call in mock_session.execute.call_args_list if len(call.args) > 1]
+    assert ("alice", "bot", None, "id1") in backfill
+    assert not instance._ann_enabled
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -249,3 +249,28 @@ def test_generate_where_clause_non_string_values():
     # ChromaDB accepts non-string values in filters
     expected = {"$and": [{"user_id": {"$eq": "alice"}}, {"count": {"$eq": 5}}, {"active": {"$eq": True}}]}
     assert result == expected
+
+
+def test_iter_list_pages_with_offsets(chromadb_instance):
+    chromadb_instance.collection.get.side_effect = [
+        {"ids": ["id1", "id2"], "metadatas": [{"user_id": "alice"}, {"user_id": "alice"}]},
+        {"ids": ["id3"], "metadatas": [{"user_id": "alice"}]},
+    ]
+
+    results = list(chromadb_instance.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+    assert [r.id for r in results] == ["id1", "id2", "id3"]
+    assert chromadb_instance.collection.get.call_args_list == [
+        call(where={"user_id": {"$eq": "alice"}}, limit=2, offset=0),
+        call(where={"user_id": {"$eq": "alice"}}, limit=2, offset=2),
+    ]
+
+
+def test_delete_by_filter(chromadb_instance):
+    chromadb_instance.delete_by_filter({"user_id": "alice", "agent_id": "agent1"})
+
+    chromadb_instance.collection.delete.assert_called_once_with(
+        where={"$and": [{"user_id": {"$eq": "alice"}}, {"agent_id": {"$eq": "agent1"}}]}
+    )
+    with pytest.raises(ValueError):
+        chromadb_instance.delete_by_filter({})
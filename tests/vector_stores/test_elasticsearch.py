@@ -286,6 +286,53 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0][1].id, "id2")
         self.assertEqual(results[0][1].payload, {"key2": "value2"})
 
+    def test_iter_list_uses_search_after(self):
+        def hit(vector_id, sort):
+            return {"_id": vector_id, "_source": {"metadata": {"user_id": "alice"}}, "sort": sort}
+
+        self.client_mock.open_point_in_time.return_value = {"id": "pit-1"}
+        self.client_mock.search.side_effect = [
+            {"pit_id": "pit-2", "hits": {"hits": [hit("id1", [0]), hit("id2", [1])]}},
+            {"pit_id": "pit-3", "hits": {"hits": [hit("id3", [2])]}},
+        ]
+
+        results = list(self.es_db.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+        self.assertEqual([r.id for r in results], ["id1", "id2", "id3"])
+        self.assertEqual(results[2].payload, {"user_id": "alice"})
+        first, second = [call.kwargs["body"] for call in self.client_mock.search.call_args_list]
+        self.assertEqual(first["query"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+        self.assertEqual(first["pit"]["id"], "pit-1")
+        self.assertNotIn("search_after", first)
+        self.assertEqual(second["pit"]["id"], "pit-2")
+        self.assertEqual(second["search_after"], [1])
+        self.client_mock.close_point_in_time.assert_called_once_with(id="pit-3")
+
+    def test_iter_list_closes_point_in_time_when_stopped_early(self):
+        self.client_mock.open_point_in_time.return_value = {"id": "pit-1"}
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_id": f"id{i}", "_source": {"metadata": {}}, "sort": [i]} for i in range(2)]}
+        }
+
+        records = self.es_db.iter_list(page_size=2)
+        self.assertEqual(next(records).id, "id0")
+        records.close()
+
+        self.client_mock.close_point_in_time.assert_called_once_with(id="pit-1")
+
+    def test_delete_by_filter(self):
+        self.client_mock.delete_by_query.return_value = {"deleted": 7}
+
+        deleted = self.es_db.delete_by_filter({"user_id": "alice"})
+
+        self.assertEqual(deleted, 7)
+        kwargs = self.client_mock.delete_by_query.call_args.kwargs
+        self.assertEqual(kwargs["index"], self.es_db.collection_name)
+        self.assertEqual(kwargs["query"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+        self.assertTrue(kwargs["refresh"])
+        with self.assertRaises(ValueError):
+            self.es_db.delete_by_filter({})
+
     def test_delete(self):
         # Perform delete
         self.es_db.delete(vector_id="id1")
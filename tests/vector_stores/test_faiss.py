@@ -1,4 +1,5 @@
 import os
+import pickle
 import tempfile
 from unittest.mock import Mock, patch
 
@@ -6,7 +7,7 @@ import faiss
 import numpy as np
 import pytest
 
-from mem0.vector_stores.faiss import FAISS, OutputData
+from mem0.vector_stores.faiss import FAISS, OutputData, SQLiteDocstore
 
 
 @pytest.fixture
@@ -21,7 +22,9 @@ def mock_faiss_index():
 def faiss_instance(mock_faiss_index):
     with tempfile.TemporaryDirectory() as temp_dir:
         # Mock the faiss index creation
-        with patch("faiss.IndexFlatL2", return_value=mock_faiss_index):
+        with patch("faiss.IndexFlatL2", return_value=mock_faiss_index), patch(
+            "faiss.IndexIDMap2", return_value=mock_faiss_index
+        ):
             # Mock the faiss.write_index function
             with patch("faiss.write_index"):
                 # Create a FAISS instance with a temporary directory
@@ -37,13 +40,18 @@ def faiss_instance(mock_faiss_index):
 
 def test_create_col(faiss_instance, mock_faiss_index):
     # Test creating a collection with euclidean distance
-    with patch("faiss.IndexFlatL2", return_value=mock_faiss_index) as mock_index_flat_l2:
+    with patch("faiss.IndexFlatL2", return_value=mock_faiss_index) as mock_index_flat_l2, patch(
+        "faiss.IndexIDMap2", return_value=mock_faiss_index
+    ) as mock_id_map:
         with patch("faiss.write_index"):
             faiss_instance.create_col(name="new_collection")
             mock_index_flat_l2.assert_called_once_with(faiss_instance.embedding_model_dims)
+            mock_id_map.assert_called_once_with(mock_faiss_index)
 
     # Test creating a collection with inner product distance
-    with patch("faiss.IndexFlatIP", return_value=mock_faiss_index) as mock_index_flat_ip:
+    with patch("faiss.IndexFlatIP", return_value=mock_faiss_index) as mock_index_flat_ip, patch(
+        "faiss.IndexIDMap2", return_value=mock_faiss_index
+    ):
         with patch("faiss.write_index"):
             faiss_instance.create_col(name="new_collection", distance="inner_product")
             mock_index_flat_ip.assert_called_once_with(faiss_instance.embedding_model_dims)
@@ -57,8 +65,8 @@ def test_insert(faiss_instance, mock_faiss_index):
 
     # Mock the numpy array conversion
     with patch("numpy.array", return_value=np.array(vectors, dtype=np.float32)) as mock_np_array:
-        # Mock index.add
-        mock_faiss_index.add.return_value = None
+        # Mock index.add_with_ids
+        mock_faiss_index.add_with_ids.return_value = None
 
         # Call insert
         faiss_instance.insert(vectors=vectors, payloads=payloads, ids=ids)
@@ -66,14 +74,16 @@ def test_insert(faiss_instance, mock_faiss_index):
         # Verify numpy.array was called
         mock_np_array.assert_called_once_with(vectors, dtype=np.float32)
 
-        # Verify index.add was called
-        mock_faiss_index.add.assert_called_once()
+        # Verify the vectors were added under their index ids
+        mock_faiss_index.add_with_ids.assert_called_once()
+        assert mock_faiss_index.add_with_ids.call_args[0][1].tolist() == [0, 1]
 
         # Verify docstore and index_to_id were updated
         assert faiss_instance.docstore["id1"] == {"name": "vector1"}
         assert faiss_instance.docstore["id2"] == {"name": "vector2"}
         assert faiss_instance.index_to_id[0] == "id1"
         assert faiss_instance.index_to_id[1] == "id2"
+        assert faiss_instance.id_to_index == {"id1": 0, "id2": 1}
 
 
 def test_search(faiss_instance, mock_faiss_index):
@@ -166,9 +176,10 @@ def test_search_with_filters(faiss_instance, mock_faiss_index):
 
 
 def test_delete(faiss_instance):
-    # Setup the docstore and index_to_id mapping
+    # Setup the docstore and the mappings
     faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
     faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    faiss_instance.id_to_index = {"id1": 0, "id2": 1}
 
     # Call delete
     faiss_instance.delete(vector_id="id1")
@@ -178,28 +189,29 @@ def test_delete(faiss_instance):
     assert 0 not in faiss_instance.index_to_id
     assert "id2" in faiss_instance.docstore
     assert 1 in faiss_instance.index_to_id
+    assert faiss_instance.id_to_index == {"id2": 1}
 
 
 def test_update(faiss_instance, mock_faiss_index):
-    # Setup the docstore and index_to_id mapping
+    # Setup the docstore and the mappings
     faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
     faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    faiss_instance.id_to_index = {"id1": 0, "id2": 1}
+    faiss_instance._next_index_id = 2
 
     # Test updating payload only
     faiss_instance.update(vector_id="id1", payload={"name": "updated_vector1"})
     assert faiss_instance.docstore["id1"] == {"name": "updated_vector1"}
 
-    # Test updating vector
-    # This requires mocking the delete and insert methods
-    with patch.object(faiss_instance, "delete") as mock_delete:
-        with patch.object(faiss_instance, "insert") as mock_insert:
-            new_vector = [0.7, 0.8, 0.9]
-            faiss_instance.update(vector_id="id2", vector=new_vector)
+    # Test updating vector: the new vector is added under a new index id and the old one is dropped
+    new_vector = [0.7, 0.8, 0.9]
+    faiss_instance.update(vector_id="id2", vector=new_vector)
 
-            # Verify delete and insert were called
-            # Match the actual call signature (positional arg instead of keyword)
-            mock_delete.assert_called_once_with("id2")
-            mock_insert.assert_called_once()
+    mock_faiss_index.add_with_ids.assert_called_once()
+    assert mock_faiss_index.add_with_ids.call_args[0][1].tolist() == [2]
+    assert faiss_instance.index_to_id == {0: "id1", 2: "id2"}
+    assert faiss_instance.id_to_index == {"id1": 0, "id2": 2}
+    assert faiss_instance.docstore["id2"] == {"name": "vector2"}
 
 
 def test_get(faiss_instance):
@@ -263,8 +275,8 @@ def test_delete_col(faiss_instance):
             # Call delete_col
             faiss_instance.delete_col()
 
-            # Verify os.remove was called twice (for index and docstore files)
-            assert mock_remove.call_count == 2
+            # Verify os.remove was called for the index, docstore and mutation log files
+            assert mock_remove.call_count == 3
 
             # Verify the internal state was reset
             assert faiss_instance.index is None
@@ -289,3 +301,597 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+@pytest.fixture
+def faiss_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield os.path.join(temp_dir, "test_faiss")
+
+
+def _open_store(path, **kwargs):
+    return FAISS(collection_name="test_collection", path=path, embedding_model_dims=4, **kwargs)
+
+
+def test_mutations_are_logged_instead_of_rewriting_the_snapshot(faiss_path):
+    store = _open_store(faiss_path)
+
+    with patch("faiss.write_index") as mock_write_index:
+        store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"name": "vector1"}], ids=["id1"])
+        store.update(vector_id="id1", payload={"name": "updated"})
+        store.delete(vector_id="id1")
+
+    mock_write_index.assert_not_called()
+    assert os.path.getsize(os.path.join(faiss_path, "test_collection.log")) > 0
+
+
+def test_logged_mutations_are_replayed_on_load(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(
+        vectors=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8], [0.9, 1.0, 1.1, 1.2]],
+        payloads=[{"name": "vector1"}, {"name": "vector2"}, {"name": "vector3"}],
+        ids=["id1", "id2", "id3"],
+    )
+    store.update(vector_id="id2", payload={"name": "updated"})
+    store.delete(vector_id="id3")
+    # Simulate a crash: the process stops without flushing
+
+    reopened = _open_store(faiss_path)
+
+    assert reopened.col_info()["count"] == 2
+    assert reopened._tombstones == {2}
+    assert reopened.docstore == {"id1": {"name": "vector1"}, "id2": {"name": "updated"}}
+    assert reopened.index_to_id == {0: "id1", 1: "id2"}
+    results = reopened.search(query="", vectors=[0.5, 0.6, 0.7, 0.8], limit=1)
+    assert results[0].id == "id2"
+    # Replayed mutations are folded into a new snapshot
+    assert not os.path.exists(os.path.join(faiss_path, "test_collection.log"))
+
+
+def test_torn_log_record_is_ignored(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"name": "vector1"}], ids=["id1"])
+    store.insert(vectors=[[0.5, 0.6, 0.7, 0.8]], payloads=[{"name": "vector2"}], ids=["id2"])
+    store._close_log()
+
+    log_path = os.path.join(faiss_path, "test_collection.log")
+    with open(log_path, "r+b") as f:
+        f.truncate(os.path.getsize(log_path) - 5)
+
+    reopened = _open_store(faiss_path)
+
+    assert reopened.docstore == {"id1": {"name": "vector1"}}
+    assert reopened.index.ntotal == 1
+
+
+def test_snapshot_after_flush_every_n_mutations(faiss_path):
+    store = _open_store(faiss_path, flush_every_n=2, flush_interval=None)
+
+    with patch.object(store, "_save", wraps=store._save) as mock_save:
+        store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], ids=["id1"])
+        assert mock_save.call_count == 0
+        store.insert(vectors=[[0.5, 0.6, 0.7, 0.8]], ids=["id2"])
+        assert mock_save.call_count == 1
+
+    assert not os.path.exists(os.path.join(faiss_path, "test_collection.log"))
+
+
+def test_flush_writes_atomic_snapshot(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"name": "vector1"}], ids=["id1"])
+
+    store.flush()
+
+    files = sorted(os.listdir(faiss_path))
+    assert files == ["test_collection.faiss", "test_collection.pkl"]
+    reopened = _open_store(faiss_path)
+    assert reopened.docstore == {"id1": {"name": "vector1"}}
+    assert reopened.index.ntotal == 1
+
+
+def test_insert_replay_is_idempotent_when_only_the_index_snapshot_landed(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"name": "vector1"}], ids=["id1"])
+    # Crash after the index snapshot was renamed into place but before the docstore snapshot was
+    faiss.write_index(store.index, os.path.join(faiss_path, "test_collection.faiss"))
+
+    reopened = _open_store(faiss_path)
+
+    assert reopened.index.ntotal == 1
+    assert reopened.docstore == {"id1": {"name": "vector1"}}
+
+
+def test_loads_snapshot_written_before_the_mutation_log(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"name": "vector1"}], ids=["id1"])
+    store.flush()
+    with open(os.path.join(faiss_path, "test_collection.pkl"), "wb") as f:
+        pickle.dump((store.docstore, store.index_to_id), f)
+
+    reopened = _open_store(faiss_path)
+
+    assert reopened.docstore == {"id1": {"name": "vector1"}}
+
+
+def test_deleted_vectors_do_not_crowd_out_search_results(faiss_path):
+    store = _open_store(faiss_path, compaction_threshold=100)
+    store.insert(
+        vectors=[[1.0, 0.0, 0.0, 0.0], [0.9, 0.1, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]],
+        ids=["id1", "id2", "id3", "id4"],
+    )
+    store.delete("id1")
+    store.delete("id2")
+
+    results = store.search(query="", vectors=[1.0, 0.0, 0.0, 0.0], limit=2)
+
+    assert sorted(result.id for result in results) == ["id3", "id4"]
+    assert store.col_info()["count"] == 2
+
+
+def test_compaction_removes_tombstones_from_the_index(faiss_path):
+    store = _open_store(faiss_path, compaction_threshold=100)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8]], ids=["id1", "id2"])
+    store.delete("id1")
+    assert store.index.ntotal == 2
+
+    store.compact()
+
+    assert store.index.ntotal == 1
+    assert faiss.vector_to_array(store.index.id_map).tolist() == [1]
+
+
+def test_compaction_runs_in_background_after_threshold(faiss_path):
+    store = _open_store(faiss_path, compaction_threshold=2)
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8], [0.9, 1.0, 1.1, 1.2]], ids=["a", "b", "c"])
+
+    store.delete("a")
+    assert store._compaction_thread is None
+    store.delete("b")
+    store._compaction_thread.join(5)
+
+    assert store.index.ntotal == 1
+    assert store._tombstones == set()
+
+
+def test_update_vector_replaces_it_in_the_index(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(vectors=[[1.0, 0.0, 0.0, 0.0]], payloads=[{"name": "vector1"}], ids=["id1"])
+
+    store.update(vector_id="id1", vector=[0.0, 1.0, 0.0, 0.0])
+    store.flush()
+
+    assert store.col_info()["count"] == 1
+    results = store.search(query="", vectors=[0.0, 1.0, 0.0, 0.0], limit=1)
+    assert results[0].id == "id1"
+    assert results[0].score == pytest.approx(0.0)
+    assert results[0].payload == {"name": "vector1"}
+
+
+def test_positional_index_is_migrated_to_id_map(faiss_path):
+    os.makedirs(faiss_path)
+    flat_index = faiss.IndexFlatL2(4)
+    flat_index.add(np.array([[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8], [0.9, 1.0, 1.1, 1.2]], dtype=np.float32))
+    faiss.write_index(flat_index, os.path.join(faiss_path, "test_collection.faiss"))
+    # The vector at position 1 was deleted, which used to leave it in the index
+    with open(os.path.join(faiss_path, "test_collection.pkl"), "wb") as f:
+        pickle.dump(({"id1": {"name": "vector1"}, "id3": {"name": "vector3"}}, {0: "id1", 2: "id3"}), f)
+
+    store = _open_store(faiss_path)
+
+    assert isinstance(store.index, faiss.IndexIDMap2)
+    assert store.index.ntotal == 2
+    assert store.id_to_index == {"id1": 0, "id3": 2}
+    assert store.search(query="", vectors=[0.9, 1.0, 1.1, 1.2], limit=1)[0].id == "id3"
+    store.insert(vectors=[[0.0, 0.0, 0.0, 1.0]], ids=["id4"])
+    assert store.id_to_index["id4"] == 3
+
+
+def _random_vectors(count, dims=8, seed=0):
+    return np.random.default_rng(seed).random((count, dims), dtype=np.float32).tolist()
+
+
+def _open_ann_store(path, **kwargs):
+    return FAISS(collection_name="test_collection", path=path, embedding_model_dims=8, **kwargs)
+
+
+def test_hnsw_index_finds_nearest_neighbours(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8)
+    vectors = _random_vectors(200)
+    store.insert(vectors=vectors, ids=[f"id{i}" for i in range(200)])
+
+    assert store.col_info()["index_type"] == "hnsw"
+    assert store.search(query="", vectors=vectors[42], limit=1)[0].id == "id42"
+    assert store.search(query="", vectors=vectors[42], limit=1, ef_search=128)[0].id == "id42"
+
+
+def test_hnsw_compaction_rebuilds_the_graph(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8, compaction_threshold=100)
+    vectors = _random_vectors(20)
+    store.insert(vectors=vectors, ids=[f"id{i}" for i in range(20)])
+    store.delete("id3")
+
+    store.compact()
+
+    assert store.index.ntotal == 19
+    assert store.col_info()["index_type"] == "hnsw"
+    assert store.search(query="", vectors=vectors[3], limit=1)[0].id != "id3"
+
+
+def test_hnsw_snapshot_keeps_tombstones_instead_of_rebuilding(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8)
+    vectors = _random_vectors(20)
+    store.insert(vectors=vectors, ids=[f"id{i}" for i in range(20)])
+    store.delete("id3")
+    index = store.index
+
+    store.flush()
+
+    assert store.index is index
+    reopened = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8)
+    assert reopened.index.ntotal == 20
+    assert reopened._tombstones == {3}
+    assert reopened.col_info()["count"] == 19
+    assert reopened.search(query="", vectors=vectors[3], limit=1)[0].id != "id3"
+
+
+def test_many_tombstones_are_excluded_through_a_selector(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8, compaction_threshold=100)
+    vectors = _random_vectors(50)
+    store.insert(vectors=vectors, ids=[f"id{i}" for i in range(50)])
+    for i in range(10):
+        store.delete(f"id{i}")
+
+    with patch("mem0.vector_stores.faiss._MAX_OVERFETCHED_TOMBSTONES", 2):
+        results = store.search(query="", vectors=vectors[0], limit=5)
+
+    assert len(results) == 5
+    assert all(int(result.id[2:]) >= 10 for result in results)
+
+
+def test_hnsw_rebuild_catches_up_with_writes_made_while_it_builds(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8, compaction_threshold=100)
+    vectors = _random_vectors(22)
+    store.insert(vectors=vectors[:20], ids=[f"id{i}" for i in range(20)])
+    store.delete("id0")
+    new_index = store._new_index
+
+    def write_while_building(index_type):
+        store.insert(vectors=vectors[20:], ids=["id20", "id21"])
+        store.delete("id1")
+        store.delete("id21")
+        return new_index(index_type)
+
+    with patch.object(store, "_new_index", side_effect=write_while_building):
+        store.compact()
+
+    assert store.index.ntotal == 20
+    assert store._tombstones == {1}
+    assert store.search(query="", vectors=vectors[20], limit=1)[0].id == "id20"
+    assert {result.id for result in store.search(query="", vectors=vectors[1], limit=20)} == {
+        f"id{i}" for i in range(2, 21)
+    }
+
+
+def test_hnsw_compaction_waits_for_the_tombstone_ratio(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8, compaction_threshold=2)
+    store.insert(vectors=_random_vectors(40), ids=[f"id{i}" for i in range(40)])
+
+    for i in range(3):
+        store.delete(f"id{i}")
+    assert store._compaction_thread is None
+
+    store.delete("id3")
+    store._compaction_thread.join(5)
+    assert store.index.ntotal == 36
+
+
+@pytest.mark.parametrize("index_type", ["ivf_flat", "ivf_pq"])
+def test_ivf_index_stays_flat_until_trained(faiss_path, index_type):
+    store = _open_ann_store(
+        faiss_path, index_type=index_type, nlist=4, nprobe=4, pq_m=2, pq_nbits=4, train_min_vectors=100
+    )
+    vectors = _random_vectors(150)
+
+    store.insert(vectors=vectors[:50], ids=[f"id{i}" for i in range(50)])
+    assert store.col_info()["index_type"] == "flat"
+
+    store.insert(vectors=vectors[50:], ids=[f"id{i}" for i in range(50, 150)])
+    assert store.col_info()["index_type"] == index_type
+    assert store.index.ntotal == 150
+
+    results = store.search(query="", vectors=vectors[7], limit=5, nprobe=4)
+    assert "id7" in [result.id for result in results]
+
+    store.delete("id7")
+    store.compact()
+    assert store.index.ntotal == 149
+
+    store.flush()
+    reopened = _open_ann_store(
+        faiss_path, index_type=index_type, nlist=4, nprobe=4, pq_m=2, pq_nbits=4, train_min_vectors=100
+    )
+    assert reopened.col_info()["index_type"] == index_type
+    assert reopened.index.ntotal == 149
+
+
+def test_search_params_follow_the_index_type(faiss_path):
+    store = _open_ann_store(faiss_path, index_type="hnsw", ef_search=16)
+
+    assert store._search_params().efSearch == 16
+    assert store._search_params(ef_search=256).efSearch == 256
+
+    flat_store = _open_ann_store(os.path.join(faiss_path, "flat"))
+    assert flat_store._search_params(ef_search=256, nprobe=8) is None
+
+
+def test_index_is_rebuilt_when_index_type_changes(faiss_path):
+    vectors = _random_vectors(30)
+    store = _open_ann_store(faiss_path)
+    store.insert(vectors=vectors, ids=[f"id{i}" for i in range(30)])
+    store.delete("id0")
+    store.flush()
+
+    reopened = _open_ann_store(faiss_path, index_type="hnsw", hnsw_m=8)
+
+    assert reopened.col_info()["index_type"] == "hnsw"
+    assert reopened.index.ntotal == 29
+    assert reopened.search(query="", vectors=vectors[5], limit=1)[0].id == "id5"
+
+
+def _insert_users(store, vectors, users):
+    store.insert(
+        vectors=vectors,
+        payloads=[{"user_id": user, "data": f"memory {i}"} for i, user in enumerate(users)],
+        ids=[f"id{i}" for i in range(len(vectors))],
+    )
+
+
+def test_scoped_search_returns_top_k_of_a_small_user(faiss_path):
+    store = _open_ann_store(faiss_path)
+    vectors = _random_vectors(500)
+    # Only three memories belong to bob and none is among alice's nearest neighbours
+    users = ["alice"] * 500
+    for i in (10, 20, 30):
+        users[i] = "bob"
+    _insert_users(store, vectors, users)
+
+    results = store.search(query="", vectors=vectors[0], limit=5, filters={"user_id": "bob"})
+
+    assert sorted(result.id for result in results) == ["id10", "id20", "id30"]
+    assert all(result.payload["user_id"] == "bob" for result in results)
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_scoped_search_matches_exact_search(faiss_path, index_type):
+    store = _open_ann_store(faiss_path, index_type=index_type, hnsw_m=8)
+    vectors = _random_vectors(3000)
+    users = ["alice" if i % 4 == 0 else "bob" for i in range(3000)]
+    _insert_users(store, vectors, users)
+    query = _random_vectors(1, seed=1)[0]
+
+    alice = [i for i in range(3000) if users[i] == "alice"]
+    distances = ((np.array(vectors)[alice] - np.array(query)) ** 2).sum(axis=1)
+    expected = [f"id{alice[i]}" for i in np.argsort(distances)[:5]]
+
+    # A scope too large to score directly is searched through an id selector
+    with patch("mem0.vector_stores.faiss._EXACT_SEARCH_MAX_CANDIDATES", 100):
+        results = store.search(query="", vectors=query, limit=5, filters={"user_id": "alice"})
+
+    assert [result.id for result in results] == expected
+
+
+def test_scoped_search_over_fetches_when_scope_covers_most_of_the_index(faiss_path):
+    store = _open_ann_store(faiss_path)
+    vectors = _random_vectors(400)
+    users = ["bob" if i == 0 else "alice" for i in range(400)]
+    _insert_users(store, vectors, users)
+
+    with patch("mem0.vector_stores.faiss._EXACT_SEARCH_MAX_CANDIDATES", 10), patch(
+        "faiss.IDSelectorBatch"
+    ) as mock_selector:
+        results = store.search(query="", vectors=vectors[5], limit=3, filters={"user_id": "alice"})
+
+    mock_selector.assert_not_called()
+    assert results[0].id == "id5"
+    assert all(result.payload["user_id"] == "alice" for result in results)
+
+
+def test_scoped_search_applies_other_filters_to_the_scope(faiss_path):
+    store = _open_ann_store(faiss_path)
+    store.insert(
+        vectors=_random_vectors(3),
+        payloads=[
+            {"user_id": "alice", "category": "food"},
+            {"user_id": "alice", "category": "travel"},
+            {"user_id": "bob", "category": "food"},
+        ],
+        ids=["id0", "id1", "id2"],
+    )
+
+    results = store.search(
+        query="", vectors=_random_vectors(1)[0], limit=5, filters={"user_id": "alice", "category": "food"}
+    )
+
+    assert [result.id for result in results] == ["id0"]
+
+
+def test_indexed_filter_the_payload_index_cannot_answer_is_checked_on_payloads(faiss_path):
+    store = _open_ann_store(faiss_path)
+    store.insert(
+        vectors=_random_vectors(3),
+        payloads=[
+            {"user_id": "alice", "agent_id": "x"},
+            {"user_id": "alice", "agent_id": "y"},
+            {"user_id": "bob", "agent_id": "x"},
+        ],
+        ids=["id0", "id1", "id2"],
+    )
+    filters = {"user_id": "alice", "agent_id": {"eq": "x"}}
+
+    assert store.list(filters=filters)[0] == []
+    assert store.search(query="", vectors=_random_vectors(1)[0], limit=5, filters=filters) == []
+
+
+def test_payload_index_follows_updates_and_deletes(faiss_path):
+    store = _open_ann_store(faiss_path)
+    vectors = _random_vectors(3)
+    _insert_users(store, vectors, ["alice", "alice", "bob"])
+
+    store.update("id0", payload={"user_id": "bob"})
+    store.delete("id1")
+
+    assert store._candidate_ids({"user_id": "alice"}) == set()
+    assert [item.id for item in store.list(filters={"user_id": "bob"})[0]] == ["id0", "id2"]
+
+    store.flush()
+    reopened = _open_ann_store(faiss_path)
+    assert reopened._candidate_ids({"user_id": "bob"}) == {reopened.id_to_index["id0"], reopened.id_to_index["id2"]}
+
+
+@pytest.mark.parametrize("docstore", ["pickle", "sqlite"])
+def test_iter_list_pages_past_the_list_limit(faiss_path, docstore):
+    store = _open_ann_store(faiss_path, docstore=docstore)
+    users = ["alice" if i % 3 else "bob" for i in range(300)]
+    _insert_users(store, _random_vectors(300), users)
+    alice_ids = [f"id{i}" for i, user in enumerate(users) if user == "alice"]
+
+    assert len(store.list(filters={"user_id": "alice"})[0]) == 100
+    assert [item.id for item in store.iter_list(filters={"user_id": "alice"}, page_size=30)] == alice_ids
+    assert len(list(store.iter_list(page_size=64))) == 300
+
+    records = store.iter_list(filters={"data": "memory 2"}, page_size=10)
+    assert [item.payload["user_id"] for item in records] == ["alice"]
+
+    records = store.iter_list(filters={"user_id": "alice"}, page_size=10)
+    assert next(records).id == "id1"
+    store.delete(alice_ids[-1])
+    assert [item.id for item in records] == alice_ids[1:-1]
+
+
+def test_delete_by_filter_logs_one_mutation(faiss_path):
+    store = _open_ann_store(faiss_path)
+    _insert_users(store, _random_vectors(6), ["alice", "bob", "alice", "bob", "alice", "bob"])
+    pending = store._pending_mutations
+
+    assert store.delete_by_filter({"user_id": "alice"}) == 3
+    assert store.delete_by_filter({"data": "memory 1"}) == 1
+
+    assert store._pending_mutations == pending + 2
+    assert [item.id for item in store.iter_list()] == ["id3", "id5"]
+    assert store._candidate_ids({"user_id": "alice"}) == set()
+    with pytest.raises(ValueError):
+        store.delete_by_filter({})
+
+    reopened = _open_ann_store(faiss_path)
+    assert sorted(reopened.id_to_index) == ["id3", "id5"]
+
+
+def test_delete_by_filter_checks_operator_filters_on_indexed_keys(faiss_path):
+    store = _open_ann_store(faiss_path)
+    store.insert(
+        vectors=_random_vectors(2),
+        payloads=[{"user_id": "alice", "agent_id": "x"}, {"user_id": "alice", "agent_id": "y"}],
+        ids=["id0", "id1"],
+    )
+
+    assert store.delete_by_filter({"user_id": "alice", "agent_id": {"eq": "x"}}) == 0
+    assert sorted(store.id_to_index) == ["id0", "id1"]
+
+
+def _collection_files(path):
+    # SQLite keeps its write-ahead log next to an open database
+    return sorted(name for name in os.listdir(path) if not name.endswith(("-wal", "-shm")))
+
+
+def test_sqlite_docstore_persists_and_reads_payloads_on_demand(faiss_path):
+    store = _open_store(faiss_path, docstore="sqlite")
+    store.insert(
+        vectors=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8]],
+        payloads=[{"user_id": "alice", "data": "likes tea"}, {"user_id": "bob", "data": "likes coffee"}],
+        ids=["id1", "id2"],
+    )
+    store.update("id1", payload={"user_id": "alice", "data": "likes green tea"})
+    store.close()
+
+    assert sorted(os.listdir(faiss_path)) == ["test_collection.db", "test_collection.faiss"]
+    reopened = _open_store(faiss_path, docstore="sqlite")
+
+    assert isinstance(reopened.docstore, SQLiteDocstore)
+    assert reopened.get("id1").payload == {"user_id": "alice", "data": "likes green tea"}
+    assert [item.id for item in reopened.list(filters={"user_id": "bob"})[0]] == ["id2"]
+    assert reopened.search(query="", vectors=[0.5, 0.6, 0.7, 0.8], limit=1)[0].id == "id2"
+    # Every read returns a new dict
+    reopened.get("id1").payload["data"] = "changed"
+    assert reopened.get("id1").payload["data"] == "likes green tea"
+
+
+def test_sqlite_docstore_replays_uncommitted_snapshot(faiss_path):
+    store = _open_store(faiss_path, docstore="sqlite")
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], payloads=[{"data": "one"}], ids=["id1"])
+    store.delete("id1")
+    store.insert(vectors=[[0.5, 0.6, 0.7, 0.8]], payloads=[{"data": "two"}], ids=["id2"])
+    # Simulate a crash: the process stops without flushing
+    store._close_log()
+
+    reopened = _open_store(faiss_path, docstore="sqlite")
+
+    assert dict(reopened.docstore.items()) == {"id2": {"data": "two"}}
+    assert reopened.col_info()["count"] == 1
+    assert reopened.search(query="", vectors=[0.5, 0.6, 0.7, 0.8], limit=1)[0].id == "id2"
+
+
+def test_sqlite_docstore_tombstones_deletes_committed_after_the_snapshot(faiss_path):
+    store = _open_store(faiss_path, docstore="sqlite", compaction_threshold=100)
+    vectors = [[float(i), 1.0, 0.0, 0.0] for i in range(5)]
+    store.insert(vectors=vectors, ids=[str(i) for i in range(5)])
+    store.flush()
+    store.delete("0")
+    # Simulate a crash: the delete is committed to SQLite and logged, but not snapshotted
+    store._close_log()
+
+    reopened = _open_store(faiss_path, docstore="sqlite", compaction_threshold=100)
+
+    assert reopened._tombstones == {0}
+    assert reopened.col_info()["count"] == 4
+    assert sorted(result.id for result in reopened.search(query="", vectors=vectors[0], limit=4)) == [
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    reopened.compact()
+    assert reopened.index.ntotal == 4
+
+
+def test_pickle_docstore_is_migrated_to_sqlite_and_back(faiss_path):
+    store = _open_store(faiss_path)
+    store.insert(
+        vectors=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8]],
+        payloads=[{"user_id": "alice"}, {"user_id": "bob"}],
+        ids=["id1", "id2"],
+    )
+    store.close()
+
+    migrated = _open_store(faiss_path, docstore="sqlite")
+
+    assert _collection_files(faiss_path) == ["test_collection.db", "test_collection.faiss"]
+    assert dict(migrated.docstore.items()) == {"id1": {"user_id": "alice"}, "id2": {"user_id": "bob"}}
+    assert migrated.id_to_index == {"id1": 0, "id2": 1}
+    assert migrated._candidate_ids({"user_id": "bob"}) == {1}
+    migrated.close()
+
+    restored = _open_store(faiss_path)
+
+    assert sorted(os.listdir(faiss_path)) == ["test_collection.faiss", "test_collection.pkl"]
+    assert restored.docstore == {"id1": {"user_id": "alice"}, "id2": {"user_id": "bob"}}
+
+
+def test_sqlite_docstore_delete_col_removes_database(faiss_path):
+    store = _open_store(faiss_path, docstore="sqlite")
+    store.insert(vectors=[[0.1, 0.2, 0.3, 0.4]], ids=["id1"])
+
+    store.reset()
+
+    assert store.get("id1") is None
+    assert _collection_files(faiss_path) == ["test_collection.db", "test_collection.faiss"]
+    assert len(store.docstore) == 0
@@ -179,6 +179,48 @@ class TestMilvusDB:
             ids=vector_id
         )
 
+    def test_delete_by_filter(self, milvus_db, mock_milvus_client):
+        """Test deleting every vector matching a filter expression in one call."""
+        mock_milvus_client.delete.return_value = {"delete_count": 3}
+
+        assert milvus_db.delete_by_filter({"user_id": "alice"}) == 3
+
+        mock_milvus_client.delete.assert_called_once_with(
+            collection_name="test_collection",
+            filter='(metadata["user_id"] == "alice")'
+        )
+        with pytest.raises(ValueError):
+            milvus_db.delete_by_filter({})
+
+    def test_iter_list_pages_by_primary_key(self, milvus_db, mock_milvus_client):
+        """Test iter_list pages past the list limit by querying ids above the last page's largest id."""
+        mock_milvus_client.query.side_effect = [
+            [{"id": "a", "metadata": {"user_id": "alice"}}, {"id": "b", "metadata": {"user_id": "alice"}}],
+            [{"id": "c", "metadata": {"user_id": "alice"}}],
+        ]
+
+        results = list(milvus_db.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+        assert [r.id for r in results] == ["a", "b", "c"]
+        filters = [call.kwargs["filter"] for call in mock_milvus_client.query.call_args_list]
+        assert filters == [
+            '((metadata["user_id"] == "alice"))',
+            '((metadata["user_id"] == "alice")) and (id > "b")',
+        ]
+
+    def test_delete_all_goes_through_delete_by_filter(self, milvus_db):
+        """Test Memory.delete_all lists the matches for history and removes them with one delete_by_filter."""
+        from mem0.memory.main import _delete_matching_memories
+
+        records = [MagicMock(id=str(i), payload={"data": f"memory {i}"}) for i in range(3)]
+        with patch.object(milvus_db, "iter_list", return_value=iter(records)), patch.object(
+            milvus_db, "delete_by_filter"
+        ) as delete_by_filter, patch.object(milvus_db, "delete") as delete:
+            assert _delete_matching_memories(milvus_db, {"user_id": "alice"}) == records
+
+        delete_by_filter.assert_called_once_with({"user_id": "alice"})
+        delete.assert_not_called()
+
     def test_get(self, milvus_db, mock_milvus_client):
         """Test retrieving a vector by ID."""
         vector_id = "test_id"
@@ -351,3 +351,18 @@ def test_list_with_no_filters(mongo_vector_fixture):
     mock_cursor.limit.assert_called_once_with(2)
     
     assert len(results) == 1
+
+
+def test_iter_list_streams_the_cursor(mongo_vector_fixture):
+    mongo_vector, mock_collection, _ = mongo_vector_fixture
+    mock_cursor = MagicMock()
+    mock_cursor.batch_size.return_value = mock_cursor
+    mock_cursor.__iter__.return_value = [{"_id": f"id{i}", "payload": {"user_id": "alice"}} for i in range(3)]
+    mock_collection.find.return_value = mock_cursor
+
+    results = list(mongo_vector.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+    assert [r.id for r in results] == ["id0", "id1", "id2"]
+    mock_collection.find.assert_called_with({"$and": [{"payload.user_id": "alice"}]}, {"payload": 1})
+    mock_cursor.batch_size.assert_called_once_with(2)
+    mock_cursor.close.assert_called_once()
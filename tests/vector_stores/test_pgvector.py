@@ -1,9 +1,13 @@
 import importlib
+import os
+import random
 import sys
 import unittest
 import uuid
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from mem0.vector_stores.pgvector import PGVector
 
 
@@ -2225,6 +2229,239 @@ class TestPGVector(unittest.TestCase):
             # Verify pool.closeall() was called
             mock_pool.closeall.assert_called()
 
+    def _make_pgvector(self, mock_get_cursor, **kwargs):
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        params = dict(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+        )
+        params.update(kwargs)
+        return PGVector(**params)
+
+    def _executed_sql(self):
+        return [" ".join(str(call.args[0]).split()) for call in self.mock_cursor.execute.call_args_list]
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_create_col_promotes_scope_columns(self, mock_get_cursor, mock_connection_pool):
+        """Scope identifiers are generated columns with B-tree indexes."""
+        self.mock_cursor.fetchall.return_value = []
+        self._make_pgvector(mock_get_cursor)
+
+        sql = self._executed_sql()
+        table = next(q for q in sql if "CREATE TABLE IF NOT EXISTS test_collection" in q)
+        for column in ("user_id", "agent_id", "run_id"):
+            self.assertIn(f"{column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED", table)
+            self.assertIn(
+                f"CREATE INDEX IF NOT EXISTS test_collection_{column}_idx ON test_collection ({column})", sql
+            )
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_existing_collection_keeps_payload_filters_until_migrated(self, mock_get_cursor, mock_connection_pool):
+        """Tables created before the scope columns existed are not rewritten on startup."""
+        self.mock_cursor.fetchall.side_effect = [
+            [("test_collection",)],  # list_cols
+            [("id",), ("vector",), ("payload",), ("user_id",)],  # information_schema.columns
+        ]
+        pgvector = self._make_pgvector(mock_get_cursor)
+
+        sql = self._executed_sql()
+        self.assertFalse(any("CREATE TABLE" in q or "ALTER TABLE" in q for q in sql))
+        self.assertEqual(pgvector._scope_columns, {"user_id"})
+        clause, params = pgvector._build_filter_clause({"user_id": "alice", "agent_id": "bot"})
+        self.assertEqual(clause, "WHERE user_id = %s AND payload->>%s = %s")
+        self.assertEqual(params, ["alice", "agent_id", "bot"])
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_migrate_adds_missing_scope_columns(self, mock_get_cursor, mock_connection_pool):
+        """migrate() adds the missing generated columns and their indexes, on startup when configured."""
+        for migrate_on_startup in (False, True):
+            self.mock_cursor.reset_mock()
+            self.mock_cursor.fetchall.side_effect = [
+                [("test_collection",)],  # list_cols
+                [("id",), ("vector",), ("payload",), ("user_id",)],  # information_schema.columns
+                [("id",), ("vector",), ("payload",), ("user_id",)],
+            ]
+            pgvector = self._make_pgvector(mock_get_cursor, migrate_scope_columns=migrate_on_startup)
+            if not migrate_on_startup:
+                pgvector.migrate()
+
+            sql = self._executed_sql()
+            self.assertFalse(any("ADD COLUMN IF NOT EXISTS user_id" in q for q in sql))
+            for column in ("agent_id", "run_id"):
+                self.assertIn(
+                    f"ALTER TABLE test_collection ADD COLUMN IF NOT EXISTS {column} "
+                    f"TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED",
+                    sql,
+                )
+            self.assertEqual(pgvector._scope_columns, {"user_id", "agent_id", "run_id"})
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_search_filters_on_scope_columns(self, mock_get_cursor, mock_connection_pool):
+        """Scope filters compare the indexed columns, other keys the JSONB payload."""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = ("0.7.4",)
+        pgvector = self._make_pgvector(mock_get_cursor)
+
+        query, params = pgvector._build_search_query([0.1, 0.2, 0.3], 5, {"user_id": "alice", "category": "food"})
+
+        self.assertIn("WHERE user_id = %s AND payload->>%s = %s", query)
+        self.assertNotIn("payload->>'user_id'", query)
+        self.assertEqual(params, ([0.1, 0.2, 0.3], "alice", "category", "food", 5))
+        self.assertIsNone(pgvector._iterative_scan)
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_filtered_search_uses_iterative_scan(self, mock_get_cursor, mock_connection_pool):
+        """On pgvector 0.8+, filtered searches let the HNSW scan continue until enough rows match."""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = ("0.8.0",)
+        pgvector = self._make_pgvector(mock_get_cursor)
+        self.mock_cursor.execute.reset_mock()
+
+        pgvector.search("query", [0.1, 0.2, 0.3], limit=5, filters={"user_id": "alice"})
+
+        sql = self._executed_sql()
+        self.assertEqual(sql[0], "SET LOCAL hnsw.iterative_scan = relaxed_order")
+        self.assertTrue(sql[1].startswith("WITH results AS MATERIALIZED ("))
+        self.assertTrue(sql[1].endswith("SELECT * FROM results ORDER BY distance"))
+
+        self.mock_cursor.execute.reset_mock()
+        pgvector.search("query", [0.1, 0.2, 0.3], limit=5)
+
+        sql = self._executed_sql()
+        self.assertEqual(len(sql), 1)
+        self.assertTrue(sql[0].startswith("SELECT id, vector <=>"))
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_iterative_scan_disabled(self, mock_get_cursor, mock_connection_pool):
+        """Iterative scans are skipped without an HNSW index or when disabled."""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = ("0.8.0",)
+
+        self.assertIsNone(self._make_pgvector(mock_get_cursor, hnsw=False)._iterative_scan)
+        self.assertIsNone(self._make_pgvector(mock_get_cursor, hnsw_iterative_scan=None)._iterative_scan)
+        self.assertEqual(
+            self._make_pgvector(mock_get_cursor, hnsw_iterative_scan="strict_order")._iterative_scan, "strict_order"
+        )
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_iter_list_uses_keyset_pagination(self, mock_get_cursor, mock_connection_pool):
+        """Each page resumes after the last id of the previous one, until a short page."""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = ("0.7.4",)
+        pgvector = self._make_pgvector(mock_get_cursor)
+        self.mock_cursor.execute.reset_mock()
+        ids = [uuid.uuid4() for _ in range(3)]
+        self.mock_cursor.fetchall.side_effect = [
+            [(ids[0], {"data": "a"}), (ids[1], {"data": "b"})],
+            [(ids[2], {"data": "c"})],
+        ]
+
+        results = list(pgvector.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+        self.assertEqual([r.id for r in results], [str(i) for i in ids])
+        self.assertEqual(results[2].payload, {"data": "c"})
+        sql = self._executed_sql()
+        self.assertEqual(sql[0], "SELECT id, payload FROM test_collection WHERE user_id = %s ORDER BY id LIMIT %s")
+        self.assertEqual(
+            sql[1], "SELECT id, payload FROM test_collection WHERE user_id = %s AND id > %s ORDER BY id LIMIT %s"
+        )
+        params = [call.args[1] for call in self.mock_cursor.execute.call_args_list]
+        self.assertEqual(params, [("alice", 2), ("alice", ids[1], 2)])
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_delete_by_filter(self, mock_get_cursor, mock_connection_pool):
+        """A filtered delete is a single DELETE statement on the scope columns."""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = ("0.7.4",)
+        pgvector = self._make_pgvector(mock_get_cursor)
+        self.mock_cursor.execute.reset_mock()
+        self.mock_cursor.rowcount = 42
+
+        deleted = pgvector.delete_by_filter({"user_id": "alice", "category": "food"})
+
+        self.assertEqual(deleted, 42)
+        self.assertEqual(
+            self._executed_sql(), ["DELETE FROM test_collection WHERE user_id = %s AND payload->>%s = %s"]
+        )
+        self.assertEqual(self.mock_cursor.execute.call_args.args[1], ("alice", "category", "food"))
+        with self.assertRaises(ValueError):
+            pgvector.delete_by_filter(None)
+
     def tearDown(self):
         """Clean up after each test."""
         pass
+
+
+@pytest.fixture
+def explain():
+    """
+    A PGVector store on a live database seeded with 100 users, and a function returning the plan of a query.
+
+    Runs when PGVECTOR_TEST_CONNECTION_STRING points to a PostgreSQL database with the vector extension.
+    """
+    store = PGVector(
+        dbname=None,
+        collection_name=f"explain_{uuid.uuid4().hex[:8]}",
+        embedding_model_dims=8,
+        user=None,
+        password=None,
+        host=None,
+        port=None,
+        diskann=False,
+        hnsw=True,
+        connection_string=os.environ["PGVECTOR_TEST_CONNECTION_STRING"],
+    )
+    rng = random.Random(0)
+    vectors = [[rng.random() for _ in range(8)] for _ in range(5000)]
+    payloads = [{"user_id": f"user-{i % 100}", "data": f"memory {i}"} for i in range(5000)]
+    store.insert(vectors, payloads, [str(uuid.uuid4()) for _ in vectors])
+    with store._get_cursor(commit=True) as cur:
+        cur.execute(f"ANALYZE {store.collection_name}")
+
+    def plan(query, params):
+        with store._get_cursor() as cur:
+            cur.execute(f"EXPLAIN {query}", params)
+            return "\n".join(row[0] for row in cur.fetchall())
+
+    yield store, plan
+    store.delete_col()
+
+
+@pytest.mark.skipif(
+    not os.getenv("PGVECTOR_TEST_CONNECTION_STRING"), reason="Only run with PGVECTOR_TEST_CONNECTION_STRING set"
+)
+def test_scoped_search_plan_uses_scope_index(explain):
+    store, plan = explain
+
+    search_plan = plan(*store._build_search_query(str([0.5] * 8), 5, {"user_id": "user-1"}))
+    assert f"{store.collection_name}_user_id_idx" in search_plan
+    assert "payload ->>" not in search_plan
+
+    filter_clause, params = store._build_filter_clause({"user_id": "user-1"})
+    list_query = f"SELECT id, vector, payload FROM {store.collection_name} {filter_clause} LIMIT %s"
+    list_plan = plan(list_query, (*params, 100))
+    assert f"{store.collection_name}_user_id_idx" in list_plan
@@ -1,11 +1,13 @@
+import asyncio
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
     Filter,
+    FilterSelector,
     PointIdsList,
     PointStruct,
     VectorParams,
@@ -288,6 +290,36 @@ class TestQdrant(unittest.TestCase):
         # The list method returns the result directly
         self.assertEqual(len(results), 1)
 
+    def test_iter_list_follows_scroll_offsets(self):
+        """Test iter_list scrolls until Qdrant returns no next page offset."""
+        pages = [
+            ([MagicMock(id="1"), MagicMock(id="2")], "offset-2"),
+            ([MagicMock(id="3"), MagicMock(id="4")], "offset-4"),
+            ([MagicMock(id="5")], None),
+        ]
+        self.client_mock.scroll.side_effect = pages
+
+        results = list(self.qdrant.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+        self.assertEqual([point.id for point in results], ["1", "2", "3", "4", "5"])
+        offsets = [call.kwargs["offset"] for call in self.client_mock.scroll.call_args_list]
+        self.assertEqual(offsets, [None, "offset-2", "offset-4"])
+        for call in self.client_mock.scroll.call_args_list:
+            self.assertEqual(call.kwargs["limit"], 2)
+            self.assertIsInstance(call.kwargs["scroll_filter"], Filter)
+
+    def test_delete_by_filter(self):
+        self.qdrant.delete_by_filter({"user_id": "alice", "agent_id": "agent1"})
+
+        self.client_mock.delete.assert_called_once()
+        call_args = self.client_mock.delete.call_args[1]
+        self.assertEqual(call_args["collection_name"], "test_collection")
+        self.assertIsInstance(call_args["points_selector"], FilterSelector)
+        self.assertEqual(len(call_args["points_selector"].filter.must), 2)
+
+        with self.assertRaises(ValueError):
+            self.qdrant.delete_by_filter({})
+
     def test_delete_col(self):
         self.qdrant.delete_col()
         self.client_mock.delete_collection.assert_called_once_with(collection_name="test_collection")
@@ -298,3 +330,36 @@ class TestQdrant(unittest.TestCase):
 
     def tearDown(self):
         del self.qdrant
+
+
+class TestQdrantAsync(unittest.TestCase):
+    def test_asearch_with_user_client_runs_sync_client(self):
+        client_mock = MagicMock(spec=QdrantClient)
+        client_mock.get_collections.return_value = MagicMock(collections=[])
+        qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=128, client=client_mock)
+        client_mock.query_points.return_value = MagicMock(points=["point"])
+
+        result = asyncio.run(qdrant.asearch(query="", vectors=[0.1, 0.2], limit=1))
+
+        self.assertEqual(result, ["point"])
+        client_mock.query_points.assert_called_once()
+        self.assertIsNone(qdrant.async_client)
+
+    @patch("mem0.vector_stores.qdrant.AsyncQdrantClient")
+    @patch("mem0.vector_stores.qdrant.QdrantClient")
+    def test_asearch_with_remote_server_uses_async_client(self, mock_client_cls, mock_async_client_cls):
+        mock_client_cls.return_value.get_collections.return_value = MagicMock(collections=[])
+        mock_async_client = mock_async_client_cls.return_value
+        mock_async_client.query_points = AsyncMock(return_value=MagicMock(points=["point"]))
+        mock_async_client.upsert = AsyncMock()
+        qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=128, url="http://qdrant:6333")
+
+        result = asyncio.run(qdrant.asearch(query="", vectors=[0.1, 0.2], limit=1, filters={"user_id": "alice"}))
+        asyncio.run(qdrant.ainsert(vectors=[[0.1, 0.2]], payloads=[{"user_id": "alice"}], ids=["id-1"]))
+
+        self.assertEqual(result, ["point"])
+        mock_async_client_cls.assert_called_once_with(url="http://qdrant:6333")
+        self.assertEqual(mock_async_client.query_points.call_args.kwargs["query_filter"].must[0].key, "user_id")
+        self.assertEqual(mock_async_client.upsert.call_args.kwargs["points"][0].id, "id-1")
+        mock_client_cls.return_value.query_points.assert_not_called()
+        mock_client_cls.return_value.upsert.assert_not_called()
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from redis.commands.search.document import Document
+
+from mem0.vector_stores.redis import RedisDB
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_db():
+    """RedisDB with a mocked search index, storing its hashes in an in-memory fakeredis server."""
+    with patch("mem0.vector_stores.redis.redis.Redis.from_url", return_value=fakeredis.FakeRedis()), patch(
+        "mem0.vector_stores.redis.SearchIndex"
+    ):
+        db = RedisDB(redis_url="redis://localhost:6379", collection_name="test_collection", embedding_model_dims=4)
+    db.batch_size = 2
+    return db
+
+
+def _payload(i):
+    return {
+        "hash": f"hash_{i}",
+        "data": f"memory {i}",
+        "user_id": "alice",
+        "category": "food",
+        "created_at": "2025-01-01T00:00:00-08:00",
+        "updated_at": "2025-01-02T00:00:00-08:00",
+    }
+
+
+def _store(db, ids):
+    for i, vector_id in enumerate(ids):
+        db.client.hset(db._key(vector_id), mapping=db._build_update_entry(vector_id, np.random.rand(4), _payload(i)))
+
+
+def test_insert_loads_in_batches(redis_db):
+    payloads = [_payload(i) for i in range(3)]
+    redis_db.insert(vectors=np.random.rand(3, 4).tolist(), payloads=payloads, ids=["a", "b", "c"])
+
+    args, kwargs = redis_db.index.load.call_args
+    assert len(args[0]) == 3
+    assert kwargs["batch_size"] == 2
+
+
+def test_update_many_loads_in_batches(redis_db):
+    redis_db.update_many([(vector_id, [0.1, 0.2, 0.3, 0.4], _payload(i)) for i, vector_id in enumerate(["a", "b"])])
+
+    kwargs = redis_db.index.load.call_args.kwargs
+    assert kwargs["keys"] == ["mem0:test_collection:a", "mem0:test_collection:b"]
+    assert [entry["memory"] for entry in kwargs["data"]] == ["memory 0", "memory 1"]
+    assert kwargs["batch_size"] == 2
+
+
+def test_get_many(redis_db):
+    ids = ["a", "b", "c"]
+    _store(redis_db, ids)
+
+    with patch.object(redis_db.client, "pipeline", wraps=redis_db.client.pipeline) as pipeline:
+        results = redis_db.get_many(["a", "missing", "c"])
+
+    assert pipeline.call_count == 2
+    assert [r.id for r in results] == ["a", "c"]
+    assert results[1].payload["data"] == "memory 2"
+    assert results[1].payload["user_id"] == "alice"
+    assert results[1].payload["category"] == "food"
+    assert "updated_at" in results[1].payload
+
+
+def test_delete_many(redis_db):
+    ids = ["a", "b", "c"]
+    _store(redis_db, ids)
+
+    assert redis_db.delete_many(["a", "b", "missing"]) == 2
+    assert [r.id for r in redis_db.get_many(ids)] == ["c"]
+
+
+def test_iter_list_pages_through_every_match(redis_db):
+    entries = [
+        redis_db._build_update_entry(vector_id, np.random.rand(4), _payload(i)) for i, vector_id in enumerate("abc")
+    ]
+    docs = [Document(redis_db._key(entry["memory_id"]), **entry) for entry in entries]
+    redis_db.index.search.side_effect = [SimpleNamespace(docs=docs[:2]), SimpleNamespace(docs=docs[2:])]
+
+    records = list(redis_db.iter_list(filters={"user_id": "alice"}, page_size=2))
+
+    assert [record.id for record in records] == ["a", "b", "c"]
+    assert records[2].payload["data"] == "memory 2"
+    assert records[2].payload["category"] == "food"
+    queries = [call.args[0] for call in redis_db.index.search.call_args_list]
+    assert [(query.query_string(), query._offset, query._num) for query in queries] == [
+        ("@user_id:{alice}", 0, 2),
+        ("@user_id:{alice}", 2, 2),
+    ]
+
+
+def test_delete_by_filter(redis_db):
+    ids = ["a", "b", "c"]
+    _store(redis_db, ids)
+    pages = [[redis_db._key("a"), redis_db._key("b")], [redis_db._key("c")]]
+    redis_db.index.search.side_effect = [
+        SimpleNamespace(docs=[SimpleNamespace(id=key) for key in page]) for page in pages
+    ]
+
+    assert redis_db.delete_by_filter({"user_id": "alice"}) == 3
+
+    query = redis_db.index.search.call_args.args[0]
+    assert query.query_string() == "@user_id:{alice}"
+    assert query._no_content
+    assert redis_db.get_many(ids) == []
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -129,9 +130,12 @@ def test_insert(valkey_db, mock_valkey_client):
     # Call insert
     valkey_db.insert(vectors=vectors, payloads=payloads, ids=ids)
 
-    # Check that hset was called with the correct arguments
-    mock_valkey_client.hset.assert_called_once()
-    args, kwargs = mock_valkey_client.hset.call_args
+    # Check that hset was queued on a non-transactional pipeline with the correct arguments
+    mock_valkey_client.pipeline.assert_called_once_with(transaction=False)
+    pipe = mock_valkey_client.pipeline.return_value
+    pipe.hset.assert_called_once()
+    pipe.execute.assert_called_once()
+    args, kwargs = pipe.hset.call_args
     assert args[0] == "mem0:test_collection:test_id"
     assert "memory_id" in kwargs["mapping"]
     assert kwargs["mapping"]["memory_id"] == "test_id"
@@ -152,9 +156,10 @@ def test_insert_handles_missing_created_at(valkey_db, mock_valkey_client):
     # Call insert
     valkey_db.insert(vectors=vectors, payloads=payloads, ids=ids)
 
-    # Check that hset was called with the correct arguments
-    mock_valkey_client.hset.assert_called_once()
-    args, kwargs = mock_valkey_client.hset.call_args
+    # Check that hset was queued with the correct arguments
+    pipe = mock_valkey_client.pipeline.return_value
+    pipe.hset.assert_called_once()
+    args, kwargs = pipe.hset.call_args
     assert "created_at" in kwargs["mapping"]  # Should be added automatically
 
 
@@ -707,8 +712,8 @@ def test_insert_missing_required_field(valkey_db, mock_valkey_client):
 
 def test_insert_general_error(valkey_db, mock_valkey_client):
     """Test error handling for general exceptions during insert."""
-    # Mock hset to raise a general exception
-    mock_valkey_client.hset.side_effect = Exception("Database error")
+    # Mock the pipeline to raise a general exception
+    mock_valkey_client.pipeline.return_value.execute.side_effect = Exception("Database error")
 
     with pytest.raises(Exception, match="Database error"):
         valkey_db.insert(vectors=[np.random.rand(1536).tolist()], payloads=[{"memory": "test"}], ids=["test_id"])
@@ -860,3 +865,106 @@ def test_list_with_missing_fields_and_defaults(valkey_db, mock_valkey_client):
     assert result.id == "fallback_id"
     assert "hash" in result.payload
     assert "data" in result.payload  # memory is renamed to data
+
+
+@pytest.fixture
+def fake_valkey_db(valkey_db):
+    """ValkeyDB backed by an in-memory fakeredis server, for the pipelined hash commands."""
+    fakeredis = pytest.importorskip("fakeredis")
+    valkey_db.client = fakeredis.FakeValkey()
+    valkey_db.batch_size = 2
+    return valkey_db
+
+
+def _payload(i, **extra):
+    return {
+        "hash": f"hash_{i}",
+        "data": f"memory {i}",
+        "user_id": "alice",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        **extra,
+    }
+
+
+def test_bulk_roundtrip(fake_valkey_db):
+    """Insert, get_many, update_many and delete_many go through pipelines of batch_size commands."""
+    ids = [f"id{i}" for i in range(5)]
+    vectors = np.random.rand(5, 1536).tolist()
+    with patch.object(fake_valkey_db.client, "pipeline", wraps=fake_valkey_db.client.pipeline) as pipeline:
+        fake_valkey_db.insert(vectors=vectors, payloads=[_payload(i) for i in range(5)], ids=ids)
+    # 5 vectors in pipelines of 2
+    assert pipeline.call_count == 3
+
+    results = fake_valkey_db.get_many(ids + ["missing"])
+    assert [r.id for r in results] == ids
+    assert results[3].payload["data"] == "memory 3"
+    assert results[3].payload["user_id"] == "alice"
+
+    fake_valkey_db.update_many(
+        [(vector_id, vector, _payload(i, data=f"updated {i}", updated_at="2025-01-02T00:00:00+00:00"))
+         for i, (vector_id, vector) in enumerate(zip(ids[:2], vectors[:2]))]
+    )
+    results = fake_valkey_db.get_many(ids[:3])
+    assert [r.payload["data"] for r in results] == ["updated 0", "updated 1", "memory 2"]
+    assert "updated_at" in results[0].payload
+
+    assert fake_valkey_db.delete_many(ids[:4] + ["missing"]) == 4
+    assert [r.id for r in fake_valkey_db.get_many(ids)] == ["id4"]
+
+
+def test_get_many_matches_get(fake_valkey_db):
+    """get_many builds the same payloads as get."""
+    payload = _payload(0, category="food")
+    fake_valkey_db.insert(vectors=[np.random.rand(1536).tolist()], payloads=[payload], ids=["id0"])
+
+    single = fake_valkey_db.get("id0")
+    (bulk,) = fake_valkey_db.get_many(["id0"])
+    assert bulk.payload == single.payload
+    assert bulk.payload["category"] == "food"
+
+
+def test_delete_by_filter(fake_valkey_db):
+    """delete_by_filter deletes the ids of each KNN page on a pipeline until no vector matches."""
+    ids = [f"id{i}" for i in range(5)]
+    payloads = [_payload(i, user_id="alice" if i != 2 else "bob") for i in range(5)]
+    fake_valkey_db.insert(vectors=np.random.rand(5, 1536).tolist(), payloads=payloads, ids=ids)
+
+    def search(query, params):
+        keys = sorted(key.decode() for key in fake_valkey_db.client.keys(f"{fake_valkey_db.prefix}:*"))
+        matching = [key for key in keys if fake_valkey_db.client.hget(key, "user_id") == b"alice"]
+        return SimpleNamespace(docs=[SimpleNamespace(id=key) for key in matching[: fake_valkey_db.batch_size]])
+
+    with patch.object(fake_valkey_db, "_execute_search", side_effect=search) as execute_search:
+        assert fake_valkey_db.delete_by_filter({"user_id": "alice"}) == 4
+
+    query = execute_search.call_args.args[0]
+    assert query.get_args()[:2] == ["@user_id:{alice} =>[KNN 2 @embedding $vec_param AS vector_score]", "NOCONTENT"]
+    assert execute_search.call_count == 3
+    assert [r.id for r in fake_valkey_db.get_many(ids)] == ["id2"]
+
+
+def test_iter_list_scans_every_matching_hash(fake_valkey_db):
+    """iter_list walks the collection's keys with SCAN, past the KNN list limit, and filters payloads."""
+    ids = [f"id{i}" for i in range(7)]
+    payloads = [_payload(i, user_id="alice" if i != 2 else "bob") for i in range(7)]
+    fake_valkey_db.insert(vectors=np.random.rand(7, 1536).tolist(), payloads=payloads, ids=ids)
+
+    results = list(fake_valkey_db.iter_list(filters={"user_id": "alice", "agent_id": None}, page_size=3))
+
+    assert sorted(r.id for r in results) == [i for i in ids if i != "id2"]
+    assert {r.payload["user_id"] for r in results} == {"alice"}
+    assert len(list(fake_valkey_db.iter_list(page_size=3))) == 7
+
+
+def test_delete_all_goes_through_delete_by_filter(valkey_db):
+    """Memory.delete_all lists the matches for history and removes them with one delete_by_filter."""
+    from mem0.memory.main import _delete_matching_memories
+
+    records = [SimpleNamespace(id=f"id{i}", payload=_payload(i)) for i in range(3)]
+    with patch.object(valkey_db, "iter_list", return_value=iter(records)), patch.object(
+        valkey_db, "delete_by_filter"
+    ) as delete_by_filter, patch.object(valkey_db, "delete") as delete:
+        assert _delete_matching_memories(valkey_db, {"user_id": "alice"}) == records
+
+    delete_by_filter.assert_called_once_with({"user_id": "alice"})
+    delete.assert_not_called()